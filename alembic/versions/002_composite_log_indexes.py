@@ -0,0 +1,64 @@
+"""Composite (user_id, log_date DESC) indexes for symptom_logs and weight_logs
+
+Revision ID: 002_composite_log_indexes
+Revises: 001_initial_schema
+Create Date: 2024-12-18 10:00:00.000000
+
+Per-user trend queries (AC 12.1: last 7 / 30 days, mood history) filter on
+user_id and order by log_date. With separate single-column indexes the planner
+has to pick one and filter on the other. These composite indexes:
+- lead with user_id so one index range scan returns a user's rows
+- order by log_date DESC, primary key DESC to match keyset pagination
+- INCLUDE the trend columns so pages are served by index-only scans
+
+The single-column user_id indexes become redundant (prefix of the composite)
+and are dropped. Indexes are built CONCURRENTLY to avoid locking writes.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '002_composite_log_indexes'
+down_revision = '001_initial_schema'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """
+    Create composite covering indexes and drop the redundant user_id indexes
+    """
+    with op.get_context().autocommit_block():
+        # 1. symptom_logs: mood history and symptom trends
+        op.create_index(
+            'ix_symptom_logs_user_id_log_date',
+            'symptom_logs',
+            ['user_id', sa.text('log_date DESC'), sa.text('log_id DESC')],
+            unique=False,
+            postgresql_include=['mood', 'symptom_type', 'severity_rating', 'pregnancy_week'],
+            postgresql_concurrently=True
+        )
+        op.drop_index(op.f('ix_symptom_logs_user_id'), table_name='symptom_logs', postgresql_concurrently=True)
+
+        # 2. weight_logs: weight trend chart
+        op.create_index(
+            'ix_weight_logs_user_id_log_date',
+            'weight_logs',
+            ['user_id', sa.text('log_date DESC'), sa.text('weight_log_id DESC')],
+            unique=False,
+            postgresql_include=['weight_kg', 'pregnancy_week'],
+            postgresql_concurrently=True
+        )
+        op.drop_index(op.f('ix_weight_logs_user_id'), table_name='weight_logs', postgresql_concurrently=True)
+
+
+def downgrade():
+    """
+    Restore the single-column user_id indexes and drop the composites
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(op.f('ix_weight_logs_user_id'), 'weight_logs', ['user_id'], unique=False, postgresql_concurrently=True)
+        op.drop_index('ix_weight_logs_user_id_log_date', table_name='weight_logs', postgresql_concurrently=True)
+
+        op.create_index(op.f('ix_symptom_logs_user_id'), 'symptom_logs', ['user_id'], unique=False, postgresql_concurrently=True)
+        op.drop_index('ix_symptom_logs_user_id_log_date', table_name='symptom_logs', postgresql_concurrently=True)
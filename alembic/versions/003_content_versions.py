@@ -0,0 +1,38 @@
+"""Content version marker table
+
+Revision ID: 003_content_versions
+Revises: 002_composite_log_indexes
+Create Date: 2024-12-20 10:00:00.000000
+
+Creates:
+- content_versions: one row per static content set, bumped on every reseed
+  so app workers know when to reload their in-memory content store
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '003_content_versions'
+down_revision = '002_composite_log_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """
+    Create content_versions table
+    """
+    op.create_table(
+        'content_versions',
+        sa.Column('content_key', sa.String(length=50), nullable=False, comment='Content set name'),
+        sa.Column('version', sa.Integer(), nullable=False, server_default='1', comment='Incremented on every reseed'),
+        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.text('CURRENT_TIMESTAMP')),
+        sa.PrimaryKeyConstraint('content_key')
+    )
+
+
+def downgrade():
+    """
+    Drop content_versions table
+    """
+    op.drop_table('content_versions')
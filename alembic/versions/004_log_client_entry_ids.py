@@ -0,0 +1,47 @@
+"""Idempotency keys for offline-synced daily logs
+
+Revision ID: 004_log_client_entry_ids
+Revises: 003_content_versions
+Create Date: 2025-01-08 10:00:00.000000
+
+Adds client_entry_id to symptom_logs and weight_logs with a unique
+(user_id, client_entry_id) index. Mobile clients generate the key per entry,
+so a retried batch upload is de-duplicated with INSERT ... ON CONFLICT DO NOTHING.
+Existing rows keep NULL (NULLs never conflict).
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '004_log_client_entry_ids'
+down_revision = '003_content_versions'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """
+    Add client_entry_id columns and unique indexes
+    """
+    op.add_column('symptom_logs', sa.Column('client_entry_id', sa.String(length=64), nullable=True, comment='Client-generated idempotency key'))
+    op.add_column('weight_logs', sa.Column('client_entry_id', sa.String(length=64), nullable=True, comment='Client-generated idempotency key'))
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'uq_symptom_logs_user_id_client_entry_id', 'symptom_logs',
+            ['user_id', 'client_entry_id'], unique=True, postgresql_concurrently=True
+        )
+        op.create_index(
+            'uq_weight_logs_user_id_client_entry_id', 'weight_logs',
+            ['user_id', 'client_entry_id'], unique=True, postgresql_concurrently=True
+        )
+
+
+def downgrade():
+    """
+    Drop client_entry_id columns and their indexes
+    """
+    op.drop_index('uq_weight_logs_user_id_client_entry_id', table_name='weight_logs')
+    op.drop_index('uq_symptom_logs_user_id_client_entry_id', table_name='symptom_logs')
+    op.drop_column('weight_logs', 'client_entry_id')
+    op.drop_column('symptom_logs', 'client_entry_id')
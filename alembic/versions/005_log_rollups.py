@@ -0,0 +1,71 @@
+"""Daily and weekly weight/mood rollup tables
+
+Revision ID: 005_log_rollups
+Revises: 004_log_client_entry_ids
+Create Date: 2025-01-15 10:00:00.000000
+
+Creates:
+- daily_log_rollups: one row per (user_id, log_date)
+- weekly_log_rollups: one row per (user_id, pregnancy_week)
+
+Both hold weight count/sum/min/max and a count per MoodType, maintained
+incrementally on write so trend charts read O(days shown) rows.
+Backfill after upgrading with: python scripts/rebuild_rollups.py
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '005_log_rollups'
+down_revision = '004_log_client_entry_ids'
+branch_labels = None
+depends_on = None
+
+MOOD_COLUMNS = [
+    'mood_happy', 'mood_anxious', 'mood_tired', 'mood_irritable',
+    'mood_excited', 'mood_calm', 'mood_overwhelmed', 'mood_neutral',
+]
+
+
+def _metric_columns():
+    """Columns shared by both rollup tables"""
+    return [
+        sa.Column('weight_count', sa.Integer(), nullable=False, server_default='0', comment='Number of weight entries'),
+        sa.Column('weight_sum', sa.Float(), nullable=False, server_default='0', comment='Sum of weight_kg (mean = sum / count)'),
+        sa.Column('weight_min', sa.Float(), nullable=True, comment='Lowest weight_kg'),
+        sa.Column('weight_max', sa.Float(), nullable=True, comment='Highest weight_kg'),
+        *[sa.Column(name, sa.Integer(), nullable=False, server_default='0') for name in MOOD_COLUMNS],
+        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.text('CURRENT_TIMESTAMP')),
+    ]
+
+
+def upgrade():
+    """
+    Create rollup tables
+    """
+    op.create_table(
+        'daily_log_rollups',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('log_date', sa.Date(), nullable=False),
+        sa.Column('pregnancy_week', sa.Integer(), nullable=True),
+        *_metric_columns(),
+        sa.PrimaryKeyConstraint('user_id', 'log_date'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.user_id'], ondelete='CASCADE')
+    )
+
+    op.create_table(
+        'weekly_log_rollups',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('pregnancy_week', sa.Integer(), nullable=False),
+        *_metric_columns(),
+        sa.PrimaryKeyConstraint('user_id', 'pregnancy_week'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.user_id'], ondelete='CASCADE')
+    )
+
+
+def downgrade():
+    """
+    Drop rollup tables
+    """
+    op.drop_table('weekly_log_rollups')
+    op.drop_table('daily_log_rollups')
@@ -0,0 +1,47 @@
+"""Background PDF export jobs
+
+Revision ID: 006_export_jobs
+Revises: 005_log_rollups
+Create Date: 2025-01-22 10:00:00.000000
+
+Creates:
+- export_jobs: PDF summary export jobs rendered in a background process pool,
+  keyed by an input fingerprint so unchanged summaries are served from cache
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '006_export_jobs'
+down_revision = '005_log_rollups'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """
+    Create export_jobs table
+    """
+    op.create_table(
+        'export_jobs',
+        sa.Column('job_id', sa.String(length=36), nullable=False, comment='UUID4 job identifier'),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False, server_default='pending', comment='pending, running, completed, failed'),
+        sa.Column('input_fingerprint', sa.String(length=64), nullable=False),
+        sa.Column('file_path', sa.String(length=512), nullable=True),
+        sa.Column('file_size', sa.Integer(), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('CURRENT_TIMESTAMP')),
+        sa.Column('completed_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('job_id'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.user_id'], ondelete='CASCADE')
+    )
+    op.create_index('ix_export_jobs_user_id_fingerprint', 'export_jobs', ['user_id', 'input_fingerprint'], unique=False)
+
+
+def downgrade():
+    """
+    Drop export_jobs table
+    """
+    op.drop_index('ix_export_jobs_user_id_fingerprint', table_name='export_jobs')
+    op.drop_table('export_jobs')
@@ -0,0 +1,46 @@
+"""Daily check-in reminder schedule on users
+
+Revision ID: 007_user_reminder_schedule
+Revises: 006_export_jobs
+Create Date: 2025-02-03 10:00:00.000000
+
+Adds to users:
+- timezone: IANA timezone name (default 'UTC')
+- reminder_local_minute: reminder time as minute of the local day
+  (default 1200 = 20:00, NULL = reminders off)
+
+and a partial index on (reminder_local_minute, timezone) over reminder-eligible
+users (active, with a push token) used by the reminder scheduler's per-minute waves.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '007_user_reminder_schedule'
+down_revision = '006_export_jobs'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """
+    Add reminder schedule columns and the reminder slot index
+    """
+    op.add_column('users', sa.Column('timezone', sa.String(length=64), nullable=False, server_default='UTC', comment='IANA timezone name'))
+    op.add_column('users', sa.Column('reminder_local_minute', sa.Integer(), nullable=True, server_default='1200', comment='Reminder time as minute of the local day (NULL = off)'))
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_users_reminder_slot', 'users', ['reminder_local_minute', 'timezone'], unique=False,
+            postgresql_where=sa.text('is_active = 1 AND platform_token IS NOT NULL AND reminder_local_minute IS NOT NULL'),
+            postgresql_concurrently=True
+        )
+
+
+def downgrade():
+    """
+    Drop reminder schedule columns and index
+    """
+    op.drop_index('ix_users_reminder_slot', table_name='users')
+    op.drop_column('users', 'reminder_local_minute')
+    op.drop_column('users', 'timezone')
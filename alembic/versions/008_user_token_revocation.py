@@ -0,0 +1,32 @@
+"""Access token revocation marker on users
+
+Revision ID: 008_user_token_revocation
+Revises: 007_user_reminder_schedule
+Create Date: 2025-02-10 10:00:00.000000
+
+Adds to users:
+- tokens_valid_after: access tokens issued before this instant are rejected
+  (set on logout so every API worker drops the user's outstanding tokens)
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '008_user_token_revocation'
+down_revision = '007_user_reminder_schedule'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """
+    Add tokens_valid_after column
+    """
+    op.add_column('users', sa.Column('tokens_valid_after', sa.DateTime(), nullable=True, comment='Access tokens issued before this are revoked (logout)'))
+
+
+def downgrade():
+    """
+    Drop tokens_valid_after column
+    """
+    op.drop_column('users', 'tokens_valid_after')
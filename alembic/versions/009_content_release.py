@@ -0,0 +1,32 @@
+"""Content data release on content_versions
+
+Revision ID: 009_content_release
+Revises: 008_user_token_revocation
+Create Date: 2025-02-17 10:00:00.000000
+
+Adds to content_versions:
+- release: the data/content manifest release last applied by
+  scripts/seed_content.py (the integer version still drives worker reloads)
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '009_content_release'
+down_revision = '008_user_token_revocation'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """
+    Add release column
+    """
+    op.add_column('content_versions', sa.Column('release', sa.String(length=50), nullable=True, comment='Content data release last applied'))
+
+
+def downgrade():
+    """
+    Drop release column
+    """
+    op.drop_column('content_versions', 'release')
@@ -0,0 +1,171 @@
+"""Monthly range partitioning for symptom_logs and weight_logs
+
+Revision ID: 010_partition_log_tables
+Revises: 009_content_release
+Create Date: 2025-02-24 10:00:00.000000
+
+PostgreSQL only. Rebuilds both log tables as PARTITION BY RANGE (log_date):
+- one partition per calendar month, named <table>_pYYYY_MM, from the oldest
+  logged month through MONTHS_AHEAD months past the current one
+- a <table>_default partition catching anything outside the monthly ranges
+  (scripts/maintain_log_partitions.py moves such rows into a proper partition)
+- the primary key becomes (id, log_date) and the idempotency index
+  (user_id, client_entry_id, log_date): unique constraints on a partitioned
+  table must include the partition key. Retried uploads resend the same
+  log_date, so de-duplication is unchanged.
+- existing id sequences are reused, so ids keep increasing
+
+Per-user trend queries filter on log_date, so they only scan the partitions in
+their window. Old months can be detached or dropped without a bulk DELETE.
+Partitions are created ahead of time by scripts/maintain_log_partitions.py,
+which also applies the retention policy.
+
+Rows are copied into the new tables under an exclusive lock, so run this during
+a maintenance window on large databases. Other dialects (SQLite development
+databases) only get the new idempotency index shape.
+"""
+from datetime import date
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '010_partition_log_tables'
+down_revision = '009_content_release'
+branch_labels = None
+depends_on = None
+
+# Months of empty partitions to create past the current month
+MONTHS_AHEAD = 3
+
+
+def _symptom_columns():
+    return [
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('log_date', sa.Date(), nullable=False),
+        sa.Column('symptom_type', postgresql.ENUM(name='symptomtype', create_type=False), nullable=True, comment='Type of symptom experienced'),
+        sa.Column('severity_rating', sa.Integer(), nullable=True, comment='Severity rating 1-5'),
+        sa.Column('mood', postgresql.ENUM(name='moodtype', create_type=False), nullable=True, comment='Daily mood selection'),
+        sa.Column('journal_entry', sa.Text(), nullable=True, comment='Optional daily journal text'),
+        sa.Column('pregnancy_week', sa.Integer(), nullable=True),
+        sa.Column('client_entry_id', sa.String(length=64), nullable=True, comment='Client-generated idempotency key'),
+        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('CURRENT_TIMESTAMP')),
+    ]
+
+
+def _weight_columns():
+    return [
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('log_date', sa.Date(), nullable=False),
+        sa.Column('weight_kg', sa.Float(), nullable=False, comment='Weight in kilograms'),
+        sa.Column('pregnancy_week', sa.Integer(), nullable=True),
+        sa.Column('client_entry_id', sa.String(length=64), nullable=True, comment='Client-generated idempotency key'),
+        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('CURRENT_TIMESTAMP')),
+    ]
+
+
+# table -> (primary key column, other columns, INCLUDE columns of the trend index)
+TABLES = {
+    'symptom_logs': ('log_id', _symptom_columns, ['mood', 'symptom_type', 'severity_rating', 'pregnancy_week']),
+    'weight_logs': ('weight_log_id', _weight_columns, ['weight_kg', 'pregnancy_week']),
+}
+
+
+def _add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _create_indexes(table, pk, include, unique_columns):
+    op.create_index(f'ix_{table}_{pk}', table, [pk], unique=False)
+    op.create_index(f'ix_{table}_log_date', table, ['log_date'], unique=False)
+    op.create_index(
+        f'ix_{table}_user_id_log_date', table,
+        ['user_id', sa.text('log_date DESC'), sa.text(f'{pk} DESC')],
+        unique=False, postgresql_include=include
+    )
+    op.create_index(f'uq_{table}_user_id_client_entry_id', table, unique_columns, unique=True)
+
+
+def _drop_indexes(table, pk):
+    for name in (f'ix_{table}_{pk}', f'ix_{table}_log_date', f'ix_{table}_user_id_log_date',
+                 f'uq_{table}_user_id_client_entry_id'):
+        op.drop_index(name, table_name=table)
+
+
+def _rebuild(table, pk, columns, include, partitioned):
+    """Copy `table` into a new (partitioned or plain) table with the same name"""
+    old = f'{table}_old'
+    sequence = f'{table}_{pk}_seq'
+    op.execute(f'LOCK TABLE {table} IN ACCESS EXCLUSIVE MODE')
+    op.rename_table(table, old)
+    _drop_indexes(old, pk)
+    op.execute(f'ALTER TABLE {old} RENAME CONSTRAINT {table}_pkey TO {old}_pkey')
+    op.execute(f'ALTER TABLE {old} RENAME CONSTRAINT {table}_user_id_fkey TO {old}_user_id_fkey')
+
+    primary_key = [pk, 'log_date'] if partitioned else [pk]
+    op.create_table(
+        table,
+        sa.Column(pk, sa.Integer(), nullable=False, server_default=sa.text(f"nextval('{sequence}'::regclass)")),
+        *columns(),
+        sa.PrimaryKeyConstraint(*primary_key, name=f'{table}_pkey'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.user_id'], ondelete='CASCADE', name=f'{table}_user_id_fkey'),
+        **({'postgresql_partition_by': 'RANGE (log_date)'} if partitioned else {})
+    )
+
+    if partitioned:
+        bind = op.get_bind()
+        oldest = bind.execute(sa.text(f'SELECT MIN(log_date) FROM {old}')).scalar()
+        current = date.today().replace(day=1)
+        month = (oldest or current).replace(day=1)
+        while month <= _add_months(current, MONTHS_AHEAD):
+            upper = _add_months(month, 1)
+            op.execute(
+                f"CREATE TABLE {table}_p{month.year:04d}_{month.month:02d} PARTITION OF {table} "
+                f"FOR VALUES FROM ('{month.isoformat()}') TO ('{upper.isoformat()}')"
+            )
+            month = upper
+        op.execute(f'CREATE TABLE {table}_default PARTITION OF {table} DEFAULT')
+
+    names = ', '.join([pk] + [column.name for column in columns()])
+    op.execute(f'INSERT INTO {table} ({names}) SELECT {names} FROM {old}')
+    op.execute(f'ALTER SEQUENCE {sequence} OWNED BY {table}.{pk}')
+    op.drop_table(old)
+
+    # Indexes built after the copy; on a partitioned table they cascade to every partition
+    unique_columns = ['user_id', 'client_entry_id', 'log_date'] if partitioned else ['user_id', 'client_entry_id']
+    _create_indexes(table, pk, include, unique_columns)
+    op.execute(f'ANALYZE {table}')
+
+
+def _replace_idempotency_index(table, columns):
+    op.drop_index(f'uq_{table}_user_id_client_entry_id', table_name=table)
+    op.create_index(f'uq_{table}_user_id_client_entry_id', table, columns, unique=True)
+
+
+def upgrade():
+    """
+    Partition both log tables by month (PostgreSQL)
+    """
+    if op.get_bind().dialect.name != 'postgresql':
+        for table in TABLES:
+            _replace_idempotency_index(table, ['user_id', 'client_entry_id', 'log_date'])
+        return
+
+    for table, (pk, columns, include) in TABLES.items():
+        _rebuild(table, pk, columns, include, partitioned=True)
+
+
+def downgrade():
+    """
+    Copy both log tables back into plain tables
+    Partitions detached by the retention policy are not part of the table and are not copied back.
+    """
+    if op.get_bind().dialect.name != 'postgresql':
+        for table in TABLES:
+            _replace_idempotency_index(table, ['user_id', 'client_entry_id'])
+        return
+
+    for table, (pk, columns, include) in TABLES.items():
+        _rebuild(table, pk, columns, include, partitioned=False)
@@ -0,0 +1,53 @@
+"""Full-text search over symptom_logs.journal_entry
+
+Revision ID: 011_journal_search
+Revises: 010_partition_log_tables
+Create Date: 2025-03-03 10:00:00.000000
+
+PostgreSQL only:
+- journal_tsv: generated column to_tsvector('english', journal_entry), STORED so
+  searches never re-parse the text. Adding it rewrites every symptom_logs
+  partition; run during a maintenance window on large databases.
+- ix_symptom_logs_journal_search: GIN index on (user_id, journal_tsv), using the
+  btree_gin extension, over rows that have a journal entry. A user's search is
+  one index probe over their own entries, not all matches across all users.
+  The index is built on the partitioned parent and cascades to every partition.
+
+SQLite development databases get an FTS5 table from Base.metadata.create_all instead
+(see JOURNAL_SEARCH_DDL in app/db/models.py).
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '011_journal_search'
+down_revision = '010_partition_log_tables'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """
+    Add the generated tsvector column and its GIN index
+    """
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute('CREATE EXTENSION IF NOT EXISTS btree_gin')
+    op.execute(
+        "ALTER TABLE symptom_logs ADD COLUMN journal_tsv tsvector "
+        "GENERATED ALWAYS AS (to_tsvector('english', coalesce(journal_entry, ''))) STORED"
+    )
+    op.create_index(
+        'ix_symptom_logs_journal_search', 'symptom_logs', ['user_id', 'journal_tsv'],
+        postgresql_using='gin', postgresql_where=sa.text('journal_entry IS NOT NULL')
+    )
+
+
+def downgrade():
+    """
+    Drop the search index and column
+    """
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.drop_index('ix_symptom_logs_journal_search', table_name='symptom_logs')
+    op.drop_column('symptom_logs', 'journal_tsv')
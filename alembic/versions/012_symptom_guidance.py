@@ -0,0 +1,62 @@
+"""Symptom guidance rules
+
+Revision ID: 012_symptom_guidance
+Revises: 011_journal_search
+Create Date: 2025-03-10 10:00:00.000000
+
+Adds symptom_guidance: curated rules mapping (symptom, severity range, week
+range) to guidance for GET /v1/content/symptom/check. Rows come from the
+data/content release (scripts/seed_content.py) and are compiled into each
+worker's in-memory content store, so the table is only read on reload.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '012_symptom_guidance'
+down_revision = '011_journal_search'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """
+    Create symptom_guidance
+    """
+    symptom_type = sa.Enum(
+        'NAUSEA', 'FATIGUE', 'HEADACHE', 'BREAST_TENDERNESS', 'CRAMPING',
+        'BLOATING', 'FOOD_AVERSION', 'FREQUENT_URINATION', 'SPOTTING', 'MOOD_SWINGS',
+        name='symptomtype',
+    )
+    if op.get_bind().dialect.name == 'postgresql':
+        # Type already created by 001_initial_schema
+        symptom_type = postgresql.ENUM(name='symptomtype', create_type=False)
+
+    op.create_table(
+        'symptom_guidance',
+        sa.Column('guidance_id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('rule_key', sa.String(length=64), nullable=False, comment='Stable rule identifier'),
+        sa.Column('symptom_type', symptom_type, nullable=False, comment='Symptom the rule applies to'),
+        sa.Column('min_severity', sa.Integer(), nullable=False, comment='Lowest severity rating covered (1-5)'),
+        sa.Column('max_severity', sa.Integer(), nullable=False, comment='Highest severity rating covered (1-5)'),
+        sa.Column('week_start', sa.Integer(), nullable=False, comment='First pregnancy week covered (1-12)'),
+        sa.Column('week_end', sa.Integer(), nullable=False, comment='Last pregnancy week covered (1-12)'),
+        sa.Column('priority', sa.Integer(), nullable=False, comment='Higher wins where rules overlap'),
+        sa.Column('level', sa.String(length=20), nullable=False, comment='self_care, contact_provider or urgent'),
+        sa.Column('title', sa.String(length=255), nullable=False, comment='Short guidance headline'),
+        sa.Column('advice', sa.Text(), nullable=False, comment='Guidance text shown to the user'),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('guidance_id'),
+        sa.UniqueConstraint('rule_key'),
+    )
+    op.create_index(op.f('ix_symptom_guidance_guidance_id'), 'symptom_guidance', ['guidance_id'], unique=False)
+
+
+def downgrade():
+    """
+    Drop symptom_guidance
+    """
+    op.drop_index(op.f('ix_symptom_guidance_guidance_id'), table_name='symptom_guidance')
+    op.drop_table('symptom_guidance')
@@ -0,0 +1,59 @@
+"""NPS rollup tables
+
+Revision ID: 013_nps_rollups
+Revises: 012_symptom_guidance
+Create Date: 2025-03-17 10:00:00.000000
+
+Creates:
+- nps_daily_rollups: one row per feedback day (UTC)
+- nps_weekly_rollups: one row per pregnancy week
+
+Both hold promoter / passive / detractor counts, maintained on every feedback
+insert so NPS analytics read one row per day/week shown instead of grouping feedbacks.
+Backfill after upgrading with: python scripts/rebuild_nps_rollups.py
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '013_nps_rollups'
+down_revision = '012_symptom_guidance'
+branch_labels = None
+depends_on = None
+
+
+def _count_columns():
+    """Columns shared by both rollup tables"""
+    return [
+        sa.Column('promoters', sa.Integer(), nullable=False, server_default='0', comment='Scores 9-10'),
+        sa.Column('passives', sa.Integer(), nullable=False, server_default='0', comment='Scores 7-8'),
+        sa.Column('detractors', sa.Integer(), nullable=False, server_default='0', comment='Scores 0-6'),
+        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.text('CURRENT_TIMESTAMP')),
+    ]
+
+
+def upgrade():
+    """
+    Create NPS rollup tables
+    """
+    op.create_table(
+        'nps_daily_rollups',
+        sa.Column('feedback_date', sa.Date(), nullable=False),
+        *_count_columns(),
+        sa.PrimaryKeyConstraint('feedback_date')
+    )
+
+    op.create_table(
+        'nps_weekly_rollups',
+        sa.Column('pregnancy_week', sa.Integer(), nullable=False),
+        *_count_columns(),
+        sa.PrimaryKeyConstraint('pregnancy_week')
+    )
+
+
+def downgrade():
+    """
+    Drop NPS rollup tables
+    """
+    op.drop_table('nps_weekly_rollups')
+    op.drop_table('nps_daily_rollups')
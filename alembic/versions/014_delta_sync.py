@@ -0,0 +1,63 @@
+"""Delta sync: created_at indexes on log tables and sync_tombstones
+
+Revision ID: 014_delta_sync
+Revises: 013_nps_rollups
+Create Date: 2025-03-24 10:00:00.000000
+
+GET /v1/sync returns a user's rows created after a cursor position:
+- ix_symptom_logs_user_id_created_at / ix_weight_logs_user_id_created_at on
+  (user_id, created_at, id), so "rows since the cursor" is one index range scan
+  per partition. Logs are insert-only, so created_at is their change time.
+  The indexes are built on the partitioned parents and cascade to every
+  partition; CONCURRENTLY is not available for partitioned tables.
+- sync_tombstones: deletes that clients must apply (entity, id, owner or NULL
+  for shared content), read by (user_id, deleted_at).
+
+pregnancy_profiles (one row per user, found by the unique user_id index) and
+weekly_content (served from the in-process content store) need no new index.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '014_delta_sync'
+down_revision = '013_nps_rollups'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """
+    Create the delta sync indexes and the tombstone table
+    """
+    op.create_index(
+        'ix_symptom_logs_user_id_created_at', 'symptom_logs', ['user_id', 'created_at', 'log_id'], unique=False
+    )
+    op.create_index(
+        'ix_weight_logs_user_id_created_at', 'weight_logs', ['user_id', 'created_at', 'weight_log_id'], unique=False
+    )
+
+    op.create_table(
+        'sync_tombstones',
+        sa.Column('tombstone_id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('entity', sa.String(length=32), nullable=False, comment="Sync table name (e.g. 'weekly_content')"),
+        sa.Column('entity_key', sa.Integer(), nullable=False, comment='Row id as sent to clients'),
+        sa.Column('user_id', sa.Integer(), nullable=True, comment='Owner (NULL = shared content)'),
+        sa.Column('deleted_at', sa.DateTime(), nullable=False, server_default=sa.text('CURRENT_TIMESTAMP')),
+        sa.ForeignKeyConstraint(['user_id'], ['users.user_id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('tombstone_id')
+    )
+    op.create_index(
+        'ix_sync_tombstones_user_id_deleted_at', 'sync_tombstones', ['user_id', 'deleted_at', 'tombstone_id'],
+        unique=False
+    )
+
+
+def downgrade():
+    """
+    Drop the tombstone table and the delta sync indexes
+    """
+    op.drop_index('ix_sync_tombstones_user_id_deleted_at', table_name='sync_tombstones')
+    op.drop_table('sync_tombstones')
+    op.drop_index('ix_weight_logs_user_id_created_at', table_name='weight_logs')
+    op.drop_index('ix_symptom_logs_user_id_created_at', table_name='symptom_logs')
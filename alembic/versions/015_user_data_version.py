@@ -0,0 +1,36 @@
+"""Per-user data version counter
+
+Revision ID: 015_user_data_version
+Revises: 014_delta_sync
+Create Date: 2025-03-31 10:00:00.000000
+
+Adds to users:
+- data_version: incremented in the same transaction as every write to the user's
+  pregnancy profile, symptom logs or weight logs. The profile and trend GET
+  endpoints build ETags from it and answer If-None-Match with 304 after one
+  primary-key lookup (app/services/data_version.py).
+
+PostgreSQL 11+ adds a column with a constant default without rewriting the table.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '015_user_data_version'
+down_revision = '014_delta_sync'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """
+    Add data_version column
+    """
+    op.add_column('users', sa.Column('data_version', sa.Integer(), nullable=False, server_default='0', comment='Bumped on every write to the user\'s profile or logs (ETags)'))
+
+
+def downgrade():
+    """
+    Drop data_version column
+    """
+    op.drop_column('users', 'data_version')
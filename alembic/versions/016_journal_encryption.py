@@ -0,0 +1,47 @@
+"""Per-user data keys for journal entry encryption
+
+Revision ID: 016_journal_encryption
+Revises: 015_user_data_version
+Create Date: 2025-04-07 10:00:00.000000
+
+Adds user_data_keys: one random data key per user, wrapped (AES-256-GCM) by the
+master key from JOURNAL_MASTER_KEY. With a master key configured,
+symptom_logs.journal_entry holds "enc:v1:" values encrypted under the owner's data
+key (app/services/journal_crypto.py). Keys are deleted with their user (ON DELETE
+CASCADE), which leaves any copies of the entries, backups included, unreadable.
+
+Existing plain-text entries stay readable and are encrypted in place by
+scripts/encrypt_journals.py. The journal full-text indexes (011_journal_search)
+are kept for plain-text deployments. Encrypted search decrypts a user's entries
+instead, so the indexes only ever see ciphertext there.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '016_journal_encryption'
+down_revision = '015_user_data_version'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """
+    Create the user_data_keys table
+    """
+    op.create_table(
+        'user_data_keys',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('wrapped_key', sa.LargeBinary(), nullable=False),
+        sa.Column('master_key_id', sa.String(length=16), nullable=False, comment='Fingerprint of the master key that wrapped the key'),
+        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('CURRENT_TIMESTAMP')),
+        sa.ForeignKeyConstraint(['user_id'], ['users.user_id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id')
+    )
+
+
+def downgrade():
+    """
+    Drop the user_data_keys table (encrypted entries become unreadable)
+    """
+    op.drop_table('user_data_keys')
@@ -0,0 +1,91 @@
+"""Compact symptom sets on symptom_logs
+
+Revision ID: 017_symptom_sets
+Revises: 016_journal_encryption
+Create Date: 2025-04-14 10:00:00.000000
+
+A check-in with several symptoms used to need one symptom_logs row per symptom,
+each repeating the mood, journal entry and week. symptom_type / severity_rating
+are replaced by:
+- symptom_mask: bit i set when the i-th SymptomType was experienced
+- symptom_severities: 3 bits per SymptomType (bits 3i..3i+2), rating 1-5, 0 = not rated
+so one row holds the whole check-in (pack_symptoms / unpack_symptoms in
+app/db/models.py). Existing rows are converted in place, one bit each, and
+flagged legacy_symptom_row = 1. Their ids and idempotency keys stay valid.
+scripts/compact_symptom_logs.py then merges a day's flagged rows that belong to
+the same check-in; rows written after the migration are never merged.
+
+The UPDATE rewrites every symptom_logs partition; run during a maintenance
+window on large databases. Downgrading keeps only the first symptom of each row.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '017_symptom_sets'
+down_revision = '016_journal_encryption'
+branch_labels = None
+depends_on = None
+
+# SymptomType names in bit order
+SYMPTOM_NAMES = (
+    'NAUSEA', 'FATIGUE', 'HEADACHE', 'BREAST_TENDERNESS', 'CRAMPING',
+    'BLOATING', 'FOOD_AVERSION', 'FREQUENT_URINATION', 'SPOTTING', 'MOOD_SWINGS',
+)
+
+
+def _case(values):
+    whens = ' '.join(f"WHEN '{name}' THEN {value}" for name, value in zip(SYMPTOM_NAMES, values))
+    return f'CASE symptom_type {whens} ELSE 0 END'
+
+
+def _covering_index(include):
+    op.drop_index('ix_symptom_logs_user_id_log_date', table_name='symptom_logs')
+    op.create_index(
+        'ix_symptom_logs_user_id_log_date', 'symptom_logs',
+        ['user_id', sa.text('log_date DESC'), sa.text('log_id DESC')],
+        unique=False, postgresql_include=include
+    )
+
+
+def upgrade():
+    """
+    Add the symptom set columns, convert existing rows and drop symptom_type / severity_rating
+    """
+    op.add_column('symptom_logs', sa.Column('symptom_mask', sa.Integer(), nullable=False, server_default='0', comment='Bit per SymptomType experienced'))
+    op.add_column('symptom_logs', sa.Column('symptom_severities', sa.Integer(), nullable=False, server_default='0', comment='3 bits per SymptomType: severity 1-5 (AC 5.1), 0 = not rated'))
+    op.add_column('symptom_logs', sa.Column('legacy_symptom_row', sa.Integer(), nullable=False, server_default='0', comment='1 = one-symptom row from before symptom sets (migration 017)'))
+    # Every existing row (a NULL symptom_type falls through to ELSE 0)
+    op.execute(
+        f"UPDATE symptom_logs SET symptom_mask = {_case(1 << i for i in range(len(SYMPTOM_NAMES)))}, "
+        f"symptom_severities = COALESCE(severity_rating, 0) * {_case(1 << 3 * i for i in range(len(SYMPTOM_NAMES)))}, "
+        "legacy_symptom_row = 1"
+    )
+    _covering_index(['mood', 'symptom_mask', 'symptom_severities', 'pregnancy_week'])
+    op.drop_column('symptom_logs', 'severity_rating')
+    op.drop_column('symptom_logs', 'symptom_type')
+
+
+def downgrade():
+    """
+    Restore symptom_type / severity_rating from the lowest symptom bit of each row (lossy)
+    """
+    symptom_type = sa.Enum(*SYMPTOM_NAMES, name='symptomtype')
+    if op.get_bind().dialect.name == 'postgresql':
+        symptom_type = postgresql.ENUM(name='symptomtype', create_type=False)
+    op.add_column('symptom_logs', sa.Column('symptom_type', symptom_type, nullable=True, comment='Type of symptom experienced'))
+    op.add_column('symptom_logs', sa.Column('severity_rating', sa.Integer(), nullable=True, comment='Severity rating 1-5 (AC 5.1)'))
+
+    first_bit = ' '.join(f"WHEN symptom_mask & {1 << i} <> 0 THEN {i}" for i in range(len(SYMPTOM_NAMES)))
+    cast = '::symptomtype' if op.get_bind().dialect.name == 'postgresql' else ''
+    names = ' '.join(f"WHEN {i} THEN '{name}'{cast}" for i, name in enumerate(SYMPTOM_NAMES))
+    op.execute(
+        f"UPDATE symptom_logs SET symptom_type = CASE CASE {first_bit} END {names} END, "
+        f"severity_rating = NULLIF((symptom_severities >> (3 * CASE {first_bit} END)) & 7, 0) "
+        "WHERE symptom_mask <> 0"
+    )
+    _covering_index(['mood', 'symptom_type', 'severity_rating', 'pregnancy_week'])
+    op.drop_column('symptom_logs', 'legacy_symptom_row')
+    op.drop_column('symptom_logs', 'symptom_severities')
+    op.drop_column('symptom_logs', 'symptom_mask')
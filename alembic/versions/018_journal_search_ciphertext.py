@@ -0,0 +1,68 @@
+"""Keep encrypted journal entries out of the full-text index
+
+Revision ID: 018_journal_search_ciphertext
+Revises: 017_symptom_sets
+Create Date: 2025-04-21 10:00:00.000000
+
+With JOURNAL_MASTER_KEY set (016_journal_encryption), journal_entry holds
+"enc:v1:" ciphertext. The journal_tsv column from 011_journal_search still
+tokenized it on every insert and update, and the GIN index stored the tokens,
+although no search can use them. PostgreSQL only:
+- journal_tsv: regenerated as an empty tsvector for "enc:v1:" values. The
+  generation expression can't be altered in place, so the column is dropped and
+  added again, which rewrites every symptom_logs partition; run during a
+  maintenance window on large databases.
+- ix_symptom_logs_journal_search: rebuilt over plain-text entries only.
+- ix_symptom_logs_user_id_journal: (user_id, log_id DESC) over rows with a
+  journal entry. Encrypted search walks it newest first, one batch at a time.
+
+SQLite development databases get the same rules (FTS5 triggers that skip
+ciphertext) from Base.metadata.create_all (see JOURNAL_SEARCH_DDL in app/db/models.py).
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '018_journal_search_ciphertext'
+down_revision = '017_symptom_sets'
+branch_labels = None
+depends_on = None
+
+
+def _rebuild_search(tsv_expression, index_where):
+    op.drop_index('ix_symptom_logs_journal_search', table_name='symptom_logs')
+    op.drop_column('symptom_logs', 'journal_tsv')
+    op.execute(
+        f"ALTER TABLE symptom_logs ADD COLUMN journal_tsv tsvector GENERATED ALWAYS AS ({tsv_expression}) STORED"
+    )
+    op.create_index(
+        'ix_symptom_logs_journal_search', 'symptom_logs', ['user_id', 'journal_tsv'],
+        postgresql_using='gin', postgresql_where=sa.text(index_where)
+    )
+
+
+def upgrade():
+    """
+    Regenerate journal_tsv and its GIN index without ciphertext; add the encrypted search index
+    """
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    _rebuild_search(
+        "to_tsvector('english', CASE WHEN journal_entry LIKE 'enc:v1:%' THEN '' "
+        "ELSE coalesce(journal_entry, '') END)",
+        "journal_entry IS NOT NULL AND journal_entry NOT LIKE 'enc:v1:%'",
+    )
+    op.create_index(
+        'ix_symptom_logs_user_id_journal', 'symptom_logs', ['user_id', sa.text('log_id DESC')],
+        postgresql_where=sa.text('journal_entry IS NOT NULL')
+    )
+
+
+def downgrade():
+    """
+    Drop the encrypted search index; index every journal entry again
+    """
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.drop_index('ix_symptom_logs_user_id_journal', table_name='symptom_logs')
+    _rebuild_search("to_tsvector('english', coalesce(journal_entry, ''))", 'journal_entry IS NOT NULL')
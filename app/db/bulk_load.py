@@ -0,0 +1,134 @@
+"""
+Bulk Fixture Loading
+Loads large CSV fixture files into tables as fast as the dialect allows
+
+- PostgreSQL: streams the file through COPY ... FROM STDIN (psycopg2
+  copy_expert), then moves the table's id sequence past the loaded ids
+- other dialects (SQLite in development): parses the CSV and inserts it in
+  batched executemany calls
+
+CSV files need a header row naming table columns. Empty cells load as NULL.
+"""
+
+import csv
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Dict, List
+
+from sqlalchemy import Boolean, Date, DateTime, Enum, Float, Integer, Numeric, Table, delete, text
+from sqlalchemy.orm import Session
+
+from app.db.dialects import dialect_name
+
+
+@dataclass
+class LoadResult:
+    """Rows loaded into one table"""
+    table: str
+    rows: int
+    method: str
+
+
+def _read_header(path: str) -> List[str]:
+    with open(path, newline="", encoding="utf-8") as handle:
+        header = next(csv.reader(handle), None)
+    if not header:
+        raise ValueError(f"{path} is empty or has no header row")
+    return header
+
+
+def _check_columns(table: Table, columns: List[str]):
+    unknown = [name for name in columns if name not in table.c]
+    if unknown:
+        raise ValueError(f"Unknown columns for {table.name}: {', '.join(unknown)}")
+
+
+def _coercer(column):
+    """CSV text -> Python value for one column (COPY does this server-side on PostgreSQL)"""
+    column_type = column.type
+    if isinstance(column_type, Enum) and column_type.enum_class is not None:
+        enum_class = column_type.enum_class
+        return lambda value: enum_class[value] if value in enum_class.__members__ else enum_class(value)
+    if isinstance(column_type, Boolean):
+        return lambda value: value.lower() in ("1", "t", "true", "yes")
+    if isinstance(column_type, Integer):
+        return int
+    if isinstance(column_type, (Float, Numeric)):
+        return float
+    if isinstance(column_type, DateTime):
+        return datetime.fromisoformat
+    if isinstance(column_type, Date):
+        return date.fromisoformat
+    return str
+
+
+def _copy_postgres(db: Session, table: Table, path: str, columns: List[str]) -> int:
+    column_list = ", ".join(f'"{name}"' for name in columns)
+    sql = f'COPY "{table.name}" ({column_list}) FROM STDIN WITH (FORMAT csv, HEADER true)'
+    cursor = db.connection().connection.cursor()
+    try:
+        with open(path, encoding="utf-8") as handle:
+            cursor.copy_expert(sql, handle)
+        rows = cursor.rowcount
+    finally:
+        cursor.close()
+
+    # Explicit ids bypass the serial sequence; move it past the loaded rows
+    for key in table.primary_key.columns:
+        if key.name in columns and isinstance(key.type, Integer):
+            db.execute(
+                text("SELECT setval(pg_get_serial_sequence(:table, :column), "
+                     f'COALESCE((SELECT MAX("{key.name}") FROM "{table.name}"), 0) + 1, false)'),
+                {"table": table.name, "column": key.name},
+            )
+    return rows
+
+
+def _insert_batches(db: Session, table: Table, path: str, batch_size: int) -> int:
+    coerce: Dict[str, object] = {}
+    rows = 0
+    batch = []
+    with open(path, newline="", encoding="utf-8") as handle:
+        for record in csv.DictReader(handle):
+            row = {}
+            for name, value in record.items():
+                if name not in coerce:
+                    coerce[name] = _coercer(table.c[name])
+                row[name] = None if value == "" else coerce[name](value)
+            batch.append(row)
+            if len(batch) >= batch_size:
+                db.execute(table.insert(), batch)
+                rows += len(batch)
+                batch = []
+    if batch:
+        db.execute(table.insert(), batch)
+        rows += len(batch)
+    return rows
+
+
+def truncate_tables(db: Session, tables: List[Table]):
+    """
+    Empty tables before a reload (caller commits)
+    PostgreSQL uses TRUNCATE ... CASCADE, which also empties tables referencing
+    them (e.g. rollups); elsewhere rows are deleted children first.
+    """
+    if dialect_name(db) == "postgresql":
+        names = ", ".join(f'"{table.name}"' for table in tables)
+        db.execute(text(f"TRUNCATE {names} CASCADE"))
+        return
+    for table in reversed(tables):
+        db.execute(delete(table))
+
+
+def load_csv(db: Session, table: Table, path: str, batch_size: int = 5000) -> LoadResult:
+    """
+    Load one CSV file into a table
+    Caller commits, so several files can load in one transaction.
+    """
+    columns = _read_header(path)
+    _check_columns(table, columns)
+
+    if dialect_name(db) == "postgresql":
+        return LoadResult(table.name, _copy_postgres(db, table, path, columns), "copy")
+    return LoadResult(table.name, _insert_batches(db, table, path, batch_size), "insert")
+
@@ -0,0 +1,43 @@
+"""
+Dialect Helpers
+Dialect-specific SQL constructs shared by services
+"""
+
+from sqlalchemy import event, insert as generic_insert
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Engine
+
+
+def dialect_name(db) -> str:
+    """Dialect name for a Session or AsyncSession ('postgresql', 'sqlite', ...)"""
+    return db.get_bind().dialect.name
+
+
+def insert_for(db):
+    """
+    insert() construct for the session's dialect
+    PostgreSQL and SQLite variants support on_conflict_do_nothing/do_update
+    (INSERT ... ON CONFLICT) and RETURNING.
+    """
+    name = dialect_name(db)
+    if name == "postgresql":
+        return postgresql.insert
+    if name == "sqlite":
+        return sqlite.insert
+    return generic_insert
+
+
+def _sqlite_foreign_keys_on(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+def enforce_foreign_keys(engine: Engine):
+    """
+    Turn on FOREIGN KEY enforcement for every new connection of a SQLite (sync) engine
+    SQLite ignores foreign keys, ON DELETE CASCADE included, unless each connection
+    asks for them. PostgreSQL always enforces them; other engines are left alone.
+    """
+    if engine.dialect.name == "sqlite" and not event.contains(engine, "connect", _sqlite_foreign_keys_on):
+        event.listen(engine, "connect", _sqlite_foreign_keys_on)
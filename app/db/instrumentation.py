@@ -0,0 +1,90 @@
+"""
+Query Instrumentation
+Per-request SQL statement counting and timing via SQLAlchemy cursor events
+
+The metrics middleware opens a QueryStats for each request in a context
+variable. Cursor events on the sync and async engines add every statement to it
+(async sessions run their cursor events in the request's context, and
+threadpool handlers inherit a copy of the context pointing at the same object).
+Statements run outside a request, e.g. from scripts or background tasks, are
+not tracked.
+
+A statement repeated N_PLUS_ONE_THRESHOLD or more times in one request is
+reported by the metrics middleware as a likely N+1 pattern. A typical cause is lazy-loading
+User.symptom_logs in a loop.
+"""
+
+import contextvars
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+@dataclass
+class QueryStats:
+    """SQL activity of one request"""
+    count: int = 0
+    db_time: float = 0.0
+    statements: Counter = field(default_factory=Counter)
+    captured: List[Tuple[str, float]] = field(default_factory=list)
+    # Statements kept for the slow-request log (MAX_CAPTURED_STATEMENTS)
+    max_captured: int = 50
+
+    def record(self, statement: str, elapsed: float):
+        self.count += 1
+        self.db_time += elapsed
+        self.statements[statement] += 1
+        if len(self.captured) < self.max_captured:
+            self.captured.append((statement, elapsed))
+
+    def repeated_statements(self, threshold: int) -> List[Tuple[str, int]]:
+        """Statements executed at least `threshold` times (likely N+1 patterns)"""
+        return [(statement, count) for statement, count in self.statements.most_common() if count >= threshold]
+
+
+_current_stats: contextvars.ContextVar[Optional[QueryStats]] = contextvars.ContextVar("query_stats", default=None)
+
+
+def start_tracking(max_captured: int = 50) -> contextvars.Token:
+    """Begin collecting query stats for the current request, keeping up to max_captured statements"""
+    return _current_stats.set(QueryStats(max_captured=max_captured))
+
+
+def current_stats() -> Optional[QueryStats]:
+    return _current_stats.get()
+
+
+def stop_tracking(token: contextvars.Token):
+    _current_stats.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_stats.get() is not None:
+        conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_stats.get()
+    started = conn.info.get("query_started_at")
+    if stats is None or not started:
+        return
+    stats.record(statement, time.perf_counter() - started.pop())
+
+
+def _handle_error(exception_context):
+    # Failed statements never reach after_cursor_execute; drop their start time
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_started_at"):
+        conn.info["query_started_at"].pop()
+
+
+def instrument_engine(engine: Engine):
+    """Attach the per-request query listeners to a (sync) engine"""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(engine, "handle_error", _handle_error)
@@ -4,7 +4,8 @@ SQLAlchemy ORM Models based on System Architecture Document
 """
 
 from datetime import datetime, date
-from sqlalchemy import Column, Integer, String, Float, Date, DateTime, Text, ForeignKey, Enum as SQLEnum
+from typing import Iterable, List, Optional, Tuple
+from sqlalchemy import Column, Integer, String, Float, Date, DateTime, Text, LargeBinary, ForeignKey, Index, Enum as SQLEnum, DDL, event
 from sqlalchemy.orm import relationship
 from sqlalchemy.ext.declarative import declarative_base
 import enum
@@ -27,19 +28,37 @@ class User(Base):
     # Push notification token for daily check-in reminders (Feature 4)
     platform_token = Column(String(512), nullable=True)
     
+    # Daily check-in reminder schedule (Feature 4)
+    timezone = Column(String(64), nullable=False, default="UTC", comment="IANA timezone name (e.g., 'Africa/Nairobi')")
+    reminder_local_minute = Column(Integer, nullable=True, default=1200, comment="Reminder time as minute of the local day (NULL = off)")
+    
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     last_login = Column(DateTime, nullable=True)
+    tokens_valid_after = Column(DateTime, nullable=True, comment="Access tokens issued before this are revoked (logout)")
+    
+    # Conditional GETs: bumped on every write to the user's profile or logs (app/services/data_version.py)
+    data_version = Column(Integer, nullable=False, default=0, server_default="0", comment="Bumped on every write to the user's profile or logs (ETags)")
     
     # Account status
     is_active = Column(Integer, default=1, nullable=False)  # 1 = active, 0 = inactive
     
     # Relationships
-    pregnancy_profile = relationship("PregnancyProfile", back_populates="user", uselist=False, cascade="all, delete-orphan")
-    symptom_logs = relationship("SymptomLog", back_populates="user", cascade="all, delete-orphan")
-    weight_logs = relationship("WeightLog", back_populates="user", cascade="all, delete-orphan")
-    feedbacks = relationship("Feedback", back_populates="user", cascade="all, delete-orphan")
+    # passive_deletes: deleting a user leaves unloaded children to the FKs' ON DELETE CASCADE
+    # instead of loading and deleting them row by row (app/services/erasure_service.py)
+    pregnancy_profile = relationship("PregnancyProfile", back_populates="user", uselist=False, cascade="all, delete-orphan", passive_deletes=True)
+    symptom_logs = relationship("SymptomLog", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    weight_logs = relationship("WeightLog", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    feedbacks = relationship("Feedback", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+
+    # Reminder waves select users by (local minute, timezone)
+    __table_args__ = (
+        Index(
+            "ix_users_reminder_slot", reminder_local_minute, timezone,
+            postgresql_where=(is_active == 1) & platform_token.isnot(None) & reminder_local_minute.isnot(None)
+        ),
+    )
 
     def __repr__(self):
         return f"<User(user_id={self.user_id}, email={self.email})>"
@@ -79,6 +98,18 @@ class PregnancyProfile(Base):
         return f"<PregnancyProfile(profile_id={self.profile_id}, user_id={self.user_id}, edd={self.edd})>"
 
 
+@event.listens_for(PregnancyProfile, "before_insert")
+@event.listens_for(PregnancyProfile, "before_update")
+def recompute_cached_week(mapper, connection, target):
+    """
+    AC 3.1: Keep current_week/current_day in step with EDD/LMP edits
+    Runs on every ORM flush of a profile; the nightly rollover job
+    (scripts/recompute_pregnancy_weeks.py) handles day-to-day progression.
+    """
+    from app.services.pregnancy_calculator import PregnancyCalculator
+    PregnancyCalculator.apply(target)
+
+
 class MoodType(enum.Enum):
     """Enum for mood types (AC 7.1: predefined, non-judgmental terms)"""
     HAPPY = "Happy"
@@ -105,56 +136,167 @@ class SymptomType(enum.Enum):
     MOOD_SWINGS = "Mood Swings"
 
 
+# Compact symptom sets (SymptomLog.symptom_mask / symptom_severities):
+# bit i of the mask is the i-th SymptomType, and bits 3i..3i+2 of the severity
+# vector hold its rating (0 = not rated). Append new symptom types at the end;
+# reordering them would change the meaning of stored rows.
+SYMPTOM_BITS = {symptom: 1 << index for index, symptom in enumerate(SymptomType)}
+SEVERITY_SHIFTS = {symptom: 3 * index for index, symptom in enumerate(SymptomType)}
+SEVERITY_MASK = 0b111
+
+
+def pack_symptoms(ratings: Iterable[Tuple[SymptomType, Optional[int]]]) -> Tuple[int, int]:
+    """(symptom_mask, symptom_severities) for (symptom, severity or None) pairs"""
+    mask = severities = 0
+    for symptom, severity in ratings:
+        symptom = SymptomType(symptom)
+        mask |= SYMPTOM_BITS[symptom]
+        severities = (severities & ~(SEVERITY_MASK << SEVERITY_SHIFTS[symptom])) \
+            | ((severity or 0) << SEVERITY_SHIFTS[symptom])
+    return mask, severities
+
+
+def unpack_symptoms(mask: Optional[int], severities: Optional[int]) -> List[Tuple[SymptomType, Optional[int]]]:
+    """(symptom, severity or None) pairs of a stored symptom set, in SymptomType order"""
+    if not mask:
+        return []
+    return [
+        (symptom, ((severities or 0) >> SEVERITY_SHIFTS[symptom]) & SEVERITY_MASK or None)
+        for symptom, bit in SYMPTOM_BITS.items() if mask & bit
+    ]
+
+
 class SymptomLog(Base):
     """
     SymptomLog table - Tracks daily symptoms, mood, and journal entries
     Features 5, 7, 8 (Daily Check-in & Logging)
+    One row per check-in: every symptom of the check-in is in one bitmask plus a
+    packed severity vector (pack_symptoms / unpack_symptoms, migration 017)
     AC 5.1: Symptom selection via friendly icons
     AC 7.1: Mood uses simple scale or predefined terms
     AC 8.1: Optional free-form journaling
+    On PostgreSQL, range-partitioned by month on log_date with primary key (log_id, log_date)
+    (migration 010, maintained by scripts/maintain_log_partitions.py)
     """
     __tablename__ = "symptom_logs"
 
     log_id = Column(Integer, primary_key=True, index=True, autoincrement=True)
-    user_id = Column(Integer, ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False)
     
     # Log date (indexed for querying trends)
     log_date = Column(Date, nullable=False, index=True, default=date.today)
     
     # Symptom tracking (Feature 5)
-    symptom_type = Column(SQLEnum(SymptomType), nullable=True, comment="Type of symptom experienced")
-    severity_rating = Column(Integer, nullable=True, comment="Severity rating 1-5 (AC 5.1)")
+    symptom_mask = Column(Integer, nullable=False, default=0, server_default="0", comment="Bit per SymptomType experienced")
+    symptom_severities = Column(Integer, nullable=False, default=0, server_default="0", comment="3 bits per SymptomType: severity 1-5 (AC 5.1), 0 = not rated")
+    # Rows converted by migration 017; only these are merged by scripts/compact_symptom_logs.py
+    legacy_symptom_row = Column(Integer, nullable=False, default=0, server_default="0", comment="1 = one-symptom row from before symptom sets (migration 017)")
     
     # Mood tracking (Feature 7 - AC 7.1)
     mood = Column(SQLEnum(MoodType), nullable=True, comment="Daily mood selection")
     
     # Free-form journaling (Feature 8 - AC 8.1)
+    # Encrypted at rest when JOURNAL_MASTER_KEY is set ("enc:v1:..." values, app/services/journal_crypto.py)
     journal_entry = Column(Text, nullable=True, comment="Optional daily journal text")
     
     # Pregnancy week at time of log (for trend analysis)
     pregnancy_week = Column(Integer, nullable=True)
     
+    # Client-generated idempotency key (offline sync retries)
+    client_entry_id = Column(String(64), nullable=True, comment="Client-generated idempotency key")
+    
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     
     # Relationships
     user = relationship("User", back_populates="symptom_logs")
 
+    # Composite covering index for per-user trend queries and keyset pagination
+    __table_args__ = (
+        Index(
+            "ix_symptom_logs_user_id_log_date",
+            user_id, log_date.desc(), log_id.desc(),
+            postgresql_include=["mood", "symptom_mask", "symptom_severities", "pregnancy_week"]
+        ),
+        # Includes log_date because unique indexes on the partitioned table must contain the partition key
+        Index("uq_symptom_logs_user_id_client_entry_id", user_id, client_entry_id, log_date, unique=True),
+        # Delta sync: a user's rows created after a cursor (app/services/sync_service.py)
+        Index("ix_symptom_logs_user_id_created_at", user_id, created_at, log_id),
+        # Encrypted journal search: a user's entries, newest first (app/services/journal_search.py)
+        Index(
+            "ix_symptom_logs_user_id_journal", user_id, log_id.desc(),
+            postgresql_where=journal_entry.isnot(None), sqlite_where=journal_entry.isnot(None)
+        ),
+    )
+
+    @property
+    def symptoms(self) -> List[dict]:
+        """Expanded symptom set: [{"symptom_type": ..., "severity_rating": ...}, ...]"""
+        return [
+            {"symptom_type": symptom, "severity_rating": severity}
+            for symptom, severity in unpack_symptoms(self.symptom_mask, self.symptom_severities)
+        ]
+
     def __repr__(self):
         return f"<SymptomLog(log_id={self.log_id}, user_id={self.user_id}, date={self.log_date})>"
 
 
+# Journal full-text search (GET /v1/logs/journal/search, app/services/journal_search.py)
+# PostgreSQL: generated tsvector column + (user_id, journal_tsv) GIN index (migration 011_journal_search);
+# the column is not mapped, so ORM queries never load it.
+# SQLite: an external-content FTS5 table kept in sync by triggers.
+# Encrypted entries ("enc:v1:...") are left out of both (migration 018): tokenizing
+# ciphertext is write overhead that no search can use. %% is a literal % (DDL formatting).
+JOURNAL_SEARCH_DDL = {
+    "postgresql": [
+        "CREATE EXTENSION IF NOT EXISTS btree_gin",
+        "ALTER TABLE symptom_logs ADD COLUMN journal_tsv tsvector "
+        "GENERATED ALWAYS AS (to_tsvector('english', CASE WHEN journal_entry LIKE 'enc:v1:%%' THEN '' "
+        "ELSE coalesce(journal_entry, '') END)) STORED",
+        "CREATE INDEX ix_symptom_logs_journal_search ON symptom_logs "
+        "USING gin (user_id, journal_tsv) WHERE journal_entry IS NOT NULL AND journal_entry NOT LIKE 'enc:v1:%%'",
+    ],
+    "sqlite": [
+        "CREATE VIRTUAL TABLE symptom_logs_fts USING fts5("
+        "journal_entry, content='symptom_logs', content_rowid='log_id', tokenize='porter unicode61')",
+        "CREATE TRIGGER symptom_logs_fts_insert AFTER INSERT ON symptom_logs "
+        "WHEN new.journal_entry IS NOT NULL AND new.journal_entry NOT LIKE 'enc:v1:%%' BEGIN "
+        "INSERT INTO symptom_logs_fts(rowid, journal_entry) VALUES (new.log_id, new.journal_entry); END",
+        "CREATE TRIGGER symptom_logs_fts_delete AFTER DELETE ON symptom_logs "
+        "WHEN old.journal_entry IS NOT NULL AND old.journal_entry NOT LIKE 'enc:v1:%%' BEGIN "
+        "INSERT INTO symptom_logs_fts(symptom_logs_fts, rowid, journal_entry) "
+        "VALUES ('delete', old.log_id, old.journal_entry); END",
+        "CREATE TRIGGER symptom_logs_fts_update AFTER UPDATE OF journal_entry ON symptom_logs BEGIN "
+        "INSERT INTO symptom_logs_fts(symptom_logs_fts, rowid, journal_entry) "
+        "SELECT 'delete', old.log_id, old.journal_entry "
+        "WHERE old.journal_entry IS NOT NULL AND old.journal_entry NOT LIKE 'enc:v1:%%'; "
+        "INSERT INTO symptom_logs_fts(rowid, journal_entry) "
+        "SELECT new.log_id, new.journal_entry "
+        "WHERE new.journal_entry IS NOT NULL AND new.journal_entry NOT LIKE 'enc:v1:%%'; END",
+    ],
+}
+
+for _dialect, _statements in JOURNAL_SEARCH_DDL.items():
+    for _statement in _statements:
+        event.listen(SymptomLog.__table__, "after_create", DDL(_statement).execute_if(dialect=_dialect))
+event.listen(
+    SymptomLog.__table__, "after_drop", DDL("DROP TABLE IF EXISTS symptom_logs_fts").execute_if(dialect="sqlite")
+)
+
+
 class WeightLog(Base):
     """
     WeightLog table - Tracks daily weight entries
     Feature 6 (Weight Logging)
     AC 6.1: Display last recorded weight upon entry
     AC 12.1: Weight Trend Chart displays last 7 and 30 days
+    On PostgreSQL, range-partitioned by month on log_date with primary key (weight_log_id, log_date)
+    (migration 010, maintained by scripts/maintain_log_partitions.py)
     """
     __tablename__ = "weight_logs"
 
     weight_log_id = Column(Integer, primary_key=True, index=True, autoincrement=True)
-    user_id = Column(Integer, ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False)
     
     # Log date (indexed for trend queries)
     log_date = Column(Date, nullable=False, index=True, default=date.today)
@@ -165,16 +307,141 @@ class WeightLog(Base):
     # Pregnancy week at time of log
     pregnancy_week = Column(Integer, nullable=True)
     
+    # Client-generated idempotency key (offline sync retries)
+    client_entry_id = Column(String(64), nullable=True, comment="Client-generated idempotency key")
+    
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     
     # Relationships
     user = relationship("User", back_populates="weight_logs")
 
+    # Composite covering index for the weight trend chart and keyset pagination
+    __table_args__ = (
+        Index(
+            "ix_weight_logs_user_id_log_date",
+            user_id, log_date.desc(), weight_log_id.desc(),
+            postgresql_include=["weight_kg", "pregnancy_week"]
+        ),
+        # Includes log_date because unique indexes on the partitioned table must contain the partition key
+        Index("uq_weight_logs_user_id_client_entry_id", user_id, client_entry_id, log_date, unique=True),
+        # Delta sync: a user's rows created after a cursor (app/services/sync_service.py)
+        Index("ix_weight_logs_user_id_created_at", user_id, created_at, weight_log_id),
+    )
+
     def __repr__(self):
         return f"<WeightLog(weight_log_id={self.weight_log_id}, user_id={self.user_id}, weight={self.weight_kg}kg)>"
 
 
+def bump_data_version(mapper, connection, target):
+    """
+    Bump the owner's users.data_version when the ORM writes a profile or log row
+    Core bulk writes (DailyLogService.ingest, the rollover job) bump it themselves.
+    """
+    from app.services.data_version import bump_statement
+    connection.execute(bump_statement(target.user_id))
+
+
+for _model in (PregnancyProfile, SymptomLog, WeightLog):
+    for _event in ("after_insert", "after_update", "after_delete"):
+        event.listen(_model, _event, bump_data_version)
+
+
+class _LogRollupMetrics:
+    """
+    Shared rollup columns: weight stats and mood counts per MoodType
+    Mean weight is weight_sum / weight_count so rows can be updated incrementally
+    """
+    weight_count = Column(Integer, nullable=False, default=0, comment="Number of weight entries")
+    weight_sum = Column(Float, nullable=False, default=0.0, comment="Sum of weight_kg (mean = sum / count)")
+    weight_min = Column(Float, nullable=True, comment="Lowest weight_kg")
+    weight_max = Column(Float, nullable=True, comment="Highest weight_kg")
+    
+    # Mood counts (one column per MoodType, see MOOD_ROLLUP_COLUMNS)
+    mood_happy = Column(Integer, nullable=False, default=0)
+    mood_anxious = Column(Integer, nullable=False, default=0)
+    mood_tired = Column(Integer, nullable=False, default=0)
+    mood_irritable = Column(Integer, nullable=False, default=0)
+    mood_excited = Column(Integer, nullable=False, default=0)
+    mood_calm = Column(Integer, nullable=False, default=0)
+    mood_overwhelmed = Column(Integer, nullable=False, default=0)
+    mood_neutral = Column(Integer, nullable=False, default=0)
+    
+    # Metadata
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+
+# Rollup column name for each MoodType
+MOOD_ROLLUP_COLUMNS = {mood: f"mood_{mood.name.lower()}" for mood in MoodType}
+
+
+class DailyLogRollup(_LogRollupMetrics, Base):
+    """
+    DailyLogRollup table - One row per user per day of weight and mood stats
+    Maintained incrementally on every log write; rebuilt by scripts/rebuild_rollups.py
+    AC 12.1: Weight Trend Chart reads 7 / 30 rows instead of raw logs
+    """
+    __tablename__ = "daily_log_rollups"
+
+    user_id = Column(Integer, ForeignKey("users.user_id", ondelete="CASCADE"), primary_key=True)
+    log_date = Column(Date, primary_key=True)
+    
+    # Pregnancy week of the day's logs
+    pregnancy_week = Column(Integer, nullable=True)
+
+    def __repr__(self):
+        return f"<DailyLogRollup(user_id={self.user_id}, log_date={self.log_date})>"
+
+
+class WeeklyLogRollup(_LogRollupMetrics, Base):
+    """
+    WeeklyLogRollup table - One row per user per pregnancy week of weight and mood stats
+    Maintained incrementally on every log write; rebuilt by scripts/rebuild_rollups.py
+    """
+    __tablename__ = "weekly_log_rollups"
+
+    user_id = Column(Integer, ForeignKey("users.user_id", ondelete="CASCADE"), primary_key=True)
+    pregnancy_week = Column(Integer, primary_key=True)
+
+    def __repr__(self):
+        return f"<WeeklyLogRollup(user_id={self.user_id}, pregnancy_week={self.pregnancy_week})>"
+
+
+class ExportJob(Base):
+    """
+    ExportJob table - Background PDF summary exports (GET /v1/logs/summary/pdf)
+    Jobs are rendered in a process pool and spooled to local disk.
+    input_fingerprint identifies the data a file was rendered from, so an
+    unchanged summary is served from the existing file instead of re-rendering.
+    """
+    __tablename__ = "export_jobs"
+
+    job_id = Column(String(36), primary_key=True, comment="UUID4 job identifier")
+    user_id = Column(Integer, ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False)
+    
+    # pending -> running -> completed | failed
+    status = Column(String(20), nullable=False, default="pending", comment="pending, running, completed, failed")
+    
+    # Hash of the export inputs (log counts/ids, profile version, date range, renderer version)
+    input_fingerprint = Column(String(64), nullable=False)
+    
+    # Spooled output
+    file_path = Column(String(512), nullable=True)
+    file_size = Column(Integer, nullable=True)
+    error = Column(Text, nullable=True)
+    
+    # Timestamps
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    completed_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index("ix_export_jobs_user_id_fingerprint", user_id, input_fingerprint),
+    )
+
+    def __repr__(self):
+        return f"<ExportJob(job_id={self.job_id}, user_id={self.user_id}, status={self.status})>"
+
+
 class WeeklyContent(Base):
     """
     WeeklyContent table - Static, curated educational content for weeks 1-12
@@ -229,6 +496,109 @@ class VisitExplanation(Base):
         return f"<VisitExplanation(visit_id={self.visit_id}, visit_number={self.visit_number}, title={self.title})>"
 
 
+class SymptomGuidance(Base):
+    """
+    SymptomGuidance table - Curated guidance rules for GET /v1/content/symptom/check
+    Each rule covers one symptom over a severity range (1-5) and a week range (1-12).
+    Where rules overlap, the highest priority wins. Workers compile the rules into
+    a dense lookup table (app/services/symptom_guidance.py) and never query this table per request.
+    """
+    __tablename__ = "symptom_guidance"
+
+    guidance_id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    
+    # Stable rule identifier (natural key for data/content releases)
+    rule_key = Column(String(64), unique=True, nullable=False, comment="Stable rule identifier")
+    
+    # What the rule matches
+    symptom_type = Column(SQLEnum(SymptomType), nullable=False, comment="Symptom the rule applies to")
+    min_severity = Column(Integer, nullable=False, comment="Lowest severity rating covered (1-5)")
+    max_severity = Column(Integer, nullable=False, comment="Highest severity rating covered (1-5)")
+    week_start = Column(Integer, nullable=False, comment="First pregnancy week covered (1-12)")
+    week_end = Column(Integer, nullable=False, comment="Last pregnancy week covered (1-12)")
+    priority = Column(Integer, nullable=False, default=0, comment="Higher wins where rules overlap")
+    
+    # Guidance
+    level = Column(String(20), nullable=False, comment="self_care, contact_provider or urgent")
+    title = Column(String(255), nullable=False, comment="Short guidance headline")
+    advice = Column(Text, nullable=False, comment="Guidance text shown to the user")
+    
+    # Metadata
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<SymptomGuidance(rule_key={self.rule_key}, symptom={self.symptom_type}, level={self.level})>"
+
+
+class SyncTombstone(Base):
+    """
+    SyncTombstone table - Deletes of rows that mobile clients hold a copy of
+    Returned by GET /v1/sync so clients drop rows deleted since their cursor.
+    user_id is NULL for shared content (e.g. a week removed by a content release).
+    """
+    __tablename__ = "sync_tombstones"
+
+    tombstone_id = Column(Integer, primary_key=True, autoincrement=True)
+    
+    # What was deleted: sync table name and the id clients know the row by
+    entity = Column(String(32), nullable=False, comment="Sync table name (e.g. 'weekly_content')")
+    entity_key = Column(Integer, nullable=False, comment="Row id as sent to clients")
+    user_id = Column(Integer, ForeignKey("users.user_id", ondelete="CASCADE"), nullable=True, comment="Owner (NULL = shared content)")
+    
+    deleted_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        Index("ix_sync_tombstones_user_id_deleted_at", user_id, deleted_at, tombstone_id),
+    )
+
+    def __repr__(self):
+        return f"<SyncTombstone(entity={self.entity}, entity_key={self.entity_key}, user_id={self.user_id})>"
+
+
+class UserDataKey(Base):
+    """
+    UserDataKey table - Per-user data key for journal entry encryption (app/services/journal_crypto.py)
+    The key is stored wrapped (AES-256-GCM) by the master key; erasing the user deletes it.
+    """
+    __tablename__ = "user_data_keys"
+
+    user_id = Column(Integer, ForeignKey("users.user_id", ondelete="CASCADE"), primary_key=True)
+    
+    # nonce || AES-GCM(master key, data key), with the user id as associated data
+    wrapped_key = Column(LargeBinary, nullable=False)
+    master_key_id = Column(String(16), nullable=False, comment="Fingerprint of the master key that wrapped the key")
+    
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<UserDataKey(user_id={self.user_id}, master_key_id={self.master_key_id})>"
+
+
+class ContentVersion(Base):
+    """
+    ContentVersion table - Version markers for static content sets
+    Bumped by scripts/seed_content.py whenever a reseed changes content
+    App workers poll it to know when to reload their in-memory content store
+    """
+    __tablename__ = "content_versions"
+
+    # Content set name (e.g., 'static_content' for weekly content + visits)
+    content_key = Column(String(50), primary_key=True, comment="Content set name")
+    
+    # Monotonic version, incremented on every reseed
+    version = Column(Integer, nullable=False, default=1, comment="Incremented on every reseed")
+    
+    # Data file release applied by the last reseed (data/content/manifest.json)
+    release = Column(String(50), nullable=True, comment="Content data release last applied")
+    
+    # Metadata
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<ContentVersion(content_key={self.content_key}, version={self.version})>"
+
+
 class Feedback(Base):
     """
     Feedback table - Stores user satisfaction feedback (NPS)
@@ -256,4 +626,43 @@ class Feedback(Base):
     user = relationship("User", back_populates="feedbacks")
 
     def __repr__(self):
-        return f"<Feedback(feedback_id={self.feedback_id}, user_id={self.user_id}, nps={self.nps_score})>"
\ No newline at end of file
+        return f"<Feedback(feedback_id={self.feedback_id}, user_id={self.user_id}, nps={self.nps_score})>"
+
+
+class _NpsRollupCounts:
+    """
+    Shared NPS rollup columns: respondents per NPS category
+    NPS = (promoters - detractors) / (promoters + passives + detractors) * 100
+    """
+    promoters = Column(Integer, nullable=False, default=0, comment="Scores 9-10")
+    passives = Column(Integer, nullable=False, default=0, comment="Scores 7-8")
+    detractors = Column(Integer, nullable=False, default=0, comment="Scores 0-6")
+    
+    # Metadata
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+
+class NpsDailyRollup(_NpsRollupCounts, Base):
+    """
+    NpsDailyRollup table - Promoter / passive / detractor counts per day (UTC) of feedback
+    Feature 15: maintained on every feedback insert; rebuilt by scripts/rebuild_nps_rollups.py
+    """
+    __tablename__ = "nps_daily_rollups"
+
+    feedback_date = Column(Date, primary_key=True)
+
+    def __repr__(self):
+        return f"<NpsDailyRollup(feedback_date={self.feedback_date})>"
+
+
+class NpsWeeklyRollup(_NpsRollupCounts, Base):
+    """
+    NpsWeeklyRollup table - Promoter / passive / detractor counts per pregnancy week
+    Feedback without a pregnancy week is only counted in the daily rollups
+    """
+    __tablename__ = "nps_weekly_rollups"
+
+    pregnancy_week = Column(Integer, primary_key=True)
+
+    def __repr__(self):
+        return f"<NpsWeeklyRollup(pregnancy_week={self.pregnancy_week})>"
@@ -0,0 +1,205 @@
+"""
+Read Replica Routing
+Routes read-only request sessions to streaming replicas, keeping writes and fresh reads on the primary
+
+Configuration:
+- REPLICA_DATABASE_URLS: comma-separated replica URLs (sync or async form; the
+  async driver is swapped in). Unset means every session uses the primary.
+- READ_YOUR_WRITES_SECONDS: after a user's request commits a write, that user's
+  reads stay on the primary for this long, so they never see their own check-in
+  missing from a lagging replica
+- REPLICA_HEALTH_INTERVAL: seconds between replica health checks
+- REPLICA_MAX_LAG_SECONDS: PostgreSQL replicas replaying further behind than
+  this are treated as down (0 = no lag limit)
+
+Replicas that fail a health check, or drop a connection mid-request, leave the
+rotation until a later check succeeds. With no healthy replica, reads fall back
+to the primary. Read-your-writes tracking is per process. Run one worker per
+container, or raise READ_YOUR_WRITES_SECONDS, if requests from one user can
+reach different workers within the window.
+"""
+
+import asyncio
+import itertools
+import logging
+import time
+from contextvars import ContextVar
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.orm import Session
+
+from app.config import Settings
+from app.db.instrumentation import instrument_engine
+from app.services.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# User whose request is being served (set by the auth dependency)
+_request_user: ContextVar[Optional[int]] = ContextVar("request_user", default=None)
+
+# user_id -> True while the user's reads are pinned to the primary
+# (TTL = READ_YOUR_WRITES_SECONDS, set by build_router)
+recent_writers = TTLCache(maxsize=100000, ttl=0)
+
+
+def set_request_user(user_id: Optional[int]):
+    _request_user.set(user_id)
+
+
+def note_write(user_id: int):
+    """Pin a user's reads to the primary for the read-your-writes window"""
+    recent_writers.set(user_id, True)
+
+
+class PrimarySession(Session):
+    """Session class for primary (read-write) sessions; commits that wrote mark the request user"""
+
+
+@event.listens_for(PrimarySession, "do_orm_execute")
+def _mark_statement_write(orm_execute_state):
+    # Core INSERT/UPDATE/DELETE through session.execute() bypass the flush
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info["wrote"] = True
+
+
+@event.listens_for(PrimarySession, "after_flush")
+def _mark_flush_write(session, flush_context):
+    session.info["wrote"] = True
+
+
+@event.listens_for(PrimarySession, "after_commit")
+def _note_committed_write(session):
+    if session.info.pop("wrote", False):
+        user_id = _request_user.get()
+        if user_id is not None:
+            note_write(user_id)
+
+
+@event.listens_for(PrimarySession, "after_rollback")
+def _clear_write_mark(session):
+    session.info.pop("wrote", None)
+
+
+class Replica:
+    """One replica engine and its last health check result"""
+
+    def __init__(self, name: str, engine: AsyncEngine):
+        self.name = name
+        self.engine = engine
+        self.healthy = True
+        self.lag_seconds: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.checked_at: Optional[float] = None
+
+    def mark_down(self, reason: str):
+        if self.healthy:
+            logger.warning("Replica %s marked down: %s", self.name, reason)
+        self.healthy = False
+        self.last_error = reason
+
+    def status(self) -> dict:
+        return {
+            "name": self.name, "healthy": self.healthy, "lag_seconds": self.lag_seconds,
+        }
+
+
+class ReplicaRouter:
+    """Chooses the engine for read-only sessions"""
+
+    def __init__(self, primary: AsyncEngine, replicas: List[Replica],
+                 max_lag_seconds: float = 0, health_interval: float = 5):
+        self.primary = primary
+        self.replicas = replicas
+        self.max_lag_seconds = max_lag_seconds
+        self.health_interval = health_interval
+        self._rotation = itertools.cycle(replicas) if replicas else None
+        self.routed: Dict[str, int] = {"primary": 0, **{replica.name: 0 for replica in replicas}}
+        for replica in replicas:
+            self._watch_disconnects(replica)
+
+    @staticmethod
+    def _watch_disconnects(replica: Replica):
+        @event.listens_for(replica.engine.sync_engine, "handle_error")
+        def _on_error(context):
+            if context.is_disconnect:
+                replica.mark_down(str(context.original_exception))
+
+    def pick(self, user_id: Optional[int] = None) -> AsyncEngine:
+        """Next healthy replica (round robin), or the primary"""
+        if self._rotation is not None and not (user_id is not None and user_id in recent_writers):
+            for _ in range(len(self.replicas)):
+                replica = next(self._rotation)
+                if replica.healthy:
+                    self.routed[replica.name] += 1
+                    return replica.engine
+        self.routed["primary"] += 1
+        return self.primary
+
+    @staticmethod
+    async def _probe(replica: Replica) -> float:
+        async with replica.engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            if replica.engine.dialect.name != "postgresql":
+                return 0.0
+            return float(await conn.scalar(text(
+                "SELECT COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)"
+            )))
+
+    async def check(self, replica: Replica, timeout: float = 2.0):
+        """Probe one replica (SELECT 1, plus replay lag on PostgreSQL) and update its status"""
+        replica.checked_at = time.time()
+        try:
+            lag = await asyncio.wait_for(self._probe(replica), timeout)
+        except Exception as exc:
+            replica.mark_down(str(exc) or type(exc).__name__)
+            return
+
+        replica.lag_seconds = lag
+        if self.max_lag_seconds and lag > self.max_lag_seconds:
+            replica.mark_down(f"replication lag {lag:.1f}s")
+            return
+        if not replica.healthy:
+            logger.info("Replica %s is back", replica.name)
+        replica.healthy = True
+        replica.last_error = None
+
+    async def check_all(self):
+        await asyncio.gather(*(self.check(replica) for replica in self.replicas))
+
+    async def watch(self, interval_seconds: Optional[float] = None):
+        """Background task: re-check replica health every interval (default REPLICA_HEALTH_INTERVAL)"""
+        while True:
+            await self.check_all()
+            await asyncio.sleep(interval_seconds or self.health_interval)
+
+    def status(self) -> dict:
+        return {
+            "replicas": [replica.status() for replica in self.replicas],
+            "routed": dict(self.routed),
+        }
+
+    async def dispose(self):
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+
+def build_router(primary: AsyncEngine, settings: Settings, to_async_url: Callable[[str], str],
+                 engine_options: Callable[[str], dict]) -> ReplicaRouter:
+    """
+    ReplicaRouter for settings, with one instrumented async engine per replica URL
+    Also applies READ_YOUR_WRITES_SECONDS to the (per-process) recent writer pins.
+    """
+    if recent_writers.ttl != settings.read_your_writes_seconds:
+        recent_writers.ttl = settings.read_your_writes_seconds
+        recent_writers.clear()
+
+    replicas = []
+    for index, url in enumerate(settings.replica_urls, start=1):
+        async_url = to_async_url(url)
+        engine = create_async_engine(async_url, pool_pre_ping=True, echo=False, **engine_options(async_url))
+        instrument_engine(engine.sync_engine)
+        replicas.append(Replica(f"replica{index}", engine))
+    return ReplicaRouter(primary, replicas, settings.replica_max_lag_seconds, settings.replica_health_interval)
+
@@ -1,58 +1,180 @@
 """
 Maternal Health Monitoring App - FastAPI Main Application
 MVP v1.0 - Entry Point
+
+create_app(settings) builds the application; nothing is created at import.
+Engines, pools and caches are created and warmed in the lifespan, before the
+worker accepts traffic.
+
+Run with either:
+    uvicorn --factory app.main:create_app
+    uvicorn app.main:app          # `app` is built with get_settings() on first access
 """
 
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager, suppress
+from typing import Optional
+
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-
-# Initialize FastAPI application
-app = FastAPI(
-    title="Maternal Health Monitoring API",
-    description="API for tracking maternal health metrics during first trimester",
-    version="1.0.0",
-    docs_url="/api/docs",
-    redoc_url="/api/redoc"
-)
-
-# CORS Configuration (adjust origins for production)
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # TODO: Restrict to specific origins in production
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-# Health Check Endpoint
-@app.get("/health", tags=["Health"])
-async def health_check():
+
+from app.config import Settings, get_settings
+
+logger = logging.getLogger(__name__)
+
+
+async def _timed(step) -> float:
+    """Elapsed seconds of an awaitable"""
+    started = time.perf_counter()
+    await step
+    return time.perf_counter() - started
+
+
+async def warm_up(settings: Settings):
     """
-    Health check endpoint to verify API is running.
-    Returns status 200 with success message.
+    Create and warm per-worker resources; returns (database, {step: milliseconds})
+    Pool connections, the auth libraries and hashing pool, and replica health
+    checks are warmed concurrently. The content store load then runs the first
+    ORM queries (mapper configuration, statement compilation) before any request does.
     """
-    return {
-        "status": "healthy",
-        "message": "Maternal Health Monitoring API is running",
-        "version": "1.0.0"
-    }
-
-# Root endpoint
-@app.get("/", tags=["Root"])
-async def root():
+    from app.db.database import configure
+    from app.services import auth_service, export_service, journal_crypto
+    from app.services.content_store import content_store
+
+    auth_service.configure(settings)
+    export_service.configure(settings)
+    # Fails startup on a malformed JOURNAL_MASTER_KEY instead of on the first journal write
+    journal_crypto.configure(settings)
+    database = configure(settings)
+
+    db_s, auth_s, replicas_s = await asyncio.gather(
+        database.warm(), auth_service.warm(), _timed(database.replica_router.check_all())
+    )
+    timings = {"db_pool": db_s, "auth": auth_s, "replicas": replicas_s}
+
+    # Content is read-only data, so it loads from a replica when one is healthy
+    try:
+        timings["content"] = await _timed(content_store.load(database.read_session))
+    except Exception:
+        # Content endpoints return 503 until the watcher manages a load
+        logger.exception("Initial content load failed; will retry in background")
+
+    return database, {step: round(seconds * 1000, 1) for step, seconds in timings.items()}
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
     """
-    Root endpoint with basic API information.
+    Application lifespan
+    Startup: build the database engines from app.state.settings, warm the pool,
+    auth and static content (warm_up), then start the replica and content watchers
+    Shutdown: stop the watchers, the PDF export process pool, the password hashing
+    pool and the engines
     """
-    return {
-        "message": "Welcome to Maternal Health Monitoring API",
-        "docs": "/api/docs",
-        "health": "/health"
-    }
-
-# TODO: Import and include routers when implemented
-# from app.routers import auth, users, logs, content, feedback
-# app.include_router(auth.router, prefix="/v1/auth", tags=["Authentication"])
-# app.include_router(users.router, prefix="/v1/users", tags=["Users"])
-# app.include_router(logs.router, prefix="/v1/logs", tags=["Daily Logs"])
-# app.include_router(content.router, prefix="/v1/content", tags=["Content"])
-# app.include_router(feedback.router, prefix="/v1/feedback", tags=["Feedback"])
\ No newline at end of file
+    from app.services.auth_service import shutdown_hash_executor
+    from app.services.content_store import content_store
+    from app.services.export_service import shutdown_pool
+
+    settings = app.state.settings
+    started = time.perf_counter()
+    database, timings = await warm_up(settings)
+    app.state.database = database
+    app.state.startup_ms = {**timings, "total": round((time.perf_counter() - started) * 1000, 1)}
+    logger.info("Worker warm: %s", app.state.startup_ms)
+
+    replica_watcher = asyncio.create_task(database.replica_router.watch())
+    watcher = asyncio.create_task(content_store.watch(database.read_session, settings.content_refresh_seconds))
+    yield
+    for task in (watcher, replica_watcher):
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    await shutdown_pool()
+    shutdown_hash_executor()
+    await database.dispose()
+
+
+def create_app(settings: Optional[Settings] = None) -> FastAPI:
+    """Build the API application for the given settings (default: environment / .env)"""
+    from fastapi.middleware.cors import CORSMiddleware
+
+    from app.routers import auth, content, feedback, logs, metrics, sync, users
+    from app.services.metrics import MetricsMiddleware
+
+    settings = settings or get_settings()
+
+    # Initialize FastAPI application
+    app = FastAPI(
+        title=settings.app_name,
+        description="API for tracking maternal health metrics during first trimester",
+        version=settings.app_version,
+        docs_url="/api/docs",
+        redoc_url="/api/redoc",
+        lifespan=lifespan
+    )
+    app.state.settings = settings
+
+    # CORS Configuration (ALLOWED_ORIGINS; defaults to any origin)
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.cors_origins,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    # Per-route latency histograms, SQL query counting and slow-request log (/metrics)
+    app.add_middleware(MetricsMiddleware, settings=settings)
+
+    # Health Check Endpoint
+    @app.get("/health", tags=["Health"])
+    async def health_check():
+        """
+        Health check endpoint to verify API is running.
+        Returns status 200 with success message.
+        """
+        body = {
+            "status": "healthy",
+            "message": "Maternal Health Monitoring API is running",
+            "version": settings.app_version
+        }
+        database = getattr(app.state, "database", None)
+        if database is not None and database.replica_router.replicas:
+            body["database"] = database.replica_router.status()
+        return body
+
+    # Root endpoint
+    @app.get("/", tags=["Root"])
+    async def root():
+        """
+        Root endpoint with basic API information.
+        """
+        return {
+            "message": "Welcome to Maternal Health Monitoring API",
+            "docs": "/api/docs",
+            "health": "/health"
+        }
+
+    # Routers
+    app.include_router(metrics.router, tags=["Monitoring"])
+    app.include_router(auth.router, prefix="/v1/auth", tags=["Authentication"])
+    app.include_router(users.router, prefix="/v1/users", tags=["Users"])
+    app.include_router(logs.router, prefix="/v1/logs", tags=["Daily Logs"])
+    app.include_router(content.router, prefix="/v1/content", tags=["Content"])
+    app.include_router(feedback.router, prefix="/v1/feedback", tags=["Feedback"])
+    app.include_router(sync.router, prefix="/v1/sync", tags=["Sync"])
+    return app
+
+
+_app: Optional[FastAPI] = None
+
+
+def __getattr__(name: str):
+    # `app.main:app` for uvicorn and existing imports, built on first access
+    global _app
+    if name == "app":
+        if _app is None:
+            _app = create_app()
+        return _app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,5 +3,4 @@ API Routers Package
 Contains all endpoint route handlers for the application.
 """
 
-# TODO: Import routers as they are implemented
-# from . import auth, users, logs, content, feedback
\ No newline at end of file
+from . import auth, content, feedback, logs, metrics, sync, users
\ No newline at end of file
@@ -0,0 +1,164 @@
+"""
+Authentication Router
+Registration, login, logout and shared authentication dependencies (Feature 1)
+"""
+
+from datetime import timedelta
+from typing import AsyncGenerator, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, status
+from fastapi.responses import Response
+from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import Settings
+from app.db.database import get_async_db, read_session
+from app.db.replicas import set_request_user
+from app.schemas.auth import TokenResponse
+from app.schemas.user import UserCreate, UserResponse
+from app.services.auth_service import AuthService, CurrentUser, EmailAlreadyRegistered, PasswordHashBusy
+from app.services.data_version import DataVersionService
+from app.services.http_cache import etag_matches
+
+router = APIRouter()
+
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/v1/auth/login")
+
+# User data may change at any time; clients keep it but revalidate on every use
+USER_DATA_CACHE_CONTROL = "private, no-cache"
+
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+def _busy_exception() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Authentication is busy, please retry",
+        headers={"Retry-After": "1"},
+    )
+
+
+def get_app_settings(request: Request) -> Settings:
+    """Dependency returning the Settings the app was built with (create_app)"""
+    return request.app.state.settings
+
+
+async def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_async_db)
+) -> CurrentUser:
+    """
+    Dependency that resolves the bearer token to an active user
+    Raises 401 if the token is invalid or revoked, or the account is inactive
+    """
+    user = await AuthService.get_current_user(db, token)
+    if user is None:
+        raise _credentials_exception()
+    # Writes committed during this request pin the user's reads to the primary
+    set_request_user(user.user_id)
+    return user
+
+
+async def get_current_user_id(token: str = Depends(oauth2_scheme)) -> int:
+    """
+    Lightweight dependency that only verifies the bearer token
+    Use for endpoints serving non-user data (e.g., static content)
+    so they don't need a database round trip
+    """
+    user_id = AuthService.decode_access_token(token)
+    if user_id is None:
+        raise _credentials_exception()
+    return user_id
+
+
+async def get_async_read_db(
+    current_user: CurrentUser = Depends(get_current_user)
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Read-only session for the current user's GET endpoints
+    Served by a read replica unless the user wrote within READ_YOUR_WRITES_SECONDS
+    """
+    async with read_session(current_user.user_id) as db:
+        yield db
+
+
+async def check_data_version(
+    request: Request,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_read_db),
+    settings: Settings = Depends(get_app_settings)
+):
+    """
+    Conditional GET on the user's data version (app/services/data_version.py)
+    Answers 304 when If-None-Match matches, after one primary-key lookup;
+    otherwise sets the ETag on the endpoint's response. Runs on the endpoint's read session.
+    """
+    etag = await DataVersionService.etag(
+        db, current_user.user_id, f"{request.url.path}?{request.url.query}", settings.app_version
+    )
+    if etag is None:
+        return
+    headers = {"ETag": etag, "Cache-Control": USER_DATA_CACHE_CONTROL}
+    if etag_matches(if_none_match, etag):
+        raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+
+
+@router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
+async def register(payload: UserCreate, db: AsyncSession = Depends(get_async_db)):
+    """
+    Create an account (AC 1.1)
+    Returns 409 if the email is already registered
+    """
+    try:
+        return await AuthService.register(db, payload.email, payload.password, payload.full_name)
+    except EmailAlreadyRegistered:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Email already registered")
+    except PasswordHashBusy:
+        raise _busy_exception()
+
+
+@router.post("/login", response_model=TokenResponse)
+async def login(
+    form: OAuth2PasswordRequestForm = Depends(),
+    db: AsyncSession = Depends(get_async_db),
+    settings: Settings = Depends(get_app_settings)
+):
+    """
+    Exchange email (OAuth2 'username') and password for a bearer token
+    Password checks run off the event loop; 503 when the hashing pool is saturated
+    """
+    try:
+        user = await AuthService.authenticate(db, form.username, form.password)
+    except PasswordHashBusy:
+        raise _busy_exception()
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Incorrect email or password",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    expires = timedelta(minutes=settings.access_token_expire_minutes)
+    return TokenResponse(
+        access_token=AuthService.create_access_token(user.user_id, expires_delta=expires),
+        expires_in=int(expires.total_seconds()),
+    )
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(
+    token: str = Depends(oauth2_scheme),
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Revoke all of the user's outstanding access tokens"""
+    await AuthService.logout(db, current_user.user_id, token)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
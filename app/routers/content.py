@@ -0,0 +1,102 @@
+"""
+Content Router
+Week-specific educational content, prenatal visit guides (Feature 9) and symptom guidance
+
+Served from the in-process content store: no database round trip,
+pre-serialized JSON bodies, strong ETags and 304 Not Modified. Weekly content
+also checks the user's current week (AC 9.1), from a per-process cache.
+"""
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Path, Query, status
+from fastapi.responses import Response
+
+from app.db.database import read_session
+from app.db.models import SymptomType
+from app.routers.auth import get_current_user_id
+from app.services.content_store import CachedDocument, content_store
+from app.services.profile_service import NOT_CACHED, ProfileService, week_cache
+from app.services.http_cache import etag_matches
+
+router = APIRouter()
+
+# Content changes only on reseed; let clients reuse it but always revalidate
+CACHE_CONTROL = "private, max-age=300, must-revalidate"
+
+
+def cached_response(document: Optional[CachedDocument], if_none_match: Optional[str], not_found: str) -> Response:
+    """Build a 200/304 response for a cached document"""
+    if document is None:
+        if not content_store.loaded:
+            raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Content not loaded yet")
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=not_found)
+
+    headers = {"ETag": document.etag, "Cache-Control": CACHE_CONTROL}
+    if etag_matches(if_none_match, document.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=document.body, media_type="application/json", headers=headers)
+
+
+async def current_week(user_id: int) -> Optional[int]:
+    """The user's pregnancy week; opens a read session only on a cache miss"""
+    week = week_cache.get(user_id, NOT_CACHED)
+    if week is not NOT_CACHED:
+        return week
+    async with read_session(user_id) as db:
+        return await ProfileService.current_week(db, user_id)
+
+
+@router.get("/week/{week_number}")
+async def get_week_content(
+    week_number: int = Path(..., ge=1, le=12),
+    if_none_match: Optional[str] = Header(None),
+    user_id: int = Depends(get_current_user_id)
+):
+    """
+    Get week-specific content (weeks 1-12 for MVP)
+    AC 9.1: 403 for weeks beyond the user's current week (week 1 while it is unknown)
+    """
+    if week_number > 1 and week_number > (await current_week(user_id) or 1):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Week content not available yet")
+    return cached_response(content_store.get_week(week_number), if_none_match, "Week content not found")
+
+
+@router.get("/visits")
+async def list_visits(
+    if_none_match: Optional[str] = Header(None),
+    user_id: int = Depends(get_current_user_id)
+):
+    """
+    Get all prenatal visit explanations, ordered by visit number
+    """
+    return cached_response(content_store.get_visit_index(), if_none_match, "Visit content not found")
+
+
+@router.get("/visit/{visit_number}")
+async def get_visit(
+    visit_number: int = Path(..., ge=1, le=4),
+    if_none_match: Optional[str] = Header(None),
+    user_id: int = Depends(get_current_user_id)
+):
+    """
+    Get what to expect at a specific prenatal visit (visits 1-4 for MVP)
+    """
+    return cached_response(content_store.get_visit(visit_number), if_none_match, "Visit content not found")
+
+
+@router.get("/symptom/check")
+async def check_symptom(
+    symptom: SymptomType = Query(..., description="Symptom experienced"),
+    severity: int = Query(..., ge=1, le=5, description="Severity rating 1-5"),
+    week: int = Query(..., ge=1, le=12, description="Pregnancy week 1-12"),
+    if_none_match: Optional[str] = Header(None),
+    user_id: int = Depends(get_current_user_id)
+):
+    """
+    Get guidance for a symptom at a severity and pregnancy week
+    Answered from the precompiled guidance table (one array lookup, no database query)
+    """
+    return cached_response(
+        content_store.get_guidance(symptom, severity, week), if_none_match, "No guidance for this symptom"
+    )
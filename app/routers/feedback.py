@@ -0,0 +1,58 @@
+"""
+Feedback Router
+NPS feedback submission and NPS analytics (Feature 15)
+"""
+
+import secrets
+from typing import AsyncGenerator, Literal, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import Settings
+from app.db.database import get_async_db, read_session
+from app.routers.auth import get_app_settings, get_current_user
+from app.schemas.feedback import FeedbackCreate, FeedbackResponse, NpsAnalyticsResponse
+from app.services.auth_service import CurrentUser
+from app.services.nps_service import NpsService
+
+router = APIRouter()
+
+
+async def get_analytics_db(
+    authorization: Optional[str] = Header(None),
+    settings: Settings = Depends(get_app_settings)
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Read session for analytics endpoints, after checking the analytics token
+    When ANALYTICS_TOKEN is set, clients must send "Authorization: Bearer <ANALYTICS_TOKEN>"
+    """
+    token = settings.analytics_token
+    if token and not secrets.compare_digest(authorization or "", f"Bearer {token}"):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid analytics token")
+    async with read_session() as db:
+        yield db
+
+
+@router.post("", response_model=FeedbackResponse, status_code=status.HTTP_201_CREATED)
+async def submit_feedback(
+    payload: FeedbackCreate,
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Submit an NPS rating with optional comment (AC 15.1)
+    """
+    return await NpsService.submit(db, current_user.user_id, payload.nps_score, payload.feedback_text)
+
+
+@router.get("/nps", response_model=NpsAnalyticsResponse)
+async def nps_analytics(
+    granularity: Literal["day", "week"] = Query("day", description="Points per UTC day or per pregnancy week"),
+    days: int = Query(30, ge=1, le=366, description="Days shown for granularity=day"),
+    db: AsyncSession = Depends(get_analytics_db)
+):
+    """
+    NPS over time or by pregnancy week, read from the maintained rollups
+    """
+    return await NpsService.analytics(db, granularity=granularity, days=days)
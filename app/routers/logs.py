@@ -0,0 +1,293 @@
+"""
+Daily Logs Router
+Endpoints for daily check-ins, trend history, PDF summaries and raw data export (Features 5-8, 12)
+"""
+
+from datetime import date
+from functools import partial
+from typing import Literal, Optional, Union
+
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, Query, status
+from fastapi.responses import Response, StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.database import get_async_db, get_database, read_session
+from app.routers.auth import check_data_version, get_async_read_db, get_current_user
+from app.schemas.logs import (
+    DailyLogBatch, DailyLogBatchResult, DailyLogEntryResult, ExportJobResponse, JournalSearchPage, MoodHistoryPage,
+    MoodTrendResponse, SymptomFrequencyResponse, SymptomLogEntry, WeightLogEntry, WeightTrendPage, WeightTrendResponse
+)
+from app.services.auth_service import CurrentUser
+from app.services.daily_log_service import DailyLogService
+from app.services.data_export import EXPORT_MEDIA_TYPES, DataExportService
+from app.services.export_service import ExportQueueFull, ExportService, iter_file, parse_range
+from app.services.journal_search import JournalSearchService
+from app.services.rollup_service import RollupService
+from app.services.trend_service import TrendService
+
+router = APIRouter()
+
+
+@router.post("/daily", response_model=DailyLogEntryResult)
+async def submit_daily_log(
+    entry: Union[SymptomLogEntry, WeightLogEntry] = Body(..., discriminator="kind"),
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Submit a single daily check-in entry (symptom/mood/journal or weight)
+    Re-sending the same client_entry_id returns status "duplicate"
+    """
+    result = await DailyLogService.ingest(db, current_user.user_id, [entry.model_dump()])
+    return result["results"][0]
+
+
+@router.post("/daily/batch", response_model=DailyLogBatchResult)
+async def submit_daily_log_batch(
+    batch: DailyLogBatch,
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Offline sync: submit many check-in entries in one request
+    Entries are validated individually and written in one transaction.
+    Each result reports created / duplicate (already uploaded) / invalid.
+    """
+    return await DailyLogService.ingest(db, current_user.user_id, batch.entries)
+
+
+@router.get("/weight", response_model=WeightTrendPage, dependencies=[Depends(check_data_version)])
+async def get_weight_trend(
+    limit: int = Query(30, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    days: Optional[int] = Query(None, ge=1, le=366, description="Restrict to the last N days (7 or 30 for AC 12.1)"),
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """
+    Weight trend for the current user, newest first
+    AC 12.1: Weight Trend Chart displays last 7 and 30 days
+    """
+    try:
+        items, next_cursor = await TrendService.get_weight_page(
+            db, current_user.user_id, limit=limit, cursor=cursor, days=days
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+    return {"items": items, "next_cursor": next_cursor}
+
+
+@router.get("/mood", response_model=MoodHistoryPage, dependencies=[Depends(check_data_version)])
+async def get_mood_history(
+    limit: int = Query(30, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    days: Optional[int] = Query(None, ge=1, le=366, description="Restrict to the last N days"),
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """
+    Mood history for the current user, newest first
+    """
+    try:
+        items, next_cursor = await TrendService.get_mood_page(
+            db, current_user.user_id, limit=limit, cursor=cursor, days=days
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+    return {"items": items, "next_cursor": next_cursor}
+
+
+@router.get("/symptoms/frequency", response_model=SymptomFrequencyResponse, dependencies=[Depends(check_data_version)])
+async def get_symptom_frequency(
+    days: int = Query(30, ge=1, le=366, description="Restrict to the last N days"),
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """
+    How often each symptom was logged, with its mean severity, most frequent first
+    """
+    return await TrendService.symptom_frequency(db, current_user.user_id, days=days)
+
+
+@router.get("/journal/search", response_model=JournalSearchPage)
+async def search_journal(
+    q: str = Query(..., min_length=1, max_length=200, description="Words to find; quotes, OR and -word are supported"),
+    limit: int = Query(20, ge=1, le=50),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """
+    Search the current user's journal entries (Feature 8), best match first
+    (newest first when journals are encrypted). Each hit carries a highlighted snippet
+    Encrypted search reads a bounded number of entries per request, so a page may
+    be short or empty while next_cursor is still set; keep paging until it is null.
+    """
+    try:
+        items, next_cursor = await JournalSearchService.search(
+            db, current_user.user_id, q, limit=limit, cursor=cursor
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+    return {"items": items, "next_cursor": next_cursor}
+
+
+@router.get("/weight/trend", response_model=WeightTrendResponse, dependencies=[Depends(check_data_version)])
+async def get_weight_trend_chart(
+    days: int = Query(30, ge=1, le=366, description="Days shown for granularity=day (7 or 30 for AC 12.1)"),
+    granularity: Literal["day", "week"] = Query("day"),
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """
+    Weight Trend Chart data from the daily/weekly rollups (AC 12.1)
+    Reads one row per day or week shown, regardless of how many entries were logged
+    """
+    return await RollupService.weight_trend(db, current_user.user_id, days=days, granularity=granularity)
+
+
+@router.get("/mood/trend", response_model=MoodTrendResponse, dependencies=[Depends(check_data_version)])
+async def get_mood_trend(
+    days: int = Query(30, ge=1, le=366, description="Days shown for granularity=day"),
+    granularity: Literal["day", "week"] = Query("day"),
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """
+    Mood counts per day or per pregnancy week from the rollups
+    """
+    return await RollupService.mood_trend(db, current_user.user_id, days=days, granularity=granularity)
+
+
+def _export_response(job) -> dict:
+    """ExportJobResponse payload with a download link once the file is ready"""
+    payload = ExportJobResponse.model_validate(job).model_dump()
+    if job.status == "completed":
+        payload["download_url"] = f"/v1/logs/summary/pdf/{job.job_id}/download"
+    return payload
+
+
+@router.post("/summary/pdf", response_model=ExportJobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def submit_summary_pdf(
+    response: Response,
+    start_date: Optional[date] = Query(None),
+    end_date: Optional[date] = Query(None),
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Start a PDF summary export and return its job id (202)
+    If nothing changed since the last export, the existing completed job
+    is returned with 200 and no re-render happens.
+    """
+    try:
+        job = await ExportService.submit(db, get_database().async_session, current_user.user_id, start_date, end_date)
+    except ExportQueueFull:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many exports in progress, please retry shortly",
+            headers={"Retry-After": "30"},
+        )
+    if job.status == "completed":
+        response.status_code = status.HTTP_200_OK
+    return _export_response(job)
+
+
+@router.get("/summary/pdf/{job_id}", response_model=ExportJobResponse)
+async def get_summary_pdf_status(
+    job_id: str,
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """
+    Poll the status of a PDF summary export
+    """
+    job = await ExportService.get_job(db, current_user.user_id, job_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Export not found")
+    return _export_response(job)
+
+
+@router.get("/summary/pdf/{job_id}/download")
+async def download_summary_pdf(
+    job_id: str,
+    range_header: Optional[str] = Header(None, alias="Range"),
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """
+    Download a completed PDF summary, streamed in chunks
+    Supports single byte ranges (Range: bytes=start-end) for resumable downloads.
+    """
+    job = await ExportService.get_job(db, current_user.user_id, job_id)
+    if job is None or job.status != "completed" or not job.file_path:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Export not ready")
+
+    size = job.file_size
+    headers = {
+        "Accept-Ranges": "bytes",
+        "Content-Disposition": f'attachment; filename="pregnancy-summary-{job.completed_at:%Y%m%d}.pdf"',
+        "ETag": f'"{job.input_fingerprint[:32]}"',
+    }
+    try:
+        byte_range = parse_range(range_header, size)
+    except ValueError:
+        return Response(status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                        headers={"Content-Range": f"bytes */{size}"})
+
+    start, end = byte_range or (0, size - 1)
+    headers["Content-Length"] = str(end - start + 1)
+    status_code = status.HTTP_200_OK
+    if byte_range is not None:
+        status_code = status.HTTP_206_PARTIAL_CONTENT
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+
+    try:
+        chunks = iter_file(job.file_path, start, end)
+        first = next(chunks, b"")
+    except FileNotFoundError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Export expired, please resubmit")
+
+    def body():
+        yield first
+        yield from chunks
+
+    return StreamingResponse(body(), status_code=status_code, media_type="application/pdf", headers=headers)
+
+
+def _accepts_gzip(accept_encoding: Optional[str]) -> bool:
+    """Whether an Accept-Encoding header allows gzip (q=0 refuses it)"""
+    for part in (accept_encoding or "").split(","):
+        coding, _, params = part.strip().partition(";")
+        if coding.strip().lower() in ("gzip", "x-gzip"):
+            return params.replace(" ", "").lower() not in ("q=0", "q=0.0", "q=0.00", "q=0.000")
+    return False
+
+
+@router.get("/export")
+async def export_logs(
+    format: Literal["ndjson", "csv"] = Query("ndjson"),
+    start_date: Optional[date] = Query(None, description="First log date to include"),
+    end_date: Optional[date] = Query(None, description="Last log date to include"),
+    accept_encoding: Optional[str] = Header(None),
+    current_user: CurrentUser = Depends(get_current_user)
+):
+    """
+    Download the current user's raw weight and symptom logs as NDJSON or CSV
+    Streamed from server-side cursors; gzip-compressed when Accept-Encoding allows it
+    """
+    if start_date and end_date and start_date > end_date:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="start_date is after end_date")
+
+    compress = _accepts_gzip(accept_encoding)
+    headers = {
+        "Content-Disposition": f'attachment; filename="pregnancy-logs-{date.today():%Y%m%d}.{format}"',
+        "Cache-Control": "private, no-store",
+        "Vary": "Accept-Encoding",
+    }
+    if compress:
+        headers["Content-Encoding"] = "gzip"
+    body = DataExportService.stream(
+        partial(read_session, current_user.user_id), current_user.user_id, format, start_date, end_date, gzip=compress
+    )
+    return StreamingResponse(body, media_type=EXPORT_MEDIA_TYPES[format], headers=headers)
@@ -0,0 +1,28 @@
+"""
+Metrics Router
+Prometheus scrape endpoint for the per-process request and SQL metrics
+"""
+
+import secrets
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from fastapi.responses import PlainTextResponse
+
+from app.config import Settings
+from app.routers.auth import get_app_settings
+from app.services.metrics import render_metrics
+
+router = APIRouter()
+
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics(authorization: Optional[str] = Header(None), settings: Settings = Depends(get_app_settings)):
+    """
+    Prometheus text exposition of latency histograms and query stats
+    When METRICS_TOKEN is set, scrapers must send "Authorization: Bearer <METRICS_TOKEN>"
+    """
+    token = settings.metrics_token
+    if token and not secrets.compare_digest(authorization or "", f"Bearer {token}"):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid metrics token")
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
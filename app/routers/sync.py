@@ -0,0 +1,40 @@
+"""
+Sync Router
+Delta sync for the mobile app: changes since the client's last sync
+"""
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import Settings
+from app.db.database import get_async_db
+from app.routers.auth import get_app_settings, get_current_user
+from app.schemas.sync import SyncPage
+from app.services.auth_service import CurrentUser
+from app.services.sync_service import SyncService
+
+router = APIRouter()
+
+
+@router.get("", response_model=SyncPage)
+async def sync_changes(
+    cursor: Optional[str] = Query(None, description="cursor from the previous sync; omit for a full sync"),
+    limit: int = Query(500, ge=1, le=2000, description="Max rows per log table in one page"),
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    settings: Settings = Depends(get_app_settings)
+):
+    """
+    Profile, logs, weekly content and deletes changed since `cursor`
+    Returns 400 for an unusable cursor; the client should then sync without one.
+    Reads the primary: a lagging replica could hide rows older than the cursor,
+    which the next cursor would then skip for good.
+    """
+    try:
+        return await SyncService.changes(
+            db, current_user.user_id, cursor, limit=limit, settle_seconds=settings.sync_settle_seconds
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
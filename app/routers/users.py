@@ -0,0 +1,31 @@
+"""
+Users Router
+Current user's profile and dashboard data (Features 2, 3, 6)
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.routers.auth import check_data_version, get_async_read_db, get_current_user
+from app.schemas.user import ProfileDashboardResponse
+from app.services.auth_service import CurrentUser
+from app.services.profile_service import ProfileService
+
+router = APIRouter()
+
+
+@router.get("/profile", response_model=ProfileDashboardResponse, dependencies=[Depends(check_data_version)])
+async def get_profile(
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """
+    Home screen data for the current user in one database round trip
+    User, pregnancy profile, last recorded weight (AC 6.1), today's logs and
+    the current week's content id
+    ETag / If-None-Match: 304 after a single version lookup when nothing changed
+    """
+    dashboard = await ProfileService.get_dashboard(db, current_user.user_id)
+    if dashboard is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    return dashboard
@@ -3,8 +3,14 @@ Pydantic Schemas Package
 Contains request/response models and data validation schemas.
 """
 
-# TODO: Import schemas as they are implemented
-# from .user import UserCreate, UserResponse, PregnancyProfile
-# from .logs import DailyLogCreate, SymptomLog, MoodLog, WeightLog
-# from .content import WeeklyContent, SymptomGuide
-# from .feedback import FeedbackCreate
\ No newline at end of file
+from .logs import (
+    WeightLogResponse, MoodLogResponse, SymptomLogResponse, WeightTrendPage, MoodHistoryPage,
+    JournalSearchHit, JournalSearchPage,
+    SymptomLogEntry, WeightLogEntry, DailyLogEntry, DailyLogBatch, DailyLogEntryResult, DailyLogBatchResult,
+    WeightTrendPoint, WeightTrendResponse, MoodTrendPoint, MoodTrendResponse, ExportJobResponse
+)
+from .content import WeeklyContentResponse, VisitExplanationResponse, SymptomGuidanceResponse
+from .user import UserCreate, UserResponse, PregnancyProfileResponse, ProfileDashboardResponse
+from .auth import TokenResponse
+from .feedback import FeedbackCreate, FeedbackResponse, NpsBreakdown, NpsPoint, NpsAnalyticsResponse
+from .sync import SyncTable, SyncPage
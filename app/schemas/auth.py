@@ -0,0 +1,13 @@
+"""
+Auth Schemas
+Response models for login
+"""
+
+from pydantic import BaseModel
+
+
+class TokenResponse(BaseModel):
+    """OAuth2 bearer token (POST /v1/auth/login)"""
+    access_token: str
+    token_type: str = "bearer"
+    expires_in: int
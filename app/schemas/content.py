@@ -0,0 +1,44 @@
+"""
+Content Schemas
+Response models for static educational content
+"""
+
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict
+
+from app.db.models import SymptomType
+
+
+class WeeklyContentResponse(BaseModel):
+    """Week-specific educational content (Feature 9)"""
+    model_config = ConfigDict(from_attributes=True)
+
+    content_id: int
+    week_number: int
+    title: str
+    focus: Optional[str] = None
+    body: str
+
+
+class VisitExplanationResponse(BaseModel):
+    """What to expect at a prenatal visit"""
+    model_config = ConfigDict(from_attributes=True)
+
+    visit_id: int
+    visit_number: int
+    typical_week: int
+    title: str
+    purpose: str
+    what_happens: str
+
+
+class SymptomGuidanceResponse(BaseModel):
+    """Guidance for a symptom at a severity and pregnancy week"""
+    symptom_type: SymptomType
+    severity: int
+    week: int
+    level: str
+    title: str
+    advice: str
+    rule_key: str
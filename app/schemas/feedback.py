@@ -0,0 +1,48 @@
+"""
+Feedback Schemas
+Request/response models for NPS feedback and NPS analytics (Feature 15)
+"""
+
+from datetime import date, datetime
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class FeedbackCreate(BaseModel):
+    """NPS rating with optional comment (AC 15.1)"""
+    nps_score: int = Field(..., ge=0, le=10, description="How likely are you to recommend the app (0-10)")
+    feedback_text: Optional[str] = Field(None, max_length=5000)
+
+
+class FeedbackResponse(BaseModel):
+    """Stored feedback"""
+    model_config = ConfigDict(from_attributes=True)
+
+    feedback_id: int
+    nps_score: int
+    feedback_text: Optional[str] = None
+    pregnancy_week: Optional[int] = None
+    created_at: datetime
+
+
+class NpsBreakdown(BaseModel):
+    """Respondents per NPS category and the resulting score"""
+    promoters: int
+    passives: int
+    detractors: int
+    responses: int
+    nps: Optional[float] = Field(None, description="-100 to 100; null with no responses")
+
+
+class NpsPoint(NpsBreakdown):
+    """NPS for one day or pregnancy week"""
+    feedback_date: Optional[date] = None
+    pregnancy_week: Optional[int] = None
+
+
+class NpsAnalyticsResponse(BaseModel):
+    """NPS over time (granularity=day) or by pregnancy week, plus totals over the points"""
+    granularity: Literal["day", "week"]
+    totals: NpsBreakdown
+    points: List[NpsPoint]
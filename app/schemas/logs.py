@@ -0,0 +1,243 @@
+"""
+Daily Log Schemas
+Request/response models for symptom, mood and weight logs
+"""
+
+from datetime import date, datetime, timedelta
+from typing import Annotated, Any, Dict, List, Literal, Optional, Union
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+
+from app.db.models import MoodType, SymptomType
+from app.services.journal_crypto import ENCRYPTED_PREFIX
+
+# Upper bound on entries per offline-sync upload
+MAX_BATCH_ENTRIES = 500
+
+
+class WeightLogResponse(BaseModel):
+    """Single weight entry in a trend response"""
+    model_config = ConfigDict(from_attributes=True)
+
+    weight_log_id: int
+    log_date: date
+    weight_kg: float
+    pregnancy_week: Optional[int] = None
+
+
+class MoodLogResponse(BaseModel):
+    """Single mood entry in a mood history response"""
+    model_config = ConfigDict(from_attributes=True)
+
+    log_id: int
+    log_date: date
+    mood: MoodType
+    pregnancy_week: Optional[int] = None
+
+
+class SymptomRating(BaseModel):
+    """One symptom of a check-in"""
+    symptom_type: SymptomType
+    severity_rating: Optional[int] = Field(None, ge=1, le=5, description="AC 5.1: severity 1-5")
+
+
+class SymptomLogResponse(BaseModel):
+    """
+    Single symptom/mood/journal entry
+    symptom_type / severity_rating are kept for older clients and are only set
+    when the entry has exactly one symptom.
+    """
+    model_config = ConfigDict(from_attributes=True)
+
+    log_id: int
+    log_date: date
+    symptoms: List[SymptomRating] = Field(default_factory=list)
+    symptom_type: Optional[SymptomType] = None
+    severity_rating: Optional[int] = None
+    mood: Optional[MoodType] = None
+    journal_entry: Optional[str] = None
+    pregnancy_week: Optional[int] = None
+
+    @model_validator(mode="after")
+    def single_symptom(self):
+        if len(self.symptoms) == 1:
+            self.symptom_type = self.symptoms[0].symptom_type
+            self.severity_rating = self.symptoms[0].severity_rating
+        return self
+
+
+class WeightTrendPage(BaseModel):
+    """
+    Page of weight entries, newest first (AC 12.1)
+    Pass next_cursor back as ?cursor= to fetch the next page
+    """
+    items: List[WeightLogResponse]
+    next_cursor: Optional[str] = None
+
+
+class MoodHistoryPage(BaseModel):
+    """Page of mood entries, newest first"""
+    items: List[MoodLogResponse]
+    next_cursor: Optional[str] = None
+
+
+class JournalSearchHit(BaseModel):
+    """One matching journal entry"""
+    log_id: int
+    log_date: date
+    mood: Optional[MoodType] = None
+    pregnancy_week: Optional[int] = None
+    rank: float = Field(..., description="Relevance, higher is better (comparable within one search only)")
+    snippet: str = Field(..., description="HTML-escaped excerpt with matches wrapped in <mark>")
+
+
+class JournalSearchPage(BaseModel):
+    """One page of journal search results, best match first"""
+    items: List[JournalSearchHit]
+    next_cursor: Optional[str] = Field(None, description="Set while more may match (pages can be short when encrypted)")
+
+
+class WeightTrendPoint(BaseModel):
+    """Weight stats for one day or one pregnancy week (from rollups)"""
+    log_date: Optional[date] = None
+    pregnancy_week: Optional[int] = None
+    min_kg: float
+    max_kg: float
+    mean_kg: float
+    delta_kg: Optional[float] = None
+    entries: int
+
+
+class WeightTrendResponse(BaseModel):
+    """
+    Weight Trend Chart data, oldest first (AC 12.1)
+    delta_kg is mean weight minus the profile's initial_weight_kg
+    """
+    granularity: Literal["day", "week"]
+    initial_weight_kg: Optional[float] = None
+    points: List[WeightTrendPoint]
+
+
+class MoodTrendPoint(BaseModel):
+    """Mood counts for one day or one pregnancy week (from rollups)"""
+    log_date: Optional[date] = None
+    pregnancy_week: Optional[int] = None
+    counts: Dict[MoodType, int]
+
+
+class MoodTrendResponse(BaseModel):
+    """Mood counts over time plus totals for the range"""
+    granularity: Literal["day", "week"]
+    totals: Dict[MoodType, int]
+    points: List[MoodTrendPoint]
+
+
+class SymptomFrequency(BaseModel):
+    """How often one symptom was logged"""
+    symptom_type: SymptomType
+    entries: int
+    mean_severity: Optional[float] = Field(None, description="Mean of the ratings given (1-5)")
+
+
+class SymptomFrequencyResponse(BaseModel):
+    """Symptoms logged over the last `days` days, most frequent first"""
+    days: int
+    entries: int = Field(..., description="Check-ins with at least one symptom in the range")
+    symptoms: List[SymptomFrequency]
+
+
+class _DailyLogEntryBase(BaseModel):
+    """Fields shared by every daily check-in entry"""
+    client_entry_id: str = Field(..., min_length=1, max_length=64, description="Client-generated idempotency key (e.g., UUID)")
+    log_date: date
+
+    @field_validator("log_date")
+    @classmethod
+    def not_in_future(cls, value: date) -> date:
+        # One day of slack for clients ahead of the server's timezone
+        if value > date.today() + timedelta(days=1):
+            raise ValueError("log_date cannot be in the future")
+        return value
+
+
+class SymptomLogEntry(_DailyLogEntryBase):
+    """
+    Symptom / mood / journal check-in entry (Features 5, 7, 8)
+    A check-in lists all of its symptoms and is stored as one row. The single
+    symptom_type / severity_rating fields of older clients are moved into symptoms.
+    """
+    kind: Literal["symptom"]
+    symptoms: List[SymptomRating] = Field(default_factory=list, max_length=len(SymptomType))
+    symptom_type: Optional[SymptomType] = None
+    severity_rating: Optional[int] = Field(None, ge=1, le=5, description="AC 5.1: severity 1-5")
+    mood: Optional[MoodType] = None
+    journal_entry: Optional[str] = Field(None, max_length=10000)
+
+    @field_validator("journal_entry")
+    @classmethod
+    def not_reserved(cls, value: Optional[str]) -> Optional[str]:
+        # Stored values with this prefix are ciphertext, encryption on or off
+        if value is not None and value.startswith(ENCRYPTED_PREFIX):
+            raise ValueError(f"journal_entry cannot start with {ENCRYPTED_PREFIX!r}")
+        return value
+
+    @model_validator(mode="after")
+    def has_content(self):
+        if self.severity_rating is not None and self.symptom_type is None:
+            raise ValueError("severity_rating requires symptom_type")
+        if self.symptom_type is not None:
+            self.symptoms = [*self.symptoms, SymptomRating(symptom_type=self.symptom_type, severity_rating=self.severity_rating)]
+            self.symptom_type = self.severity_rating = None
+        if len({rating.symptom_type for rating in self.symptoms}) < len(self.symptoms):
+            raise ValueError("each symptom_type may appear only once")
+        if not self.symptoms and self.mood is None and not self.journal_entry:
+            raise ValueError("entry must include a symptom, mood or journal entry")
+        return self
+
+
+class WeightLogEntry(_DailyLogEntryBase):
+    """Weight check-in entry (Feature 6)"""
+    kind: Literal["weight"]
+    weight_kg: float = Field(..., gt=20, lt=300)
+
+
+# Either entry type, selected by the "kind" field
+DailyLogEntry = Annotated[Union[SymptomLogEntry, WeightLogEntry], Field(discriminator="kind")]
+
+
+class DailyLogBatch(BaseModel):
+    """
+    Offline-sync upload of mixed check-in entries
+    Entries are validated individually so one bad entry doesn't reject the batch
+    """
+    entries: List[Any] = Field(..., min_length=1, max_length=MAX_BATCH_ENTRIES)
+
+
+class DailyLogEntryResult(BaseModel):
+    """Outcome for one uploaded entry (same order as the request)"""
+    index: int
+    client_entry_id: Optional[str] = None
+    status: Literal["created", "duplicate", "invalid"]
+    log_id: Optional[int] = None
+    errors: Optional[List[str]] = None
+
+
+class DailyLogBatchResult(BaseModel):
+    """Per-entry results plus totals"""
+    created: int
+    duplicates: int
+    invalid: int
+    results: List[DailyLogEntryResult]
+
+
+class ExportJobResponse(BaseModel):
+    """Status of a PDF summary export job"""
+    model_config = ConfigDict(from_attributes=True)
+
+    job_id: str
+    status: Literal["pending", "running", "completed", "failed"]
+    created_at: datetime
+    completed_at: Optional[datetime] = None
+    file_size: Optional[int] = None
+    error: Optional[str] = None
+    download_url: Optional[str] = None
@@ -0,0 +1,29 @@
+"""
+Sync Schemas
+Response models for delta sync (GET /v1/sync)
+"""
+
+from typing import Any, Dict, List
+
+from pydantic import BaseModel, Field
+
+
+class SyncTable(BaseModel):
+    """Changed rows of one table, column-wise"""
+    columns: List[str]
+    rows: List[List[Any]]
+
+
+class SyncPage(BaseModel):
+    """
+    Changes since the request cursor
+    Apply changes as upserts by id and deletes by id, then store cursor.
+    Call again with the new cursor while has_more is true.
+    """
+    cursor: str = Field(..., description="Pass back as ?cursor= on the next sync")
+    has_more: bool = Field(..., description="More changes are waiting; sync again right away")
+    reset: bool = Field(..., description="First page of a full sync: clear the local copy before applying")
+    changes: Dict[str, SyncTable] = Field(
+        default_factory=dict, description="profile, symptom_logs, weight_logs, weekly_content (changed tables only)"
+    )
+    deleted: Dict[str, List[int]] = Field(default_factory=dict, description="Deleted ids per table")
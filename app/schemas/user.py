@@ -0,0 +1,58 @@
+"""
+User Schemas
+Request/response models for registration and account data
+"""
+
+from datetime import date, datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from app.schemas.logs import SymptomLogResponse, WeightLogResponse
+
+
+class UserCreate(BaseModel):
+    """Registration request (Feature 1)"""
+    email: str = Field(..., max_length=255, pattern=r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+    password: str = Field(..., min_length=8)
+    full_name: Optional[str] = Field(None, max_length=255)
+
+    @field_validator("password")
+    @classmethod
+    def password_fits_bcrypt(cls, value: str) -> str:
+        # bcrypt only uses the first 72 bytes
+        if len(value.encode()) > 72:
+            raise ValueError("Password must be at most 72 bytes")
+        return value
+
+
+class UserResponse(BaseModel):
+    """Public account data"""
+    model_config = ConfigDict(from_attributes=True)
+
+    user_id: int
+    email: str
+    full_name: Optional[str] = None
+    created_at: datetime
+
+
+class PregnancyProfileResponse(BaseModel):
+    """Pregnancy dates and the cached current week (Features 2, 3)"""
+    model_config = ConfigDict(from_attributes=True)
+
+    edd: Optional[date] = None
+    lmp_start_date: Optional[date] = None
+    initial_weight_kg: Optional[float] = None
+    current_week: Optional[int] = None
+    current_day: Optional[int] = None
+
+
+class ProfileDashboardResponse(BaseModel):
+    """Everything the home screen needs in one response (GET /v1/users/profile)"""
+    user: UserResponse
+    profile: Optional[PregnancyProfileResponse] = None
+    last_weight: Optional[WeightLogResponse] = Field(None, description="AC 6.1: last recorded weight")
+    today: date = Field(..., description="The user's local date")
+    today_symptoms: List[SymptomLogResponse]
+    today_weights: List[WeightLogResponse]
+    week_content_id: Optional[int] = Field(None, description="Weekly content for the current week, if any")
@@ -0,0 +1,339 @@
+"""
+Authentication Service
+Password hashing, JWT access tokens and cached request authentication
+
+bcrypt is deliberately slow, so hashing and verification run on a small
+dedicated thread pool (bcrypt releases the GIL) rather than the event loop.
+AUTH_HASH_MAX_PENDING bounds the backlog so a login storm fails fast with
+PasswordHashBusy instead of queueing without limit. Hashes made with fewer
+than BCRYPT_ROUNDS rounds are upgraded on the next successful login.
+
+Per request, verified token claims are cached by token digest (until the token
+expires or TOKEN_CACHE_TTL passes) and the user's active/revocation state is
+cached for USER_CACHE_TTL. Both caches are per process: logout and
+deactivation evict local entries immediately and persist the change, so other
+workers pick it up within USER_CACHE_TTL.
+
+python-jose and passlib are imported on first use, not at module import, so
+worker startup doesn't pay for them. The app lifespan calls warm() to load them
+and start the hashing pool before the first login.
+"""
+
+import asyncio
+import hashlib
+import importlib
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import func, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import Settings, get_settings
+from app.db.models import User
+from app.services.ttl_cache import TTLCache
+
+# Settings from configure() (app lifespan), or get_settings() on first use (see .env.example)
+_settings: Optional[Settings] = None
+
+# Request authentication caches (per process), sized by configure():
+# sha256(token) -> TokenClaims
+token_cache = TTLCache(0, 0)
+# user_id -> CurrentUser
+user_cache = TTLCache(0, 0)
+
+
+class PasswordHashBusy(Exception):
+    """Raised when AUTH_HASH_MAX_PENDING hash operations are already queued"""
+
+
+class EmailAlreadyRegistered(Exception):
+    """Raised when registering an email that already has an account"""
+
+
+@dataclass(frozen=True)
+class TokenClaims:
+    """Verified access token contents"""
+    user_id: int
+    issued_at: float
+    expires_at: float
+
+
+@dataclass(frozen=True)
+class CurrentUser:
+    """Authenticated user state resolved per request (cached, detached from any session)"""
+    user_id: int
+    email: str
+    is_active: bool
+    tokens_valid_after: Optional[float] = None
+
+
+_hash_executor: Optional[ThreadPoolExecutor] = None
+_hash_pending = 0
+_dummy_hash: Optional[str] = None
+_pwd_context = None
+
+
+def configure(settings: Optional[Settings] = None) -> Settings:
+    """
+    Apply auth settings (app lifespan; default get_settings() on first use)
+    Drops cached claims, users and the password context, since the key or cost may have changed.
+    """
+    global _settings, _pwd_context, _dummy_hash
+    previous, _settings = _settings, settings or get_settings()
+    if previous is None or _settings.bcrypt_rounds != previous.bcrypt_rounds:
+        _pwd_context = _dummy_hash = None
+    if previous is None or _settings.auth_hash_workers != previous.auth_hash_workers:
+        shutdown_hash_executor()
+
+    token_cache.maxsize, token_cache.ttl = _settings.token_cache_size, _settings.token_cache_ttl
+    user_cache.maxsize, user_cache.ttl = _settings.user_cache_size, _settings.user_cache_ttl
+    token_cache.clear()
+    user_cache.clear()
+    return _settings
+
+
+def auth_settings() -> Settings:
+    return _settings if _settings is not None else configure()
+
+
+def get_pwd_context():
+    """passlib CryptContext for BCRYPT_ROUNDS (passlib is imported on first call)"""
+    global _pwd_context
+    if _pwd_context is None:
+        from passlib.context import CryptContext
+        rounds = auth_settings().bcrypt_rounds
+        _pwd_context = CryptContext(
+            schemes=["bcrypt"],
+            deprecated="auto",
+            bcrypt__default_rounds=rounds,
+            bcrypt__min_rounds=rounds,
+        )
+    return _pwd_context
+
+
+async def warm() -> float:
+    """
+    Load jose and the passlib bcrypt backend, and start the hashing pool
+    Run at startup so the first login and first authenticated request don't pay for it.
+    The dummy hash for unknown emails is still made lazily: at production rounds it
+    would add a full bcrypt hash to every worker start. Returns the elapsed seconds.
+    """
+    started = time.perf_counter()
+    importlib.import_module("jose.jwt")
+    get_pwd_context().handler().get_backend()
+    get_hash_executor()
+    return time.perf_counter() - started
+
+
+def get_hash_executor() -> ThreadPoolExecutor:
+    """Lazily start the password hashing pool"""
+    global _hash_executor
+    if _hash_executor is None:
+        _hash_executor = ThreadPoolExecutor(max_workers=auth_settings().auth_hash_workers, thread_name_prefix="bcrypt")
+    return _hash_executor
+
+
+def shutdown_hash_executor():
+    """Stop the password hashing pool (app shutdown)"""
+    global _hash_executor
+    if _hash_executor is not None:
+        _hash_executor.shutdown(wait=False, cancel_futures=True)
+        _hash_executor = None
+
+
+async def _run_hash(fn, *args):
+    """Run a bcrypt operation on the hashing pool, refusing work past AUTH_HASH_MAX_PENDING"""
+    global _hash_pending
+    if _hash_pending >= auth_settings().auth_hash_max_pending:
+        raise PasswordHashBusy()
+    _hash_pending += 1
+    try:
+        return await asyncio.get_running_loop().run_in_executor(get_hash_executor(), fn, *args)
+    finally:
+        _hash_pending -= 1
+
+
+def _token_key(token: str) -> bytes:
+    return hashlib.sha256(token.encode()).digest()
+
+
+def _timestamp(value: Optional[datetime]) -> Optional[float]:
+    """Naive UTC datetime -> epoch seconds"""
+    return value.replace(tzinfo=timezone.utc).timestamp() if value is not None else None
+
+
+def normalize_email(email: str) -> str:
+    return email.strip().lower()
+
+
+class AuthService:
+    """
+    Token, password and account helpers for the authentication flow
+    Tokens carry the user_id in the standard "sub" claim
+    """
+
+    @staticmethod
+    def create_access_token(user_id: int, expires_delta: Optional[timedelta] = None) -> str:
+        """Create a signed access token for a user"""
+        settings = auth_settings()
+        now = time.time()
+        expire = now + (expires_delta or timedelta(minutes=settings.access_token_expire_minutes)).total_seconds()
+        claims = {"sub": str(user_id), "iat": now, "exp": int(expire)}
+        from jose import jwt
+        return jwt.encode(claims, settings.secret_key, algorithm=settings.algorithm)
+
+    @staticmethod
+    def verify_access_token(token: str) -> Optional[TokenClaims]:
+        """
+        Verify an access token, using the claims cache when possible
+        Returns None if the token is invalid, expired, or has no subject
+        """
+        settings = auth_settings()
+        key = _token_key(token)
+        claims = token_cache.get(key)
+        if claims is not None:
+            return claims if claims.expires_at > time.time() else None
+
+        from jose import JWTError, jwt
+        try:
+            raw = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+        except JWTError:
+            return None
+        subject = raw.get("sub")
+        if subject is None or not str(subject).isdigit() or "exp" not in raw:
+            return None
+
+        claims = TokenClaims(user_id=int(subject), issued_at=float(raw.get("iat", 0)), expires_at=float(raw["exp"]))
+        token_cache.set(key, claims, ttl=claims.expires_at - time.time())
+        return claims
+
+    @staticmethod
+    def decode_access_token(token: str) -> Optional[int]:
+        """
+        Verify an access token and return its user_id
+        Returns None if the token is invalid, expired, or has no subject
+        """
+        claims = AuthService.verify_access_token(token)
+        return claims.user_id if claims is not None else None
+
+    @staticmethod
+    async def hash_password(password: str) -> str:
+        """bcrypt hash on the hashing pool"""
+        return await _run_hash(get_pwd_context().hash, password)
+
+    @staticmethod
+    async def verify_password(password: str, hashed: str):
+        """
+        Check a password on the hashing pool
+        Returns (matches, replacement hash if the stored one uses outdated cost settings)
+        """
+        return await _run_hash(get_pwd_context().verify_and_update, password, hashed)
+
+    @staticmethod
+    async def _burn_verify(password: str):
+        """Spend one verification on unknown accounts so response time doesn't reveal them"""
+        global _dummy_hash
+        if _dummy_hash is None:
+            _dummy_hash = await _run_hash(get_pwd_context().hash, "not-a-real-password")
+        await _run_hash(get_pwd_context().verify, password, _dummy_hash)
+
+    @staticmethod
+    async def register(db: AsyncSession, email: str, password: str, full_name: Optional[str] = None) -> User:
+        """
+        Create an account
+        Raises EmailAlreadyRegistered if the email is taken.
+        """
+        email = normalize_email(email)
+        if await db.scalar(select(User.user_id).where(User.email == email)) is not None:
+            raise EmailAlreadyRegistered()
+
+        user = User(email=email, hashed_password=await AuthService.hash_password(password), full_name=full_name)
+        db.add(user)
+        try:
+            await db.commit()
+        except IntegrityError:
+            # Lost a race with a concurrent registration
+            await db.rollback()
+            raise EmailAlreadyRegistered()
+        return user
+
+    @staticmethod
+    async def authenticate(db: AsyncSession, email: str, password: str) -> Optional[User]:
+        """
+        Check credentials for login
+        Returns the active User on success, None otherwise. Records last_login and
+        upgrades the stored hash when cost settings have changed.
+        """
+        user = (await db.execute(select(User).where(User.email == normalize_email(email)))).scalar_one_or_none()
+        if user is None:
+            await AuthService._burn_verify(password)
+            return None
+
+        matches, new_hash = await AuthService.verify_password(password, user.hashed_password)
+        if not matches or not user.is_active:
+            return None
+
+        values = {"last_login": func.now()}
+        if new_hash is not None:
+            values["hashed_password"] = new_hash
+        await db.execute(update(User).where(User.user_id == user.user_id).values(**values))
+        await db.commit()
+        return user
+
+    @staticmethod
+    async def get_current_user(db: AsyncSession, token: str) -> Optional[CurrentUser]:
+        """
+        Resolve a bearer token to an active user
+        Verified claims and user state come from the per-process caches; the
+        database is only read on a user cache miss.
+        """
+        claims = AuthService.verify_access_token(token)
+        if claims is None:
+            return None
+
+        current = user_cache.get(claims.user_id)
+        if current is None:
+            row = (await db.execute(
+                select(User.user_id, User.email, User.is_active, User.tokens_valid_after)
+                .where(User.user_id == claims.user_id)
+            )).one_or_none()
+            if row is None:
+                return None
+            current = CurrentUser(
+                user_id=row.user_id,
+                email=row.email,
+                is_active=bool(row.is_active),
+                tokens_valid_after=_timestamp(row.tokens_valid_after),
+            )
+            user_cache.set(claims.user_id, current)
+
+        if not current.is_active:
+            return None
+        if current.tokens_valid_after is not None and claims.issued_at < current.tokens_valid_after:
+            return None
+        return current
+
+    @staticmethod
+    def invalidate_user(user_id: int):
+        """Drop a user's cached state (call after any change to is_active or revocation)"""
+        user_cache.pop(user_id)
+
+    @staticmethod
+    async def logout(db: AsyncSession, user_id: int, token: Optional[str] = None):
+        """Revoke every access token issued to the user so far"""
+        await db.execute(update(User).where(User.user_id == user_id).values(tokens_valid_after=datetime.utcnow()))
+        await db.commit()
+        if token is not None:
+            token_cache.pop(_token_key(token))
+        AuthService.invalidate_user(user_id)
+
+    @staticmethod
+    async def deactivate_user(db: AsyncSession, user_id: int):
+        """Deactivate an account; its tokens stop working immediately on this worker"""
+        await db.execute(update(User).where(User.user_id == user_id).values(is_active=0))
+        await db.commit()
+        AuthService.invalidate_user(user_id)
@@ -0,0 +1,180 @@
+"""
+Content Seed
+Applies a versioned static-content release (data/content/) to the database
+
+A release is a manifest.json (release id + one JSON file per table) checked into
+the repo. Applying it:
+1. loads every table's rows from the data files
+2. reads the current rows of each table in one query and diffs them by
+   natural key (week_number / visit_number / rule_key)
+3. writes all new and changed rows with one multi-row
+   INSERT ... ON CONFLICT (key) DO UPDATE per table
+4. optionally deletes rows no longer in the release (prune), recording
+   sync tombstones for tables mobile clients keep a copy of
+5. bumps the content version marker (so app workers reload) only if something
+   changed, all in one transaction
+
+Reapplying an unchanged release is a no-op: no writes and no version bump.
+"""
+
+import json
+import os
+from dataclasses import dataclass, field
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any, List, Optional
+
+from sqlalchemy import Enum, delete, select
+from sqlalchemy.orm import Session
+
+from app.db.dialects import insert_for
+from app.db.models import SymptomGuidance, VisitExplanation, WeeklyContent
+from app.services.content_store import STATIC_CONTENT_KEY, bump_content_version
+from app.services.symptom_guidance import validate_rule
+from app.services.sync_service import SYNCED_CONTENT, tombstone_insert
+
+CONTENT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "data", "content")
+
+# table name -> (model, natural key column)
+CONTENT_TABLES = {
+    "weekly_content": (WeeklyContent, "week_number"),
+    "visit_explanations": (VisitExplanation, "visit_number"),
+    "symptom_guidance": (SymptomGuidance, "rule_key"),
+}
+
+
+@dataclass
+class TableDiff:
+    """Planned changes for one table"""
+    table: str
+    inserted: List[Any] = field(default_factory=list)
+    updated: List[Any] = field(default_factory=list)
+    removed: List[Any] = field(default_factory=list)
+    unchanged: int = 0
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.inserted or self.updated or self.removed)
+
+
+@dataclass
+class SeedReport:
+    """Outcome of applying a release"""
+    release: str
+    tables: List[TableDiff]
+    version: Optional[int] = None
+    applied: bool = False
+
+    @property
+    def changed(self) -> bool:
+        return any(diff.changed for diff in self.tables)
+
+
+def _coerce_enums(model, rows: List[dict]) -> List[dict]:
+    """Enum columns are written by member name in the data files; map them to members for diffing"""
+    enums = {
+        column.name: column.type.enum_class
+        for column in model.__table__.columns
+        if isinstance(column.type, Enum) and column.type.enum_class is not None
+    }
+    if not enums:
+        return rows
+    return [
+        {name: enums[name][value] if name in enums and value is not None else value for name, value in row.items()}
+        for row in rows
+    ]
+
+
+def load_release(content_dir: str = CONTENT_DIR) -> tuple:
+    """Read the manifest and data files; returns (release id, {table: rows})"""
+    with open(os.path.join(content_dir, "manifest.json"), encoding="utf-8") as handle:
+        manifest = json.load(handle)
+
+    data = {}
+    for table, filename in manifest["tables"].items():
+        if table not in CONTENT_TABLES:
+            raise ValueError(f"Unknown content table in manifest: {table}")
+        with open(os.path.join(content_dir, filename), encoding="utf-8") as handle:
+            rows = json.load(handle)
+        model, key = CONTENT_TABLES[table]
+        rows = _coerce_enums(model, rows)
+        keys = [row[key] for row in rows]
+        if len(keys) != len(set(keys)):
+            raise ValueError(f"Duplicate {key} values in {filename}")
+        if model is SymptomGuidance:
+            # Fail the seed, not every worker's next reload
+            for row in rows:
+                validate_rule(SimpleNamespace(**row))
+        data[table] = rows
+    return manifest["release"], data
+
+
+def diff_table(db: Session, table: str, rows: List[dict], prune: bool = False) -> TableDiff:
+    """Compare release rows against the table with a single SELECT"""
+    model, key = CONTENT_TABLES[table]
+    columns = sorted({name for row in rows for name in row})
+    current = {
+        row[key]: row
+        for row in db.execute(select(*(model.__table__.c[name] for name in columns))).mappings()
+    }
+
+    diff = TableDiff(table=table)
+    for row in rows:
+        existing = current.get(row[key])
+        if existing is None:
+            diff.inserted.append(row[key])
+        elif any(existing.get(name) != row.get(name) for name in columns):
+            diff.updated.append(row[key])
+        else:
+            diff.unchanged += 1
+    if prune:
+        wanted = {row[key] for row in rows}
+        diff.removed = sorted(value for value in current if value not in wanted)
+    return diff
+
+
+def _upsert(db: Session, table: str, rows: List[dict]):
+    """One multi-row INSERT ... ON CONFLICT (key) DO UPDATE for the given rows"""
+    model, key = CONTENT_TABLES[table]
+    now = datetime.utcnow()
+    values = [{**row, "created_at": now, "updated_at": now} for row in rows]
+    stmt = insert_for(db)(model).values(values)
+    set_ = {name: stmt.excluded[name] for name in rows[0] if name != key}
+    set_["updated_at"] = stmt.excluded.updated_at
+    db.execute(stmt.on_conflict_do_update(index_elements=[key], set_=set_))
+
+
+def apply_release(db: Session, content_dir: str = CONTENT_DIR, prune: bool = False,
+                  dry_run: bool = False, force: bool = False) -> SeedReport:
+    """
+    Diff and apply a content release in one transaction
+    force bumps the version marker even when nothing changed (forces a worker reload).
+    """
+    release, data = load_release(content_dir)
+    report = SeedReport(release=release, tables=[])
+
+    for table, rows in data.items():
+        diff = diff_table(db, table, rows, prune=prune)
+        report.tables.append(diff)
+        if dry_run or not diff.changed:
+            continue
+
+        model, key = CONTENT_TABLES[table]
+        changed = set(diff.inserted) | set(diff.updated)
+        if changed:
+            _upsert(db, table, [row for row in rows if row[key] in changed])
+        if diff.removed:
+            db.execute(delete(model).where(model.__table__.c[key].in_(diff.removed)))
+            if table in SYNCED_CONTENT:
+                # Mobile clients hold a copy; GET /v1/sync tells them to drop it
+                db.execute(tombstone_insert(table, diff.removed))
+
+    if dry_run:
+        db.rollback()
+        return report
+
+    if report.changed or force:
+        report.version = bump_content_version(db, STATIC_CONTENT_KEY, release=release)
+        report.applied = True
+    db.commit()
+    return report
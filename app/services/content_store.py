@@ -0,0 +1,206 @@
+"""
+Content Store
+Immutable in-process cache of WeeklyContent, VisitExplanation and compiled SymptomGuidance
+
+Static content is written only by scripts/seed_content.py, so each worker loads
+it once at startup, pre-serializes every document to JSON bytes with a strong
+ETag, and serves content requests without touching the connection pool.
+
+After a reseed the script bumps the 'static_content' row in content_versions.
+A background watcher polls that single row and swaps in a freshly built
+snapshot when the version changes. Readers always see one complete snapshot.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from types import MappingProxyType
+from typing import List, Mapping, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+
+from app.db.models import ContentVersion, SymptomType, VisitExplanation, WeeklyContent
+from app.schemas.content import VisitExplanationResponse, WeeklyContentResponse
+from app.services.http_cache import make_etag
+from app.services.symptom_guidance import GuidanceTable, compile_guidance, load_rules
+
+logger = logging.getLogger(__name__)
+
+# content_versions key for weekly content + visit explanations + symptom guidance
+STATIC_CONTENT_KEY = "static_content"
+
+
+@dataclass(frozen=True)
+class CachedDocument:
+    """Pre-serialized JSON response body and its strong ETag"""
+    body: bytes
+    etag: str
+
+    @classmethod
+    def from_json(cls, body: bytes) -> "CachedDocument":
+        return cls(body=body, etag=make_etag(body))
+
+
+@dataclass(frozen=True)
+class ContentSnapshot:
+    """One consistent, read-only view of all static content"""
+    version: int
+    weeks: Mapping[int, CachedDocument]
+    week_updated_at: Mapping[int, datetime]
+    visits: Mapping[int, CachedDocument]
+    visit_index: CachedDocument
+    guidance: GuidanceTable
+
+
+class ContentStore:
+    """
+    Holds the current ContentSnapshot for this worker
+    Reloads replace the snapshot reference in one assignment, so concurrent
+    requests never observe a partially loaded store.
+    """
+
+    def __init__(self):
+        self._snapshot: Optional[ContentSnapshot] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._snapshot is not None
+
+    @property
+    def version(self) -> Optional[int]:
+        return self._snapshot.version if self._snapshot else None
+
+    def get_week(self, week_number: int) -> Optional[CachedDocument]:
+        """Cached document for a week, or None if not loaded / not found"""
+        if self._snapshot is None:
+            return None
+        return self._snapshot.weeks.get(week_number)
+
+    def get_visit(self, visit_number: int) -> Optional[CachedDocument]:
+        """Cached document for a visit, or None if not loaded / not found"""
+        if self._snapshot is None:
+            return None
+        return self._snapshot.visits.get(visit_number)
+
+    def get_visit_index(self) -> Optional[CachedDocument]:
+        """Cached document listing all visits in order"""
+        if self._snapshot is None:
+            return None
+        return self._snapshot.visit_index
+
+    def get_guidance(self, symptom: SymptomType, severity: int, week: int) -> Optional[CachedDocument]:
+        """Pre-rendered guidance for (symptom, severity 1-5, week 1-12), or None"""
+        if self._snapshot is None:
+            return None
+        return self._snapshot.guidance.lookup(symptom, severity, week)
+
+    def week_changes(self, since: Optional[datetime]) -> Optional[Tuple[int, Optional[datetime], List[CachedDocument]]]:
+        """
+        Weeks updated after `since` (all weeks if None) for delta sync
+        Returns (version, newest updated_at, documents) from one snapshot, or None if not loaded.
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            return None
+        updated = snapshot.week_updated_at
+        documents = [
+            snapshot.weeks[week] for week in sorted(updated) if since is None or updated[week] > since
+        ]
+        return snapshot.version, max(updated.values(), default=None), documents
+
+    @staticmethod
+    async def fetch_version(db: AsyncSession) -> int:
+        """Current content version marker (0 if never stamped)"""
+        version = await db.scalar(
+            select(ContentVersion.version).where(ContentVersion.content_key == STATIC_CONTENT_KEY)
+        )
+        return version or 0
+
+    async def load(self, session_factory: async_sessionmaker) -> ContentSnapshot:
+        """Build a new snapshot from the database and make it current"""
+        async with session_factory() as db:
+            version = await self.fetch_version(db)
+            weeks = (await db.execute(
+                select(WeeklyContent).order_by(WeeklyContent.week_number)
+            )).scalars().all()
+            visits = (await db.execute(
+                select(VisitExplanation).order_by(VisitExplanation.visit_number)
+            )).scalars().all()
+            rules = await load_rules(db)
+
+        week_docs = {
+            row.week_number: CachedDocument.from_json(
+                WeeklyContentResponse.model_validate(row).model_dump_json().encode()
+            )
+            for row in weeks
+        }
+        visit_models = [VisitExplanationResponse.model_validate(row) for row in visits]
+        visit_docs = {
+            model.visit_number: CachedDocument.from_json(model.model_dump_json().encode())
+            for model in visit_models
+        }
+        index_body = b"[" + b",".join(model.model_dump_json().encode() for model in visit_models) + b"]"
+
+        snapshot = ContentSnapshot(
+            version=version,
+            weeks=MappingProxyType(week_docs),
+            week_updated_at=MappingProxyType({row.week_number: row.updated_at for row in weeks}),
+            visits=MappingProxyType(visit_docs),
+            visit_index=CachedDocument.from_json(index_body),
+            guidance=compile_guidance(rules, lambda model: CachedDocument.from_json(model.model_dump_json().encode())),
+        )
+        self._snapshot = snapshot
+        logger.info(
+            "Content store loaded: version=%s weeks=%d visits=%d guidance_rules=%d (%d/%d cells)",
+            version, len(week_docs), len(visit_docs), snapshot.guidance.rule_count,
+            snapshot.guidance.covered, len(snapshot.guidance),
+        )
+        return snapshot
+
+    async def refresh_if_changed(self, session_factory: async_sessionmaker) -> bool:
+        """Reload if the version marker moved (or nothing is loaded yet)"""
+        if self._snapshot is not None:
+            async with session_factory() as db:
+                version = await self.fetch_version(db)
+            if version == self._snapshot.version:
+                return False
+        await self.load(session_factory)
+        return True
+
+    async def watch(self, session_factory: async_sessionmaker, interval_seconds: float):
+        """
+        Poll the version marker forever, reloading on change
+        Run as a background task from the app lifespan; DB errors are logged
+        and retried on the next tick so a blip never kills the watcher.
+        """
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                await self.refresh_if_changed(session_factory)
+            except Exception:
+                logger.exception("Content store refresh failed; keeping current snapshot")
+
+
+def bump_content_version(db: Session, content_key: str = STATIC_CONTENT_KEY, release: Optional[str] = None) -> int:
+    """
+    Increment a content version marker (sync, for scripts/seed_content.py)
+    Optionally records the data release applied. Caller commits. Returns the new version.
+    """
+    marker = db.get(ContentVersion, content_key)
+    if marker is None:
+        marker = ContentVersion(content_key=content_key, version=1, release=release)
+        db.add(marker)
+    else:
+        marker.version += 1
+        marker.updated_at = datetime.utcnow()
+        if release is not None:
+            marker.release = release
+    db.flush()
+    return marker.version
+
+
+# Process-wide store used by the content router
+content_store = ContentStore()
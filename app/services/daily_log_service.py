@@ -0,0 +1,170 @@
+"""
+Daily Log Service
+Writes daily check-in entries (symptoms, mood, journal, weight)
+
+Offline clients upload bursts of entries after reconnecting. A batch is:
+1. validated entry-by-entry in one pass (bad entries are reported, not fatal)
+2. split by table and written with one multi-row
+   INSERT ... ON CONFLICT (user_id, client_entry_id, log_date) DO NOTHING RETURNING
+   per table, so retried uploads are idempotent
+3. folded into the daily/weekly trend rollups, and the user's data version
+   bumped (app/services/data_version.py) if anything was created
+4. committed once
+
+A symptom entry is one row however many symptoms it lists: the set is packed
+into symptom_mask / symptom_severities (app/db/models.py).
+
+Journal entries are encrypted under the user's data key before the insert
+(app/services/journal_crypto.py); the key is resolved once per batch.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.dialects import insert_for
+from app.db.models import PregnancyProfile, SymptomLog, WeightLog, pack_symptoms
+from app.schemas.logs import DailyLogEntry, DailyLogEntryResult, SymptomLogEntry
+from app.services.data_version import bump_statement
+from app.services.journal_crypto import user_cipher
+from app.services.pregnancy_calculator import PregnancyCalculator
+from app.services.rollup_service import RollupService
+
+_entry_adapter = TypeAdapter(DailyLogEntry)
+
+
+def _format_errors(exc: ValidationError) -> List[str]:
+    """Flatten pydantic errors into 'field: message' strings"""
+    messages = []
+    for error in exc.errors():
+        location = ".".join(str(part) for part in error["loc"][1:]) or "entry"
+        messages.append(f"{location}: {error['msg']}")
+    return messages
+
+
+class DailyLogService:
+    """Bulk, idempotent writes of daily check-in entries"""
+
+    @staticmethod
+    def validate(raw_entries: List[Any]) -> Tuple[list, Dict[int, DailyLogEntryResult]]:
+        """
+        Validate raw entries in one pass
+        Returns (valid (index, entry) pairs, results for rejected entries by index).
+        Repeated client_entry_ids within a batch keep the first occurrence.
+        """
+        valid = []
+        rejected: Dict[int, DailyLogEntryResult] = {}
+        seen = set()
+
+        for index, raw in enumerate(raw_entries):
+            client_entry_id = raw.get("client_entry_id") if isinstance(raw, dict) else None
+            try:
+                entry = _entry_adapter.validate_python(raw)
+            except ValidationError as exc:
+                rejected[index] = DailyLogEntryResult(
+                    index=index, client_entry_id=client_entry_id if isinstance(client_entry_id, str) else None,
+                    status="invalid", errors=_format_errors(exc)
+                )
+                continue
+
+            key = (entry.kind, entry.client_entry_id)
+            if key in seen:
+                rejected[index] = DailyLogEntryResult(
+                    index=index, client_entry_id=entry.client_entry_id, status="duplicate"
+                )
+                continue
+            seen.add(key)
+            valid.append((index, entry))
+
+        return valid, rejected
+
+    @staticmethod
+    async def _insert(db: AsyncSession, model, pk, rows: List[dict]) -> Dict[str, int]:
+        """Multi-row insert, skipping existing idempotency keys; returns {client_entry_id: pk} for new rows"""
+        if not rows:
+            return {}
+        insert = insert_for(db)
+        stmt = (
+            insert(model)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=[model.user_id, model.client_entry_id, model.log_date])
+            .returning(model.client_entry_id, pk)
+        )
+        result = await db.execute(stmt)
+        return {client_entry_id: row_id for client_entry_id, row_id in result.all()}
+
+    @staticmethod
+    async def ingest(db: AsyncSession, user_id: int, raw_entries: List[Any]) -> dict:
+        """
+        Validate and write a batch of entries for one user in a single transaction
+        Returns a DailyLogBatchResult-shaped dict with per-entry outcomes
+        """
+        valid, results = DailyLogService.validate(raw_entries)
+
+        profile = await db.scalar(select(PregnancyProfile).where(PregnancyProfile.user_id == user_id))
+
+        def week_at(log_date) -> Optional[int]:
+            if profile is None:
+                return None
+            return PregnancyCalculator.week_and_day(profile.edd, profile.lmp_start_date, today=log_date)[0]
+
+        cipher = None
+        if any(isinstance(entry, SymptomLogEntry) and entry.journal_entry for _, entry in valid):
+            cipher = await user_cipher(db, user_id, create=True)
+
+        symptom_rows, weight_rows = [], []
+        for _, entry in valid:
+            row = {
+                "user_id": user_id,
+                "client_entry_id": entry.client_entry_id,
+                "log_date": entry.log_date,
+                "pregnancy_week": week_at(entry.log_date),
+            }
+            if isinstance(entry, SymptomLogEntry):
+                symptom_mask, symptom_severities = pack_symptoms(
+                    (rating.symptom_type, rating.severity_rating) for rating in entry.symptoms
+                )
+                row.update(
+                    symptom_mask=symptom_mask,
+                    symptom_severities=symptom_severities,
+                    mood=entry.mood,
+                    journal_entry=cipher.encrypt(entry.journal_entry) if entry.journal_entry else None,
+                )
+                symptom_rows.append(row)
+            else:
+                row.update(weight_kg=entry.weight_kg)
+                weight_rows.append(row)
+
+        created_symptoms = await DailyLogService._insert(db, SymptomLog, SymptomLog.log_id, symptom_rows)
+        created_weights = await DailyLogService._insert(db, WeightLog, WeightLog.weight_log_id, weight_rows)
+
+        # Fold only the newly created rows into the trend rollups (same transaction)
+        await RollupService.apply(
+            db, user_id,
+            [row for row in weight_rows if row["client_entry_id"] in created_weights],
+            [row for row in symptom_rows if row["client_entry_id"] in created_symptoms],
+        )
+        if created_symptoms or created_weights:
+            # Invalidates the user's profile / trend ETags
+            await db.execute(bump_statement(user_id))
+        await db.commit()
+
+        for index, entry in valid:
+            created = created_symptoms if isinstance(entry, SymptomLogEntry) else created_weights
+            log_id = created.get(entry.client_entry_id)
+            results[index] = DailyLogEntryResult(
+                index=index,
+                client_entry_id=entry.client_entry_id,
+                status="created" if log_id is not None else "duplicate",
+                log_id=log_id,
+            )
+
+        ordered = [results[index] for index in sorted(results)]
+        return {
+            "created": sum(1 for r in ordered if r.status == "created"),
+            "duplicates": sum(1 for r in ordered if r.status == "duplicate"),
+            "invalid": sum(1 for r in ordered if r.status == "invalid"),
+            "results": ordered,
+        }
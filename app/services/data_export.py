@@ -0,0 +1,169 @@
+"""
+Data Export Service
+Streams a user's raw weight and symptom history as NDJSON or CSV (GET /v1/logs/export)
+
+Rows are read through server-side cursors (AsyncSession.stream with yield_per),
+one partition of STREAM_BATCH_SIZE rows at a time. Each partition is encoded
+and handed to the response before the next one is fetched, so memory stays
+constant however much history is exported. The first bytes (the CSV header, or
+the first partition) go out as soon as the query starts returning rows.
+
+Both formats share one record layout: weight rows first, then symptom rows,
+each by (log_date, id). NDJSON lines carry only the fields of their type; CSV
+uses the union of columns (EXPORT_COLUMNS) and leaves the others empty. A symptom
+row's packed symptom set is expanded into "symptoms": a list of
+{symptom_type, severity_rating} in NDJSON, "Nausea:3;Fatigue" in CSV.
+
+Encrypted journal entries are decrypted partition by partition with the user's
+key, which is resolved once per export (app/services/journal_crypto.py).
+
+With gzip=True the stream is gzip-compressed incrementally. Each partition is
+flushed with Z_SYNC_FLUSH, so clients can decompress rows as they arrive.
+"""
+
+import csv
+import enum
+import io
+import json
+import zlib
+from datetime import date, datetime
+from typing import AsyncIterator, Callable, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import SymptomLog, WeightLog, unpack_symptoms
+from app.services.journal_crypto import decrypt_rows
+
+# Rows fetched per round trip from the server-side cursor (and per response chunk)
+STREAM_BATCH_SIZE = 1000
+
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+EXPORT_COLUMNS = (
+    "type", "id", "log_date", "pregnancy_week", "weight_kg",
+    "symptoms", "mood", "journal_entry", "created_at",
+)
+
+# (record type, model, columns as (field name, column)), in export order
+EXPORT_TABLES = (
+    ("weight", WeightLog, (
+        ("id", WeightLog.weight_log_id), ("log_date", WeightLog.log_date),
+        ("pregnancy_week", WeightLog.pregnancy_week), ("weight_kg", WeightLog.weight_kg),
+        ("created_at", WeightLog.created_at),
+    )),
+    ("symptom", SymptomLog, (
+        ("id", SymptomLog.log_id), ("log_date", SymptomLog.log_date),
+        ("pregnancy_week", SymptomLog.pregnancy_week), ("symptom_mask", SymptomLog.symptom_mask),
+        ("symptom_severities", SymptomLog.symptom_severities), ("mood", SymptomLog.mood),
+        ("journal_entry", SymptomLog.journal_entry), ("created_at", SymptomLog.created_at),
+    )),
+)
+
+
+def _plain(value):
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def _expand_symptoms(fields, rows):
+    """Replace the packed symptom_mask / symptom_severities values with one "symptoms" list"""
+    position = fields.index("symptom_mask")
+    fields = [*fields[:position], "symptoms", *fields[position + 2:]]
+    rows = [
+        [*row[:position], [
+            {"symptom_type": symptom.value, "severity_rating": severity}
+            for symptom, severity in unpack_symptoms(row[position], row[position + 1])
+        ], *row[position + 2:]]
+        for row in rows
+    ]
+    return fields, rows
+
+
+def export_query(model, columns, user_id: int, start_date: Optional[date] = None, end_date: Optional[date] = None):
+    """One table's rows for a user, oldest first, within an optional inclusive date range"""
+    pk = columns[0][1]
+    query = select(*(column for _, column in columns)).where(model.user_id == user_id)
+    if start_date is not None:
+        query = query.where(model.log_date >= start_date)
+    if end_date is not None:
+        query = query.where(model.log_date <= end_date)
+    return query.order_by(model.log_date, pk)
+
+
+def _ndjson(kind: str, fields, rows) -> str:
+    lines = []
+    for row in rows:
+        record = {"type": kind}
+        record.update((field, _plain(value)) for field, value in zip(fields, row))
+        lines.append(json.dumps(record, separators=(",", ":"), ensure_ascii=False))
+    return "\n".join(lines) + "\n"
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        # symptoms as "Nausea:3;Fatigue" (no rating given for Fatigue)
+        return ";".join(
+            item["symptom_type"] if item["severity_rating"] is None else f"{item['symptom_type']}:{item['severity_rating']}"
+            for item in value
+        )
+    return _plain(value)
+
+
+def _csv(kind: str, fields, rows) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    positions = [EXPORT_COLUMNS.index(field) for field in fields]
+    for row in rows:
+        line = [""] * len(EXPORT_COLUMNS)
+        line[0] = kind
+        for position, value in zip(positions, row):
+            line[position] = _csv_value(value)
+        writer.writerow(line)
+    return buffer.getvalue()
+
+
+class DataExportService:
+    """Streaming raw-data exports"""
+
+    @staticmethod
+    async def stream(session_factory: Callable[[], AsyncSession], user_id: int, fmt: str = "ndjson",
+                     start_date: Optional[date] = None, end_date: Optional[date] = None,
+                     gzip: bool = False) -> AsyncIterator[bytes]:
+        """
+        Encoded export chunks for a StreamingResponse
+        Opens its own session, which stays open only while the response is being sent.
+        """
+        encode = _csv if fmt == "csv" else _ndjson
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS) if gzip else None
+
+        def chunk(text: str) -> bytes:
+            data = text.encode()
+            if compressor is None:
+                return data
+            return compressor.compress(data) + compressor.flush(zlib.Z_SYNC_FLUSH)
+
+        if fmt == "csv":
+            yield chunk(",".join(EXPORT_COLUMNS) + "\n")
+
+        async with session_factory() as db:
+            for kind, model, columns in EXPORT_TABLES:
+                fields = [field for field, _ in columns]
+                journal = fields.index("journal_entry") if "journal_entry" in fields else None
+                query = export_query(model, columns, user_id, start_date, end_date)
+                result = await db.stream(query.execution_options(yield_per=STREAM_BATCH_SIZE))
+                async for rows in result.partitions():
+                    if journal is not None:
+                        rows = await decrypt_rows(db, user_id, rows, journal)
+                    if "symptom_mask" in fields:
+                        yield chunk(encode(kind, *_expand_symptoms(fields, rows)))
+                    else:
+                        yield chunk(encode(kind, fields, rows))
+
+        if compressor is not None:
+            yield compressor.flush()
@@ -0,0 +1,70 @@
+"""
+User Data Version
+Per-user change counter behind conditional GETs on the profile and trend endpoints
+
+users.data_version is incremented in the same transaction as every write to the
+user's pregnancy profile, symptom logs or weight logs:
+- DailyLogService.ingest, when a batch creates entries
+- the nightly rollover job, for profiles whose cached week/day changed
+- trend rollup rebuilds, for the users rebuilt
+- any ORM flush of those models (mapper events in app/db/models.py)
+
+GET endpoints build a strong ETag from the version and everything else their
+response depends on: request path and query, the user's local date and the server
+date (for "today" and day windows), the content version and the app version.
+If-None-Match is then answered with 304 after one primary-key lookup, before the
+real query runs or anything is serialized.
+"""
+
+from datetime import date, datetime, timezone
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import User
+from app.services.content_store import content_store
+from app.services.http_cache import make_etag
+from app.services.profile_service import local_today
+
+
+def bump_users_statement(*criteria):
+    """UPDATE incrementing the data version of the users matching criteria on the users table"""
+    users = User.__table__
+    return (
+        users.update()
+        .where(*criteria)
+        # Keep users.updated_at for account changes; this is not one
+        .values(data_version=users.c.data_version + 1, updated_at=users.c.updated_at)
+    )
+
+
+def bump_statement(user_id: int):
+    """UPDATE incrementing one user's data version (sync or async sessions, or a raw connection)"""
+    return bump_users_statement(User.__table__.c.user_id == user_id)
+
+
+def data_etag(user_id: int, version: int, tz_name: str, request_key: str, app_version: str,
+              now_utc: Optional[datetime] = None) -> str:
+    """Strong ETag for one user-data response (app_version: the serving app's APP_VERSION)"""
+    now_utc = now_utc or datetime.now(timezone.utc)
+    key = ":".join((
+        app_version, str(user_id), str(version), str(content_store.version),
+        local_today(tz_name, now_utc).isoformat(), date.today().isoformat(), request_key,
+    ))
+    return make_etag(key.encode())
+
+
+class DataVersionService:
+    """Version lookups for conditional GETs"""
+
+    @staticmethod
+    async def etag(db: AsyncSession, user_id: int, request_key: str, app_version: str,
+                   now_utc: Optional[datetime] = None) -> Optional[str]:
+        """ETag for a request on the user's data, or None if the user doesn't exist"""
+        row = (await db.execute(
+            select(User.data_version, User.timezone).where(User.user_id == user_id)
+        )).first()
+        if row is None:
+            return None
+        return data_etag(user_id, row.data_version, row.timezone, request_key, app_version, now_utc)
@@ -0,0 +1,128 @@
+"""
+Account Erasure Service
+Bulk deletion of accounts and everything they own, without loading it into the ORM
+
+Erasing an account is one DELETE on users. Every table holding a user's data
+(pregnancy_profiles, symptom_logs, weight_logs, feedbacks, export_jobs, the trend
+rollups and sync_tombstones) references users.user_id with ON DELETE CASCADE, and
+each has an index leading with user_id. The database therefore removes the
+children in the same statement, and no row is ever read into Python. SQLite
+connections enable foreign keys for this (app/db/dialects.py). The user's journal
+data key (user_data_keys) goes too, so copies of encrypted entries left in backups
+can no longer be read.
+
+Background purges remove deactivated accounts (is_active = 0) in primary-key
+batches, one transaction per batch. This bounds lock time and WAL/replication
+bursts however many accounts are waiting. Rendered PDF summaries are removed
+from EXPORT_DIR after their batch commits.
+
+NPS rollups are anonymous counters and keep the erased feedbacks' scores until
+the next scripts/rebuild_nps_rollups.py run.
+"""
+
+import os
+import time
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Sequence
+
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from app.db.models import ExportJob, User
+from app.services import journal_crypto
+from app.services.auth_service import AuthService
+
+
+@dataclass
+class PurgeStats:
+    """Progress / summary of an erasure run"""
+    accounts: int = 0
+    batches: int = 0
+    export_files: int = 0
+    elapsed_s: float = 0.0
+
+
+def _remove_files(paths: Sequence[str]) -> int:
+    removed = 0
+    for path in paths:
+        try:
+            os.remove(path)
+            removed += 1
+        except FileNotFoundError:
+            pass
+    return removed
+
+
+class ErasureService:
+    """Set-based account erasure relying on ON DELETE CASCADE"""
+
+    @staticmethod
+    def _erase_batch(db: Session, user_ids: List[int], *criteria) -> tuple:
+        """
+        Delete the given accounts (and, by cascade, their data) and commit
+        Returns (accounts deleted, export files removed).
+        """
+        paths = db.scalars(
+            select(ExportJob.file_path).where(ExportJob.user_id.in_(user_ids), ExportJob.file_path.isnot(None))
+        ).all()
+        result = db.execute(delete(User).where(User.user_id.in_(user_ids), *criteria))
+        db.commit()
+        for user_id in user_ids:
+            AuthService.invalidate_user(user_id)
+            journal_crypto.forget(user_id)
+        return result.rowcount, _remove_files(paths)
+
+    @staticmethod
+    def erase_users(db: Session, user_ids: Sequence[int], batch_size: int = 500) -> PurgeStats:
+        """Erase specific accounts, active or not (e.g. a data deletion request)"""
+        stats = PurgeStats()
+        started = time.perf_counter()
+        user_ids = sorted(set(user_ids))
+        for start in range(0, len(user_ids), batch_size):
+            accounts, files = ErasureService._erase_batch(db, user_ids[start:start + batch_size])
+            stats.accounts += accounts
+            stats.export_files += files
+            stats.batches += 1
+        stats.elapsed_s = round(time.perf_counter() - started, 2)
+        return stats
+
+    @staticmethod
+    def purge_deactivated(db: Session, batch_size: int = 500, max_accounts: Optional[int] = None,
+                          pause_s: float = 0.0,
+                          progress: Optional[Callable[[PurgeStats], None]] = None) -> PurgeStats:
+        """
+        Erase every deactivated account, batch_size accounts per transaction
+        Batches are picked in user_id order and locked (SKIP LOCKED on PostgreSQL),
+        and is_active is re-checked in the DELETE, so an account reactivated
+        meanwhile is kept. progress is called with the running totals after each
+        batch; pause_s sleeps between batches to spare replicas.
+        """
+        stats = PurgeStats()
+        started = time.perf_counter()
+        last_id = 0
+        while max_accounts is None or stats.accounts < max_accounts:
+            size = batch_size if max_accounts is None else min(batch_size, max_accounts - stats.accounts)
+            user_ids = db.scalars(
+                select(User.user_id)
+                .where(User.is_active == 0, User.user_id > last_id)
+                .order_by(User.user_id)
+                .limit(size)
+                .with_for_update(skip_locked=True)
+            ).all()
+            if not user_ids:
+                db.rollback()
+                break
+
+            accounts, files = ErasureService._erase_batch(db, user_ids, User.is_active == 0)
+            last_id = user_ids[-1]
+            stats.accounts += accounts
+            stats.export_files += files
+            stats.batches += 1
+            stats.elapsed_s = round(time.perf_counter() - started, 2)
+            if progress is not None:
+                progress(stats)
+            if pause_s:
+                time.sleep(pause_s)
+
+        stats.elapsed_s = round(time.perf_counter() - started, 2)
+        return stats
@@ -0,0 +1,252 @@
+"""
+Export Service
+Background PDF summary export jobs
+
+Submitting an export:
+1. fingerprints the inputs (log counts / latest ids, profile version and
+   current week, range)
+2. returns the latest completed job with the same fingerprint if its file
+   still exists (unchanged summaries are never re-rendered)
+3. otherwise records a pending job and hands rendering to a bounded
+   process pool; the request returns the job id immediately
+
+Rendered files are spooled under EXPORT_DIR and streamed back in chunks
+(with HTTP Range support) by the download endpoint.
+"""
+
+import asyncio
+import hashlib
+import logging
+import multiprocessing
+import os
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import Iterator, Optional, Tuple
+
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import Settings, get_settings
+from app.db.models import ExportJob, PregnancyProfile, SymptomLog, WeightLog
+from app.services.pdf_generator import RENDERER_VERSION, render_summary_pdf
+
+logger = logging.getLogger(__name__)
+
+# Download chunk size
+CHUNK_SIZE = 64 * 1024
+
+# Pending/running jobs older than this are assumed lost (e.g., worker restart)
+STALE_JOB_AFTER = timedelta(minutes=10)
+
+
+class ExportQueueFull(Exception):
+    """Raised when the export pool already has EXPORT_MAX_PENDING jobs in flight"""
+
+
+_settings: Optional[Settings] = None
+_pool: Optional[ProcessPoolExecutor] = None
+_in_flight = set()
+
+
+def configure(settings: Optional[Settings] = None) -> Settings:
+    """
+    Settings for exports (app lifespan; default get_settings() on first use)
+    EXPORT_DIR: where rendered PDFs are spooled (local disk of the API host)
+    EXPORT_WORKERS: renderer processes per API worker; they use these settings' database
+    EXPORT_MAX_PENDING: jobs in flight per API worker before new submissions are refused
+    """
+    global _settings
+    _settings = settings or get_settings()
+    return _settings
+
+
+def export_settings() -> Settings:
+    return _settings if _settings is not None else configure()
+
+
+def _init_renderer(settings: Settings):
+    """Renderer process initializer: point app.db.database at the API worker's database"""
+    from app.db.database import configure as configure_database
+    configure_database(settings)
+
+
+def get_pool() -> ProcessPoolExecutor:
+    """Lazily start the renderer pool ('spawn' so children don't inherit the event loop)"""
+    global _pool
+    if _pool is None:
+        settings = export_settings()
+        _pool = ProcessPoolExecutor(
+            max_workers=settings.export_workers, mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_renderer, initargs=(settings,)
+        )
+    return _pool
+
+
+async def shutdown_pool():
+    """
+    Stop in-flight export tasks and the renderer pool (app shutdown)
+    Interrupted jobs stay pending/running and are retried once stale.
+    """
+    global _pool
+    tasks = list(_in_flight)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+class ExportService:
+    """Submit, track and serve PDF summary exports"""
+
+    @staticmethod
+    async def fingerprint(db: AsyncSession, user_id: int,
+                          start_date: Optional[date], end_date: Optional[date]) -> str:
+        """Hash of everything the rendered summary depends on"""
+        parts = [f"v{RENDERER_VERSION}", str(user_id), str(start_date), str(end_date)]
+
+        for model, pk in ((WeightLog, WeightLog.weight_log_id), (SymptomLog, SymptomLog.log_id)):
+            query = select(func.count(), func.max(pk), func.max(model.created_at)).where(model.user_id == user_id)
+            if start_date is not None:
+                query = query.where(model.log_date >= start_date)
+            if end_date is not None:
+                query = query.where(model.log_date <= end_date)
+            parts.extend(str(value) for value in (await db.execute(query)).one())
+
+        # The summary prints the current week; hash it directly rather than trusting updated_at to follow it
+        profile = (await db.execute(
+            select(PregnancyProfile.updated_at, PregnancyProfile.current_week, PregnancyProfile.current_day)
+            .where(PregnancyProfile.user_id == user_id)
+        )).one_or_none()
+        parts.extend(str(value) for value in (profile or (None, None, None)))
+        return hashlib.sha256("|".join(parts).encode()).hexdigest()
+
+    @staticmethod
+    async def submit(db: AsyncSession, session_factory: async_sessionmaker, user_id: int,
+                     start_date: Optional[date] = None, end_date: Optional[date] = None) -> ExportJob:
+        """
+        Return a cached or in-progress job for unchanged inputs, else start a new one
+        Raises ExportQueueFull when this worker already has too many jobs in flight.
+        """
+        fingerprint = await ExportService.fingerprint(db, user_id, start_date, end_date)
+
+        existing = (await db.execute(
+            select(ExportJob)
+            .where(ExportJob.user_id == user_id, ExportJob.input_fingerprint == fingerprint,
+                   ExportJob.status.in_(("pending", "running", "completed")))
+            .order_by(ExportJob.created_at.desc())
+            .limit(1)
+        )).scalar_one_or_none()
+        if existing is not None:
+            if existing.status == "completed" and os.path.exists(existing.file_path or ""):
+                return existing
+            if existing.status != "completed" and datetime.utcnow() - existing.created_at < STALE_JOB_AFTER:
+                return existing
+
+        settings = export_settings()
+        if len(_in_flight) >= settings.export_max_pending:
+            raise ExportQueueFull()
+
+        job_id = str(uuid.uuid4())
+        os.makedirs(settings.export_dir, exist_ok=True)
+        job = ExportJob(
+            job_id=job_id,
+            user_id=user_id,
+            status="pending",
+            input_fingerprint=fingerprint,
+            file_path=os.path.join(settings.export_dir, f"{job_id}.pdf"),
+        )
+        db.add(job)
+        await db.commit()
+
+        task = asyncio.create_task(ExportService._run(session_factory, job_id, user_id, job.file_path, start_date, end_date))
+        _in_flight.add(task)
+        task.add_done_callback(_in_flight.discard)
+        return job
+
+    @staticmethod
+    async def _run(session_factory: async_sessionmaker, job_id: str, user_id: int, file_path: str,
+                   start_date: Optional[date], end_date: Optional[date]):
+        """Render in the process pool and record the outcome"""
+        async with session_factory() as db:
+            await db.execute(update(ExportJob).where(ExportJob.job_id == job_id).values(status="running"))
+            await db.commit()
+
+        loop = asyncio.get_running_loop()
+        try:
+            size = await loop.run_in_executor(get_pool(), render_summary_pdf, user_id, file_path, start_date, end_date)
+            values = {"status": "completed", "file_size": size, "completed_at": datetime.utcnow()}
+        except Exception as exc:
+            logger.exception("PDF export %s failed", job_id)
+            values = {"status": "failed", "error": str(exc)[:1000], "completed_at": datetime.utcnow()}
+
+        async with session_factory() as db:
+            result = await db.execute(update(ExportJob).where(ExportJob.job_id == job_id).values(**values))
+            if result.rowcount == 0:
+                # The account was erased while rendering; don't leave its summary on disk
+                if os.path.exists(file_path):
+                    os.remove(file_path)
+                return
+            if values["status"] == "completed":
+                await ExportService._discard_superseded(db, user_id, job_id)
+            await db.commit()
+
+    @staticmethod
+    async def _discard_superseded(db: AsyncSession, user_id: int, keep_job_id: str):
+        """Delete older completed files for the user so the spool holds one summary each"""
+        old_jobs = (await db.execute(
+            select(ExportJob).where(
+                ExportJob.user_id == user_id, ExportJob.job_id != keep_job_id, ExportJob.status == "completed"
+            )
+        )).scalars().all()
+        for old in old_jobs:
+            if old.file_path and os.path.exists(old.file_path):
+                os.remove(old.file_path)
+            await db.delete(old)
+
+    @staticmethod
+    async def get_job(db: AsyncSession, user_id: int, job_id: str) -> Optional[ExportJob]:
+        """A user's job by id (None if missing or owned by someone else)"""
+        job = await db.get(ExportJob, job_id)
+        if job is None or job.user_id != user_id:
+            return None
+        return job
+
+
+def parse_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single-range 'bytes=start-end' header into inclusive offsets
+    Returns None for no/unsupported ranges; raises ValueError if unsatisfiable.
+    """
+    if not header or not header.startswith("bytes=") or "," in header:
+        return None
+    start_text, _, end_text = header[len("bytes="):].strip().partition("-")
+    try:
+        if start_text == "":
+            # Suffix range: last N bytes
+            length = int(end_text)
+            if length <= 0:
+                raise ValueError("Unsatisfiable range")
+            return max(size - length, 0), size - 1
+        start = int(start_text)
+        end = int(end_text) if end_text else size - 1
+    except ValueError:
+        raise ValueError("Unsatisfiable range")
+    if start >= size or end < start:
+        raise ValueError("Unsatisfiable range")
+    return start, min(end, size - 1)
+
+
+def iter_file(path: str, start: int, end: int) -> Iterator[bytes]:
+    """Yield bytes start..end (inclusive) of a file in CHUNK_SIZE pieces"""
+    remaining = end - start + 1
+    with open(path, "rb") as handle:
+        handle.seek(start)
+        while remaining > 0:
+            chunk = handle.read(min(CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
@@ -0,0 +1,32 @@
+"""
+HTTP Caching Helpers
+Strong ETag generation and If-None-Match evaluation for conditional GETs
+"""
+
+import hashlib
+from typing import Optional
+
+
+def make_etag(data: bytes) -> str:
+    """Strong ETag for a response body (quoted, per RFC 9110)"""
+    return '"' + hashlib.sha256(data).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Evaluate an If-None-Match header against an ETag
+    Uses weak comparison as RFC 9110 requires for If-None-Match,
+    and accepts lists of tags as well as "*"
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    target = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == target:
+            return True
+    return False
@@ -0,0 +1,346 @@
+"""
+Journal Encryption
+Envelope encryption of SymptomLog.journal_entry at rest
+
+Each user gets a random 256-bit data key the first time they write a journal
+entry. It is stored in user_data_keys wrapped (AES-256-GCM) by the master key
+from JOURNAL_MASTER_KEY. Entries are encrypted with AES-256-GCM under the
+owner's data key, with the user id as associated data, and stored as
+"enc:v1:" + base64(nonce || ciphertext).
+
+Unwrapped keys are kept in a bounded per-process LRU (JOURNAL_KEY_CACHE_SIZE).
+A list, sync or export request resolves its user's key once, from the cache or
+with one primary-key lookup plus an unwrap, and then decrypts all of its rows
+with it. Keys are never unwrapped per row.
+
+Without JOURNAL_MASTER_KEY (local development) entries are stored as plain text.
+New entries may not start with "enc:v1:" (schemas.logs rejects them), so that
+prefix always means ciphertext. Plain-text rows from before encryption was
+enabled stay readable, and scripts/encrypt_journals.py encrypts them in place.
+Values read without a data key (encryption off, or a user who never had a key)
+are returned as stored, so older plain text that happens to carry the prefix
+still reads back.
+"""
+
+import base64
+import binascii
+import hashlib
+import os
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterable, List, Optional
+
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.config import Settings, get_settings
+from app.db.dialects import insert_for
+from app.db.models import SymptomLog, UserDataKey
+from app.services.ttl_cache import TTLCache
+
+ENCRYPTED_PREFIX = "enc:v1:"
+_PREFIX_LENGTH = len(ENCRYPTED_PREFIX)
+NONCE_BYTES = 12
+KEY_BYTES = 32
+
+# Unwrapped keys never change; the TTL only bounds how long an erased user's key lingers
+KEY_CACHE_TTL = 3600
+
+
+class JournalKeyError(Exception):
+    """Raised when a journal entry or data key can't be decrypted with the configured master key"""
+
+
+def is_encrypted(value: Optional[str]) -> bool:
+    """Whether a stored journal_entry value is ciphertext"""
+    return value is not None and value.startswith(ENCRYPTED_PREFIX)
+
+
+def parse_master_key(value: str) -> bytes:
+    """
+    Decode JOURNAL_MASTER_KEY (urlsafe base64 of 32 random bytes)
+    Raises ValueError if it isn't a 256-bit key
+    """
+    try:
+        key = base64.urlsafe_b64decode(value.strip() + "=" * (-len(value.strip()) % 4))
+    except (ValueError, TypeError) as exc:
+        raise ValueError("JOURNAL_MASTER_KEY is not valid base64") from exc
+    if len(key) != KEY_BYTES:
+        raise ValueError(f"JOURNAL_MASTER_KEY must decode to {KEY_BYTES} bytes, got {len(key)}")
+    return key
+
+
+def _associated_data(user_id: int) -> bytes:
+    return f"user:{user_id}".encode()
+
+
+class UserCipher:
+    """One user's unwrapped data key (or plain-text passthrough when encryption is off)"""
+
+    __slots__ = ("user_id", "wrapped_key", "_aead", "_aad")
+
+    def __init__(self, user_id: int, aead: Optional[AESGCM] = None, wrapped_key: Optional[bytes] = None):
+        self.user_id = user_id
+        self.wrapped_key = wrapped_key
+        self._aead = aead
+        self._aad = _associated_data(user_id)
+
+    def encrypt(self, text: Optional[str]) -> Optional[str]:
+        """Stored form of a journal entry"""
+        if text is None or self._aead is None:
+            return text
+        nonce = os.urandom(NONCE_BYTES)
+        sealed = self._aead.encrypt(nonce, text.encode(), self._aad)
+        return ENCRYPTED_PREFIX + binascii.b2a_base64(nonce + sealed, newline=False).decode()
+
+    def decrypt(self, value: Optional[str]) -> Optional[str]:
+        """Plain text of a stored journal entry (plain-text rows, and every row without a key, pass through)"""
+        if self._aead is None or not is_encrypted(value):
+            return value
+        try:
+            raw = binascii.a2b_base64(value[_PREFIX_LENGTH:])
+            return self._aead.decrypt(raw[:NONCE_BYTES], raw[NONCE_BYTES:], self._aad).decode()
+        except (InvalidTag, ValueError) as exc:
+            raise JournalKeyError(f"Journal entry of user {self.user_id} could not be decrypted") from exc
+
+    def decrypt_all(self, values: Iterable[Optional[str]]) -> List[Optional[str]]:
+        """Decrypt a batch of stored values with this key"""
+        return [self.decrypt(value) for value in values]
+
+
+class JournalKeyring:
+    """Master key, key wrapping and the LRU of unwrapped data keys"""
+
+    def __init__(self, master_key: bytes, cache_size: int = 10000):
+        self._master = AESGCM(master_key)
+        self.key_id = hashlib.sha256(master_key).hexdigest()[:16]
+        self.cache = TTLCache(cache_size, KEY_CACHE_TTL)
+
+    def new_key_row(self, user_id: int) -> dict:
+        """user_data_keys row holding a fresh wrapped data key"""
+        nonce = os.urandom(NONCE_BYTES)
+        wrapped = nonce + self._master.encrypt(nonce, AESGCM.generate_key(bit_length=256), _associated_data(user_id))
+        return {"user_id": user_id, "wrapped_key": wrapped, "master_key_id": self.key_id}
+
+    def unwrap(self, user_id: int, wrapped_key: bytes, master_key_id: str, remember: bool = True) -> UserCipher:
+        """Unwrap a stored data key (and cache it unless remember=False)"""
+        if master_key_id != self.key_id:
+            raise JournalKeyError(
+                f"Data key of user {user_id} was wrapped by master key {master_key_id}, not {self.key_id}"
+            )
+        try:
+            key = self._master.decrypt(wrapped_key[:NONCE_BYTES], wrapped_key[NONCE_BYTES:], _associated_data(user_id))
+        except InvalidTag as exc:
+            raise JournalKeyError(f"Data key of user {user_id} could not be unwrapped") from exc
+        cipher = UserCipher(user_id, AESGCM(key), wrapped_key)
+        if remember:
+            self.cache.set(user_id, cipher)
+        return cipher
+
+    def resolve(self, user_id: int, row, created: bool) -> UserCipher:
+        """Cipher for a looked-up user_data_keys row, reusing the cached key when it is the same one"""
+        if row is None:
+            # Nothing of this user's was ever encrypted; don't cache, a key may be created later
+            return UserCipher(user_id)
+        cached = self.cache.get(user_id)
+        if cached is not None and cached.wrapped_key == row.wrapped_key:
+            return cached
+        # A key created in this (uncommitted) transaction is cached once a later request reads it back
+        return self.unwrap(user_id, row.wrapped_key, row.master_key_id, remember=not created)
+
+
+_keyring: Optional[JournalKeyring] = None
+_configured = False
+
+
+def configure(settings: Optional[Settings] = None) -> Optional[JournalKeyring]:
+    """
+    Build the keyring from settings (app.main.create_app, or on first use)
+    Returns None when JOURNAL_MASTER_KEY is unset. Raises ValueError for a malformed key.
+    """
+    global _keyring, _configured
+    settings = settings or get_settings()
+    master = settings.journal_master_key
+    _keyring = JournalKeyring(parse_master_key(master), settings.journal_key_cache_size) if master else None
+    _configured = True
+    return _keyring
+
+
+def get_keyring() -> Optional[JournalKeyring]:
+    """The process keyring, or None when journal encryption is off"""
+    if not _configured:
+        return configure()
+    return _keyring
+
+
+def forget(user_id: int):
+    """Drop a user's cached data key (account erasure)"""
+    if _keyring is not None:
+        _keyring.cache.pop(user_id)
+
+
+def _key_query(user_id: int):
+    return select(UserDataKey.wrapped_key, UserDataKey.master_key_id).where(UserDataKey.user_id == user_id)
+
+
+def _create_statement(db, keyring: JournalKeyring, user_id: int):
+    # A concurrent first write for the same user keeps whichever key committed first
+    return insert_for(db)(UserDataKey).values(keyring.new_key_row(user_id)) \
+        .on_conflict_do_nothing(index_elements=[UserDataKey.user_id])
+
+
+async def user_cipher(db: AsyncSession, user_id: int, create: bool = False) -> UserCipher:
+    """
+    The user's cipher for reading (cached, or one primary-key lookup) or writing
+    create=True is the write path: it always reads the stored key, so entries are
+    only ever encrypted under the committed one, and makes a data key if the user
+    has none yet (caller commits).
+    """
+    keyring = get_keyring()
+    if keyring is None:
+        return UserCipher(user_id)
+    if not create:
+        cipher = keyring.cache.get(user_id)
+        if cipher is not None:
+            return cipher
+
+    row = (await db.execute(_key_query(user_id))).first()
+    created = False
+    if row is None and create:
+        await db.execute(_create_statement(db, keyring, user_id))
+        row, created = (await db.execute(_key_query(user_id))).first(), True
+    return keyring.resolve(user_id, row, created)
+
+
+def user_cipher_sync(db: Session, user_id: int, create: bool = False) -> UserCipher:
+    """user_cipher for sync sessions (scripts)"""
+    keyring = get_keyring()
+    if keyring is None:
+        return UserCipher(user_id)
+    if not create:
+        cipher = keyring.cache.get(user_id)
+        if cipher is not None:
+            return cipher
+
+    row = db.execute(_key_query(user_id)).first()
+    created = False
+    if row is None and create:
+        db.execute(_create_statement(db, keyring, user_id))
+        row, created = db.execute(_key_query(user_id)).first(), True
+    return keyring.resolve(user_id, row, created)
+
+
+async def decrypt_rows(db: AsyncSession, user_id: int, rows: Iterable, position: int) -> List:
+    """
+    One user's rows with the journal_entry value at `position` decrypted
+    The user's key is resolved once for the batch, and only if a row is encrypted.
+    Rows without ciphertext are returned as they are.
+    """
+    rows = list(rows)
+    cipher = None
+    for index, row in enumerate(rows):
+        if is_encrypted(row[position]):
+            if cipher is None:
+                cipher = await user_cipher(db, user_id)
+            row = list(row)
+            row[position] = cipher.decrypt(row[position])
+            rows[index] = row
+    return rows
+
+
+@dataclass
+class EncryptStats:
+    """Progress / summary of a plain-text journal backfill"""
+    entries: int = 0
+    users: int = 0
+    batches: int = 0
+    elapsed_s: float = 0.0
+
+
+def _legacy_entries_query(batch_size: int):
+    """
+    Rows of users without a data key whose plain text starts with the ciphertext prefix
+    (written before the prefix was reserved); nothing of such a user's can be ciphertext.
+    """
+    return (
+        select(SymptomLog.log_id, SymptomLog.log_date, SymptomLog.user_id, SymptomLog.journal_entry)
+        .outerjoin(UserDataKey, UserDataKey.user_id == SymptomLog.user_id)
+        .where(UserDataKey.user_id.is_(None), SymptomLog.journal_entry.like(ENCRYPTED_PREFIX + "%"))
+        .order_by(SymptomLog.user_id, SymptomLog.log_id)
+        .limit(batch_size)
+    )
+
+
+def encrypt_plaintext_entries(db: Session, batch_size: int = 1000,
+                              progress: Optional[Callable[[EncryptStats], None]] = None) -> EncryptStats:
+    """
+    Encrypt journal entries stored as plain text, in log_id order, one transaction per batch
+    Prefixed plain text of users without a key goes first, before keys are made for them.
+    Each user's key is resolved once per batch. Raises RuntimeError without JOURNAL_MASTER_KEY.
+    """
+    if get_keyring() is None:
+        raise RuntimeError("JOURNAL_MASTER_KEY is not set")
+    stats = EncryptStats()
+    started = time.perf_counter()
+    users = set()
+    table = SymptomLog.__table__
+    # log_date too, so PostgreSQL prunes to one partition per row
+    statement = update(table).where(
+        table.c.log_id == bindparam("b_log_id"), table.c.log_date == bindparam("b_log_date")
+    ).values(journal_entry=bindparam("b_journal"))
+
+    def encrypt_batch(rows):
+        ciphers = {}
+        for row in rows:
+            if row.user_id not in ciphers:
+                ciphers[row.user_id] = user_cipher_sync(db, row.user_id, create=True)
+        db.execute(statement, [
+            {"b_log_id": row.log_id, "b_log_date": row.log_date, "b_journal": ciphers[row.user_id].encrypt(row.journal_entry)}
+            for row in rows
+        ])
+        db.commit()
+
+        users.update(ciphers)
+        stats.entries += len(rows)
+        stats.users = len(users)
+        stats.batches += 1
+        stats.elapsed_s = round(time.perf_counter() - started, 2)
+        if progress is not None:
+            progress(stats)
+
+    # Batches hold whole users (rows come in user order): once a user has a key, their rest would be skipped
+    while True:
+        rows = db.execute(_legacy_entries_query(batch_size)).all()
+        if not rows:
+            break
+        if len(rows) == batch_size:
+            last_user = rows[-1].user_id
+            whole = [row for row in rows if row.user_id != last_user]
+            rows = whole or db.execute(
+                _legacy_entries_query(batch_size).where(SymptomLog.user_id == last_user).limit(None)
+            ).all()
+        encrypt_batch(rows)
+
+    last_id = 0
+    while True:
+        rows = db.execute(
+            select(SymptomLog.log_id, SymptomLog.log_date, SymptomLog.user_id, SymptomLog.journal_entry)
+            .where(
+                SymptomLog.log_id > last_id,
+                SymptomLog.journal_entry.isnot(None),
+                SymptomLog.journal_entry.notlike(ENCRYPTED_PREFIX + "%"),
+            )
+            .order_by(SymptomLog.log_id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            db.rollback()
+            break
+        encrypt_batch(rows)
+        last_id = rows[-1].log_id
+
+    stats.elapsed_s = round(time.perf_counter() - started, 2)
+    return stats
@@ -0,0 +1,234 @@
+"""
+Journal Search Service
+Ranked full-text search over a user's journal entries (GET /v1/logs/journal/search)
+
+PostgreSQL matches websearch_to_tsquery('english', q) against the generated
+journal_tsv column through the (user_id, journal_tsv) GIN index and ranks with
+ts_rank. SQLite (local runs) uses the symptom_logs_fts FTS5 table and bm25.
+Both use the schema from JOURNAL_SEARCH_DDL in app/db/models.py.
+
+Encrypted entries ("enc:v1:..." with JOURNAL_MASTER_KEY set) are kept out of
+both indexes. Search then walks the user's entries newest first through the
+(user_id, log_id DESC) partial index, DECRYPT_BATCH_SIZE at a time, decrypts
+each batch with the user's data key and matches it in memory: every word is
+required, as a prefix of a word in the entry. It stops as soon as a page plus one
+hit is found, or after DECRYPT_MAX_ROWS entries. A capped scan returns the hits
+it found (possibly none) and a cursor where it stopped, so one request never
+decrypts more than DECRYPT_MAX_ROWS entries; a rare term may take several
+requests to page through an older journal. Hits come newest first, with the
+rank (matched words divided by the square root of the entry's length) reported
+but not used for ordering.
+
+Indexed results are ordered by (rank DESC, log_id DESC) and paginated by keyset:
+the cursor carries the last hit's (rank, log_id); encrypted search only uses its
+log_id, the last hit or the last entry scanned. Snippets are only built for the
+rows of the returned page. Each snippet is HTML-escaped, with matched terms
+wrapped in <mark>...</mark>.
+"""
+
+import base64
+import html
+import math
+import re
+from typing import List, Optional, Tuple
+
+from sqlalchemy import and_, func, literal_column, or_, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.dialects import dialect_name
+from app.db.models import SymptomLog
+from app.services.journal_crypto import ENCRYPTED_PREFIX, decrypt_rows, get_keyring
+
+# Private-use markers around matches; swapped for <mark> after escaping the snippet
+_START, _STOP = "\ue000", "\ue001"
+SNIPPET_WORDS = 16
+# Encrypted entries read and decrypted per query while searching without an index
+DECRYPT_BATCH_SIZE = 200
+# ... and at most this many per request, after which the page ends early with a cursor
+DECRYPT_MAX_ROWS = 2000
+
+# Inlined rather than bound: asyncpg would have to encode a bound regconfig parameter
+_TS_CONFIG = literal_column("'english'::regconfig")
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+
+def encode_cursor(rank: float, log_id: int) -> str:
+    """Encode a (rank, log_id) position as an opaque URL-safe cursor"""
+    raw = f"{rank!r}:{log_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[float, int]:
+    """
+    Decode a cursor produced by encode_cursor
+    Raises ValueError if the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        rank_part, id_part = base64.urlsafe_b64decode(padded.encode()).decode().rsplit(":", 1)
+        return float(rank_part), int(id_part)
+    except (ValueError, UnicodeDecodeError) as exc:
+        raise ValueError("Invalid cursor") from exc
+
+
+def render_snippet(raw: Optional[str]) -> str:
+    """HTML-escape a snippet and turn the match markers into <mark> tags"""
+    escaped = html.escape(raw or "")
+    return escaped.replace(_START, "<mark>").replace(_STOP, "</mark>")
+
+
+def fts5_query(q: str) -> Optional[str]:
+    """
+    User input -> FTS5 MATCH expression: every word quoted, all required
+    Quoting keeps FTS5 operators and punctuation in the input from being parsed as syntax.
+    """
+    tokens = _TOKEN.findall(q)
+    return " ".join(f'"{token}"' for token in tokens) or None
+
+
+def _marked_snippet(text: str, words: List[re.Match], matched: List[int]) -> str:
+    """SNIPPET_WORDS words of text around the first match, matches wrapped in the private-use markers"""
+    first = max(matched[0] - SNIPPET_WORDS // 4, 0)
+    window = range(first, min(first + SNIPPET_WORDS, len(words)))
+    hits = set(matched)
+    parts, position = [], words[first].start()
+    for index in window:
+        word = words[index]
+        parts.append(text[position:word.start()])
+        parts.append(f"{_START}{word.group()}{_STOP}" if index in hits else word.group())
+        position = word.end()
+    prefix = "…" if first > 0 else ""
+    suffix = "…" if window.stop < len(words) else text[position:]
+    return prefix + "".join(parts) + suffix
+
+
+class JournalSearchService:
+    """Per-user journal search with ranking, snippets and keyset pagination"""
+
+    @staticmethod
+    async def _search_postgres(db: AsyncSession, user_id: int, q: str, limit: int,
+                               after: Optional[Tuple[float, int]]) -> List[dict]:
+        query = func.websearch_to_tsquery(_TS_CONFIG, q)
+        tsv = literal_column("symptom_logs.journal_tsv")
+        rank = func.ts_rank(tsv, query)
+
+        hits = select(
+            SymptomLog.log_id, SymptomLog.log_date, SymptomLog.mood, SymptomLog.pregnancy_week,
+            SymptomLog.journal_entry, rank.label("rank"),
+        ).where(
+            SymptomLog.user_id == user_id,
+            SymptomLog.journal_entry.isnot(None),
+            # Matches the partial index predicate (ciphertext is not indexed)
+            SymptomLog.journal_entry.notlike(ENCRYPTED_PREFIX + "%"),
+            tsv.op("@@")(query),
+        )
+        if after is not None:
+            hits = hits.where(or_(rank < after[0], and_(rank == after[0], SymptomLog.log_id < after[1])))
+        hits = hits.order_by(rank.desc(), SymptomLog.log_id.desc()).limit(limit).subquery()
+
+        # ts_headline re-parses the text, so only run it on the page
+        options = f'StartSel="{_START}", StopSel="{_STOP}", MaxWords={SNIPPET_WORDS}, MinWords=5, MaxFragments=2'
+        page = select(
+            hits.c.log_id, hits.c.log_date, hits.c.mood, hits.c.pregnancy_week, hits.c.rank,
+            func.ts_headline(_TS_CONFIG, hits.c.journal_entry, query, options).label("snippet"),
+        ).order_by(hits.c.rank.desc(), hits.c.log_id.desc())
+        return [dict(row) for row in (await db.execute(page)).mappings()]
+
+    @staticmethod
+    async def _search_sqlite(db: AsyncSession, user_id: int, q: str, limit: int,
+                             after: Optional[Tuple[float, int]]) -> List[dict]:
+        match = fts5_query(q)
+        if match is None:
+            return []
+        keyset = "WHERE rank < :after_rank OR (rank = :after_rank AND log_id < :after_id)" if after else ""
+        # bm25() is lower-is-better; negate so both dialects rank higher-is-better
+        statement = text(f"""
+            SELECT * FROM (
+                SELECT s.log_id, s.log_date, s.mood, s.pregnancy_week,
+                       -bm25(symptom_logs_fts) AS rank,
+                       snippet(symptom_logs_fts, 0, :start, :stop, '…', :words) AS snippet
+                FROM symptom_logs_fts JOIN symptom_logs s ON s.log_id = symptom_logs_fts.rowid
+                WHERE symptom_logs_fts MATCH :match AND s.user_id = :user_id
+            ) {keyset}
+            ORDER BY rank DESC, log_id DESC
+            LIMIT :limit
+        """).columns(
+            SymptomLog.log_id, SymptomLog.log_date, SymptomLog.mood, SymptomLog.pregnancy_week,
+        )
+        params = {
+            "start": _START, "stop": _STOP, "words": SNIPPET_WORDS, "match": match,
+            "user_id": user_id, "limit": limit,
+        }
+        if after:
+            params.update(after_rank=after[0], after_id=after[1])
+        return [dict(row) for row in (await db.execute(statement, params)).mappings()]
+
+    @staticmethod
+    async def _search_decrypted(db: AsyncSession, user_id: int, q: str, limit: int,
+                                after: Optional[Tuple[float, int]]) -> Tuple[List[dict], Optional[int]]:
+        """Hits, plus the log_id the scan stopped at when DECRYPT_MAX_ROWS ran out first"""
+        terms = sorted({token.lower() for token in _TOKEN.findall(q)})
+        if not terms:
+            return [], None
+        hits = []
+        scanned = 0
+        before = after[1] if after is not None else None
+        while len(hits) < limit:
+            if scanned >= DECRYPT_MAX_ROWS:
+                return hits, before
+            size = min(DECRYPT_BATCH_SIZE, DECRYPT_MAX_ROWS - scanned)
+            batch = select(
+                SymptomLog.log_id, SymptomLog.log_date, SymptomLog.mood, SymptomLog.pregnancy_week,
+                SymptomLog.journal_entry,
+            ).where(SymptomLog.user_id == user_id, SymptomLog.journal_entry.isnot(None))
+            if before is not None:
+                batch = batch.where(SymptomLog.log_id < before)
+            rows = (await db.execute(batch.order_by(SymptomLog.log_id.desc()).limit(size))).all()
+            scanned += len(rows)
+
+            for log_id, log_date, mood, pregnancy_week, entry in await decrypt_rows(db, user_id, rows, 4):
+                words = list(_TOKEN.finditer(entry))
+                lowered = [word.group().lower() for word in words]
+                if not all(any(word.startswith(term) for word in lowered) for term in terms):
+                    continue
+                matched = [index for index, word in enumerate(lowered) if any(word.startswith(term) for term in terms)]
+                hits.append({
+                    "log_id": log_id, "log_date": log_date, "mood": mood, "pregnancy_week": pregnancy_week,
+                    "rank": len(matched) / math.sqrt(len(words)),
+                    "snippet": _marked_snippet(entry, words, matched),
+                })
+                if len(hits) == limit:
+                    break
+            if len(rows) < size:
+                break
+            before = rows[-1].log_id
+        return hits, None
+
+    @staticmethod
+    async def search(db: AsyncSession, user_id: int, q: str, limit: int = 20,
+                     cursor: Optional[str] = None) -> Tuple[List[dict], Optional[str]]:
+        """
+        One page of ranked hits plus the cursor for the next page
+        Raises ValueError if the cursor is malformed
+        """
+        after = decode_cursor(cursor) if cursor is not None else None
+        # Fetch one extra row to know whether another page exists
+        stopped_at = None
+        if get_keyring() is not None:
+            rows, stopped_at = await JournalSearchService._search_decrypted(db, user_id, q, limit + 1, after)
+        elif dialect_name(db) == "postgresql":
+            rows = await JournalSearchService._search_postgres(db, user_id, q, limit + 1, after)
+        else:
+            rows = await JournalSearchService._search_sqlite(db, user_id, q, limit + 1, after)
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(float(rows[-1]["rank"]), rows[-1]["log_id"])
+        elif stopped_at is not None:
+            # Scan cap reached: a short (or empty) page, and the rest is still to search
+            next_cursor = encode_cursor(0.0, stopped_at)
+        for row in rows:
+            row["snippet"] = render_snippet(row["snippet"])
+        return rows, next_cursor
@@ -0,0 +1,179 @@
+"""
+Log Partition Maintenance
+Creates future monthly partitions of symptom_logs / weight_logs and retires old ones
+
+On PostgreSQL both tables are PARTITION BY RANGE (log_date), one partition per
+calendar month (<table>_pYYYY_MM) plus a <table>_default catch-all (migration 010).
+A maintenance run:
+1. creates any missing partitions from the current month through months_ahead
+   (new tables are ATTACHed, which locks the parent less than CREATE ... PARTITION OF;
+   rows that landed in the default partition for that month are moved in first)
+2. applies the retention policy to partitions entirely older than retain_months:
+   - detach:  detach the partition, leaving it as a standalone table
+   - archive: detach it and move it to the log_archive schema
+   - drop:    detach and drop it
+3. ANALYZEs the parent tables (autovacuum never analyzes a partitioned parent)
+
+Trend rollups are separate tables, so charts for retired months keep working.
+Other dialects have no partitions; runs there report the tables as unpartitioned.
+"""
+
+import re
+from dataclasses import dataclass, field
+from datetime import date
+from typing import List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.db.dialects import dialect_name
+
+PARTITIONED_TABLES = ("symptom_logs", "weight_logs")
+ARCHIVE_SCHEMA = "log_archive"
+RETENTION_MODES = ("detach", "archive", "drop")
+
+_BOUND_PATTERN = re.compile(r"FROM \('([0-9-]+)'\) TO \('([0-9-]+)'\)")
+
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    return f"{table}_p{month.year:04d}_{month.month:02d}"
+
+
+@dataclass
+class Partition:
+    """One attached partition; lower/upper are None for the default partition"""
+    name: str
+    lower: Optional[date]
+    upper: Optional[date]
+
+    @property
+    def is_default(self) -> bool:
+        return self.lower is None
+
+
+@dataclass
+class MaintenanceReport:
+    """Actions taken (or planned, for a dry run) per table"""
+    table: str
+    partitioned: bool = True
+    created: List[str] = field(default_factory=list)
+    retired: List[str] = field(default_factory=list)
+    moved_rows: int = 0
+
+
+def is_partitioned(db: Session, table: str) -> bool:
+    if dialect_name(db) != "postgresql":
+        return False
+    return db.scalar(text("SELECT relkind FROM pg_class WHERE oid = to_regclass(:table)"), {"table": table}) == "p"
+
+
+def list_partitions(db: Session, table: str) -> List[Partition]:
+    """Attached partitions of a table, oldest first, default last"""
+    rows = db.execute(text(
+        "SELECT child.relname, pg_get_expr(child.relpartbound, child.oid) "
+        "FROM pg_inherits JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+        "WHERE pg_inherits.inhparent = to_regclass(:table)"
+    ), {"table": table}).all()
+
+    partitions = []
+    for name, bound in rows:
+        match = _BOUND_PATTERN.search(bound)
+        if match:
+            partitions.append(Partition(name, date.fromisoformat(match[1]), date.fromisoformat(match[2])))
+        else:
+            partitions.append(Partition(name, None, None))
+    return sorted(partitions, key=lambda p: (p.is_default, p.lower or date.max))
+
+
+def _create_partition(db: Session, table: str, month: date, default: Optional[Partition]) -> int:
+    """Create and attach one month's partition; returns rows moved out of the default partition"""
+    name, upper = partition_name(table, month), add_months(month, 1)
+    db.execute(text(f"CREATE TABLE {name} (LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"))
+
+    moved = 0
+    if default is not None:
+        moved = db.execute(text(
+            f"WITH moved AS (DELETE FROM {default.name} WHERE log_date >= :lower AND log_date < :upper RETURNING *) "
+            f"INSERT INTO {name} SELECT * FROM moved"
+        ), {"lower": month, "upper": upper}).rowcount
+
+    db.execute(text(
+        f"ALTER TABLE {table} ATTACH PARTITION {name} FOR VALUES FROM ('{month.isoformat()}') TO ('{upper.isoformat()}')"
+    ))
+    return moved
+
+
+def _retire_partition(db: Session, table: str, partition: Partition, mode: str):
+    db.execute(text(f"ALTER TABLE {table} DETACH PARTITION {partition.name}"))
+    if mode == "archive":
+        db.execute(text(f"CREATE SCHEMA IF NOT EXISTS {ARCHIVE_SCHEMA}"))
+        db.execute(text(f"ALTER TABLE {partition.name} SET SCHEMA {ARCHIVE_SCHEMA}"))
+    elif mode == "drop":
+        db.execute(text(f"DROP TABLE {partition.name}"))
+
+
+def maintain_table(db: Session, table: str, months_ahead: Optional[int] = None,
+                   retain_months: Optional[int] = None, mode: Optional[str] = None,
+                   today: Optional[date] = None, dry_run: bool = False) -> MaintenanceReport:
+    """
+    Create upcoming partitions and retire expired ones for one table
+    Options left as None come from LOG_PARTITION_MONTHS_AHEAD, LOG_RETENTION_MONTHS
+    (0 = keep everything) and LOG_RETENTION_MODE when called. Caller commits.
+    """
+    settings = get_settings()
+    months_ahead = settings.log_partition_months_ahead if months_ahead is None else months_ahead
+    retain_months = settings.log_retention_months if retain_months is None else retain_months
+    mode = mode or settings.log_retention_mode
+    if mode not in RETENTION_MODES:
+        raise ValueError(f"Unknown retention mode: {mode}")
+    report = MaintenanceReport(table=table)
+    if not is_partitioned(db, table):
+        report.partitioned = False
+        return report
+
+    current = month_start(today or date.today())
+    partitions = list_partitions(db, table)
+    existing = {p.lower for p in partitions if not p.is_default}
+    default = next((p for p in partitions if p.is_default), None)
+
+    for offset in range(months_ahead + 1):
+        month = add_months(current, offset)
+        if month in existing:
+            continue
+        report.created.append(partition_name(table, month))
+        if not dry_run:
+            report.moved_rows += _create_partition(db, table, month, default)
+
+    if retain_months:
+        cutoff = add_months(current, -retain_months)
+        for partition in partitions:
+            if partition.is_default or partition.upper > cutoff:
+                continue
+            report.retired.append(partition.name)
+            if not dry_run:
+                _retire_partition(db, table, partition, mode)
+
+    if not dry_run:
+        # Autovacuum analyzes partitions but never the partitioned parent
+        db.execute(text(f"ANALYZE {table}"))
+    return report
+
+
+def maintain_all(db: Session, dry_run: bool = False, **options) -> List[MaintenanceReport]:
+    """Run maintain_table for every partitioned log table in one transaction"""
+    reports = [maintain_table(db, table, dry_run=dry_run, **options) for table in PARTITIONED_TABLES]
+    if dry_run:
+        db.rollback()
+    else:
+        db.commit()
+    return reports
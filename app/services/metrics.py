@@ -0,0 +1,188 @@
+"""
+Metrics
+Per-route latency histograms, per-request SQL stats and a slow-request log
+
+MetricsMiddleware wraps every HTTP request. It times the request through the
+last body chunk, so streamed downloads are counted in full. It labels the
+request by route template (e.g. /v1/logs/summary/pdf/{job_id}), not by raw path,
+which keeps label cardinality bounded. Query counts and DB time come from
+app.db.instrumentation.
+
+Metrics are per process and rendered in Prometheus text format at /metrics.
+With several workers, scrape each worker or use one worker per container.
+"""
+
+import logging
+import time
+from bisect import bisect_left
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from app.config import Settings, get_settings
+from app.db.instrumentation import current_stats, start_tracking, stop_tracking
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Monotonic counter with labels"""
+
+    def __init__(self, name: str, description: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.description = description
+        self.labels = tuple(labels)
+        self.values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *label_values: str, amount: float = 1):
+        self.values[label_values] = self.values.get(label_values, 0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} counter"]
+        for label_values, value in sorted(self.values.items()):
+            lines.append(f"{self.name}{_format_labels(self.labels, label_values)} {_format_value(value)}")
+        return lines
+
+
+class Histogram:
+    """Cumulative-bucket histogram with labels"""
+
+    def __init__(self, name: str, description: str, labels: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.name = name
+        self.description = description
+        self.labels = tuple(labels)
+        self.buckets = tuple(buckets)
+        # label values -> [per-bucket counts..., +Inf count, sum]
+        self.series: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, value: float, *label_values: str):
+        series = self.series.get(label_values)
+        if series is None:
+            series = self.series[label_values] = [0] * (len(self.buckets) + 1) + [0.0]
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} histogram"]
+        for label_values, series in sorted(self.series.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), series[:-1]):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else _format_value(bound)
+                bucket_labels = _format_labels(self.labels, label_values, f'le="{le}"')
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            labels = _format_labels(self.labels, label_values)
+            lines.append(f"{self.name}_sum{labels} {_format_value(series[-1])}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route", ("method", "route", "status")
+)
+REQUEST_QUERIES = Histogram(
+    "http_request_db_queries", "SQL statements executed per request", ("method", "route"), QUERY_COUNT_BUCKETS
+)
+REQUEST_DB_TIME = Histogram(
+    "http_request_db_seconds", "Time spent in SQL statements per request", ("method", "route")
+)
+N_PLUS_ONE = Counter(
+    "http_request_n_plus_one_total", "Requests that repeated one SQL statement past the N+1 threshold", ("method", "route")
+)
+SLOW_REQUESTS = Counter(
+    "http_slow_requests_total", "Requests slower than SLOW_REQUEST_MS", ("method", "route")
+)
+
+REGISTRY = [REQUEST_LATENCY, REQUEST_QUERIES, REQUEST_DB_TIME, N_PLUS_ONE, SLOW_REQUESTS]
+
+
+def render_metrics() -> str:
+    """All metrics in Prometheus text exposition format"""
+    lines = []
+    for metric in REGISTRY:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+def _route_label(scope) -> str:
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording latency, SQL stats and slow requests per route
+    Thresholds come from the app's settings (SLOW_REQUEST_MS, N_PLUS_ONE_THRESHOLD,
+    MAX_CAPTURED_STATEMENTS; default: get_settings()).
+    """
+
+    def __init__(self, app, settings: Optional[Settings] = None, exclude_paths: Sequence[str] = ("/metrics",)):
+        settings = settings or get_settings()
+        self.app = app
+        self.exclude_paths = set(exclude_paths)
+        # Requests slower than this are logged with their captured SQL
+        self.slow_request_ms = settings.slow_request_ms
+        # Identical statements per request at which we flag an N+1 pattern
+        self.n_plus_one_threshold = settings.n_plus_one_threshold
+        self.max_captured_statements = settings.max_captured_statements
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        started = time.perf_counter()
+        token = start_tracking(self.max_captured_statements)
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            stats = current_stats()
+            stop_tracking(token)
+            self._record(scope, status_code, elapsed, stats)
+
+    def _record(self, scope, status_code: int, elapsed: float, stats):
+        method, route = scope["method"], _route_label(scope)
+        REQUEST_LATENCY.observe(elapsed, method, route, str(status_code))
+        REQUEST_QUERIES.observe(stats.count, method, route)
+        REQUEST_DB_TIME.observe(stats.db_time, method, route)
+
+        repeated = stats.repeated_statements(self.n_plus_one_threshold)
+        if repeated:
+            N_PLUS_ONE.inc(method, route)
+            statement, count = repeated[0]
+            logger.warning("Possible N+1 on %s %s: statement ran %d times: %s", method, route, count, statement)
+
+        if elapsed * 1000 >= self.slow_request_ms:
+            SLOW_REQUESTS.inc(method, route)
+            captured = "\n".join(f"  [{seconds * 1000:.1f} ms] {sql}" for sql, seconds in stats.captured)
+            if stats.count > len(stats.captured):
+                captured += f"\n  ... {stats.count - len(stats.captured)} more"
+            logger.warning(
+                "Slow request %s %s -> %d in %.0f ms (%d queries, %.0f ms in DB)\n%s",
+                method, scope["path"], status_code, elapsed * 1000, stats.count, stats.db_time * 1000, captured
+            )
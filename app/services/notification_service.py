@@ -0,0 +1,438 @@
+"""
+Notification Service
+Daily check-in push reminders (Feature 4)
+
+Every minute the scheduler runs one reminder wave:
+1. Timezones are sharded by their current UTC offset. Each shard has a single
+   local (minute, date), so it maps to one indexed query on
+   (reminder_local_minute, timezone).
+2. Recipients are streamed from a server-side cursor in batches, skipping
+   inactive users, users without a push token, and users who already logged
+   a check-in on their local date.
+3. A producer puts batches on a bounded queue. A fixed number of senders hand
+   them to the push transport, retrying transient failures with exponential
+   backoff and jitter. Any other transport error fails only its batch. If the
+   producer or a sender dies anyway, the rest of the wave is cancelled and the
+   error raised, so the producer never blocks on a queue nobody drains.
+4. Tokens the transport reports as invalid are cleared in bulk afterwards.
+
+Deliveries go through FCM HTTP v1 (PUSH_TRANSPORT=fcm, keyed by
+User.platform_token). The log and fake transports deliver nothing; the
+scheduler refuses to run them outside DEBUG.
+
+Memory is bounded by queue size * batch size, whatever the size of the wave.
+run_forever remembers the last minute it processed. A wave that runs past
+its minute is followed by catch-up waves for the minutes it overlapped, so
+users scheduled at those local minutes are still reminded.
+"""
+
+import abc
+import asyncio
+import json
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from zoneinfo import ZoneInfo, available_timezones
+
+from sqlalchemy import exists, select, update
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.config import Settings, get_settings
+from app.db.models import SymptomLog, User, WeightLog
+
+logger = logging.getLogger(__name__)
+
+REMINDER_TITLE = "Daily check-in"
+REMINDER_BODY = "How are you feeling today? Take a moment to log your check-in."
+
+
+@dataclass(frozen=True)
+class PushMessage:
+    """One push notification to one device"""
+    user_id: int
+    token: str
+    title: str = REMINDER_TITLE
+    body: str = REMINDER_BODY
+
+
+@dataclass(frozen=True)
+class SendResult:
+    """Delivery outcome for one message"""
+    user_id: int
+    ok: bool
+    invalid_token: bool = False
+
+
+class TransientPushError(Exception):
+    """Retryable transport failure (rate limited, provider unavailable, timeout)"""
+
+
+class PushTransport(abc.ABC):
+    """
+    Interface for push providers (FCM, APNs, ...)
+    Implementations send a batch of at most max_batch_size messages and
+    return one SendResult per message, or raise TransientPushError.
+    """
+    max_batch_size = 500
+
+    @abc.abstractmethod
+    async def send_batch(self, messages: Sequence[PushMessage]) -> List[SendResult]:
+        """Deliver one batch; one SendResult per message, in order"""
+
+    async def close(self):
+        pass
+
+
+class FakePushTransport(PushTransport):
+    """
+    In-memory transport for tests and local runs
+    Records every delivered message; can simulate latency, transient
+    failures (first N calls) and invalid tokens.
+    """
+
+    def __init__(self, latency: float = 0.0, fail_first: int = 0, invalid_tokens: Iterable[str] = ()):
+        self.latency = latency
+        self.fail_first = fail_first
+        self.invalid_tokens = set(invalid_tokens)
+        self.sent: List[PushMessage] = []
+        self.calls = 0
+
+    async def send_batch(self, messages: Sequence[PushMessage]) -> List[SendResult]:
+        self.calls += 1
+        call = self.calls
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if call <= self.fail_first:
+            raise TransientPushError("simulated provider failure")
+
+        results = []
+        for message in messages:
+            if message.token in self.invalid_tokens:
+                results.append(SendResult(message.user_id, ok=False, invalid_token=True))
+            else:
+                self.sent.append(message)
+                results.append(SendResult(message.user_id, ok=True))
+        return results
+
+
+class LoggingPushTransport(PushTransport):
+    """Transport that only logs batch sizes (dry runs)"""
+
+    async def send_batch(self, messages: Sequence[PushMessage]) -> List[SendResult]:
+        logger.info("Would send %d push reminders", len(messages))
+        return [SendResult(message.user_id, ok=True) for message in messages]
+
+
+class FcmPushTransport(PushTransport):
+    """
+    Firebase Cloud Messaging HTTP v1, authenticated as a service account
+    FCM v1 takes one message per request, so a batch is sent as concurrent
+    requests over one pooled httpx client. An OAuth2 access token is obtained
+    from the service account key (a JWT signed with python-jose) and reused
+    until shortly before it expires. UNREGISTERED tokens are reported invalid.
+    A batch in which nothing got through because of rate limits, provider
+    errors, timeouts or an expired access token (refreshed) raises
+    TransientPushError so the whole batch is retried.
+    When only some messages fail that way, those messages are reported as
+    failed, so the delivered ones are not sent twice.
+    """
+    SCOPE = "https://www.googleapis.com/auth/firebase.messaging"
+    SEND_URL = "https://fcm.googleapis.com/v1/projects/{project_id}/messages:send"
+    TRANSIENT_STATUSES = {429, 500, 502, 503, 504}
+
+    def __init__(self, credentials: Dict[str, Any], project_id: Optional[str] = None,
+                 http=None, max_connections: int = 100, timeout: float = 10.0):
+        import httpx
+        self.credentials = credentials
+        self.project_id = project_id or credentials["project_id"]
+        self.http = http or httpx.AsyncClient(
+            timeout=timeout, limits=httpx.Limits(max_connections=max_connections)
+        )
+        self._access_token: Optional[str] = None
+        self._token_expires = 0.0
+        self._token_lock = asyncio.Lock()
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "FcmPushTransport":
+        """Transport for FCM_CREDENTIALS_FILE (service account JSON) and FCM_PROJECT_ID"""
+        if not settings.fcm_credentials_file:
+            raise ValueError("PUSH_TRANSPORT=fcm requires FCM_CREDENTIALS_FILE")
+        with open(settings.fcm_credentials_file, encoding="utf-8") as handle:
+            credentials = json.load(handle)
+        return cls(credentials, settings.fcm_project_id)
+
+    async def _token(self, refresh: bool = False) -> str:
+        async with self._token_lock:
+            if refresh or self._access_token is None or time.time() >= self._token_expires:
+                from jose import jwt
+                now = int(time.time())
+                token_uri = self.credentials.get("token_uri", "https://oauth2.googleapis.com/token")
+                assertion = jwt.encode(
+                    {"iss": self.credentials["client_email"], "scope": self.SCOPE, "aud": token_uri,
+                     "iat": now, "exp": now + 3600},
+                    self.credentials["private_key"], algorithm="RS256",
+                    headers={"kid": self.credentials["private_key_id"]} if "private_key_id" in self.credentials else None,
+                )
+                response = await self.http.post(token_uri, data={
+                    "grant_type": "urn:ietf:params:oauth:grant-type:jwt-bearer", "assertion": assertion,
+                })
+                if response.status_code in self.TRANSIENT_STATUSES:
+                    raise TransientPushError(f"FCM token endpoint returned {response.status_code}")
+                response.raise_for_status()
+                body = response.json()
+                self._access_token = body["access_token"]
+                self._token_expires = time.time() + body.get("expires_in", 3600) - 60
+            return self._access_token
+
+    async def _send(self, message: PushMessage, token: str) -> Tuple[Optional[SendResult], int]:
+        """(SendResult, status), or (None, status) for a transient failure"""
+        import httpx
+        payload = {"message": {"token": message.token, "notification": {"title": message.title, "body": message.body}}}
+        try:
+            response = await self.http.post(
+                self.SEND_URL.format(project_id=self.project_id), json=payload,
+                headers={"Authorization": f"Bearer {token}"},
+            )
+        except httpx.TransportError:
+            return None, 0
+        if response.status_code == 200:
+            return SendResult(message.user_id, ok=True), 200
+        if response.status_code in self.TRANSIENT_STATUSES or response.status_code == 401:
+            return None, response.status_code
+        if response.status_code == 404 and "UNREGISTERED" in response.text:
+            return SendResult(message.user_id, ok=False, invalid_token=True), 404
+        logger.warning("FCM rejected a reminder for user %d: %d %s",
+                       message.user_id, response.status_code, response.text[:200])
+        return SendResult(message.user_id, ok=False), response.status_code
+
+    async def send_batch(self, messages: Sequence[PushMessage]) -> List[SendResult]:
+        token = await self._token()
+        outcomes = await asyncio.gather(*(self._send(message, token) for message in messages))
+        if any(status == 401 for _, status in outcomes):
+            # Revoked or expired early: the next attempt uses a new token
+            await self._token(refresh=True)
+        if all(result is None for result, _ in outcomes):
+            raise TransientPushError(f"FCM unavailable for a batch of {len(messages)}")
+        return [
+            result if result is not None else SendResult(message.user_id, ok=False)
+            for message, (result, _) in zip(messages, outcomes)
+        ]
+
+    async def close(self):
+        await self.http.aclose()
+
+
+# Transports that deliver nothing; the scheduler only runs them with DEBUG on
+DEVELOPMENT_TRANSPORTS = {"fake", "log"}
+
+
+def get_transport(name: Optional[str] = None, settings: Optional[Settings] = None) -> PushTransport:
+    """Transport selected by PUSH_TRANSPORT ('fcm', or 'fake' / 'log' for development)"""
+    settings = settings or get_settings()
+    name = name or settings.push_transport
+    if name == "fcm":
+        return FcmPushTransport.from_settings(settings)
+    if name == "fake":
+        return FakePushTransport()
+    if name == "log":
+        return LoggingPushTransport()
+    raise ValueError(f"Unknown push transport: {name}")
+
+
+def check_scheduler_transport(name: Optional[str] = None, settings: Optional[Settings] = None) -> str:
+    """
+    Transport name the long-running scheduler may use
+    Raises RuntimeError for a development transport unless DEBUG is on, so a
+    deployment can't silently "send" every reminder to the log.
+    """
+    settings = settings or get_settings()
+    name = name or settings.push_transport
+    if name in DEVELOPMENT_TRANSPORTS and not settings.debug:
+        raise RuntimeError(f"PUSH_TRANSPORT={name} delivers nothing; set PUSH_TRANSPORT=fcm (or DEBUG=true)")
+    return name
+
+
+@dataclass
+class WaveStats:
+    """Summary of one reminder wave"""
+    shards: int = 0
+    recipients: int = 0
+    sent: int = 0
+    failed: int = 0
+    invalid_tokens: int = 0
+    batches: int = 0
+    retries: int = 0
+    elapsed_s: float = 0.0
+    invalid_user_ids: List[int] = field(default_factory=list, repr=False)
+
+
+def reminder_shards(now_utc: datetime, timezones: Iterable[str]) -> Dict[Tuple[int, date], List[str]]:
+    """
+    Group timezones by the local (minute of day, date) they are at for now_utc
+    Timezones sharing a UTC offset land in the same shard.
+    """
+    now_utc = now_utc.replace(second=0, microsecond=0, tzinfo=dt_timezone.utc)
+    shards: Dict[Tuple[int, date], List[str]] = {}
+    for name in timezones:
+        local = now_utc.astimezone(ZoneInfo(name))
+        shards.setdefault((local.hour * 60 + local.minute, local.date()), []).append(name)
+    return shards
+
+
+class NotificationService:
+    """Per-minute, timezone-sharded reminder waves"""
+
+    def __init__(self, session_factory: async_sessionmaker, transport: PushTransport,
+                 batch_size: int = 500, concurrency: int = 8, max_retries: int = 5,
+                 base_backoff: float = 0.5, timezones: Optional[Iterable[str]] = None):
+        self.session_factory = session_factory
+        self.transport = transport
+        self.batch_size = min(batch_size, transport.max_batch_size)
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self.base_backoff = base_backoff
+        self.timezones = sorted(timezones) if timezones is not None else sorted(available_timezones() | {"UTC"})
+
+    @staticmethod
+    def recipients_query(local_minute: int, local_date: date, timezones: List[str]):
+        """Reminder-eligible users in one shard who haven't logged on local_date"""
+        logged_symptom = exists().where(SymptomLog.user_id == User.user_id, SymptomLog.log_date == local_date)
+        logged_weight = exists().where(WeightLog.user_id == User.user_id, WeightLog.log_date == local_date)
+        return (
+            select(User.user_id, User.platform_token)
+            .where(
+                User.reminder_local_minute == local_minute,
+                User.timezone.in_(timezones),
+                User.is_active == 1,
+                User.platform_token.isnot(None),
+                ~logged_symptom,
+                ~logged_weight,
+            )
+            .order_by(User.user_id)
+        )
+
+    async def _send_with_backoff(self, batch: List[PushMessage], stats: WaveStats):
+        """
+        Send one batch, retrying transient failures with exponential backoff + jitter
+        Any other transport error fails just this batch (logged), so the sender keeps going.
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                results = await self.transport.send_batch(batch)
+                break
+            except TransientPushError:
+                if attempt == self.max_retries:
+                    logger.warning("Giving up on reminder batch of %d after %d retries", len(batch), attempt)
+                    stats.failed += len(batch)
+                    return
+                stats.retries += 1
+                delay = self.base_backoff * (2 ** attempt)
+                await asyncio.sleep(delay + random.uniform(0, delay))
+            except Exception:
+                logger.exception("Reminder batch of %d failed", len(batch))
+                stats.failed += len(batch)
+                return
+
+        stats.batches += 1
+        for result in results:
+            if result.ok:
+                stats.sent += 1
+            else:
+                stats.failed += 1
+                if result.invalid_token:
+                    stats.invalid_tokens += 1
+                    stats.invalid_user_ids.append(result.user_id)
+
+    async def _produce(self, shards, queue: asyncio.Queue, stats: WaveStats):
+        """Stream each shard's recipients onto the queue in batches"""
+        async with self.session_factory() as db:
+            for (local_minute, local_date), timezones in shards.items():
+                query = self.recipients_query(local_minute, local_date, timezones)
+                result = await db.stream(query.execution_options(yield_per=self.batch_size))
+                async for rows in result.partitions():
+                    batch = [PushMessage(user_id=user_id, token=token) for user_id, token in rows]
+                    stats.recipients += len(batch)
+                    await queue.put(batch)
+
+    async def _clear_invalid_tokens(self, user_ids: List[int]):
+        """Drop push tokens the provider rejected so later waves skip them"""
+        async with self.session_factory() as db:
+            for start in range(0, len(user_ids), 1000):
+                await db.execute(
+                    update(User).where(User.user_id.in_(user_ids[start:start + 1000])).values(platform_token=None)
+                )
+            await db.commit()
+
+    async def run_wave(self, now_utc: Optional[datetime] = None) -> WaveStats:
+        """Send reminders to everyone whose local reminder minute is now"""
+        started = time.perf_counter()
+        stats = WaveStats()
+        shards = reminder_shards(now_utc or datetime.utcnow(), self.timezones)
+        stats.shards = len(shards)
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.concurrency * 2)
+
+        async def producer():
+            await self._produce(shards, queue, stats)
+            for _ in range(self.concurrency):
+                await queue.put(None)
+
+        async def sender():
+            while True:
+                batch = await queue.get()
+                if batch is None:
+                    return
+                await self._send_with_backoff(batch, stats)
+
+        # If the producer or a sender dies, stop the rest instead of leaving
+        # the producer blocked on a full queue that nobody drains
+        tasks = [asyncio.ensure_future(producer())] + [asyncio.ensure_future(sender()) for _ in range(self.concurrency)]
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        for task in done:
+            if not task.cancelled() and task.exception() is not None:
+                raise task.exception()
+
+        if stats.invalid_user_ids:
+            await self._clear_invalid_tokens(stats.invalid_user_ids)
+
+        stats.elapsed_s = round(time.perf_counter() - started, 3)
+        return stats
+
+    async def run_forever(self, max_lag_minutes: int = 60):
+        """
+        Run one wave for every UTC minute, in order
+        Waves are scheduled by absolute minute. When a wave overruns, the minutes
+        it overlapped run straight after it as catch-up waves, so no local
+        reminder minute is skipped. Minutes more than max_lag_minutes behind
+        (e.g. after the process was suspended) are skipped with a warning.
+        """
+        last_minute = datetime.utcnow().replace(second=0, microsecond=0)
+        while True:
+            minute = last_minute + timedelta(minutes=1)
+            delay = (minute - datetime.utcnow()).total_seconds()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            elif -delay > max_lag_minutes * 60:
+                now = datetime.utcnow().replace(second=0, microsecond=0)
+                skip_to = now - timedelta(minutes=max_lag_minutes)
+                logger.warning("Reminder scheduler is %d minutes behind; skipping waves %s-%s",
+                               (now - minute).total_seconds() // 60, minute.strftime("%H:%M"),
+                               (skip_to - timedelta(minutes=1)).strftime("%H:%M"))
+                minute = skip_to
+            elif delay <= -60:
+                logger.info("Catch-up reminder wave %s (%ds late)", minute.strftime("%H:%M"), -delay)
+
+            try:
+                stats = await self.run_wave(minute)
+                logger.info("Reminder wave %s: %s", minute.strftime("%H:%M"), stats)
+            except Exception:
+                logger.exception("Reminder wave %s failed", minute.strftime("%H:%M"))
+            last_minute = minute
@@ -0,0 +1,187 @@
+"""
+NPS Service
+Feedback submission and the maintained NPS rollups behind NPS analytics (Feature 15)
+
+Write path: each feedback insert adds one to the promoter, passive or detractor
+counter of its day (UTC) and of its pregnancy week. It does this with one
+INSERT ... ON CONFLICT DO UPDATE per rollup table, in the same transaction as
+the feedback row.
+
+Read path: analytics read one rollup row per day or week shown, by primary key
+range. The cost does not depend on how many feedbacks exist.
+
+Rebuild (scripts/rebuild_nps_rollups.py): streams feedbacks through a server-side
+cursor in batches and counts them into per-day and per-week buckets. Memory is
+bounded by the number of days and weeks, not by the number of feedbacks. The
+rebuild then replaces the rollups in one transaction. Rollup tables are
+locked for the duration on PostgreSQL, so feedback submitted during a rebuild
+waits and is then counted exactly once.
+"""
+
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional
+
+from sqlalchemy import delete, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.db.dialects import dialect_name, insert_for
+from app.db.models import Feedback, NpsDailyRollup, NpsWeeklyRollup, PregnancyProfile
+from app.services.pregnancy_calculator import PregnancyCalculator
+
+NPS_CATEGORIES = ("promoters", "passives", "detractors")
+
+
+def nps_category(score: int) -> str:
+    """Rollup counter for a 0-10 score"""
+    if score >= 9:
+        return "promoters"
+    if score >= 7:
+        return "passives"
+    return "detractors"
+
+
+def breakdown(promoters: int, passives: int, detractors: int) -> dict:
+    """NpsBreakdown-shaped dict: counts, responses and the -100..100 score"""
+    responses = promoters + passives + detractors
+    return {
+        "promoters": promoters, "passives": passives, "detractors": detractors, "responses": responses,
+        "nps": round((promoters - detractors) * 100 / responses, 1) if responses else None,
+    }
+
+
+def _counts(score: int) -> dict:
+    counts = dict.fromkeys(NPS_CATEGORIES, 0)
+    counts[nps_category(score)] = 1
+    return counts
+
+
+def _merge_statement(db, model, key: str, rows: List[dict]):
+    """INSERT ... ON CONFLICT DO UPDATE that adds rows onto existing counters"""
+    stmt = insert_for(db)(model).values(rows)
+    table = model.__table__
+    set_ = {name: table.c[name] + stmt.excluded[name] for name in NPS_CATEGORIES}
+    set_["updated_at"] = stmt.excluded.updated_at
+    return stmt.on_conflict_do_update(index_elements=[key], set_=set_)
+
+
+@dataclass
+class NpsRebuildStats:
+    """Summary of an NPS rollup rebuild"""
+    feedbacks: int = 0
+    daily_rows: int = 0
+    weekly_rows: int = 0
+    elapsed_s: float = 0.0
+
+
+class NpsService:
+    """Feedback writes with incremental NPS rollups, and rollup reads"""
+
+    @staticmethod
+    async def submit(db: AsyncSession, user_id: int, nps_score: int, feedback_text: Optional[str] = None) -> Feedback:
+        """
+        Store feedback and count it into the rollups (one transaction, committed here)
+        The pregnancy week is the user's week at submission (None without a profile).
+        """
+        profile = (await db.execute(
+            select(PregnancyProfile.edd, PregnancyProfile.lmp_start_date).where(PregnancyProfile.user_id == user_id)
+        )).first()
+        now = datetime.utcnow()
+        pregnancy_week = None
+        if profile is not None:
+            pregnancy_week = PregnancyCalculator.week_and_day(profile.edd, profile.lmp_start_date, today=now.date())[0]
+
+        feedback = Feedback(
+            user_id=user_id, nps_score=nps_score, feedback_text=feedback_text,
+            pregnancy_week=pregnancy_week, created_at=now,
+        )
+        db.add(feedback)
+        await db.flush()
+
+        counts = _counts(nps_score)
+        await db.execute(_merge_statement(
+            db, NpsDailyRollup, "feedback_date", [{"feedback_date": now.date(), "updated_at": now, **counts}]
+        ))
+        if pregnancy_week is not None:
+            await db.execute(_merge_statement(
+                db, NpsWeeklyRollup, "pregnancy_week", [{"pregnancy_week": pregnancy_week, "updated_at": now, **counts}]
+            ))
+        await db.commit()
+        return feedback
+
+    @staticmethod
+    async def analytics(db: AsyncSession, granularity: str = "day", days: int = 30) -> dict:
+        """
+        NPS per day for the last `days` days (UTC), or per pregnancy week
+        Reads at most one rollup row per point; totals are summed from those rows.
+        """
+        if granularity == "week":
+            rows = (await db.execute(
+                select(NpsWeeklyRollup).order_by(NpsWeeklyRollup.pregnancy_week)
+            )).scalars().all()
+        else:
+            since = datetime.utcnow().date() - timedelta(days=days - 1)
+            rows = (await db.execute(
+                select(NpsDailyRollup).where(NpsDailyRollup.feedback_date >= since)
+                .order_by(NpsDailyRollup.feedback_date)
+            )).scalars().all()
+
+        totals = dict.fromkeys(NPS_CATEGORIES, 0)
+        points = []
+        for row in rows:
+            point = breakdown(row.promoters, row.passives, row.detractors)
+            if not point["responses"]:
+                continue
+            for name in NPS_CATEGORIES:
+                totals[name] += point[name]
+            if granularity == "week":
+                point["pregnancy_week"] = row.pregnancy_week
+            else:
+                point["feedback_date"] = row.feedback_date
+            points.append(point)
+        return {"granularity": granularity, "totals": breakdown(**totals), "points": points}
+
+    @staticmethod
+    def rebuild(db: Session, batch_size: int = 10000) -> NpsRebuildStats:
+        """
+        Recompute the NPS rollups from all feedbacks (backfill / repair)
+        Streams (created_at, pregnancy_week, nps_score) with yield_per, which uses a
+        server-side cursor on PostgreSQL, so only one batch of feedbacks is in memory.
+        """
+        stats = NpsRebuildStats()
+        started = time.perf_counter()
+
+        if dialect_name(db) == "postgresql":
+            # Feedback inserts block on their rollup upsert until this transaction commits,
+            # so each one is either in the streamed snapshot or applied on top afterwards
+            db.execute(text("LOCK TABLE nps_daily_rollups, nps_weekly_rollups IN EXCLUSIVE MODE"))
+
+        daily: Dict[date, dict] = {}
+        weekly: Dict[int, dict] = {}
+        result = db.execute(
+            select(Feedback.created_at, Feedback.pregnancy_week, Feedback.nps_score)
+            .execution_options(yield_per=batch_size)
+        )
+        for partition in result.partitions():
+            for created_at, pregnancy_week, nps_score in partition:
+                category = nps_category(nps_score)
+                daily.setdefault(created_at.date(), dict.fromkeys(NPS_CATEGORIES, 0))[category] += 1
+                if pregnancy_week is not None:
+                    weekly.setdefault(pregnancy_week, dict.fromkeys(NPS_CATEGORIES, 0))[category] += 1
+            stats.feedbacks += len(partition)
+
+        now = datetime.utcnow()
+        db.execute(delete(NpsDailyRollup))
+        db.execute(delete(NpsWeeklyRollup))
+        daily_rows = [{"feedback_date": key, "updated_at": now, **counts} for key, counts in sorted(daily.items())]
+        weekly_rows = [{"pregnancy_week": key, "updated_at": now, **counts} for key, counts in sorted(weekly.items())]
+        for model, rows in ((NpsDailyRollup, daily_rows), (NpsWeeklyRollup, weekly_rows)):
+            for start in range(0, len(rows), batch_size):
+                db.execute(insert_for(db)(model).values(rows[start:start + batch_size]))
+        db.commit()
+
+        stats.daily_rows, stats.weekly_rows = len(daily_rows), len(weekly_rows)
+        stats.elapsed_s = round(time.perf_counter() - started, 3)
+        return stats
@@ -0,0 +1,131 @@
+"""
+PDF Generator
+Renders a user's log summary to PDF (GET /v1/logs/summary/pdf)
+
+render_summary_pdf runs inside the export process pool, never on the event loop.
+It opens its own sync session and streams logs with a server-side cursor
+(yield_per), drawing each row as it arrives, so memory stays flat regardless
+of how much history is exported. Output is written to a temp file and renamed
+into place, so readers never see a half-written PDF.
+"""
+
+import os
+from datetime import date, datetime
+from typing import Optional
+
+from sqlalchemy import select
+
+# Bump when the PDF layout changes so cached summaries are re-rendered
+RENDERER_VERSION = 1
+
+# Rows fetched per round trip from the server-side cursor
+STREAM_BATCH_SIZE = 500
+
+
+class PDFGenerator:
+    """Page layout helper around a reportlab canvas"""
+
+    MARGIN = 50
+    LINE_HEIGHT = 14
+
+    def __init__(self, output_path: str):
+        # reportlab is only needed inside export workers
+        from reportlab.lib.pagesizes import A4
+        from reportlab.pdfgen import canvas
+
+        self.canvas = canvas.Canvas(output_path, pagesize=A4)
+        self.width, self.height = A4
+        self.y = self.height - self.MARGIN
+
+    def _ensure_space(self, lines: int = 1):
+        if self.y - lines * self.LINE_HEIGHT < self.MARGIN:
+            self.canvas.showPage()
+            self.y = self.height - self.MARGIN
+
+    def heading(self, text: str, size: int = 14):
+        self._ensure_space(3)
+        self.y -= self.LINE_HEIGHT
+        self.canvas.setFont("Helvetica-Bold", size)
+        self.canvas.drawString(self.MARGIN, self.y, text)
+        self.y -= self.LINE_HEIGHT
+
+    def line(self, *columns: str, widths=(90, 150, 80, 120)):
+        self._ensure_space()
+        self.canvas.setFont("Helvetica", 10)
+        x = self.MARGIN
+        for text, width in zip(columns, widths):
+            self.canvas.drawString(x, self.y, text)
+            x += width
+        self.y -= self.LINE_HEIGHT
+
+    def save(self):
+        self.canvas.save()
+
+
+def render_summary_pdf(user_id: int, output_path: str,
+                       start_date: Optional[date] = None, end_date: Optional[date] = None) -> int:
+    """
+    Render the summary for one user to output_path (process-pool entry point)
+    Returns the size of the written file in bytes.
+    """
+    from app.db.database import SessionLocal
+    from app.db.models import PregnancyProfile, SymptomLog, User, WeightLog, unpack_symptoms
+
+    def in_range(query, model):
+        if start_date is not None:
+            query = query.where(model.log_date >= start_date)
+        if end_date is not None:
+            query = query.where(model.log_date <= end_date)
+        return query
+
+    tmp_path = output_path + ".tmp"
+    db = SessionLocal()
+    try:
+        user = db.get(User, user_id)
+        profile = db.scalar(select(PregnancyProfile).where(PregnancyProfile.user_id == user_id))
+
+        pdf = PDFGenerator(tmp_path)
+        pdf.heading("Pregnancy Health Summary", size=18)
+        pdf.line(f"Name: {user.full_name or user.email}", widths=(400,))
+        if profile is not None:
+            pdf.line(f"Estimated due date: {profile.edd or '-'}", widths=(400,))
+            pdf.line(f"Current week: {profile.current_week or '-'}", widths=(400,))
+            pdf.line(f"Initial weight: {profile.initial_weight_kg or '-'} kg", widths=(400,))
+        pdf.line(f"Generated: {datetime.utcnow():%Y-%m-%d %H:%M} UTC", widths=(400,))
+
+        pdf.heading("Weight")
+        pdf.line("Date", "Weight (kg)", "Week")
+        weights = in_range(
+            select(WeightLog.log_date, WeightLog.weight_kg, WeightLog.pregnancy_week)
+            .where(WeightLog.user_id == user_id), WeightLog
+        ).order_by(WeightLog.log_date, WeightLog.weight_log_id)
+        for log_date, weight_kg, week in db.execute(weights.execution_options(yield_per=STREAM_BATCH_SIZE)):
+            pdf.line(str(log_date), f"{weight_kg:.1f}", str(week or "-"))
+
+        pdf.heading("Symptoms and Mood")
+        pdf.line("Date", "Symptom", "Severity", "Mood")
+        symptoms = in_range(
+            select(SymptomLog.log_date, SymptomLog.symptom_mask, SymptomLog.symptom_severities, SymptomLog.mood)
+            .where(SymptomLog.user_id == user_id), SymptomLog
+        ).order_by(SymptomLog.log_date, SymptomLog.log_id)
+        for log_date, mask, severities, mood in db.execute(symptoms.execution_options(yield_per=STREAM_BATCH_SIZE)):
+            # One line per symptom of the check-in; date and mood on the first
+            ratings = unpack_symptoms(mask, severities) or [(None, None)]
+            for index, (symptom, severity) in enumerate(ratings):
+                pdf.line(
+                    str(log_date) if index == 0 else "",
+                    symptom.value if symptom else "-",
+                    str(severity or "-"),
+                    (mood.value if mood else "-") if index == 0 else "",
+                )
+
+        pdf.save()
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    finally:
+        db.close()
+
+    os.replace(tmp_path, output_path)
+    return os.path.getsize(output_path)
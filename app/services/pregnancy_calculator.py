@@ -0,0 +1,57 @@
+"""
+Pregnancy Calculator Service
+Derives the current pregnancy week and day from EDD or LMP (AC 2.1, AC 3.1)
+
+Gestational age is counted from the first day of the last menstrual period.
+When an EDD is given it takes precedence: LMP is inferred as EDD - 280 days
+(Naegele's rule). Week 1 starts on the LMP date; days are numbered 1-7.
+"""
+
+from datetime import date, timedelta
+from typing import Optional, Tuple
+
+# Full-term pregnancy length in days (40 weeks)
+GESTATION_DAYS = 280
+
+# Weeks beyond this are clamped (post-term pregnancies stop at 42 weeks)
+MAX_WEEK = 42
+
+
+class PregnancyCalculator:
+    """Pure date arithmetic for pregnancy progress"""
+
+    @staticmethod
+    def pregnancy_start(edd: Optional[date], lmp_start_date: Optional[date]) -> Optional[date]:
+        """Effective LMP date: derived from EDD if present, else the recorded LMP"""
+        if edd is not None:
+            return edd - timedelta(days=GESTATION_DAYS)
+        return lmp_start_date
+
+    @staticmethod
+    def week_and_day(edd: Optional[date], lmp_start_date: Optional[date],
+                     today: Optional[date] = None) -> Tuple[Optional[int], Optional[int]]:
+        """
+        Current (week, day) of pregnancy
+        Returns (None, None) if neither date is known or the start is in the future
+        """
+        start = PregnancyCalculator.pregnancy_start(edd, lmp_start_date)
+        if start is None:
+            return None, None
+
+        elapsed = ((today or date.today()) - start).days
+        if elapsed < 0:
+            return None, None
+        return min(elapsed // 7 + 1, MAX_WEEK), elapsed % 7 + 1
+
+    @staticmethod
+    def apply(profile, today: Optional[date] = None) -> bool:
+        """
+        Recompute a PregnancyProfile's cached current_week / current_day in place
+        Returns True if either value changed
+        """
+        week, day = PregnancyCalculator.week_and_day(profile.edd, profile.lmp_start_date, today)
+        changed = (profile.current_week, profile.current_day) != (week, day)
+        if changed:
+            profile.current_week = week
+            profile.current_day = day
+        return changed
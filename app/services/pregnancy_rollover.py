@@ -0,0 +1,140 @@
+"""
+Pregnancy Rollover Job
+Nightly batch recompute of PregnancyProfile.current_week / current_day
+
+Profiles are read in primary-key order in fixed-size chunks. Each chunk's dates
+are converted to NumPy datetime64 arrays and week/day are computed for the whole
+chunk at once using the same rules as PregnancyCalculator. Only rows whose
+values actually changed are written back, in one bulk UPDATE per chunk, and
+their owners' data versions are bumped (profile ETags) in the same transaction.
+"""
+
+import time
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional, Tuple
+
+import numpy as np
+from sqlalchemy import Integer, bindparam, column, func, select, update, values
+from sqlalchemy.orm import Session
+
+from app.db.models import PregnancyProfile, User
+from app.services.data_version import bump_users_statement
+from app.services.pregnancy_calculator import GESTATION_DAYS, MAX_WEEK
+
+# Sentinel for NULL week/day inside integer arrays
+UNKNOWN = -1
+
+
+@dataclass
+class RolloverStats:
+    """Summary of a rollover run"""
+    scanned: int = 0
+    updated: int = 0
+    chunks: int = 0
+    elapsed_s: float = 0.0
+
+
+def compute_week_and_day(edd: np.ndarray, lmp: np.ndarray, today: date) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized PregnancyCalculator.week_and_day
+    edd / lmp are datetime64[D] arrays with NaT for missing dates.
+    Returns int64 (week, day) arrays with UNKNOWN where not computable.
+    """
+    start = np.where(np.isnat(edd), lmp, edd - np.timedelta64(GESTATION_DAYS, "D"))
+    elapsed = (np.datetime64(today, "D") - start).astype(np.int64)
+    valid = ~np.isnat(start) & (elapsed >= 0)
+
+    week = np.where(valid, np.minimum(elapsed // 7 + 1, MAX_WEEK), UNKNOWN)
+    day = np.where(valid, elapsed % 7 + 1, UNKNOWN)
+    return week, day
+
+
+def _write_changes(db: Session, rows: list):
+    """Bulk UPDATE the changed (profile_id, week, day) rows of one chunk and bump their users' data versions"""
+    table = PregnancyProfile.__table__
+    users = User.__table__
+
+    if db.get_bind().dialect.name == "postgresql":
+        # One UPDATE ... FROM (VALUES ...) statement per chunk.
+        # The UNKNOWN sentinel keeps the VALUES list NULL-free so every
+        # column stays typed; NULLIF turns it back into NULL.
+        changes = values(
+            column("profile_id", Integer), column("week", Integer), column("day", Integer),
+            name="changes"
+        ).data(rows)
+        db.execute(
+            update(table)
+            .where(table.c.profile_id == changes.c.profile_id)
+            .values(
+                current_week=func.nullif(changes.c.week, UNKNOWN),
+                current_day=func.nullif(changes.c.day, UNKNOWN),
+            )
+        )
+        db.execute(bump_users_statement(users.c.user_id == table.c.user_id, table.c.profile_id == changes.c.profile_id))
+    else:
+        # Portable fallback (SQLite for local runs): executemany by primary key
+        db.execute(
+            update(table)
+            .where(table.c.profile_id == bindparam("b_profile_id"))
+            .values(current_week=bindparam("b_week"), current_day=bindparam("b_day")),
+            [
+                {"b_profile_id": pid, "b_week": None if week == UNKNOWN else week,
+                 "b_day": None if day == UNKNOWN else day}
+                for pid, week, day in rows
+            ],
+        )
+        owner = select(table.c.user_id).where(table.c.profile_id == bindparam("b_profile_id")).scalar_subquery()
+        db.execute(bump_users_statement(users.c.user_id == owner), [{"b_profile_id": pid} for pid, _, _ in rows])
+
+
+def recompute_all(db: Session, today: Optional[date] = None, chunk_size: int = 50000) -> RolloverStats:
+    """
+    Recompute cached week/day for every profile
+    Commits after each chunk so locks and transaction size stay bounded.
+    """
+    today = today or date.today()
+    stats = RolloverStats()
+    started = time.perf_counter()
+    last_id = 0
+
+    while True:
+        chunk = db.execute(
+            select(
+                PregnancyProfile.profile_id,
+                PregnancyProfile.edd,
+                PregnancyProfile.lmp_start_date,
+                PregnancyProfile.current_week,
+                PregnancyProfile.current_day,
+            )
+            .where(PregnancyProfile.profile_id > last_id)
+            .order_by(PregnancyProfile.profile_id)
+            .limit(chunk_size)
+        ).all()
+        if not chunk:
+            break
+
+        ids, edd, lmp, cur_week, cur_day = zip(*chunk)
+        ids = np.array(ids, dtype=np.int64)
+        new_week, new_day = compute_week_and_day(
+            np.array(edd, dtype="datetime64[D]"),
+            np.array(lmp, dtype="datetime64[D]"),
+            today,
+        )
+        old_week = np.array([UNKNOWN if v is None else v for v in cur_week], dtype=np.int64)
+        old_day = np.array([UNKNOWN if v is None else v for v in cur_day], dtype=np.int64)
+
+        changed = (new_week != old_week) | (new_day != old_day)
+        if changed.any():
+            _write_changes(db, list(zip(
+                ids[changed].tolist(), new_week[changed].tolist(), new_day[changed].tolist()
+            )))
+            db.commit()
+
+        stats.scanned += len(chunk)
+        stats.updated += int(changed.sum())
+        stats.chunks += 1
+        last_id = int(ids[-1])
+
+    stats.elapsed_s = round(time.perf_counter() - started, 3)
+    return stats
@@ -0,0 +1,143 @@
+"""
+Profile Dashboard Service
+Read model behind GET /v1/users/profile, loaded in a single SELECT
+
+One statement returns:
+- the user, with the pregnancy profile eager-joined (contains_eager)
+- the last recorded weight (AC 6.1): a LEFT JOIN LATERAL picking the newest
+  weight_logs row per user on PostgreSQL. Other dialects join that row by a
+  correlated id subquery instead. Both read the (user_id, log_date DESC, id DESC) index.
+- today's symptom and weight logs, outer-joined over the UTC dates around
+  now and narrowed to the user's local date afterwards (one or two rows each,
+  so the join product stays tiny)
+- the weekly_content id for the profile's current week
+
+Every relationship on the loaded objects uses raiseload("*"), so a template or
+serializer reaching for User.symptom_logs raises instead of silently loading the
+user's whole history.
+
+Encrypted journal entries of today's symptom logs are decrypted together, with
+at most one key lookup (app/services/journal_crypto.py).
+
+current_week() backs the content routes' AC 9.1 check. It reads the cached
+PregnancyProfile.current_week by the unique user_id index and keeps it per process for
+CURRENT_WEEK_CACHE_TTL, so repeated content reads don't touch the database.
+"""
+
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from sqlalchemy import and_, select, true
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased, contains_eager, raiseload
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.db.dialects import dialect_name
+from app.db.models import PregnancyProfile, SymptomLog, User, WeeklyContent, WeightLog
+from app.services.journal_crypto import decrypt_rows
+from app.services.ttl_cache import TTLCache
+
+# The week only changes at the nightly rollover or an EDD edit
+CURRENT_WEEK_CACHE_TTL = 300
+# user_id -> current_week (None when unknown)
+week_cache = TTLCache(10000, CURRENT_WEEK_CACHE_TTL)
+NOT_CACHED = object()
+
+
+def local_today(tz_name: str, now_utc: datetime) -> date:
+    """The user's calendar date (unknown timezone names fall back to UTC)"""
+    try:
+        return now_utc.astimezone(ZoneInfo(tz_name)).date()
+    except (ZoneInfoNotFoundError, ValueError):
+        return now_utc.date()
+
+
+class ProfileService:
+    """Single-round-trip dashboard read model"""
+
+    @staticmethod
+    def dashboard_query(user_id: int, dialect: str, now_utc: datetime):
+        """SELECT for the dashboard; rows are (User, last weight, today symptom, today weight, content id)"""
+        # Local "today" is within one day of the UTC date for every timezone
+        utc_today = now_utc.date()
+        nearby_dates = [utc_today - timedelta(days=1), utc_today, utc_today + timedelta(days=1)]
+
+        newest_weight = (
+            select(WeightLog.weight_log_id)
+            .where(WeightLog.user_id == User.user_id)
+            .order_by(WeightLog.log_date.desc(), WeightLog.weight_log_id.desc())
+            .limit(1)
+        )
+        if dialect == "postgresql":
+            last_weight_row = (
+                select(WeightLog)
+                .where(WeightLog.user_id == User.user_id)
+                .order_by(WeightLog.log_date.desc(), WeightLog.weight_log_id.desc())
+                .limit(1)
+                .lateral("last_weight")
+            )
+            LastWeight = aliased(WeightLog, last_weight_row)
+            last_weight_join = (last_weight_row, true())
+        else:
+            LastWeight = aliased(WeightLog, name="last_weight")
+            last_weight_join = (LastWeight, LastWeight.weight_log_id == newest_weight.scalar_subquery())
+
+        TodaySymptom = aliased(SymptomLog, name="today_symptom")
+        TodayWeight = aliased(WeightLog, name="today_weight")
+
+        return (
+            select(User, LastWeight, TodaySymptom, TodayWeight, WeeklyContent.content_id)
+            .outerjoin(User.pregnancy_profile)
+            .outerjoin(*last_weight_join)
+            .outerjoin(TodaySymptom, and_(TodaySymptom.user_id == User.user_id, TodaySymptom.log_date.in_(nearby_dates)))
+            .outerjoin(TodayWeight, and_(TodayWeight.user_id == User.user_id, TodayWeight.log_date.in_(nearby_dates)))
+            .outerjoin(WeeklyContent, WeeklyContent.week_number == PregnancyProfile.current_week)
+            .where(User.user_id == user_id)
+            .options(contains_eager(User.pregnancy_profile), raiseload("*"))
+        )
+
+    @staticmethod
+    async def get_dashboard(db: AsyncSession, user_id: int, now_utc: Optional[datetime] = None) -> Optional[dict]:
+        """ProfileDashboardResponse-shaped dict, or None if the user doesn't exist"""
+        now_utc = now_utc or datetime.now(timezone.utc)
+        query = ProfileService.dashboard_query(user_id, dialect_name(db), now_utc)
+        rows = (await db.execute(query)).all()
+        if not rows:
+            return None
+
+        user, last_weight, _, _, content_id = rows[0]
+        today = local_today(user.timezone, now_utc)
+
+        symptoms, weights = {}, {}
+        for _, _, symptom, weight, _ in rows:
+            if symptom is not None and symptom.log_date == today:
+                symptoms[symptom.log_id] = symptom
+            if weight is not None and weight.log_date == today:
+                weights[weight.weight_log_id] = weight
+
+        today_symptoms = [symptoms[key] for key in sorted(symptoms)]
+        journals = await decrypt_rows(db, user_id, ([symptom.journal_entry] for symptom in today_symptoms), 0)
+        for symptom, (journal,) in zip(today_symptoms, journals):
+            # Plain text for the response only; never flushed back
+            set_committed_value(symptom, "journal_entry", journal)
+
+        return {
+            "user": user,
+            "profile": user.pregnancy_profile,
+            "last_weight": last_weight,
+            "today": today,
+            "today_symptoms": today_symptoms,
+            "today_weights": [weights[key] for key in sorted(weights)],
+            "week_content_id": content_id,
+        }
+
+    @staticmethod
+    async def current_week(db: AsyncSession, user_id: int) -> Optional[int]:
+        """The user's cached pregnancy week (None without a profile or dates), per-process cached"""
+        week = week_cache.get(user_id, NOT_CACHED)
+        if week is not NOT_CACHED:
+            return week
+        week = await db.scalar(select(PregnancyProfile.current_week).where(PregnancyProfile.user_id == user_id))
+        week_cache.set(user_id, week)
+        return week
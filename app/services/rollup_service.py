@@ -0,0 +1,283 @@
+"""
+Rollup Service
+Maintains and reads the daily / weekly weight and mood rollup tables
+
+Write path: every batch of newly created logs is aggregated in memory per day
+and per pregnancy week, then merged into the rollups with one
+INSERT ... ON CONFLICT DO UPDATE per table (counts and sums add, min/max widen),
+in the same transaction as the log rows.
+
+Read path: trend charts read one rollup row per day/week shown. The delta from
+PregnancyProfile.initial_weight_kg is computed at read time so editing the
+initial weight never leaves stale deltas behind.
+
+Rollups only ever grow; if logs are edited or deleted, rebuild the affected
+users with rebuild() (scripts/rebuild_rollups.py).
+"""
+
+import time
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import and_, case, delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.db.dialects import dialect_name, insert_for
+from app.db.models import (
+    MOOD_ROLLUP_COLUMNS, DailyLogRollup, MoodType, PregnancyProfile, SymptomLog, User, WeeklyLogRollup, WeightLog
+)
+from app.services.data_version import bump_users_statement
+
+MOOD_COLUMN_NAMES = list(MOOD_ROLLUP_COLUMNS.values())
+
+
+def _empty_metrics() -> dict:
+    metrics = {"weight_count": 0, "weight_sum": 0.0, "weight_min": None, "weight_max": None}
+    metrics.update({name: 0 for name in MOOD_COLUMN_NAMES})
+    return metrics
+
+
+def _add_weight(metrics: dict, weight_kg: float):
+    metrics["weight_count"] += 1
+    metrics["weight_sum"] += weight_kg
+    metrics["weight_min"] = weight_kg if metrics["weight_min"] is None else min(metrics["weight_min"], weight_kg)
+    metrics["weight_max"] = weight_kg if metrics["weight_max"] is None else max(metrics["weight_max"], weight_kg)
+
+
+def aggregate(user_id: int, weight_rows: Iterable[dict], symptom_rows: Iterable[dict]):
+    """
+    Fold new log rows into per-day and per-week rollup deltas
+    Rows are the dicts inserted by DailyLogService (log_date, pregnancy_week,
+    weight_kg / mood). Returns (daily rows, weekly rows) ready to upsert.
+    """
+    daily: Dict[date, dict] = {}
+    weekly: Dict[int, dict] = {}
+
+    def buckets(row):
+        day = daily.setdefault(row["log_date"], {
+            "user_id": user_id, "log_date": row["log_date"], "pregnancy_week": row.get("pregnancy_week"),
+            **_empty_metrics()
+        })
+        yield day
+        if row.get("pregnancy_week") is not None:
+            yield weekly.setdefault(row["pregnancy_week"], {
+                "user_id": user_id, "pregnancy_week": row["pregnancy_week"], **_empty_metrics()
+            })
+
+    for row in weight_rows:
+        for metrics in buckets(row):
+            _add_weight(metrics, row["weight_kg"])
+
+    for row in symptom_rows:
+        if row.get("mood") is None:
+            continue
+        for metrics in buckets(row):
+            metrics[MOOD_ROLLUP_COLUMNS[MoodType(row["mood"])]] += 1
+
+    return list(daily.values()), list(weekly.values())
+
+
+def _merge_statement(db, model, key_columns: List, rows: List[dict]):
+    """INSERT ... ON CONFLICT DO UPDATE that adds rows onto existing rollups"""
+    insert = insert_for(db)
+    # SQLite spells LEAST/GREATEST as multi-argument min()/max()
+    least, greatest = (func.least, func.greatest) if dialect_name(db) == "postgresql" else (func.min, func.max)
+
+    stmt = insert(model).values(rows)
+    excluded = stmt.excluded
+    table = model.__table__
+
+    def widen(fn, name):
+        current, incoming = table.c[name], excluded[name]
+        return fn(func.coalesce(current, incoming), func.coalesce(incoming, current))
+
+    set_ = {
+        "weight_count": table.c.weight_count + excluded.weight_count,
+        "weight_sum": table.c.weight_sum + excluded.weight_sum,
+        "weight_min": widen(least, "weight_min"),
+        "weight_max": widen(greatest, "weight_max"),
+        "updated_at": func.now(),
+    }
+    set_.update({name: table.c[name] + excluded[name] for name in MOOD_COLUMN_NAMES})
+    if model is DailyLogRollup:
+        set_["pregnancy_week"] = func.coalesce(table.c.pregnancy_week, excluded.pregnancy_week)
+
+    return stmt.on_conflict_do_update(index_elements=key_columns, set_=set_)
+
+
+def _weight_point(row, initial_weight: Optional[float]) -> dict:
+    mean = row.weight_sum / row.weight_count
+    return {
+        "min_kg": row.weight_min,
+        "max_kg": row.weight_max,
+        "mean_kg": round(mean, 2),
+        "delta_kg": round(mean - initial_weight, 2) if initial_weight is not None else None,
+        "entries": row.weight_count,
+    }
+
+
+def _mood_counts(row) -> Dict[MoodType, int]:
+    return {mood: getattr(row, name) for mood, name in MOOD_ROLLUP_COLUMNS.items() if getattr(row, name)}
+
+
+@dataclass
+class RebuildStats:
+    """Summary of a rollup rebuild"""
+    users: int = 0
+    daily_rows: int = 0
+    weekly_rows: int = 0
+    elapsed_s: float = 0.0
+
+
+class RollupService:
+    """Incremental maintenance and reads of log rollups"""
+
+    @staticmethod
+    async def apply(db: AsyncSession, user_id: int, weight_rows: List[dict], symptom_rows: List[dict]):
+        """
+        Merge newly created log rows into the rollups (caller commits)
+        Only pass rows that were actually inserted, never duplicates.
+        """
+        daily, weekly = aggregate(user_id, weight_rows, symptom_rows)
+        if daily:
+            await db.execute(_merge_statement(db, DailyLogRollup, ["user_id", "log_date"], daily))
+        if weekly:
+            await db.execute(_merge_statement(db, WeeklyLogRollup, ["user_id", "pregnancy_week"], weekly))
+
+    @staticmethod
+    async def _initial_weight(db: AsyncSession, user_id: int) -> Optional[float]:
+        return await db.scalar(
+            select(PregnancyProfile.initial_weight_kg).where(PregnancyProfile.user_id == user_id)
+        )
+
+    @staticmethod
+    async def _rows(db: AsyncSession, user_id: int, granularity: str, days: int, *criteria):
+        if granularity == "week":
+            query = select(WeeklyLogRollup).where(WeeklyLogRollup.user_id == user_id, *criteria) \
+                .order_by(WeeklyLogRollup.pregnancy_week)
+        else:
+            query = select(DailyLogRollup).where(
+                DailyLogRollup.user_id == user_id,
+                DailyLogRollup.log_date > date.today() - timedelta(days=days),
+                *criteria
+            ).order_by(DailyLogRollup.log_date)
+        return (await db.execute(query)).scalars().all()
+
+    @staticmethod
+    async def weight_trend(db: AsyncSession, user_id: int, days: int = 30, granularity: str = "day") -> dict:
+        """
+        Weight trend points, oldest first (AC 12.1)
+        granularity="day": one point per logged day in the last `days` days
+        granularity="week": one point per pregnancy week
+        """
+        initial_weight = await RollupService._initial_weight(db, user_id)
+        model = WeeklyLogRollup if granularity == "week" else DailyLogRollup
+        rows = await RollupService._rows(db, user_id, granularity, days, model.weight_count > 0)
+
+        points = []
+        for row in rows:
+            point = _weight_point(row, initial_weight)
+            if granularity == "week":
+                point["pregnancy_week"] = row.pregnancy_week
+            else:
+                point["log_date"] = row.log_date
+            points.append(point)
+        return {"granularity": granularity, "initial_weight_kg": initial_weight, "points": points}
+
+    @staticmethod
+    async def mood_trend(db: AsyncSession, user_id: int, days: int = 30, granularity: str = "day") -> dict:
+        """Mood counts per day / per pregnancy week, plus totals over the range"""
+        rows = await RollupService._rows(db, user_id, granularity, days)
+
+        totals: Dict[MoodType, int] = {}
+        points = []
+        for row in rows:
+            counts = _mood_counts(row)
+            if not counts:
+                continue
+            for mood, count in counts.items():
+                totals[mood] = totals.get(mood, 0) + count
+            point = {"counts": counts}
+            if granularity == "week":
+                point["pregnancy_week"] = row.pregnancy_week
+            else:
+                point["log_date"] = row.log_date
+            points.append(point)
+        return {"granularity": granularity, "totals": totals, "points": points}
+
+    @staticmethod
+    def rebuild(db: Session, user_ids: Optional[List[int]] = None, user_batch_size: int = 5000) -> RebuildStats:
+        """
+        Recompute rollups from raw logs (backfill / repair)
+        Works through users in primary-key batches, one transaction per batch,
+        using server-side INSERT ... SELECT ... GROUP BY (no rows pulled into Python).
+        """
+        stats = RebuildStats()
+        started = time.perf_counter()
+        insert = insert_for(db)
+
+        mood_sums = [
+            func.sum(case((SymptomLog.mood == mood, 1), else_=0)).label(name)
+            for mood, name in MOOD_ROLLUP_COLUMNS.items()
+        ]
+
+        def rebuild_batch(in_batch):
+            db.execute(delete(DailyLogRollup).where(in_batch(DailyLogRollup.user_id)))
+            db.execute(delete(WeeklyLogRollup).where(in_batch(WeeklyLogRollup.user_id)))
+
+            for model, key in ((DailyLogRollup, "log_date"), (WeeklyLogRollup, "pregnancy_week")):
+                weight_key = getattr(WeightLog, key)
+                symptom_key = getattr(SymptomLog, key)
+                week_columns = [func.max(WeightLog.pregnancy_week)] if model is DailyLogRollup else []
+                week_names = ["pregnancy_week"] if model is DailyLogRollup else []
+
+                # 1. Weight stats
+                weights = select(
+                    WeightLog.user_id, weight_key, *week_columns,
+                    func.count(), func.sum(WeightLog.weight_kg),
+                    func.min(WeightLog.weight_kg), func.max(WeightLog.weight_kg),
+                ).where(in_batch(WeightLog.user_id), weight_key.isnot(None)) \
+                    .group_by(WeightLog.user_id, weight_key)
+                result = db.execute(insert(model).from_select(
+                    ["user_id", key, *week_names, "weight_count", "weight_sum", "weight_min", "weight_max"],
+                    weights
+                ))
+                stats_key = "daily_rows" if model is DailyLogRollup else "weekly_rows"
+                setattr(stats, stats_key, getattr(stats, stats_key) + max(result.rowcount, 0))
+
+                # 2. Mood counts, merged onto the weight rows
+                symptom_week = [func.max(SymptomLog.pregnancy_week)] if model is DailyLogRollup else []
+                moods = select(SymptomLog.user_id, symptom_key, *symptom_week, *mood_sums) \
+                    .where(in_batch(SymptomLog.user_id), symptom_key.isnot(None), SymptomLog.mood.isnot(None)) \
+                    .group_by(SymptomLog.user_id, symptom_key)
+                stmt = insert(model).from_select(["user_id", key, *week_names, *MOOD_COLUMN_NAMES], moods)
+                set_ = {name: stmt.excluded[name] for name in MOOD_COLUMN_NAMES}
+                db.execute(stmt.on_conflict_do_update(index_elements=["user_id", key], set_=set_))
+
+            # Repaired trends must not be answered with 304 from a stale ETag
+            db.execute(bump_users_statement(in_batch(User.__table__.c.user_id)))
+            db.commit()
+
+        if user_ids is not None:
+            for start in range(0, len(user_ids), user_batch_size):
+                batch = user_ids[start:start + user_batch_size]
+                rebuild_batch(lambda column: column.in_(batch))
+                stats.users += len(batch)
+        else:
+            last_id = 0
+            while True:
+                batch_ids = db.scalars(
+                    select(User.user_id).where(User.user_id > last_id)
+                    .order_by(User.user_id).limit(user_batch_size)
+                ).all()
+                if not batch_ids:
+                    break
+                low, high = batch_ids[0], batch_ids[-1]
+                rebuild_batch(lambda column: and_(column >= low, column <= high))
+                stats.users += len(batch_ids)
+                last_id = high
+
+        stats.elapsed_s = round(time.perf_counter() - started, 3)
+        return stats
@@ -0,0 +1,181 @@
+"""
+Symptom Log Compaction
+Merges the per-symptom rows older clients wrote for one check-in into one row
+
+Before symptom sets (migration 017) a check-in with four symptoms was four
+symptom_logs rows, each repeating the mood, journal entry and week. Migration 017
+converts those rows in place and flags them legacy_symptom_row = 1. This pass
+then merges a user's flagged rows for one day when they can be one check-in:
+their mood, journal entry (compared as plain text) and week agree wherever both
+rows have a value. Rows that disagree, e.g. two different moods, are separate
+check-ins and stay apart. Rows written after the migration are whole check-ins
+with their own idempotency keys and are never touched, even when a day has
+several of them.
+
+Each merged group becomes one new row: the union of the symptoms (the later
+rating wins for a symptom rated twice) and the first non-empty mood, journal and
+week. The old rows are deleted with sync tombstones, and the new row is created
+now, so delta sync sends the swap on the next app open. It has no
+client_entry_id: only rows created more than min_age_days ago are touched, and
+clients never retry an upload that old, so the dropped keys are never sent again.
+
+Users are processed in primary-key batches, one transaction per batch. The
+trend rollups of affected users are rebuilt afterwards, because a mood repeated
+across the merged rows now counts once.
+"""
+
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import and_, delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.db.models import SymptomLog, User, pack_symptoms, unpack_symptoms
+from app.services.journal_crypto import user_cipher_sync
+from app.services.rollup_service import RollupService
+from app.services.sync_service import tombstone_insert
+
+# Columns a merged row takes from the first of its rows that has a value
+_SHARED = ("mood", "journal_entry", "pregnancy_week")
+
+
+@dataclass
+class CompactStats:
+    """Progress / summary of a compaction run"""
+    users: int = 0
+    rows_merged: int = 0
+    rows_written: int = 0
+    batches: int = 0
+    elapsed_s: float = 0.0
+
+
+def _groups(rows: List, journals: Dict[int, Optional[str]]) -> List[List]:
+    """
+    Split one user's rows for one day (log_id order) into mergeable groups
+    A row joins the first group whose shared values don't conflict with its own.
+    """
+    groups = []
+    for row in rows:
+        values = {"mood": row.mood, "journal_entry": journals[row.log_id], "pregnancy_week": row.pregnancy_week}
+        for group in groups:
+            known = group[0]
+            if all(values[name] is None or known[name] is None or values[name] == known[name] for name in _SHARED):
+                for name in _SHARED:
+                    if known[name] is None:
+                        known[name] = values[name]
+                group.append(row)
+                break
+        else:
+            groups.append([values, row])
+    return [group[1:] for group in groups]
+
+
+def _merged_row(rows: List, now: datetime) -> dict:
+    ratings = {}
+    for row in rows:
+        ratings.update(unpack_symptoms(row.symptom_mask, row.symptom_severities))
+    symptom_mask, symptom_severities = pack_symptoms(ratings.items())
+    merged = {
+        "user_id": rows[0].user_id, "log_date": rows[0].log_date, "client_entry_id": None,
+        "symptom_mask": symptom_mask, "symptom_severities": symptom_severities, "created_at": now,
+    }
+    for name in _SHARED:
+        # The stored (possibly encrypted) value; equal plain text across the group
+        merged[name] = next((getattr(row, name) for row in rows if getattr(row, name) is not None), None)
+    return merged
+
+
+class SymptomCompactionService:
+    """Merges a day's per-symptom rows into symptom-set rows"""
+
+    @staticmethod
+    def _compact_batch(db: Session, in_batch, cutoff: datetime, stats: CompactStats) -> List[int]:
+        """Merge one batch of users' rows and commit; returns the users that changed"""
+        legacy = (SymptomLog.legacy_symptom_row == 1, SymptomLog.created_at < cutoff)
+        days = (
+            select(SymptomLog.user_id, SymptomLog.log_date)
+            .where(in_batch(SymptomLog.user_id), *legacy)
+            .group_by(SymptomLog.user_id, SymptomLog.log_date)
+            .having(func.count() > 1)
+            .subquery()
+        )
+        rows = db.execute(
+            select(SymptomLog.log_id, SymptomLog.user_id, SymptomLog.log_date, SymptomLog.symptom_mask,
+                   SymptomLog.symptom_severities, *(getattr(SymptomLog, name) for name in _SHARED))
+            .join(days, and_(SymptomLog.user_id == days.c.user_id, SymptomLog.log_date == days.c.log_date))
+            .where(*legacy)
+            .order_by(SymptomLog.user_id, SymptomLog.log_date, SymptomLog.log_id)
+        ).all()
+
+        by_day: Dict[tuple, List] = {}
+        for row in rows:
+            by_day.setdefault((row.user_id, row.log_date), []).append(row)
+
+        now = datetime.utcnow()
+        ciphers, merged, removed = {}, [], {}
+        for (user_id, _), day_rows in by_day.items():
+            if any(row.journal_entry is not None for row in day_rows) and user_id not in ciphers:
+                ciphers[user_id] = user_cipher_sync(db, user_id)
+            journals = {
+                row.log_id: ciphers[user_id].decrypt(row.journal_entry) if row.journal_entry is not None else None
+                for row in day_rows
+            }
+            for group in _groups(day_rows, journals):
+                if len(group) > 1:
+                    merged.append(_merged_row(group, now))
+                    removed.setdefault(user_id, []).extend(group)
+
+        # Insert before deleting, so a new row can never take a deleted (tombstoned) id
+        if merged:
+            db.execute(insert(SymptomLog), merged)
+        for user_id, group_rows in removed.items():
+            # log_date lets PostgreSQL prune partitions
+            db.execute(delete(SymptomLog).where(
+                SymptomLog.log_id.in_([row.log_id for row in group_rows]),
+                SymptomLog.log_date.in_({row.log_date for row in group_rows}),
+            ))
+            db.execute(tombstone_insert("symptom_logs", [row.log_id for row in group_rows], user_id))
+        db.commit()
+
+        stats.rows_merged += sum(len(group_rows) for group_rows in removed.values())
+        stats.rows_written += len(merged)
+        return sorted(removed)
+
+    @staticmethod
+    def compact(db: Session, min_age_days: int = 7, user_batch_size: int = 1000,
+                progress: Optional[Callable[[CompactStats], None]] = None) -> CompactStats:
+        """
+        Merge every user's mergeable same-day pre-migration rows created more than min_age_days ago
+        progress is called with the running totals after each batch.
+        """
+        stats = CompactStats()
+        started = time.perf_counter()
+        cutoff = datetime.utcnow() - timedelta(days=min_age_days)
+        changed: List[int] = []
+
+        last_id = 0
+        while True:
+            batch_ids = db.scalars(
+                select(User.user_id).where(User.user_id > last_id).order_by(User.user_id).limit(user_batch_size)
+            ).all()
+            if not batch_ids:
+                db.rollback()
+                break
+            low, high = batch_ids[0], batch_ids[-1]
+            changed += SymptomCompactionService._compact_batch(
+                db, lambda column: and_(column >= low, column <= high), cutoff, stats
+            )
+            last_id = high
+            stats.users += len(batch_ids)
+            stats.batches += 1
+            stats.elapsed_s = round(time.perf_counter() - started, 2)
+            if progress is not None:
+                progress(stats)
+
+        if changed:
+            # Also bumps their data versions, so cached trend / profile ETags go stale
+            RollupService.rebuild(db, changed, user_batch_size)
+        stats.elapsed_s = round(time.perf_counter() - started, 2)
+        return stats
@@ -0,0 +1,124 @@
+"""
+Symptom Guidance Lookup
+Compiles symptom_guidance rules into a dense, pre-rendered lookup table (GET /v1/content/symptom/check)
+
+The request space is small and fixed: 10 symptoms x severity 1-5 x weeks 1-12 =
+600 cells. At load time every rule is painted into the cells it covers, in
+ascending priority order so the highest-priority rule wins. Each cell holds the
+finished JSON body and ETag. A request is one index computation and one tuple
+lookup, with no database query and no serialization.
+
+The table is built as part of the content store snapshot (app/services/content_store.py).
+A reseed therefore swaps it atomically together with the weekly and visit content.
+"""
+
+from typing import Iterable, Optional, Sequence, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import SymptomGuidance, SymptomType
+from app.schemas.content import SymptomGuidanceResponse
+
+SYMPTOMS: Tuple[SymptomType, ...] = tuple(SymptomType)
+MAX_SEVERITY = 5
+MAX_WEEK = 12
+GUIDANCE_LEVELS = ("self_care", "contact_provider", "urgent")
+
+_SYMPTOM_INDEX = {symptom: position for position, symptom in enumerate(SYMPTOMS)}
+
+
+def cell_index(symptom: SymptomType, severity: int, week: int) -> int:
+    """Position of (symptom, severity 1-5, week 1-12) in the flat table"""
+    return (_SYMPTOM_INDEX[symptom] * MAX_SEVERITY + (severity - 1)) * MAX_WEEK + (week - 1)
+
+
+def validate_rule(rule) -> None:
+    """Raise ValueError if a rule's ranges or level are out of bounds"""
+    if not 1 <= rule.min_severity <= rule.max_severity <= MAX_SEVERITY:
+        raise ValueError(f"Guidance rule {rule.rule_key}: severity range must be within 1-{MAX_SEVERITY}")
+    if not 1 <= rule.week_start <= rule.week_end <= MAX_WEEK:
+        raise ValueError(f"Guidance rule {rule.rule_key}: week range must be within 1-{MAX_WEEK}")
+    if rule.level not in GUIDANCE_LEVELS:
+        raise ValueError(f"Guidance rule {rule.rule_key}: unknown level {rule.level!r}")
+
+
+class GuidanceTable:
+    """
+    Immutable dense table of pre-rendered guidance documents
+    Cells no rule covers hold None.
+    """
+
+    def __init__(self, cells: Sequence, rule_count: int = 0):
+        self._cells = tuple(cells)
+        self.rule_count = rule_count
+
+    @property
+    def covered(self) -> int:
+        return sum(cell is not None for cell in self._cells)
+
+    def __len__(self) -> int:
+        return len(self._cells)
+
+    def lookup(self, symptom: SymptomType, severity: int, week: int):
+        """Pre-rendered document for the cell (callers validate the ranges)"""
+        return self._cells[cell_index(symptom, severity, week)]
+
+
+def compile_guidance(rules: Iterable, render) -> GuidanceTable:
+    """
+    Paint rules into a dense table
+    render(response_model) turns each cell's SymptomGuidanceResponse into the stored
+    document (the content store passes CachedDocument builders). Ties on priority
+    go to the rule listed later (rule_key order when loaded from the database).
+    """
+    rules = sorted(rules, key=lambda rule: rule.priority)
+    winners = [None] * (len(SYMPTOMS) * MAX_SEVERITY * MAX_WEEK)
+    for rule in rules:
+        validate_rule(rule)
+        for severity in range(rule.min_severity, rule.max_severity + 1):
+            for week in range(rule.week_start, rule.week_end + 1):
+                winners[cell_index(rule.symptom_type, severity, week)] = rule
+
+    cells = []
+    for symptom in SYMPTOMS:
+        for severity in range(1, MAX_SEVERITY + 1):
+            for week in range(1, MAX_WEEK + 1):
+                rule = winners[cell_index(symptom, severity, week)]
+                cells.append(None if rule is None else render(SymptomGuidanceResponse(
+                    symptom_type=symptom, severity=severity, week=week, level=rule.level,
+                    title=rule.title, advice=rule.advice, rule_key=rule.rule_key,
+                )))
+    return GuidanceTable(cells, rule_count=len(rules))
+
+
+async def load_rules(db: AsyncSession) -> list:
+    """All guidance rules in a deterministic order"""
+    return (await db.execute(select(SymptomGuidance).order_by(SymptomGuidance.rule_key))).scalars().all()
+
+
+def matching_rule_query(symptom: SymptomType, severity: int, week: int):
+    """
+    The per-request SELECT the lookup table replaces
+    Used by benchmarks/symptom_guidance.py as the baseline.
+    """
+    return (
+        select(SymptomGuidance)
+        .where(
+            SymptomGuidance.symptom_type == symptom,
+            SymptomGuidance.min_severity <= severity, SymptomGuidance.max_severity >= severity,
+            SymptomGuidance.week_start <= week, SymptomGuidance.week_end >= week,
+        )
+        .order_by(SymptomGuidance.priority.desc(), SymptomGuidance.rule_key.desc())
+        .limit(1)
+    )
+
+
+def render_rule(rule: Optional[SymptomGuidance], symptom: SymptomType, severity: int, week: int) -> Optional[bytes]:
+    """Serialize a matched rule the way compile_guidance does (baseline path)"""
+    if rule is None:
+        return None
+    return SymptomGuidanceResponse(
+        symptom_type=symptom, severity=severity, week=week, level=rule.level,
+        title=rule.title, advice=rule.advice, rule_key=rule.rule_key,
+    ).model_dump_json().encode()
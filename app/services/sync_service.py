@@ -0,0 +1,270 @@
+"""
+Delta Sync Service
+"Changes since cursor" for mobile clients (GET /v1/sync)
+
+A sync without a cursor returns everything the app keeps offline: the pregnancy
+profile, all of the user's symptom and weight logs and the weekly content. Every
+response carries an opaque cursor, and passing it back returns only what changed
+after it:
+- profile: when pregnancy_profiles.updated_at moved past the cursor
+- symptom_logs / weight_logs: rows created after the cursor's (created_at, id)
+  position, one seek on the (user_id, created_at, id) indexes. Logs are insert-only.
+- weekly_content: from the content store snapshot, only when the content version
+  changed, so an ordinary sync never reads the content tables
+- deleted: sync_tombstones written by whatever deleted the rows (content releases
+  for weekly_content), keyed the way the rows were sent
+
+Rows are sent column-wise ({"columns": [...], "rows": [[...], ...]}), so field
+names appear once per table instead of once per row. A symptom row's packed
+symptom set is sent as a "symptoms" list of [symptom, severity] pairs. Encrypted journal entries
+are decrypted per page with one key lookup (app/services/journal_crypto.py).
+
+Timestamps come from the app server at flush time, slightly before the row's
+transaction commits, and worker clocks differ a little. A position therefore never
+advances past now - SYNC_SETTLE_SECONDS unless a page was cut off by the limit.
+Rows from the last few seconds are sent again on the next sync, so clients apply
+changes as upserts by id.
+"""
+
+import base64
+import enum
+import json
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Iterable, List, Optional, Tuple
+
+from sqlalchemy import insert, or_, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.db.models import PregnancyProfile, SymptomLog, SyncTombstone, WeightLog, unpack_symptoms
+from app.services.content_store import content_store
+from app.services.journal_crypto import decrypt_rows
+
+# Shared content tables clients keep a copy of, and the key rows are sent (and tombstoned) by
+SYNCED_CONTENT = {"weekly_content": "week_number"}
+
+PROFILE_COLUMNS = (
+    PregnancyProfile.edd, PregnancyProfile.lmp_start_date, PregnancyProfile.initial_weight_kg,
+    PregnancyProfile.current_week, PregnancyProfile.current_day,
+)
+SYMPTOM_COLUMNS = (
+    SymptomLog.log_id, SymptomLog.client_entry_id, SymptomLog.log_date, SymptomLog.symptom_mask,
+    SymptomLog.symptom_severities, SymptomLog.mood, SymptomLog.journal_entry, SymptomLog.pregnancy_week,
+)
+WEIGHT_COLUMNS = (
+    WeightLog.weight_log_id, WeightLog.client_entry_id, WeightLog.log_date, WeightLog.weight_kg,
+    WeightLog.pregnancy_week,
+)
+WEEK_COLUMNS = ("week_number", "title", "focus", "body")
+
+# Where journal_entry sits in SYMPTOM_COLUMNS (decrypted before sending)
+JOURNAL_POSITION = [column.key for column in SYMPTOM_COLUMNS].index("journal_entry")
+
+# symptom_mask / symptom_severities are sent as one "symptoms" column of [symptom, severity] pairs
+SYMPTOM_SET_POSITION = [column.key for column in SYMPTOM_COLUMNS].index("symptom_mask")
+SYMPTOM_FIELDS = (
+    *(column.key for column in SYMPTOM_COLUMNS[:SYMPTOM_SET_POSITION]), "symptoms",
+    *(column.key for column in SYMPTOM_COLUMNS[SYMPTOM_SET_POSITION + 2:]),
+)
+
+# (changed_at, id) position in one change stream
+Position = Tuple[datetime, int]
+
+
+@dataclass(frozen=True)
+class SyncCursor:
+    """Where a client's copy is up to, per change stream"""
+    user_id: int
+    profile: datetime
+    symptom_logs: Position
+    weight_logs: Position
+    tombstones: Position
+    content_version: Optional[int] = None
+    content_updated_at: Optional[datetime] = None
+
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _micros(value: datetime) -> int:
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _datetime(micros) -> datetime:
+    return _EPOCH + int(micros) * _MICROSECOND
+
+
+def encode_cursor(cursor: SyncCursor) -> str:
+    """Encode a SyncCursor as an opaque URL-safe string (timestamps as epoch microseconds)"""
+    state = {
+        "u": cursor.user_id,
+        "p": _micros(cursor.profile),
+        "s": [_micros(cursor.symptom_logs[0]), cursor.symptom_logs[1]],
+        "w": [_micros(cursor.weight_logs[0]), cursor.weight_logs[1]],
+        "t": [_micros(cursor.tombstones[0]), cursor.tombstones[1]],
+        "c": None if cursor.content_version is None else [
+            cursor.content_version,
+            _micros(cursor.content_updated_at) if cursor.content_updated_at else None,
+        ],
+    }
+    raw = json.dumps(state, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, user_id: int) -> SyncCursor:
+    """
+    Decode a cursor produced by encode_cursor for this user
+    Raises ValueError if the cursor is malformed or belongs to another account
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        state = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        content = state["c"] or (None, None)
+        decoded = SyncCursor(
+            user_id=int(state["u"]),
+            profile=_datetime(state["p"]),
+            symptom_logs=(_datetime(state["s"][0]), int(state["s"][1])),
+            weight_logs=(_datetime(state["w"][0]), int(state["w"][1])),
+            tombstones=(_datetime(state["t"][0]), int(state["t"][1])),
+            content_version=None if content[0] is None else int(content[0]),
+            content_updated_at=None if content[1] is None else _datetime(content[1]),
+        )
+    except (ValueError, TypeError, KeyError, IndexError, OverflowError, UnicodeDecodeError) as exc:
+        raise ValueError("Invalid sync cursor") from exc
+    if decoded.user_id != user_id:
+        raise ValueError("Sync cursor belongs to another account")
+    return decoded
+
+
+def tombstone_insert(entity: str, keys: Iterable[int], user_id: Optional[int] = None):
+    """
+    INSERT recording deleted rows for delta sync (sync or async sessions)
+    Execute it in the transaction that deletes the rows. keys must not be empty.
+    """
+    now = datetime.utcnow()
+    return insert(SyncTombstone).values(
+        [{"entity": entity, "entity_key": key, "user_id": user_id, "deleted_at": now} for key in keys]
+    )
+
+
+def _plain(value):
+    return value.value if isinstance(value, enum.Enum) else value
+
+
+def _table(columns: Iterable[str], rows: Iterable) -> dict:
+    """Column-wise table payload"""
+    return {"columns": list(columns), "rows": [[_plain(value) for value in row] for row in rows]}
+
+
+def _expand_symptoms(row) -> list:
+    """SYMPTOM_COLUMNS row as SYMPTOM_FIELDS values"""
+    position = SYMPTOM_SET_POSITION
+    symptoms = [[symptom.value, severity] for symptom, severity in unpack_symptoms(row[position], row[position + 1])]
+    return [*row[:position], symptoms, *row[position + 2:]]
+
+
+class SyncService:
+    """Builds delta sync pages"""
+
+    @staticmethod
+    async def _seek(db: AsyncSession, query, changed_at, pk, after: Optional[Position],
+                    settled: datetime, limit: int) -> Tuple[List, Position, bool]:
+        """
+        Rows of a change stream after a position, oldest first
+        The query selects (changed_at, pk, ...). Returns (rows, next position, more).
+        """
+        if after is not None:
+            query = query.where(tuple_(changed_at, pk) > tuple_(*after))
+        rows = (await db.execute(query.order_by(changed_at, pk).limit(limit + 1))).all()
+        if len(rows) > limit:
+            rows = rows[:limit]
+            return rows, (rows[-1][0], rows[-1][1]), True
+        return rows, max(after or (settled, 0), (settled, 0)), False
+
+    @staticmethod
+    async def changes(db: AsyncSession, user_id: int, cursor: Optional[str] = None,
+                      limit: int = 500, now: Optional[datetime] = None,
+                      settle_seconds: Optional[float] = None) -> dict:
+        """
+        One SyncPage-shaped dict of changes after `cursor` (None = full sync)
+        limit caps the rows per log table and tombstones; has_more asks the client
+        to call again with the returned cursor. Raises ValueError for a bad cursor.
+        settle_seconds defaults to get_settings().sync_settle_seconds.
+        """
+        state = decode_cursor(cursor, user_id) if cursor else None
+        if settle_seconds is None:
+            settle_seconds = get_settings().sync_settle_seconds
+        settled = (now or datetime.utcnow()) - timedelta(seconds=settle_seconds)
+        changes, deleted = {}, {}
+
+        # Profile: one row by the unique user_id index
+        query = select(*PROFILE_COLUMNS).where(PregnancyProfile.user_id == user_id)
+        if state is not None:
+            query = query.where(PregnancyProfile.updated_at > state.profile)
+        profile = (await db.execute(query)).first()
+        if profile is not None:
+            changes["profile"] = _table((column.key for column in PROFILE_COLUMNS), [profile])
+
+        # Logs: rows created after the cursor position
+        positions, more = {}, False
+        for name, model, columns in (
+            ("symptom_logs", SymptomLog, SYMPTOM_COLUMNS),
+            ("weight_logs", WeightLog, WEIGHT_COLUMNS),
+        ):
+            rows, positions[name], truncated = await SyncService._seek(
+                db, select(model.created_at, *columns).where(model.user_id == user_id),
+                model.created_at, columns[0], getattr(state, name, None), settled, limit,
+            )
+            more = more or truncated
+            if rows:
+                rows = [row[1:] for row in rows]
+                fields = [column.key for column in columns]
+                if model is SymptomLog:
+                    rows = await decrypt_rows(db, user_id, rows, JOURNAL_POSITION)
+                    rows, fields = [_expand_symptoms(row) for row in rows], SYMPTOM_FIELDS
+                changes[name] = _table(fields, rows)
+
+        # Tombstones: the user's own deletes and shared content removed by a release
+        # (a full sync already reflects every delete)
+        if state is None:
+            positions["tombstones"] = (settled, 0)
+        else:
+            rows, positions["tombstones"], truncated = await SyncService._seek(
+                db,
+                select(SyncTombstone.deleted_at, SyncTombstone.tombstone_id, SyncTombstone.entity, SyncTombstone.entity_key)
+                .where(or_(SyncTombstone.user_id == user_id, SyncTombstone.user_id.is_(None))),
+                SyncTombstone.deleted_at, SyncTombstone.tombstone_id, state.tombstones, settled, limit,
+            )
+            more = more or truncated
+            for _, _, entity, key in rows:
+                deleted.setdefault(entity, []).append(key)
+
+        # Weekly content: only when this worker's content version differs from the client's
+        content_version = state.content_version if state else None
+        content_updated_at = state.content_updated_at if state else None
+        content = content_store.week_changes(content_updated_at if content_version is not None else None)
+        if content is not None and content[0] != content_version:
+            content_version, content_updated_at, documents = content
+            if documents:
+                changes["weekly_content"] = _table(
+                    WEEK_COLUMNS, ([json.loads(doc.body)[name] for name in WEEK_COLUMNS] for doc in documents)
+                )
+
+        next_cursor = SyncCursor(
+            user_id=user_id,
+            profile=max(state.profile, settled) if state else settled,
+            symptom_logs=positions["symptom_logs"],
+            weight_logs=positions["weight_logs"],
+            tombstones=positions["tombstones"],
+            content_version=content_version,
+            content_updated_at=content_updated_at,
+        )
+        return {
+            "cursor": encode_cursor(next_cursor),
+            "has_more": more,
+            "reset": state is None,
+            "changes": changes,
+            "deleted": deleted,
+        }
@@ -0,0 +1,149 @@
+"""
+Trend Query Service
+Keyset-paginated reads behind GET /v1/logs/weight and GET /v1/logs/mood
+
+Pages are ordered newest first by (log_date, primary key). Instead of OFFSET,
+each page carries a cursor encoding the last row's (log_date, id); the next page
+seeks past it with a row-value comparison. Combined with the composite
+(user_id, log_date DESC, id DESC) indexes this is a single index range scan,
+so page latency doesn't grow with the user's history or the table size.
+Pages select only the response columns, which the PostgreSQL indexes INCLUDE,
+so they are index-only scans.
+
+Symptom frequency (GET /v1/logs/symptoms/frequency) is one bitwise aggregate over
+the packed symptom sets, served from the same index on PostgreSQL (it INCLUDEs
+symptom_mask / symptom_severities).
+"""
+
+import base64
+from datetime import date, timedelta
+from typing import List, Optional, Tuple
+
+from sqlalchemy import bindparam, case, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import SEVERITY_MASK, SEVERITY_SHIFTS, SYMPTOM_BITS, SymptomLog, WeightLog
+
+
+def encode_cursor(log_date: date, row_id: int) -> str:
+    """Encode a (log_date, id) position as an opaque URL-safe cursor"""
+    raw = f"{log_date.isoformat()}:{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[date, int]:
+    """
+    Decode a cursor produced by encode_cursor
+    Raises ValueError if the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        date_part, id_part = raw.split(":")
+        return date.fromisoformat(date_part), int(id_part)
+    except (ValueError, UnicodeDecodeError) as exc:
+        raise ValueError("Invalid cursor") from exc
+
+
+def symptom_frequency_columns(mask, severities) -> list:
+    """
+    Aggregates over packed symptom sets: count(*), then per SymptomType the rows
+    with its bit set, the sum of its ratings and the number of rows rating it
+    """
+    columns = [func.count()]
+    for symptom, bit in SYMPTOM_BITS.items():
+        rating = severities.op(">>")(SEVERITY_SHIFTS[symptom]).op("&")(SEVERITY_MASK)
+        columns += [
+            func.sum(case((mask.op("&")(bit) != 0, 1), else_=0)),
+            func.sum(rating),
+            func.sum(case((rating != 0, 1), else_=0)),
+        ]
+    return columns
+
+
+def symptom_frequency(row) -> dict:
+    """{"entries", "symptoms"} from a symptom_frequency_columns row, most frequent first"""
+    symptoms = []
+    for index, symptom in enumerate(SYMPTOM_BITS):
+        entries, severity_sum, rated = row[1 + 3 * index:4 + 3 * index]
+        if entries:
+            symptoms.append({
+                "symptom_type": symptom,
+                "entries": entries,
+                "mean_severity": round(severity_sum / rated, 2) if rated else None,
+            })
+    symptoms.sort(key=lambda item: item["entries"], reverse=True)
+    return {"entries": row[0], "symptoms": symptoms}
+
+
+# Built once: the 31-column aggregate costs more to build and cache-key per call than to run
+_SYMPTOM_FREQUENCY = select(*symptom_frequency_columns(SymptomLog.symptom_mask, SymptomLog.symptom_severities)).where(
+    SymptomLog.user_id == bindparam("user_id"),
+    SymptomLog.log_date > bindparam("since"),
+    SymptomLog.symptom_mask != 0,
+)
+
+
+# Response columns per page (WeightLogResponse / MoodLogResponse), all in the covering indexes
+WEIGHT_PAGE_COLUMNS = (WeightLog.weight_log_id, WeightLog.log_date, WeightLog.weight_kg, WeightLog.pregnancy_week)
+MOOD_PAGE_COLUMNS = (SymptomLog.log_id, SymptomLog.log_date, SymptomLog.mood, SymptomLog.pregnancy_week)
+
+
+class TrendService:
+    """Per-user trend queries with keyset pagination"""
+
+    @staticmethod
+    async def _page(db: AsyncSession, model, pk, columns, user_id: int, limit: int,
+                    cursor: Optional[str], days: Optional[int], *criteria) -> Tuple[List, Optional[str]]:
+        """Fetch one page of a user's `model` rows (only `columns`) plus the cursor for the next page"""
+        query = select(*columns).where(model.user_id == user_id, *criteria)
+
+        if days is not None:
+            query = query.where(model.log_date > date.today() - timedelta(days=days))
+        if cursor is not None:
+            cursor_date, cursor_id = decode_cursor(cursor)
+            # The plain log_date bound lets PostgreSQL prune partitions (row comparisons don't)
+            query = query.where(model.log_date <= cursor_date, tuple_(model.log_date, pk) < tuple_(cursor_date, cursor_id))
+
+        # Fetch one extra row to know whether another page exists
+        query = query.order_by(model.log_date.desc(), pk.desc()).limit(limit + 1)
+        rows = (await db.execute(query)).all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_cursor(last.log_date, getattr(last, pk.key))
+        return rows, next_cursor
+
+    @staticmethod
+    async def get_weight_page(db: AsyncSession, user_id: int, limit: int = 30,
+                              cursor: Optional[str] = None, days: Optional[int] = None):
+        """
+        Weight entries for the trend chart (AC 12.1)
+        days=7 or days=30 restricts to the chart window
+        """
+        return await TrendService._page(
+            db, WeightLog, WeightLog.weight_log_id, WEIGHT_PAGE_COLUMNS, user_id, limit, cursor, days
+        )
+
+    @staticmethod
+    async def get_mood_page(db: AsyncSession, user_id: int, limit: int = 30,
+                            cursor: Optional[str] = None, days: Optional[int] = None):
+        """Mood history entries (rows with a mood selected)"""
+        return await TrendService._page(
+            db, SymptomLog, SymptomLog.log_id, MOOD_PAGE_COLUMNS, user_id, limit, cursor, days,
+            SymptomLog.mood.isnot(None)
+        )
+
+    @staticmethod
+    async def symptom_frequency(db: AsyncSession, user_id: int, days: int = 30) -> dict:
+        """
+        How often each symptom was logged in the last `days` days, with its mean severity
+        One aggregate over the user's rows: a bitwise test of symptom_mask and the
+        3-bit rating from symptom_severities per SymptomType, no GROUP BY.
+        """
+        row = (await db.execute(
+            _SYMPTOM_FREQUENCY, {"user_id": user_id, "since": date.today() - timedelta(days=days)}
+        )).one()
+        return {"days": days, **symptom_frequency(row)}
@@ -0,0 +1,4 @@
+"""
+Benchmarks Package
+Performance benchmarks that run against the real application code and database.
+"""
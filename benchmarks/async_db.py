@@ -0,0 +1,131 @@
+"""
+Benchmark: Sync vs Async Database Sessions
+Compares request throughput of a sync handler using get_db-style sessions
+against an async handler using AsyncSession, on the same hardware and pool size.
+
+Sync handlers run on Starlette's threadpool (40 threads by default), so the
+number of in-flight DB calls per worker is capped by that pool. Async handlers
+only hold a pooled connection while awaiting, so concurrency is bounded by the
+connection pool instead.
+
+Each request runs one query that holds the connection for --query-ms
+(pg_sleep on PostgreSQL, a plain SELECT 1 elsewhere).
+
+Usage:
+    python -m benchmarks.async_db --requests 2000 --concurrency 200 --query-ms 20
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.db.database import ASYNC_DATABASE_URL, DATABASE_URL, pool_options
+from benchmarks.common import emit, run_metadata, summarize
+
+
+def build_app(pool_size: int, query_ms: int) -> FastAPI:
+    """Build a throwaway app exposing one sync and one async DB-bound route"""
+    sync_engine = create_engine(DATABASE_URL, **pool_options(DATABASE_URL, pool_size, 0))
+    async_engine = create_async_engine(ASYNC_DATABASE_URL, **pool_options(ASYNC_DATABASE_URL, pool_size, 0))
+    SyncSession = sessionmaker(bind=sync_engine, autoflush=False)
+    AsyncSessionFactory = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+    if sync_engine.dialect.name == "postgresql":
+        query = text("SELECT pg_sleep(:seconds)").bindparams(seconds=query_ms / 1000)
+    else:
+        query = text("SELECT 1")
+
+    def get_sync_db():
+        db = SyncSession()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    async def get_async_db():
+        async with AsyncSessionFactory() as db:
+            yield db
+
+    app = FastAPI()
+
+    @app.get("/sync")
+    def sync_route(db: Session = Depends(get_sync_db)):
+        db.execute(query)
+        return {"ok": True}
+
+    @app.get("/async")
+    async def async_route(db: AsyncSession = Depends(get_async_db)):
+        await db.execute(query)
+        return {"ok": True}
+
+    app.state.engines = (sync_engine, async_engine)
+    return app
+
+
+async def run_scenario(app: FastAPI, path: str, total: int, concurrency: int) -> dict:
+    """Fire `total` requests at `path` with at most `concurrency` in flight"""
+    latencies = []
+    semaphore = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def one():
+            async with semaphore:
+                start = time.perf_counter()
+                response = await client.get(path)
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - start)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(total)))
+        elapsed = time.perf_counter() - started
+
+    return summarize(path.strip("/"), latencies, elapsed, concurrency)
+
+
+async def main_async(args) -> list:
+    app = build_app(args.pool_size, args.query_ms)
+    try:
+        results = []
+        for path in ("/sync", "/async"):
+            # Warm the pool so connection setup isn't billed to either path
+            await run_scenario(app, path, min(args.concurrency, 50), args.concurrency)
+            results.append(await run_scenario(app, path, args.requests, args.concurrency))
+        return results
+    finally:
+        sync_engine, async_engine = app.state.engines
+        sync_engine.dispose()
+        await async_engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sync vs async DB session throughput")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--pool-size", type=int, default=100, help="Connections per engine (same for both paths)")
+    parser.add_argument("--query-ms", type=int, default=20, help="Simulated query time (PostgreSQL only)")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable results")
+    parser.add_argument("--output", default=None, help="Also write the JSON report to this file")
+    args = parser.parse_args()
+
+    results = asyncio.run(main_async(args))
+    meta = run_metadata(benchmark="async_db", pool_size=args.pool_size, query_ms=args.query_ms)
+    emit(results, meta, as_json=args.json, output=args.output)
+
+    if not args.json:
+        sync_rps, async_rps = results[0]["rps"], results[1]["rps"]
+        print(f"\nAsync speedup: {async_rps / sync_rps:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""
+Benchmark: Login and Authenticated Request Throughput
+Measures the auth paths through the real routers:
+
+- login: POST /v1/auth/login with bcrypt running on the hashing pool
+  (throughput is bounded by AUTH_HASH_WORKERS x cores, not the event loop)
+- health_during_login: GET /health latency while logins are in flight, showing
+  the event loop stays responsive
+- me_cached / me_uncached: an authenticated request with the token and user
+  caches warm vs. disabled (JWT decode + user lookup on every call)
+
+Creates throwaway users (bench-auth-N@example.invalid) in the configured
+database and removes them afterwards.
+
+Usage:
+    python -m benchmarks.auth --users 50 --logins 200 --requests 5000 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy import delete, insert
+
+from app.db.database import SessionLocal, async_engine, init_db
+from app.db.models import User
+from app.routers import auth as auth_router
+from app.services import auth_service
+from app.services.auth_service import CurrentUser, get_pwd_context
+from benchmarks.common import emit, run_metadata, summarize
+
+PASSWORD = "bench-password-123"
+EMAIL_PATTERN = "bench-auth-{}@example.invalid"
+
+
+def build_app() -> FastAPI:
+    """The auth router plus one authenticated and one unauthenticated route"""
+    app = FastAPI()
+    app.include_router(auth_router.router, prefix="/v1/auth")
+
+    @app.get("/me")
+    async def me(current_user: CurrentUser = Depends(auth_router.get_current_user)):
+        return {"user_id": current_user.user_id}
+
+    @app.get("/health")
+    async def health():
+        return {"ok": True}
+
+    return app
+
+
+def create_users(count: int):
+    hashed = get_pwd_context().hash(PASSWORD)
+    db = SessionLocal()
+    try:
+        db.execute(delete(User).where(User.email.like(EMAIL_PATTERN.format("%"))))
+        db.execute(insert(User), [
+            {"email": EMAIL_PATTERN.format(i), "hashed_password": hashed} for i in range(count)
+        ])
+        db.commit()
+    finally:
+        db.close()
+
+
+def drop_users():
+    db = SessionLocal()
+    try:
+        db.execute(delete(User).where(User.email.like(EMAIL_PATTERN.format("%"))))
+        db.commit()
+    finally:
+        db.close()
+
+
+async def fire(client: httpx.AsyncClient, total: int, concurrency: int, make_request) -> tuple:
+    """Run `total` requests with at most `concurrency` in flight; returns (latencies, elapsed)"""
+    latencies = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i):
+        async with semaphore:
+            start = time.perf_counter()
+            response = await make_request(i)
+            response.raise_for_status()
+            latencies.append(time.perf_counter() - start)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(total)))
+    return latencies, time.perf_counter() - started
+
+
+async def main_async(args) -> list:
+    app = build_app()
+    results = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        def login(i):
+            return client.post("/v1/auth/login", data={
+                "username": EMAIL_PATTERN.format(i % args.users), "password": PASSWORD
+            })
+
+        # Warm the hashing pool and DB pool
+        await fire(client, min(args.users, 8), args.concurrency, login)
+
+        # 1. Login throughput, with a health probe running alongside
+        health_latencies = []
+        logins_done = asyncio.Event()
+
+        async def probe():
+            while not logins_done.is_set():
+                start = time.perf_counter()
+                await client.get("/health")
+                health_latencies.append(time.perf_counter() - start)
+                await asyncio.sleep(0.005)
+
+        probe_task = asyncio.create_task(probe())
+        latencies, elapsed = await fire(client, args.logins, args.concurrency, login)
+        logins_done.set()
+        await probe_task
+        results.append(summarize("login", latencies, elapsed, args.concurrency))
+        results.append(summarize("health_during_login", health_latencies, elapsed, 1))
+
+        # 2. Authenticated requests, caches warm vs disabled
+        tokens = [(await login(i)).json()["access_token"] for i in range(args.users)]
+
+        def me(i):
+            return client.get("/me", headers={"Authorization": f"Bearer {tokens[i % len(tokens)]}"})
+
+        await fire(client, len(tokens), args.concurrency, me)
+        latencies, elapsed = await fire(client, args.requests, args.concurrency, me)
+        results.append(summarize("me_cached", latencies, elapsed, args.concurrency))
+
+        sizes = (auth_service.token_cache.maxsize, auth_service.user_cache.maxsize)
+        auth_service.token_cache.maxsize = auth_service.user_cache.maxsize = 0
+        auth_service.token_cache.clear()
+        auth_service.user_cache.clear()
+        try:
+            latencies, elapsed = await fire(client, args.requests, args.concurrency, me)
+            results.append(summarize("me_uncached", latencies, elapsed, args.concurrency))
+        finally:
+            auth_service.token_cache.maxsize, auth_service.user_cache.maxsize = sizes
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Login and token verification throughput")
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=5000, help="Authenticated requests per cache scenario")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--json", action="store_true", help="Print machine-readable results")
+    parser.add_argument("--output", default=None, help="Also write the JSON report to this file")
+    args = parser.parse_args()
+
+    init_db()
+    create_users(args.users)
+    try:
+        results = asyncio.run(main_async(args))
+    finally:
+        drop_users()
+        auth_service.shutdown_hash_executor()
+        asyncio.run(async_engine.dispose())
+
+    settings = auth_service.auth_settings()
+    meta = run_metadata(
+        benchmark="auth", bcrypt_rounds=settings.bcrypt_rounds, hash_workers=settings.auth_hash_workers
+    )
+    emit(results, meta, as_json=args.json, output=args.output)
+
+
+if __name__ == "__main__":
+    main()
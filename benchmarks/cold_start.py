@@ -0,0 +1,120 @@
+"""
+Benchmark: Worker Cold Start
+Measures what a freshly started worker pays before and during its first requests
+
+Each run is a new Python process (like an autoscaled uvicorn worker) that records:
+- import_ms: importing app.main
+- startup_ms: create_app() plus the lifespan startup (engine, pool and cache warm-up)
+- first_login_ms / first_auth_request_ms / second_auth_request_ms: the first
+  POST /v1/auth/login, then two authenticated GET /v1/content/week/1 calls
+- rss_mb: resident memory after the requests
+
+Results are medians over --runs processes. --root points the child processes at
+another checkout (e.g. a git worktree of an older commit) for before/after
+comparisons; trees without create_app() use app.main.app.
+
+Creates one throwaway user (bench-cold-start@example.invalid) in the configured database.
+
+Usage:
+    python -m benchmarks.cold_start --runs 5
+    python -m benchmarks.cold_start --runs 5 --root /tmp/baseline-tree
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import delete, insert
+
+from app.db.database import SessionLocal, init_db
+from app.db.models import User
+from app.services.auth_service import get_pwd_context
+from benchmarks.common import ROOT, run_metadata
+
+EMAIL = "bench-cold-start@example.invalid"
+PASSWORD = "bench-password-123"
+
+CHILD = r"""
+import asyncio, json, resource, sys, time
+started = time.perf_counter()
+import app.main as main
+import_ms = (time.perf_counter() - started) * 1000
+import httpx
+
+async def run():
+    started = time.perf_counter()
+    app = main.create_app() if hasattr(main, "create_app") else main.app
+    result = {"import_ms": import_ms}
+    async with app.router.lifespan_context(app):
+        result["startup_ms"] = (time.perf_counter() - started) * 1000
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+            started = time.perf_counter()
+            response = await client.post("/v1/auth/login", data={"username": sys.argv[1], "password": sys.argv[2]})
+            response.raise_for_status()
+            result["first_login_ms"] = (time.perf_counter() - started) * 1000
+            headers = {"Authorization": "Bearer " + response.json()["access_token"]}
+            for key in ("first_auth_request_ms", "second_auth_request_ms"):
+                started = time.perf_counter()
+                (await client.get("/v1/content/week/1", headers=headers)).raise_for_status()
+                result[key] = (time.perf_counter() - started) * 1000
+    result["rss_mb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(json.dumps(result))
+
+asyncio.run(run())
+"""
+
+
+def run_child(root: str) -> dict:
+    env = {**os.environ, "PYTHONPATH": root}
+    completed = subprocess.run(
+        [sys.executable, "-c", CHILD, EMAIL, PASSWORD], cwd=root, env=env, capture_output=True, text=True
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip().splitlines()[-1] if completed.stderr else "child failed")
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Worker import time, startup and first-request latency")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh processes to measure")
+    parser.add_argument("--root", default=ROOT, help="Checkout to measure (default: this one)")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable results")
+    parser.add_argument("--output", default=None, help="Also write the JSON report to this file")
+    args = parser.parse_args()
+
+    init_db()
+    db = SessionLocal()
+    try:
+        db.execute(delete(User).where(User.email == EMAIL))
+        db.execute(insert(User), [{"email": EMAIL, "hashed_password": get_pwd_context().hash(PASSWORD)}])
+        db.commit()
+
+        runs = [run_child(os.path.abspath(args.root)) for _ in range(args.runs)]
+    except Exception as e:
+        print(f"\n✗ Error running cold start benchmark: {str(e)}")
+        sys.exit(1)
+    finally:
+        db.execute(delete(User).where(User.email == EMAIL))
+        db.commit()
+        db.close()
+
+    medians = {key: round(statistics.median(run[key] for run in runs), 1) for key in runs[0]}
+    report = {"meta": run_metadata(benchmark="cold_start", runs=args.runs, root=os.path.abspath(args.root)),
+              "results": [{"scenario": "cold_start", **medians}]}
+    if args.output:
+        with open(args.output, "w") as handle:
+            json.dump(report, handle, indent=2)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for key, value in medians.items():
+            print(f"{key:<24} {value:>9}")
+
+
+if __name__ == "__main__":
+    main()
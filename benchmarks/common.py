@@ -0,0 +1,99 @@
+"""
+Benchmark Helpers
+Latency summaries and run metadata shared by the benchmark scripts
+
+Every script reports results in one shape: a list of scenario rows with
+requests, errors, rps and p50/p95/p99/max latency in milliseconds. With
+--json/--output it also writes a metadata block, so runs can be compared
+with benchmarks.compare.
+"""
+
+import json
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime
+from typing import List, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list (q in 0..100)"""
+    if not sorted_values:
+        return 0.0
+    rank = max(int(round(q / 100 * len(sorted_values))) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+def summarize(name: str, latencies: List[float], elapsed: float, concurrency: int, errors: int = 0, **extra) -> dict:
+    """One result row from per-request latencies (seconds)"""
+    latencies = sorted(latencies)
+    total = len(latencies)
+
+    def ms(value):
+        return round(value * 1000, 2)
+
+    row = {
+        "scenario": name,
+        "requests": total,
+        "errors": errors,
+        "concurrency": concurrency,
+        "elapsed_s": round(elapsed, 3),
+        "rps": round(total / elapsed, 1) if elapsed > 0 else 0.0,
+        "p50_ms": ms(percentile(latencies, 50)),
+        "p95_ms": ms(percentile(latencies, 95)),
+        "p99_ms": ms(percentile(latencies, 99)),
+        "max_ms": ms(latencies[-1]) if latencies else 0.0,
+    }
+    row.update(extra)
+    return row
+
+
+def run_metadata(**extra) -> dict:
+    """Where and on what a run happened"""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, timeout=5
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+
+    from app.db.database import engine
+
+    meta = {
+        "timestamp": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+        "git_commit": commit,
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "database": engine.dialect.name,
+    }
+    meta.update(extra)
+    return meta
+
+
+def print_table(results: List[dict]):
+    """Human-readable result table"""
+    print(f"{'scenario':<22} {'requests':>9} {'errors':>7} {'rps':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for row in results:
+        if row.get("skipped"):
+            print(f"{row['scenario']:<22} skipped: {row['skipped']}")
+            continue
+        print(f"{row['scenario']:<22} {row['requests']:>9} {row['errors']:>7} {row['rps']:>9} "
+              f"{row['p50_ms']:>9} {row['p95_ms']:>9} {row['p99_ms']:>9}")
+
+
+def emit(results: List[dict], meta: dict, as_json: bool = False, output: Optional[str] = None):
+    """Print results (table or JSON) and optionally save the JSON report"""
+    report = {"meta": meta, "results": results}
+    if output:
+        with open(output, "w") as handle:
+            json.dump(report, handle, indent=2)
+    if as_json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_table(results)
+        if output:
+            print(f"\nSaved results to {output}")
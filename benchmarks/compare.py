@@ -0,0 +1,73 @@
+"""
+Compare Benchmark Runs
+Diffs two JSON reports (from --output) and flags regressions
+
+A scenario regresses when its p95 latency grows, or its throughput drops, by
+more than --threshold percent. Scenarios that had no errors before and have
+errors now also count. Exits with status 1 on any regression, so it can gate CI.
+
+Usage:
+    python -m benchmarks.compare baseline.json candidate.json --threshold 10
+"""
+
+import argparse
+import json
+import sys
+
+
+def load(path: str) -> dict:
+    with open(path) as handle:
+        report = json.load(handle)
+    return {row["scenario"]: row for row in report["results"] if not row.get("skipped")}
+
+
+def pct_change(before: float, after: float) -> float:
+    return (after - before) / before * 100 if before else 0.0
+
+
+def compare(baseline: dict, candidate: dict, threshold: float) -> list:
+    """One row per scenario present in both reports"""
+    rows = []
+    for name in sorted(set(baseline) & set(candidate)):
+        before, after = baseline[name], candidate[name]
+        p95_change = pct_change(before["p95_ms"], after["p95_ms"])
+        rps_change = pct_change(before["rps"], after["rps"])
+        reasons = []
+        if p95_change > threshold:
+            reasons.append(f"p95 +{p95_change:.1f}%")
+        if rps_change < -threshold:
+            reasons.append(f"rps {rps_change:.1f}%")
+        if before.get("errors", 0) == 0 and after.get("errors", 0) > 0:
+            reasons.append(f"{after['errors']} errors")
+        rows.append({
+            "scenario": name,
+            "p95_before": before["p95_ms"], "p95_after": after["p95_ms"], "p95_change_pct": round(p95_change, 1),
+            "rps_before": before["rps"], "rps_after": after["rps"], "rps_change_pct": round(rps_change, 1),
+            "regression": ", ".join(reasons) or None,
+        })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare two benchmark reports")
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Allowed change in percent")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable comparison")
+    args = parser.parse_args()
+
+    rows = compare(load(args.baseline), load(args.candidate), args.threshold)
+    if args.json:
+        print(json.dumps(rows, indent=2))
+    else:
+        print(f"{'scenario':<22} {'p95 before':>11} {'p95 after':>10} {'rps before':>11} {'rps after':>10}  result")
+        for row in rows:
+            print(f"{row['scenario']:<22} {row['p95_before']:>11} {row['p95_after']:>10} "
+                  f"{row['rps_before']:>11} {row['rps_after']:>10}  {row['regression'] or 'ok'}")
+
+    if any(row["regression"] for row in rows):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+"""
+Synthetic Benchmark Dataset
+Generates N users with pregnancy profiles and months of check-in history
+
+Per user:
+- PregnancyProfile: pregnancy started 5-21 weeks before the log window ends;
+  70% give an EDD, the rest only an LMP; initial weight ~ N(65, 11) kg
+- daily check-in adherence ~ Beta(5, 2) (most users log most days)
+- SymptomLog: one row per check-in day with 1-2 symptoms; nausea/fatigue
+  dominate, severity skews mild, mood skews calm/tired/happy, ~15% have a
+  journal entry
+- WeightLog: on about half of check-in days; gain of 0.5-2 kg/month plus
+  daily noise
+- Feedback: ~30% of users leave 1-2 NPS scores (promoter-heavy)
+
+Users are bench-user-N@example.invalid with password "bench-password-123".
+The generator uses a fixed seed, so the same arguments give the same dataset.
+Existing bench users are replaced. Rows are written with multi-row Core
+inserts, then the trend and NPS rollups are rebuilt.
+
+Usage:
+    python -m benchmarks.datagen --users 10000 --days 120
+    python -m benchmarks.datagen --reset-only       # delete bench users
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import delete, func, insert, select
+
+from app.db.database import SessionLocal, init_db
+from app.db.models import (
+    DailyLogRollup, Feedback, MoodType, PregnancyProfile, SymptomLog, SymptomType, User, WeeklyLogRollup, WeightLog, pack_symptoms
+)
+from app.services.auth_service import get_pwd_context
+from app.services.nps_service import NpsService
+from app.services.pregnancy_calculator import GESTATION_DAYS, PregnancyCalculator
+from app.services.rollup_service import RollupService
+
+EMAIL_PATTERN = "bench-user-{}@example.invalid"
+PASSWORD = "bench-password-123"
+
+SYMPTOM_WEIGHTS = {
+    SymptomType.NAUSEA: 30, SymptomType.FATIGUE: 25, SymptomType.BREAST_TENDERNESS: 10,
+    SymptomType.FREQUENT_URINATION: 8, SymptomType.BLOATING: 7, SymptomType.FOOD_AVERSION: 6,
+    SymptomType.HEADACHE: 5, SymptomType.MOOD_SWINGS: 5, SymptomType.CRAMPING: 3, SymptomType.SPOTTING: 1,
+}
+MOOD_WEIGHTS = {
+    MoodType.CALM: 20, MoodType.TIRED: 20, MoodType.HAPPY: 16, MoodType.NEUTRAL: 12,
+    MoodType.ANXIOUS: 12, MoodType.EXCITED: 8, MoodType.IRRITABLE: 7, MoodType.OVERWHELMED: 5,
+}
+SEVERITY_WEIGHTS = {1: 25, 2: 35, 3: 25, 4: 11, 5: 4}
+NPS_WEIGHTS = {0: 1, 1: 1, 2: 1, 3: 1, 4: 2, 5: 3, 6: 5, 7: 10, 8: 20, 9: 26, 10: 30}
+JOURNAL_PHRASES = [
+    "Felt queasy in the morning but better after lunch.",
+    "Slept badly, very tired today.",
+    "Heard the heartbeat at the appointment!",
+    "Craving citrus and nothing else.",
+    "A bit worried about cramps, will mention it at the next visit.",
+    "Good day overall, went for a short walk.",
+]
+
+
+def _weighted(rng: random.Random, weights: dict):
+    return rng.choices(list(weights), weights=list(weights.values()))[0]
+
+
+def reset(db):
+    """Delete all bench users and everything they own"""
+    user_ids = select(User.user_id).where(User.email.like(EMAIL_PATTERN.format("%"))).scalar_subquery()
+    for model in (DailyLogRollup, WeeklyLogRollup, Feedback, WeightLog, SymptomLog, PregnancyProfile):
+        db.execute(delete(model).where(model.user_id.in_(user_ids)))
+    db.execute(delete(User).where(User.email.like(EMAIL_PATTERN.format("%"))))
+    db.commit()
+
+
+class _Buffer:
+    """Accumulates rows per model and flushes them as multi-row inserts"""
+
+    def __init__(self, db, batch_size: int):
+        self.db = db
+        self.batch_size = batch_size
+        self.rows = {}
+        self.counts = {}
+
+    def add(self, model, row: dict):
+        rows = self.rows.setdefault(model, [])
+        rows.append(row)
+        if len(rows) >= self.batch_size:
+            self.flush(model)
+
+    def flush(self, model=None):
+        for target in ([model] if model else list(self.rows)):
+            rows = self.rows.get(target)
+            if rows:
+                self.db.execute(insert(target), rows)
+                self.counts[target.__tablename__] = self.counts.get(target.__tablename__, 0) + len(rows)
+                self.rows[target] = []
+
+
+def generate(db, users: int, days: int, seed: int = 42, batch_size: int = 5000, today: date = None) -> dict:
+    """Insert the synthetic dataset; returns row counts per table"""
+    rng = random.Random(seed)
+    today = today or date.today()
+    now = datetime.utcnow()
+    hashed_password = get_pwd_context().hash(PASSWORD)
+    buffer = _Buffer(db, batch_size)
+
+    first_id = (db.scalar(select(func.max(User.user_id))) or 0) + 1
+    for start in range(0, users, batch_size):
+        db.execute(insert(User), [
+            {"email": EMAIL_PATTERN.format(i), "hashed_password": hashed_password, "full_name": f"Bench User {i}",
+             "created_at": now, "updated_at": now}
+            for i in range(start, min(start + batch_size, users))
+        ])
+    user_ids = db.scalars(
+        select(User.user_id).where(User.email.like(EMAIL_PATTERN.format("%")), User.user_id >= first_id)
+        .order_by(User.user_id)
+    ).all()
+
+    for user_id in user_ids:
+        pregnancy_start = today - timedelta(days=rng.randint(35, 21 * 7))
+        edd = pregnancy_start + timedelta(days=GESTATION_DAYS)
+        lmp = pregnancy_start if rng.random() < 0.3 else None
+        initial_weight = min(max(rng.gauss(65, 11), 42), 130)
+        week, day = PregnancyCalculator.week_and_day(None if lmp else edd, lmp, today=today)
+        buffer.add(PregnancyProfile, {
+            "user_id": user_id, "edd": None if lmp else edd, "lmp_start_date": lmp,
+            "initial_weight_kg": round(initial_weight, 1), "current_week": week, "current_day": day,
+            "created_at": now, "updated_at": now,
+        })
+
+        adherence = rng.betavariate(5, 2)
+        gain_per_day = rng.uniform(0.5, 2.0) / 30
+        window_start = max(pregnancy_start + timedelta(days=7), today - timedelta(days=days))
+        for offset in range((today - window_start).days + 1):
+            log_date = window_start + timedelta(days=offset)
+            if rng.random() > adherence:
+                continue
+            log_week = (log_date - pregnancy_start).days // 7 + 1
+            created_at = datetime.combine(log_date, datetime.min.time()) + timedelta(minutes=rng.randint(420, 1380))
+
+            symptom_mask, symptom_severities = pack_symptoms(
+                (_weighted(rng, SYMPTOM_WEIGHTS), _weighted(rng, SEVERITY_WEIGHTS))
+                for _ in range(1 if rng.random() < 0.7 else 2)
+            )
+            buffer.add(SymptomLog, {
+                "user_id": user_id, "log_date": log_date, "pregnancy_week": log_week,
+                "symptom_mask": symptom_mask, "symptom_severities": symptom_severities,
+                "mood": _weighted(rng, MOOD_WEIGHTS),
+                "journal_entry": rng.choice(JOURNAL_PHRASES) if rng.random() < 0.15 else None,
+                "created_at": created_at,
+            })
+
+            if rng.random() < 0.5:
+                weight = initial_weight + gain_per_day * (log_date - pregnancy_start).days + rng.gauss(0, 0.4)
+                buffer.add(WeightLog, {
+                    "user_id": user_id, "log_date": log_date, "pregnancy_week": log_week,
+                    "weight_kg": round(weight, 1), "created_at": created_at,
+                })
+
+        if rng.random() < 0.3:
+            for _ in range(rng.randint(1, 2)):
+                buffer.add(Feedback, {
+                    "user_id": user_id, "nps_score": _weighted(rng, NPS_WEIGHTS),
+                    "pregnancy_week": rng.randint(6, max(week or 6, 6)),
+                    "created_at": now - timedelta(days=rng.randint(0, days)),
+                })
+
+    buffer.flush()
+    db.commit()
+
+    RollupService.rebuild(db, user_ids=list(user_ids))
+    NpsService.rebuild(db)
+    counts = {"users": len(user_ids)}
+    counts.update(buffer.counts)
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate the synthetic benchmark dataset")
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--days", type=int, default=90, help="Days of check-in history per user")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--batch-size", type=int, default=5000, help="Rows per insert statement")
+    parser.add_argument("--reset-only", action="store_true", help="Delete bench users and exit")
+    args = parser.parse_args()
+
+    init_db()
+    db = SessionLocal()
+    try:
+        reset(db)
+        if args.reset_only:
+            print("✓ Removed bench users")
+            return
+        started = time.perf_counter()
+        counts = generate(db, args.users, args.days, seed=args.seed, batch_size=args.batch_size)
+        elapsed = time.perf_counter() - started
+        print(f"✓ Generated in {elapsed:.1f}s: " + ", ".join(f"{table}={count}" for table, count in counts.items()))
+    except Exception as e:
+        print(f"\n✗ Error generating dataset: {str(e)}")
+        db.rollback()
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""
+Benchmark: Journal Encryption Overhead
+Cost of encrypted journal entries on the endpoints that list them
+
+Creates two throwaway users with identical symptom history (--logs entries,
+--journal-share of them with journal text): one stored as plain text, one
+encrypted under a data key. Then it times, per user:
+- sync: a full GET /v1/sync (SyncService.changes, paging until has_more is false)
+- export: a full NDJSON GET /v1/logs/export (DataExportService.stream)
+Encrypted scenarios run with the user's key in the LRU cache, as in steady
+state. The *_cold variants clear the cache before every request, so each one
+pays for the key lookup and unwrap too. overhead_pct compares p50 latency with
+the plain-text scenario for the same endpoint.
+
+The variants of an endpoint are interleaved, one request each per round in a
+rotating order, with a garbage collection before every request, so drift on a
+busy host hits them alike. --cpu pins the process to one core (Linux). The
+decrypt scenario times decrypting the encrypted user's journal entries alone,
+the floor of the overhead.
+
+Uses JOURNAL_MASTER_KEY when set, otherwise a random master key for the run.
+The users (bench-journal-*@example.invalid) are deleted afterwards.
+
+Usage:
+    python -m benchmarks.journal_crypto --logs 2000 --repeat 100 --cpu 0
+"""
+
+import argparse
+import asyncio
+import base64
+import gc
+import os
+import random
+import sys
+import time
+from datetime import date, timedelta
+from functools import partial
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import delete, insert, select
+
+from app.config import get_settings
+from app.db.database import AsyncSessionLocal, SessionLocal, async_engine, init_db
+from app.db.models import SYMPTOM_BITS, MoodType, SymptomLog, SymptomType, User
+from app.services import journal_crypto
+from app.services.data_export import DataExportService
+from app.services.sync_service import SyncService
+from benchmarks.common import emit, run_metadata, summarize
+from benchmarks.datagen import JOURNAL_PHRASES
+
+EMAILS = {"plain": "bench-journal-plain@example.invalid", "encrypted": "bench-journal-encrypted@example.invalid"}
+
+
+def create_users(logs: int, journal_share: float, seed: int) -> dict:
+    """Create the two users with the same history; returns {"plain": user_id, "encrypted": user_id}"""
+    rng = random.Random(seed)
+    start = date.today() - timedelta(days=logs // 3)
+    history = [
+        {"log_date": start + timedelta(days=index // 3), "mood": rng.choice(list(MoodType)),
+         "symptom_mask": SYMPTOM_BITS[SymptomType.NAUSEA], "symptom_severities": rng.randint(1, 5),
+         "journal_entry": rng.choice(JOURNAL_PHRASES) if rng.random() < journal_share else None}
+        for index in range(logs)
+    ]
+
+    user_ids = {}
+    with SessionLocal() as db:
+        db.execute(delete(User).where(User.email.in_(EMAILS.values())))
+        for kind, email in EMAILS.items():
+            user_ids[kind] = db.scalar(insert(User).values(email=email, hashed_password="!").returning(User.user_id))
+        cipher = journal_crypto.user_cipher_sync(db, user_ids["encrypted"], create=True)
+        for kind, encrypt in (("plain", lambda text: text), ("encrypted", cipher.encrypt)):
+            db.execute(insert(SymptomLog), [
+                {**row, "user_id": user_ids[kind], "journal_entry": encrypt(row["journal_entry"]) if row["journal_entry"] else None}
+                for row in history
+            ])
+        db.commit()
+    return user_ids
+
+
+async def full_sync(user_id: int):
+    cursor = None
+    while True:
+        async with AsyncSessionLocal() as db:
+            page = await SyncService.changes(db, user_id, cursor)
+        cursor = page["cursor"]
+        if not page["has_more"]:
+            return
+
+
+async def full_export(user_id: int):
+    async for _ in DataExportService.stream(AsyncSessionLocal, user_id, "ndjson"):
+        pass
+
+
+async def compare(endpoint: str, request, user_ids: dict, repeat: int) -> list:
+    """Plain, encrypted and encrypted_cold requests of one endpoint, interleaved"""
+    keyring = journal_crypto.get_keyring()
+    variants = [("plain", user_ids["plain"], False), ("encrypted", user_ids["encrypted"], False),
+                ("encrypted_cold", user_ids["encrypted"], True)]
+    latencies = {name: [] for name, _, _ in variants}
+    for _, user_id, _ in variants:
+        await request(user_id)  # warm-up (and key cache fill)
+    for round_number in range(repeat):
+        shift = round_number % len(variants)
+        for name, user_id, cold in variants[shift:] + variants[:shift]:
+            if cold:
+                keyring.cache.clear()
+            gc.collect()
+            start = time.perf_counter()
+            await request(user_id)
+            latencies[name].append(time.perf_counter() - start)
+
+    rows = [summarize(f"{endpoint}_{name}", values, sum(values), 1) for name, values in latencies.items()]
+    for row in rows[1:]:
+        row["overhead_pct"] = round((row["p50_ms"] / rows[0]["p50_ms"] - 1) * 100, 1)
+    return rows
+
+
+def decrypt_scenario(user_id: int, repeat: int) -> dict:
+    """Decrypting every journal entry of the encrypted user, without the database"""
+    with SessionLocal() as db:
+        values = db.scalars(select(SymptomLog.journal_entry).where(
+            SymptomLog.user_id == user_id, SymptomLog.journal_entry.isnot(None)
+        )).all()
+        cipher = journal_crypto.user_cipher_sync(db, user_id)
+    latencies = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        cipher.decrypt_all(values)
+        latencies.append(time.perf_counter() - start)
+    return summarize("decrypt", latencies, sum(latencies), 1, entries=len(values))
+
+
+async def main_async(args, user_ids: dict) -> list:
+    results = []
+    for endpoint, request in (("sync", full_sync), ("export", full_export)):
+        results.extend(await compare(endpoint, request, user_ids, args.repeat))
+    results.append(decrypt_scenario(user_ids["encrypted"], args.repeat))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Journal encryption overhead on sync and export")
+    parser.add_argument("--logs", type=int, default=2000, help="Symptom logs per user")
+    parser.add_argument("--journal-share", type=float, default=0.5, help="Share of logs with a journal entry")
+    parser.add_argument("--repeat", type=int, default=100, help="Requests per scenario")
+    parser.add_argument("--cpu", type=int, default=None, help="Pin the process to this CPU (Linux)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", action="store_true", help="Print machine-readable results")
+    parser.add_argument("--output", default=None, help="Also write the JSON report to this file")
+    args = parser.parse_args()
+    if args.cpu is not None:
+        os.sched_setaffinity(0, {args.cpu})
+
+    settings = get_settings()
+    if not settings.journal_master_key:
+        key = base64.urlsafe_b64encode(os.urandom(journal_crypto.KEY_BYTES)).decode()
+        journal_crypto.configure(settings.model_copy(update={"journal_master_key": key}))
+
+    init_db()
+    try:
+        user_ids = create_users(args.logs, args.journal_share, args.seed)
+        results = asyncio.run(main_async(args, user_ids))
+    except Exception as e:
+        print(f"\n✗ Error running journal encryption benchmark: {str(e)}")
+        sys.exit(1)
+    finally:
+        with SessionLocal() as db:
+            db.execute(delete(User).where(User.email.in_(EMAILS.values())))
+            db.commit()
+        asyncio.run(async_engine.dispose())
+
+    emit(results, run_metadata(benchmark="journal_crypto", logs=args.logs, journal_share=args.journal_share,
+                               cpu=args.cpu),
+         as_json=args.json, output=args.output)
+    if not args.json:
+        for row in results:
+            if "overhead_pct" in row:
+                print(f"{row['scenario']:<22} overhead {row['overhead_pct']:+.1f}% (p50 vs plain text)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+"""
+Load Test Scenarios
+Drives the real application (app.main:app) with check-in, trend, content and
+profile traffic from the synthetic dataset's users
+
+Scenarios:
+- checkin: POST /v1/logs/daily (symptom + mood, unique client_entry_id)
+- trend:   GET weight / mood trend rollups and the paginated weight history
+- content: GET /v1/content/week/{n}, half revalidating with If-None-Match
+- profile: GET /v1/users/profile
+- mixed:   70% trend/content/profile reads, 30% check-ins (profile reads
+           become trend reads while the profile route is not mounted)
+
+By default requests go in-process through httpx's ASGI transport with the app
+lifespan running (content store loaded). Pass --base-url to target a running
+server instead; tokens are minted locally, so it must share SECRET_KEY.
+Scenarios whose route is not mounted are reported as skipped.
+
+Generate data first (python -m benchmarks.datagen) and seed content
+(python scripts/seed_content.py).
+
+Usage:
+    python -m benchmarks.load --scenarios checkin trend --requests 5000 --concurrency 50
+    python -m benchmarks.load --output results.json    # then: python -m benchmarks.compare
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import sys
+import time
+import uuid
+from datetime import date
+from typing import Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+from sqlalchemy import func, select
+
+from app.db.database import SessionLocal
+from app.db.models import User
+from app.services.auth_service import AuthService
+from benchmarks.common import emit, run_metadata, summarize
+from benchmarks.datagen import EMAIL_PATTERN
+
+MOODS = ["Happy", "Calm", "Tired", "Anxious", "Neutral"]
+SYMPTOMS = ["Nausea", "Fatigue", "Headache", "Bloating"]
+
+
+class Context:
+    """Per-run state shared by request builders: bench users, their tokens and cached ETags"""
+
+    def __init__(self, user_ids: List[int], seed: int):
+        self.user_ids = user_ids
+        self.headers = {
+            user_id: {"Authorization": f"Bearer {AuthService.create_access_token(user_id)}"} for user_id in user_ids
+        }
+        self.rng = random.Random(seed)
+        self.etags: Dict[str, str] = {}
+        self.has_profile = True
+
+    def auth(self) -> dict:
+        return dict(self.headers[self.rng.choice(self.user_ids)])
+
+
+def checkin(client: httpx.AsyncClient, ctx: Context):
+    entry = {
+        "kind": "symptom",
+        "client_entry_id": uuid.uuid4().hex,
+        "log_date": date.today().isoformat(),
+        "symptoms": [
+            {"symptom_type": symptom, "severity_rating": ctx.rng.randint(1, 5)}
+            for symptom in ctx.rng.sample(SYMPTOMS, ctx.rng.randint(1, 2))
+        ],
+        "mood": ctx.rng.choice(MOODS),
+    }
+    return client.post("/v1/logs/daily", json=entry, headers=ctx.auth())
+
+
+def trend(client: httpx.AsyncClient, ctx: Context):
+    path, params = ctx.rng.choice([
+        ("/v1/logs/weight/trend", {"days": 30}),
+        ("/v1/logs/weight/trend", {"granularity": "week"}),
+        ("/v1/logs/mood/trend", {"days": 30}),
+        ("/v1/logs/weight", {"days": 30, "limit": 30}),
+    ])
+    return client.get(path, params=params, headers=ctx.auth())
+
+
+def content(client: httpx.AsyncClient, ctx: Context):
+    # Generated users are at least in week 5, so these weeks pass the AC 9.1 check
+    path = f"/v1/content/week/{ctx.rng.randint(1, 5)}"
+    headers = ctx.auth()
+    if path in ctx.etags and ctx.rng.random() < 0.5:
+        headers["If-None-Match"] = ctx.etags[path]
+    return client.get(path, headers=headers)
+
+
+def profile(client: httpx.AsyncClient, ctx: Context):
+    return client.get("/v1/users/profile", headers=ctx.auth())
+
+
+def mixed(client: httpx.AsyncClient, ctx: Context):
+    roll = ctx.rng.random()
+    if roll < 0.3:
+        return checkin(client, ctx)
+    if roll < 0.6:
+        return trend(client, ctx)
+    if roll < 0.85:
+        return content(client, ctx)
+    return profile(client, ctx) if ctx.has_profile else trend(client, ctx)
+
+
+SCENARIOS: Dict[str, tuple] = {
+    # name -> (request builder, routes it needs)
+    "checkin": (checkin, ["/v1/logs/daily"]),
+    "trend": (trend, ["/v1/logs/weight/trend", "/v1/logs/mood/trend", "/v1/logs/weight"]),
+    "content": (content, ["/v1/content/week/{week_number}"]),
+    "profile": (profile, ["/v1/users/profile"]),
+    "mixed": (mixed, ["/v1/logs/daily", "/v1/logs/weight/trend", "/v1/content/week/{week_number}"]),
+}
+
+
+def missing_routes(app, paths: List[str]) -> List[str]:
+    mounted = {getattr(route, "path", None) for route in app.routes}
+    return [path for path in paths if path not in mounted]
+
+
+async def run_scenario(client: httpx.AsyncClient, ctx: Context, name: str, build: Callable,
+                       total: int, concurrency: int, warmup: int) -> dict:
+    """Send `total` requests (after `warmup` unmeasured ones) with at most `concurrency` in flight"""
+    latencies: List[float] = []
+    statuses: Dict[int, int] = {}
+    errors = 0
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(measure: bool):
+        nonlocal errors
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                response = await build(client, ctx)
+            except httpx.HTTPError:
+                errors += measure
+                return
+            elapsed = time.perf_counter() - start
+            if response.status_code == 200 and "etag" in response.headers:
+                ctx.etags[response.request.url.path] = response.headers["etag"]
+            if not measure:
+                return
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+            if response.status_code >= 400:
+                errors += 1
+            latencies.append(elapsed)
+
+    await asyncio.gather(*(one(False) for _ in range(warmup)))
+    started = time.perf_counter()
+    await asyncio.gather(*(one(True) for _ in range(total)))
+    elapsed = time.perf_counter() - started
+    return summarize(name, latencies, elapsed, concurrency, errors=errors,
+                     status_codes={str(code): count for code, count in sorted(statuses.items())})
+
+
+def bench_user_ids(limit: int) -> List[int]:
+    db = SessionLocal()
+    try:
+        return db.scalars(
+            select(User.user_id).where(User.email.like(EMAIL_PATTERN.format("%")))
+            .order_by(func.random()).limit(limit)
+        ).all()
+    finally:
+        db.close()
+
+
+async def main_async(args) -> List[dict]:
+    user_ids = bench_user_ids(args.users)
+    if not user_ids:
+        raise SystemExit("No bench users found; run python -m benchmarks.datagen first")
+    ctx = Context(user_ids, args.seed)
+
+    results = []
+
+    async def run_all(client, app=None):
+        ctx.has_profile = app is None or not missing_routes(app, SCENARIOS["profile"][1])
+        for name in args.scenarios:
+            build, routes = SCENARIOS[name]
+            missing = missing_routes(app, routes) if app is not None else []
+            if missing:
+                results.append({"scenario": name, "skipped": f"route not mounted: {', '.join(missing)}"})
+                continue
+            results.append(await run_scenario(client, ctx, name, build, args.requests, args.concurrency, args.warmup))
+
+    if args.base_url:
+        async with httpx.AsyncClient(base_url=args.base_url, timeout=30) as client:
+            await run_all(client)
+    else:
+        from app.main import app
+        async with app.router.lifespan_context(app):
+            transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=30) as client:
+                await run_all(client, app)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scenario load tests against the real app")
+    parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--requests", type=int, default=2000, help="Measured requests per scenario")
+    parser.add_argument("--warmup", type=int, default=100, help="Unmeasured requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--users", type=int, default=500, help="Bench users to spread traffic over")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--base-url", default=None, help="Target a running server instead of in-process")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable results")
+    parser.add_argument("--output", default=None, help="Also write the JSON report to this file")
+    parser.add_argument("--verbose", action="store_true", help="Keep the app's slow-request / N+1 warnings")
+    args = parser.parse_args()
+
+    if not args.verbose:
+        logging.getLogger("app.services.metrics").setLevel(logging.ERROR)
+
+    results = asyncio.run(main_async(args))
+    meta = run_metadata(
+        benchmark="load", target=args.base_url or "in-process", requests=args.requests,
+        concurrency=args.concurrency, users=args.users,
+    )
+    emit(results, meta, as_json=args.json, output=args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark: Symptom Guidance Lookup
+Compares the precompiled guidance table behind GET /v1/content/symptom/check
+against answering each request with a database query
+
+- guidance_lookup: GuidanceTable.lookup() on the compiled, pre-rendered table
+  (what the endpoint does)
+- guidance_db_query: open a session, run the highest-priority matching-rule
+  SELECT and serialize the response, the per-request alternative
+
+Both scenarios answer the same random (symptom, severity, week) mix, and every
+answer is cross-checked. A mismatch means the compiled table disagrees with the
+rules in the database, and the run exits with code 1. Needs seeded content
+(python scripts/seed_content.py).
+
+Usage:
+    python -m benchmarks.symptom_guidance --requests 5000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import select
+
+from app.db.database import SessionLocal
+from app.db.models import SymptomGuidance
+from app.services.content_store import CachedDocument
+from app.services.symptom_guidance import (
+    MAX_SEVERITY, MAX_WEEK, SYMPTOMS, compile_guidance, matching_rule_query, render_rule
+)
+from benchmarks.common import emit, run_metadata, summarize
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compiled symptom guidance vs per-request queries")
+    parser.add_argument("--requests", type=int, default=5000, help="Requests per scenario")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for the request mix")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable results")
+    parser.add_argument("--output", default=None, help="Also write the JSON report to this file")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    requests = [
+        (rng.choice(SYMPTOMS), rng.randint(1, MAX_SEVERITY), rng.randint(1, MAX_WEEK))
+        for _ in range(args.requests)
+    ]
+
+    with SessionLocal() as db:
+        rules = db.execute(select(SymptomGuidance).order_by(SymptomGuidance.rule_key)).scalars().all()
+    if not rules:
+        print("✗ No symptom guidance rules; run scripts/seed_content.py first")
+        sys.exit(1)
+
+    started = time.perf_counter()
+    table = compile_guidance(rules, lambda model: CachedDocument.from_json(model.model_dump_json().encode()))
+    compile_ms = round((time.perf_counter() - started) * 1000, 2)
+
+    latencies, lookup_bodies = [], []
+    started = time.perf_counter()
+    for symptom, severity, week in requests:
+        start = time.perf_counter()
+        document = table.lookup(symptom, severity, week)
+        latencies.append(time.perf_counter() - start)
+        lookup_bodies.append(document.body if document else None)
+    results = [summarize("guidance_lookup", latencies, time.perf_counter() - started, 1)]
+
+    latencies, query_bodies = [], []
+    started = time.perf_counter()
+    for symptom, severity, week in requests:
+        start = time.perf_counter()
+        with SessionLocal() as db:
+            rule = db.execute(matching_rule_query(symptom, severity, week)).scalar_one_or_none()
+            body = render_rule(rule, symptom, severity, week)
+        latencies.append(time.perf_counter() - start)
+        query_bodies.append(body)
+    results.append(summarize("guidance_db_query", latencies, time.perf_counter() - started, 1))
+
+    mismatches = sum(a != b for a, b in zip(lookup_bodies, query_bodies))
+    meta = run_metadata(
+        benchmark="symptom_guidance", rules=table.rule_count, cells=len(table), covered_cells=table.covered,
+        compile_ms=compile_ms, mismatches=mismatches,
+    )
+    emit(results, meta, as_json=args.json, output=args.output)
+    if mismatches:
+        print(f"\n✗ {mismatches} responses differ between the lookup table and the database query")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
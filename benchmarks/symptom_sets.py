@@ -0,0 +1,185 @@
+"""
+Benchmark: Symptom Sets vs One Row per Symptom
+Storage and symptom-frequency cost of packed symptom sets (migration 017)
+
+Builds two scratch tables with the same check-in history (--users x --days, each
+check-in with 1..--max-symptoms symptoms, a mood, and a journal entry on ~15%):
+- bench_symptom_rows: the old layout, one row per symptom repeating the mood,
+  journal entry and week, with symptom_type / severity_rating columns
+- bench_symptom_sets: one row per check-in with symptom_mask / symptom_severities
+Both get the indexes symptom_logs has (covering (user_id, log_date DESC, id DESC),
+idempotency, delta sync). Reported per layout: rows, table and index bytes, and
+the latency of one user's 30-day symptom frequency. That query is GROUP BY
+symptom_type on the old layout and one bitwise aggregate
+(TrendService.symptom_frequency) on the new one.
+
+Sizes come from dbstat on SQLite and pg_relation_size / pg_indexes_size on
+PostgreSQL. The scratch tables are dropped afterwards.
+
+Usage:
+    python -m benchmarks.symptom_sets --users 500 --days 90 --repeat 500
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import (
+    Column, Date, DateTime, Index, Integer, MetaData, String, Table, Text, bindparam, func, insert, select, text
+)
+
+from app.db.database import engine
+from app.db.models import MoodType, SymptomType, pack_symptoms
+from app.services.trend_service import symptom_frequency, symptom_frequency_columns
+from benchmarks.common import emit, run_metadata, summarize
+from benchmarks.datagen import JOURNAL_PHRASES
+
+metadata = MetaData()
+
+
+def _table(name: str, *symptom_columns: Column) -> Table:
+    """Scratch copy of symptom_logs with the given symptom columns"""
+    table = Table(
+        name, metadata,
+        Column("log_id", Integer, primary_key=True, autoincrement=True),
+        Column("user_id", Integer, nullable=False),
+        Column("log_date", Date, nullable=False),
+        *symptom_columns,
+        Column("mood", String(20)),
+        Column("journal_entry", Text),
+        Column("pregnancy_week", Integer),
+        Column("client_entry_id", String(64)),
+        Column("created_at", DateTime, nullable=False),
+    )
+    c = table.c
+    Index(f"ix_{name}_user_id_log_date", c.user_id, c.log_date.desc(), c.log_id.desc(),
+          postgresql_include=["mood", *(column.name for column in symptom_columns), "pregnancy_week"])
+    Index(f"uq_{name}_user_id_client_entry_id", c.user_id, c.client_entry_id, c.log_date, unique=True)
+    Index(f"ix_{name}_user_id_created_at", c.user_id, c.created_at, c.log_id)
+    return table
+
+
+ROWS = _table("bench_symptom_rows", Column("symptom_type", String(18)), Column("severity_rating", Integer))
+SETS = _table(
+    "bench_symptom_sets",
+    Column("symptom_mask", Integer, nullable=False), Column("symptom_severities", Integer, nullable=False),
+)
+
+
+def generate(users: int, days: int, max_symptoms: int, seed: int):
+    """Same check-ins in both layouts; returns (per-symptom rows, per-check-in rows)"""
+    rng = random.Random(seed)
+    today = date.today()
+    per_symptom, per_checkin = [], []
+    for user_id in range(1, users + 1):
+        for offset in range(days):
+            log_date = today - timedelta(days=offset)
+            ratings = [(symptom, rng.choice([None, 1, 2, 3, 4, 5]))
+                       for symptom in rng.sample(list(SymptomType), rng.randint(1, max_symptoms))]
+            shared = {
+                "user_id": user_id, "log_date": log_date, "mood": rng.choice(list(MoodType)).name,
+                "journal_entry": rng.choice(JOURNAL_PHRASES) if rng.random() < 0.15 else None,
+                "pregnancy_week": 6 + offset // 7, "created_at": datetime.combine(log_date, datetime.min.time()),
+            }
+            for index, (symptom, severity) in enumerate(ratings):
+                per_symptom.append({**shared, "client_entry_id": f"{offset}-{index}",
+                                    "symptom_type": symptom.name, "severity_rating": severity})
+            mask, severities = pack_symptoms(ratings)
+            per_checkin.append({**shared, "client_entry_id": f"{offset}",
+                                "symptom_mask": mask, "symptom_severities": severities})
+    return per_symptom, per_checkin
+
+
+def sizes(connection, table: Table) -> dict:
+    """Table and index bytes"""
+    if connection.dialect.name == "postgresql":
+        table_bytes, index_bytes = connection.execute(
+            text("SELECT pg_relation_size(:name), pg_indexes_size(:name)"), {"name": table.name}
+        ).one()
+    else:
+        pages = dict(connection.execute(
+            text("SELECT name, SUM(pgsize) FROM dbstat WHERE name = :name OR name IN "
+                 "(SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = :name) GROUP BY name"),
+            {"name": table.name},
+        ).all())
+        table_bytes = pages.pop(table.name, 0)
+        index_bytes = sum(pages.values())
+    return {"table_bytes": int(table_bytes), "index_bytes": int(index_bytes)}
+
+
+# One user's symptom frequency since a date, per layout (built once, as in TrendService)
+FREQUENCY_QUERIES = {
+    ROWS: select(ROWS.c.symptom_type, func.count(), func.avg(ROWS.c.severity_rating))
+    .where(ROWS.c.user_id == bindparam("user_id"), ROWS.c.log_date > bindparam("since"), ROWS.c.symptom_type.isnot(None))
+    .group_by(ROWS.c.symptom_type),
+    SETS: select(*symptom_frequency_columns(SETS.c.symptom_mask, SETS.c.symptom_severities))
+    .where(SETS.c.user_id == bindparam("user_id"), SETS.c.log_date > bindparam("since"), SETS.c.symptom_mask != 0),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Symptom sets vs one row per symptom: size and frequency queries")
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--days", type=int, default=90, help="Check-in days per user")
+    parser.add_argument("--max-symptoms", type=int, default=4, help="Symptoms per check-in: 1..N")
+    parser.add_argument("--repeat", type=int, default=500, help="Frequency queries per layout")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", action="store_true", help="Print machine-readable results")
+    parser.add_argument("--output", default=None, help="Also write the JSON report to this file")
+    args = parser.parse_args()
+
+    per_symptom, per_checkin = generate(args.users, args.days, args.max_symptoms, args.seed)
+    since = date.today() - timedelta(days=30)
+    results = []
+    try:
+        metadata.drop_all(engine)
+        metadata.create_all(engine)
+        with engine.begin() as connection:
+            for table, rows in ((ROWS, per_symptom), (SETS, per_checkin)):
+                for start in range(0, len(rows), 5000):
+                    connection.execute(insert(table), rows[start:start + 5000])
+            if connection.dialect.name == "postgresql":
+                connection.execute(text(f"ANALYZE {ROWS.name}"))
+                connection.execute(text(f"ANALYZE {SETS.name}"))
+
+        rng = random.Random(args.seed)
+        with engine.connect() as connection:
+            # Same answer from both layouts for one user
+            check = rng.randint(1, args.users)
+            old = {symptom: count for symptom, count, _ in connection.execute(FREQUENCY_QUERIES[ROWS], {"user_id": check, "since": since})}
+            new = symptom_frequency(connection.execute(FREQUENCY_QUERIES[SETS], {"user_id": check, "since": since}).one())
+            assert old == {item["symptom_type"].name: item["entries"] for item in new["symptoms"]}, "layouts disagree"
+
+            for name, table, rows in (("frequency_symptom_rows", ROWS, per_symptom),
+                                      ("frequency_symptom_sets", SETS, per_checkin)):
+                latencies = []
+                started = time.perf_counter()
+                for _ in range(args.repeat):
+                    params = {"user_id": rng.randint(1, args.users), "since": since}
+                    start = time.perf_counter()
+                    connection.execute(FREQUENCY_QUERIES[table], params).all()
+                    latencies.append(time.perf_counter() - start)
+                results.append(summarize(
+                    name, latencies, time.perf_counter() - started, 1, rows=len(rows), **sizes(connection, table)
+                ))
+    except Exception as e:
+        print(f"\n✗ Error running symptom set benchmark: {str(e)}")
+        sys.exit(1)
+    finally:
+        metadata.drop_all(engine)
+
+    emit(results, run_metadata(benchmark="symptom_sets", users=args.users, days=args.days,
+                               max_symptoms=args.max_symptoms), as_json=args.json, output=args.output)
+    if not args.json:
+        for row in results:
+            print(f"{row['scenario']:<24} rows {row['rows']:>9}  table {row['table_bytes'] / 2**20:7.1f} MiB  "
+                  f"indexes {row['index_bytes'] / 2**20:7.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Benchmark: Delta Sync
+Cost of an app open with GET /v1/sync: full download vs changes since the cursor
+
+For --users users with generated history (python -m benchmarks.datagen):
+- sync_full: first sync without a cursor, paging until has_more is false
+- sync_idle: returning user, nothing changed since the cursor
+- sync_one_new_log: returning user after one new check-in
+
+Each row reports latency plus avg_bytes (serialized response bodies per open)
+and avg_queries (SQL statements per open). The check-ins inserted for the last
+scenario are deleted afterwards.
+
+Usage:
+    python -m benchmarks.sync --users 200
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import delete, distinct, insert, select
+
+from app.db.database import AsyncSessionLocal, SessionLocal, async_engine
+from app.db.instrumentation import current_stats, start_tracking, stop_tracking
+from app.db.models import SYMPTOM_BITS, SymptomLog, SymptomType
+from app.schemas.sync import SyncPage
+from app.services.content_store import content_store
+from app.services.sync_service import SyncService
+from benchmarks.common import emit, run_metadata, summarize
+
+ENTRY_PREFIX = "bench-sync-"
+
+
+async def open_app(user_id: int, cursor, limit: int) -> tuple:
+    """One app open: sync until has_more is false; returns (cursor, bytes, queries)"""
+    size = queries = 0
+    while True:
+        token = start_tracking()
+        try:
+            async with AsyncSessionLocal() as db:
+                page = await SyncService.changes(db, user_id, cursor, limit=limit)
+            queries += current_stats().count
+        finally:
+            stop_tracking(token)
+        size += len(SyncPage.model_validate(page).model_dump_json())
+        cursor = page["cursor"]
+        if not page["has_more"]:
+            return cursor, size, queries
+
+
+async def scenario(name: str, user_ids, cursors: dict, limit: int) -> dict:
+    latencies, sizes, queries = [], [], []
+    started = time.perf_counter()
+    for user_id in user_ids:
+        start = time.perf_counter()
+        cursors[user_id], size, count = await open_app(user_id, cursors.get(user_id), limit)
+        latencies.append(time.perf_counter() - start)
+        sizes.append(size)
+        queries.append(count)
+    return summarize(
+        name, latencies, time.perf_counter() - started, 1,
+        avg_bytes=round(statistics.mean(sizes)), avg_queries=round(statistics.mean(queries), 1),
+    )
+
+
+async def main_async(args, user_ids) -> list:
+    # Weekly content comes from the content store, as in the app
+    await content_store.load(AsyncSessionLocal)
+    cursors = {}
+    results = [await scenario("sync_full", user_ids, cursors, args.limit)]
+    results.append(await scenario("sync_idle", user_ids, cursors, args.limit))
+
+    with SessionLocal() as db:
+        db.execute(insert(SymptomLog), [
+            {"user_id": user_id, "log_date": date.today(), "client_entry_id": f"{ENTRY_PREFIX}{user_id}",
+             "symptom_mask": SYMPTOM_BITS[SymptomType.NAUSEA], "symptom_severities": 1}
+            for user_id in user_ids
+        ])
+        db.commit()
+    results.append(await scenario("sync_one_new_log", user_ids, cursors, args.limit))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Delta sync: full vs incremental app opens")
+    parser.add_argument("--users", type=int, default=200, help="Users to sync")
+    parser.add_argument("--limit", type=int, default=500, help="Rows per log table per page")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable results")
+    parser.add_argument("--output", default=None, help="Also write the JSON report to this file")
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        user_ids = db.scalars(
+            select(distinct(SymptomLog.user_id)).order_by(SymptomLog.user_id).limit(args.users)
+        ).all()
+    if not user_ids:
+        print("✗ No symptom logs; run python -m benchmarks.datagen first")
+        sys.exit(1)
+
+    try:
+        results = asyncio.run(main_async(args, user_ids))
+    except Exception as e:
+        print(f"\n✗ Error running sync benchmark: {str(e)}")
+        sys.exit(1)
+    finally:
+        with SessionLocal() as db:
+            db.execute(delete(SymptomLog).where(SymptomLog.client_entry_id.like(f"{ENTRY_PREFIX}%")))
+            db.commit()
+        asyncio.run(async_engine.dispose())
+
+    emit(results, run_metadata(benchmark="sync", users=len(user_ids), limit=args.limit),
+         as_json=args.json, output=args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Compact Symptom Logs
+Merges the per-symptom rows older clients wrote for one check-in into one symptom-set row
+Run once after migration 017 (safe to re-run; merged days are skipped)
+Only rows migration 017 converted (legacy_symptom_row = 1) are merged
+
+Usage:
+    python scripts/compact_symptom_logs.py
+    python scripts/compact_symptom_logs.py --min-age-days 14 --batch-size 500
+"""
+
+import argparse
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.database import SessionLocal
+from app.services.symptom_compaction import SymptomCompactionService
+
+
+def report(stats):
+    print(f"  … {stats.users} users checked, {stats.rows_merged} rows merged into {stats.rows_written} "
+          f"({stats.elapsed_s}s)", flush=True)
+
+
+def main():
+    """Run the symptom log compaction"""
+    parser = argparse.ArgumentParser(description="Merge per-symptom check-in rows into symptom sets")
+    parser.add_argument("--min-age-days", type=int, default=7, help="Only merge rows created at least this long ago")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Users per transaction")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        stats = SymptomCompactionService.compact(
+            db, min_age_days=args.min_age_days, user_batch_size=args.batch_size, progress=report
+        )
+        print(f"✓ Merged {stats.rows_merged} symptom log rows into {stats.rows_written} "
+              f"for {stats.users} users in {stats.batches} batches, {stats.elapsed_s}s")
+    except Exception as e:
+        print(f"\n✗ Error compacting symptom logs: {str(e)}")
+        db.rollback()
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Encrypt Journal Entries
+Encrypts journal entries still stored as plain text under their owners' data keys
+Run once after setting JOURNAL_MASTER_KEY (safe to re-run; encrypted rows are skipped)
+
+Usage:
+    python scripts/encrypt_journals.py
+    python scripts/encrypt_journals.py --batch-size 5000
+"""
+
+import argparse
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.database import SessionLocal
+from app.services.journal_crypto import encrypt_plaintext_entries
+
+
+def report(stats):
+    print(f"  … {stats.entries} entries of {stats.users} users encrypted ({stats.elapsed_s}s)", flush=True)
+
+
+def main():
+    """Run the journal encryption backfill"""
+    parser = argparse.ArgumentParser(description="Encrypt plain-text journal entries")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Entries per transaction")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        stats = encrypt_plaintext_entries(db, batch_size=args.batch_size, progress=report)
+        print(f"✓ Encrypted {stats.entries} journal entries of {stats.users} users "
+              f"in {stats.batches} batches, {stats.elapsed_s}s")
+    except Exception as e:
+        print(f"\n✗ Error encrypting journal entries: {str(e)}")
+        db.rollback()
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
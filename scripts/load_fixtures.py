@@ -0,0 +1,67 @@
+"""
+Load Fixture Datasets
+Bulk-loads a directory of <table>.csv files (e.g. users.csv, symptom_logs.csv)
+Uses COPY on PostgreSQL and batched inserts elsewhere; see app/db/bulk_load.py
+
+Files load in foreign-key order in one transaction, so a failure leaves the
+database unchanged. Trend rollups are rebuilt afterwards when log tables were loaded.
+
+Usage:
+    python scripts/load_fixtures.py fixtures/large
+    python scripts/load_fixtures.py fixtures/large --truncate     # replace existing rows
+"""
+
+import argparse
+import sys
+import os
+import time
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.bulk_load import load_csv, truncate_tables
+from app.db.database import SessionLocal
+from app.db.models import Base
+from app.services.rollup_service import RollupService
+
+ROLLUP_SOURCES = {"symptom_logs", "weight_logs"}
+
+
+def main():
+    """Load every <table>.csv in the directory"""
+    parser = argparse.ArgumentParser(description="Bulk-load CSV fixture files")
+    parser.add_argument("directory", help="Directory of <table>.csv files")
+    parser.add_argument("--truncate", action="store_true", help="Empty the fixture tables (and tables referencing them) first")
+    parser.add_argument("--batch-size", type=int, default=5000, help="Rows per insert when COPY is unavailable")
+    parser.add_argument("--skip-rollups", action="store_true", help="Don't rebuild trend rollups afterwards")
+    args = parser.parse_args()
+
+    files = {name[:-4]: os.path.join(args.directory, name) for name in os.listdir(args.directory) if name.endswith(".csv")}
+    unknown = sorted(set(files) - set(Base.metadata.tables))
+    if unknown:
+        print(f"✗ No table for fixture files: {', '.join(unknown)}")
+        sys.exit(1)
+    tables = [table for table in Base.metadata.sorted_tables if table.name in files]
+
+    db = SessionLocal()
+    try:
+        started = time.perf_counter()
+        if args.truncate:
+            truncate_tables(db, tables)
+        for table in tables:
+            result = load_csv(db, table, files[table.name], batch_size=args.batch_size)
+            print(f"  ✓ {result.table}: {result.rows} rows ({result.method})")
+        db.commit()
+        print(f"✓ Loaded {len(tables)} fixture files in {time.perf_counter() - started:.1f}s")
+
+        if not args.skip_rollups and ROLLUP_SOURCES & set(files):
+            stats = RollupService.rebuild(db)
+            print(f"✓ Rebuilt rollups for {stats.users} users")
+    except Exception as e:
+        print(f"\n✗ Error loading fixtures: {str(e)}")
+        db.rollback()
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Log Partition Maintenance
+Creates upcoming monthly partitions of symptom_logs / weight_logs and applies the retention policy
+Schedule daily (e.g., cron at 00:15); runs are idempotent. PostgreSQL only (see migration 010).
+
+Defaults come from LOG_PARTITION_MONTHS_AHEAD, LOG_RETENTION_MONTHS and LOG_RETENTION_MODE.
+
+Usage:
+    python scripts/maintain_log_partitions.py
+    python scripts/maintain_log_partitions.py --retain-months 24 --mode archive
+    python scripts/maintain_log_partitions.py --dry-run
+"""
+
+import argparse
+import sys
+import os
+from datetime import date
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config import get_settings
+from app.db.database import SessionLocal
+from app.services.log_partitions import RETENTION_MODES, maintain_all
+
+
+def main():
+    """Run partition maintenance"""
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description="Create future log partitions and retire old ones")
+    parser.add_argument("--months-ahead", type=int, default=settings.log_partition_months_ahead, help="Future months to pre-create")
+    parser.add_argument("--retain-months", type=int, default=settings.log_retention_months,
+                        help="Retire partitions older than this many months (0 = keep everything)")
+    parser.add_argument("--mode", choices=RETENTION_MODES, default=settings.log_retention_mode, help="What to do with expired partitions")
+    parser.add_argument("--date", type=date.fromisoformat, default=None, help="Run as of this date (default: today)")
+    parser.add_argument("--dry-run", action="store_true", help="Report planned changes without applying them")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        reports = maintain_all(
+            db, dry_run=args.dry_run, months_ahead=args.months_ahead, retain_months=args.retain_months,
+            mode=args.mode, today=args.date,
+        )
+        for report in reports:
+            if not report.partitioned:
+                print(f"- {report.table} is not partitioned, skipping")
+                continue
+            print(f"✓ {report.table}: created {len(report.created)} ({', '.join(report.created) or 'none'}), "
+                  f"{args.mode} {len(report.retired)} ({', '.join(report.retired) or 'none'}), "
+                  f"moved {report.moved_rows} rows from the default partition")
+        if args.dry_run:
+            print("✓ Dry run, nothing changed")
+    except Exception as e:
+        print(f"\n✗ Error maintaining log partitions: {str(e)}")
+        db.rollback()
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Purge Accounts
+Erases deactivated accounts (is_active = 0), or specific accounts, with all their data
+Schedule the deactivated purge daily (e.g., cron at 03:00)
+
+Each batch of accounts is one transaction; logs, profiles, feedbacks, exports and
+rollups go with their user through ON DELETE CASCADE.
+
+Usage:
+    python scripts/purge_accounts.py                       # every deactivated account
+    python scripts/purge_accounts.py --max-accounts 10000 --pause 0.5
+    python scripts/purge_accounts.py --user-id 42 43       # these accounts, active or not
+"""
+
+import argparse
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.database import SessionLocal
+from app.services.erasure_service import ErasureService
+
+
+def report(stats):
+    print(f"  … {stats.accounts} accounts erased in {stats.batches} batches ({stats.elapsed_s}s)", flush=True)
+
+
+def main():
+    """Run the account purge"""
+    parser = argparse.ArgumentParser(description="Erase deactivated (or specific) accounts and their data")
+    parser.add_argument("--user-id", type=int, nargs="+", default=None, help="Erase these accounts instead")
+    parser.add_argument("--batch-size", type=int, default=500, help="Accounts per transaction")
+    parser.add_argument("--max-accounts", type=int, default=None, help="Stop after this many accounts")
+    parser.add_argument("--pause", type=float, default=0.0, help="Seconds to sleep between batches")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        if args.user_id:
+            stats = ErasureService.erase_users(db, args.user_id, batch_size=args.batch_size)
+        else:
+            stats = ErasureService.purge_deactivated(
+                db, batch_size=args.batch_size, max_accounts=args.max_accounts, pause_s=args.pause, progress=report
+            )
+        print(f"✓ Erased {stats.accounts} accounts and {stats.export_files} export files "
+              f"in {stats.batches} batches, {stats.elapsed_s}s")
+    except Exception as e:
+        print(f"\n✗ Error purging accounts: {str(e)}")
+        db.rollback()
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
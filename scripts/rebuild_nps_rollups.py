@@ -0,0 +1,43 @@
+"""
+Rebuild NPS Rollups
+Backfills nps_daily_rollups and nps_weekly_rollups from the feedbacks table
+Run once after migrating, and whenever feedback rows are edited or deleted
+
+Streams feedbacks through a server-side cursor, so memory stays bounded by the
+number of days and pregnancy weeks regardless of table size.
+
+Usage:
+    python scripts/rebuild_nps_rollups.py
+    python scripts/rebuild_nps_rollups.py --batch-size 50000
+"""
+
+import argparse
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.database import SessionLocal
+from app.services.nps_service import NpsService
+
+
+def main():
+    """Run the NPS rollup rebuild"""
+    parser = argparse.ArgumentParser(description="Rebuild NPS rollups from feedbacks")
+    parser.add_argument("--batch-size", type=int, default=10000, help="Feedback rows fetched per round trip")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        stats = NpsService.rebuild(db, batch_size=args.batch_size)
+        print(f"✓ Rebuilt NPS rollups from {stats.feedbacks} feedbacks: {stats.daily_rows} daily / "
+              f"{stats.weekly_rows} weekly rows in {stats.elapsed_s}s")
+    except Exception as e:
+        print(f"\n✗ Error rebuilding NPS rollups: {str(e)}")
+        db.rollback()
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
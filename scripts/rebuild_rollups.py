@@ -0,0 +1,41 @@
+"""
+Rebuild Trend Rollups
+Backfills daily_log_rollups and weekly_log_rollups from raw weight_logs and symptom_logs
+Run once after migrating, and for specific users after logs are edited or deleted
+
+Usage:
+    python scripts/rebuild_rollups.py                   # all users
+    python scripts/rebuild_rollups.py --user-id 42 43   # specific users
+"""
+
+import argparse
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.database import SessionLocal
+from app.services.rollup_service import RollupService
+
+
+def main():
+    """Run the rollup rebuild"""
+    parser = argparse.ArgumentParser(description="Rebuild weight/mood trend rollups")
+    parser.add_argument("--user-id", type=int, nargs="+", default=None, help="Only rebuild these users")
+    parser.add_argument("--batch-size", type=int, default=5000, help="Users per transaction")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        stats = RollupService.rebuild(db, user_ids=args.user_id, user_batch_size=args.batch_size)
+        print(f"✓ Rebuilt rollups for {stats.users} users: {stats.daily_rows} daily / "
+              f"{stats.weekly_rows} weekly weight rows in {stats.elapsed_s}s")
+    except Exception as e:
+        print(f"\n✗ Error rebuilding rollups: {str(e)}")
+        db.rollback()
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
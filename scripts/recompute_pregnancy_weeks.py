@@ -0,0 +1,41 @@
+"""
+Nightly Pregnancy Week Rollover
+Recomputes PregnancyProfile.current_week / current_day for every profile
+Schedule once a day (e.g., cron at 00:05) after the date changes
+
+Usage:
+    python scripts/recompute_pregnancy_weeks.py [--chunk-size 50000] [--date YYYY-MM-DD]
+"""
+
+import argparse
+import sys
+import os
+from datetime import date
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.database import SessionLocal
+from app.services.pregnancy_rollover import recompute_all
+
+
+def main():
+    """Run the rollover job"""
+    parser = argparse.ArgumentParser(description="Recompute cached pregnancy week/day")
+    parser.add_argument("--chunk-size", type=int, default=50000)
+    parser.add_argument("--date", type=date.fromisoformat, default=None, help="Compute as of this date (default: today)")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        stats = recompute_all(db, today=args.date, chunk_size=args.chunk_size)
+        print(f"✓ Scanned {stats.scanned} profiles in {stats.chunks} chunks, "
+              f"updated {stats.updated} in {stats.elapsed_s}s")
+    except Exception as e:
+        print(f"\n✗ Error recomputing pregnancy weeks: {str(e)}")
+        db.rollback()
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
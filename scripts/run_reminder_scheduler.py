@@ -0,0 +1,68 @@
+"""
+Daily Check-in Reminder Scheduler
+Sends push reminders to users whose local reminder time is the current minute
+Run as a single long-lived process (one instance per deployment)
+Needs a delivering transport (PUSH_TRANSPORT=fcm); log and fake run only with
+DEBUG=True, or for --once dry runs.
+
+Usage:
+    python scripts/run_reminder_scheduler.py                      # run forever
+    python scripts/run_reminder_scheduler.py --once               # one wave for the current minute
+    python scripts/run_reminder_scheduler.py --once --at 2024-03-01T18:00
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import os
+from datetime import datetime
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config import get_settings
+from app.db.database import AsyncSessionLocal, async_engine
+from app.services.notification_service import NotificationService, check_scheduler_transport, get_transport
+
+
+async def run(args):
+    name = args.transport if args.once else check_scheduler_transport(args.transport)
+    transport = get_transport(name)
+    service = NotificationService(
+        AsyncSessionLocal, transport,
+        batch_size=args.batch_size, concurrency=args.concurrency,
+    )
+    try:
+        if args.once:
+            stats = await service.run_wave(args.at)
+            print(f"✓ Wave over {stats.shards} timezone shards: {stats.recipients} recipients, "
+                  f"{stats.sent} sent, {stats.failed} failed ({stats.invalid_tokens} invalid tokens), "
+                  f"{stats.retries} retries in {stats.elapsed_s}s")
+        else:
+            await service.run_forever()
+    finally:
+        await transport.close()
+        await async_engine.dispose()
+
+
+def main():
+    """Run the reminder scheduler"""
+    parser = argparse.ArgumentParser(description="Send daily check-in push reminders")
+    parser.add_argument("--once", action="store_true", help="Run a single wave and exit")
+    parser.add_argument("--at", type=datetime.fromisoformat, default=None, help="UTC minute for --once (default: now)")
+    parser.add_argument("--transport", default=None, help="Push transport (default: PUSH_TRANSPORT)")
+    parser.add_argument("--batch-size", type=int, default=get_settings().reminder_batch_size)
+    parser.add_argument("--concurrency", type=int, default=get_settings().reminder_concurrency)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(run(args))
+    except KeyboardInterrupt:
+        pass
+    except Exception as e:
+        print(f"\n✗ Error running reminder scheduler: {str(e)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
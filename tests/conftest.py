@@ -0,0 +1,97 @@
+"""
+Test Fixtures
+Each test gets its own SQLite database file and an app built from its own Settings
+
+Tests that call the API are async (pytestmark = pytest.mark.anyio) and use the
+client fixture, which runs the app lifespan around an httpx client. Per-process
+caches that outlive one database (recent writers, current week) are cleared
+between tests; the lifespan resets the auth caches itself.
+"""
+
+from datetime import date
+from typing import Dict
+
+import httpx
+import pytest
+
+from app.config import Settings
+from app.db.database import configure
+from app.db.models import Base
+from app.db.replicas import recent_writers
+from app.main import create_app
+from app.services import journal_crypto
+from app.services.profile_service import week_cache
+
+PASSWORD = "test-password-123"
+
+
+def make_settings(tmp_path, **overrides) -> Settings:
+    """Settings for a throwaway SQLite database under tmp_path (no .env file)"""
+    values = {
+        "database_url": f"sqlite:///{tmp_path}/primary.db",
+        "bcrypt_rounds": 4,
+        "auth_hash_workers": 1,
+        "db_warm_connections": 1,
+        "sync_settle_seconds": 0,
+        "export_dir": str(tmp_path / "exports"),
+    }
+    values.update(overrides)
+    return Settings(_env_file=None, **values)
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+def settings(tmp_path) -> Settings:
+    return make_settings(tmp_path)
+
+
+@pytest.fixture
+def database(settings):
+    database = configure(settings)
+    Base.metadata.create_all(database.engine)
+    # Scripts and services used without the app read the keyring too
+    journal_crypto.configure(settings)
+    recent_writers.clear()
+    week_cache.clear()
+    yield database
+    database.engine.dispose()
+
+
+@pytest.fixture
+def db(database):
+    """Sync session on the primary, as scripts use"""
+    session = database.session_factory()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def app(settings, database):
+    return create_app(settings)
+
+
+@pytest.fixture
+async def client(app):
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            yield client
+
+
+async def sign_up(client: httpx.AsyncClient, email: str = "user@example.com") -> Dict[str, str]:
+    """Register and log in a user; returns the Authorization header"""
+    response = await client.post("/v1/auth/register", json={"email": email, "password": PASSWORD})
+    assert response.status_code == 201, response.text
+    response = await client.post("/v1/auth/login", data={"username": email, "password": PASSWORD})
+    assert response.status_code == 200, response.text
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+def symptom_entry(client_entry_id: str, log_date: date = None, **fields) -> dict:
+    """POST /v1/logs/daily body for a symptom / mood / journal check-in"""
+    return {"kind": "symptom", "client_entry_id": client_entry_id,
+            "log_date": (log_date or date.today()).isoformat(), **fields}
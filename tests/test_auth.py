@@ -0,0 +1,30 @@
+"""
+Authentication Tests
+Login tokens follow the Settings the app was built with
+"""
+
+import pytest
+from jose import jwt
+
+from app.services import auth_service
+from conftest import PASSWORD, make_settings, sign_up
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def settings(tmp_path):
+    return make_settings(tmp_path, access_token_expire_minutes=120, secret_key="test-secret")
+
+
+async def test_login_reports_configured_expiry(client, settings):
+    headers = await sign_up(client)
+
+    response = await client.post("/v1/auth/login", data={"username": "user@example.com", "password": PASSWORD})
+
+    body = response.json()
+    assert body["expires_in"] == 7200
+    claims = jwt.decode(body["access_token"], "test-secret", algorithms=[settings.algorithm])
+    assert 7199 <= claims["exp"] - claims["iat"] <= 7200
+    assert auth_service.auth_settings() is settings
+    assert (await client.get("/v1/users/profile", headers=headers)).status_code == 200
@@ -0,0 +1,74 @@
+"""
+Daily Log Ingest Tests
+Idempotent offline-sync uploads (POST /v1/logs/daily/batch)
+"""
+
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import func, select
+
+from app.db.models import SymptomLog, WeightLog
+from conftest import sign_up, symptom_entry
+
+pytestmark = pytest.mark.anyio
+
+YESTERDAY = date.today() - timedelta(days=1)
+
+BATCH = [
+    symptom_entry("a", YESTERDAY, mood="Calm", symptoms=[{"symptom_type": "Nausea", "severity_rating": 2}]),
+    {"kind": "weight", "client_entry_id": "a", "log_date": YESTERDAY.isoformat(), "weight_kg": 62.4},
+    symptom_entry("b", journal_entry="Short walk"),
+    symptom_entry("b", mood="Happy"),
+    symptom_entry("c", YESTERDAY, symptoms=[{"symptom_type": "Nausea", "severity_rating": 9}]),
+    {"kind": "weight", "client_entry_id": "d", "log_date": date.today().isoformat()},
+]
+
+
+def _counts(db) -> tuple:
+    return db.scalar(select(func.count()).select_from(SymptomLog)), db.scalar(select(func.count()).select_from(WeightLog))
+
+
+async def test_batch_reports_each_entry(client, db):
+    headers = await sign_up(client)
+
+    response = await client.post("/v1/logs/daily/batch", json={"entries": BATCH}, headers=headers)
+
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert (body["created"], body["duplicates"], body["invalid"]) == (3, 1, 2)
+    assert [result["status"] for result in body["results"]] == [
+        "created", "created", "created", "duplicate", "invalid", "invalid",
+    ]
+    assert [result["index"] for result in body["results"]] == list(range(len(BATCH)))
+    assert body["results"][4]["errors"] and body["results"][4]["client_entry_id"] == "c"
+    # A symptom and a weight entry may share a client_entry_id
+    assert _counts(db) == (2, 1)
+
+
+async def test_retried_upload_writes_nothing(client, db):
+    headers = await sign_up(client)
+    first = (await client.post("/v1/logs/daily/batch", json={"entries": BATCH}, headers=headers)).json()
+    etag = (await client.get("/v1/logs/weight", headers=headers)).headers["etag"]
+    trend = (await client.get("/v1/logs/mood/trend", headers=headers)).json()
+
+    retry = (await client.post("/v1/logs/daily/batch", json={"entries": BATCH}, headers=headers)).json()
+
+    assert (retry["created"], retry["duplicates"], retry["invalid"]) == (0, 4, 2)
+    assert all(result["log_id"] is None for result in retry["results"])
+    assert _counts(db) == (2, 1)
+    # Duplicates don't bump the data version or count twice in the rollups
+    assert (await client.get("/v1/logs/weight", headers=headers)).headers["etag"] == etag
+    assert (await client.get("/v1/logs/mood/trend", headers=headers)).json() == trend
+    # The single-entry endpoint shares the idempotency keys
+    single = (await client.post("/v1/logs/daily", json=BATCH[0], headers=headers)).json()
+    assert single["status"] == "duplicate" and first["results"][0]["status"] == "created"
+
+
+async def test_keys_are_per_user(client, db):
+    first = await sign_up(client)
+    second = await sign_up(client, "second@example.com")
+    for headers in (first, second):
+        response = await client.post("/v1/logs/daily", json=BATCH[0], headers=headers)
+        assert response.json()["status"] == "created"
+    assert _counts(db) == (2, 0)
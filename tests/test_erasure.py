@@ -0,0 +1,96 @@
+"""
+Account Erasure Tests
+ON DELETE CASCADE erasure of an account and everything it owns
+"""
+
+import base64
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import func, insert, select, update
+
+from app.db.models import Base, ExportJob, PregnancyProfile, SyncTombstone, User
+from app.services.erasure_service import ErasureService
+from app.services.journal_crypto import get_keyring
+from conftest import make_settings, sign_up, symptom_entry
+
+pytestmark = pytest.mark.anyio
+
+# Every table holding a user's data
+USER_TABLES = [table for table in Base.metadata.sorted_tables if "user_id" in table.c and table.name != "users"]
+
+
+@pytest.fixture
+def settings(tmp_path):
+    return make_settings(tmp_path, journal_master_key=base64.urlsafe_b64encode(bytes(32)).decode())
+
+
+async def _seed(client, db, tmp_path, email: str) -> tuple:
+    """An account with a row in every per-user table; returns (user_id, headers, export file)"""
+    headers = await sign_up(client, email)
+    user_id = db.scalar(select(User.user_id).where(User.email == email))
+    # Before the check-ins, so they get a pregnancy week (weekly rollups)
+    db.execute(insert(PregnancyProfile).values(user_id=user_id, edd=date(2027, 3, 1), current_week=12, current_day=3))
+    db.commit()
+    for entry in (
+        symptom_entry("s1", mood="Happy", journal_entry="First kick!", symptoms=[{"symptom_type": "Nausea"}]),
+        {"kind": "weight", "client_entry_id": "w1", "log_date": date.today().isoformat(), "weight_kg": 64},
+    ):
+        response = await client.post("/v1/logs/daily", json=entry, headers=headers)
+        assert response.status_code == 200, response.text
+    response = await client.post("/v1/feedback", json={"nps_score": 9}, headers=headers)
+    assert response.status_code == 201, response.text
+
+    export_file = tmp_path / f"summary-{user_id}.pdf"
+    export_file.write_bytes(b"%PDF")
+    db.execute(insert(ExportJob).values(
+        job_id=f"job-{user_id}", user_id=user_id, status="completed", input_fingerprint="f",
+        file_path=str(export_file), created_at=datetime.utcnow(),
+    ))
+    db.execute(insert(SyncTombstone).values(entity="symptom_logs", entity_key=0, user_id=user_id))
+    db.commit()
+    return user_id, headers, export_file
+
+
+def _rows_per_table(db, user_id: int) -> dict:
+    return {
+        table.name: db.scalar(select(func.count()).select_from(table).where(table.c.user_id == user_id))
+        for table in USER_TABLES
+    }
+
+
+async def test_erase_removes_everything_the_account_owns(client, db, tmp_path):
+    erased, erased_headers, erased_file = await _seed(client, db, tmp_path, "erased@example.com")
+    kept, kept_headers, kept_file = await _seed(client, db, tmp_path, "kept@example.com")
+    kept_rows = _rows_per_table(db, kept)
+    assert all(_rows_per_table(db, erased).values()), _rows_per_table(db, erased)
+    # Reading the journal back caches the data key
+    assert (await client.get("/v1/sync", headers=erased_headers)).status_code == 200
+    assert erased in get_keyring().cache
+
+    stats = ErasureService.erase_users(db, [erased])
+
+    assert (stats.accounts, stats.export_files) == (1, 1)
+    assert db.get(User, erased) is None
+    assert not any(_rows_per_table(db, erased).values())
+    assert _rows_per_table(db, kept) == kept_rows
+    assert not erased_file.exists() and kept_file.exists()
+    # Cached token and data key go with the account
+    assert erased not in get_keyring().cache
+    assert (await client.get("/v1/users/profile", headers=erased_headers)).status_code == 401
+    assert (await client.get("/v1/users/profile", headers=kept_headers)).status_code == 200
+
+
+async def test_purge_only_erases_deactivated_accounts(client, db, tmp_path):
+    users = [(await _seed(client, db, tmp_path, f"user{i}@example.com"))[0] for i in range(5)]
+    deactivated = users[1::2]
+    db.execute(update(User).where(User.user_id.in_(deactivated)).values(is_active=0))
+    db.commit()
+
+    batches = []
+    stats = ErasureService.purge_deactivated(db, batch_size=1, progress=lambda stats: batches.append(stats.accounts))
+
+    assert (stats.accounts, stats.batches, batches) == (2, 2, [1, 2])
+    assert db.scalars(select(User.user_id).order_by(User.user_id)).all() == [users[0], users[2], users[4]]
+    for user_id in deactivated:
+        assert not any(_rows_per_table(db, user_id).values())
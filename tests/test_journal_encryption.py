@@ -0,0 +1,152 @@
+"""
+Journal Encryption Tests
+Encryption at rest, the plain-text backfill and search over encrypted entries
+"""
+
+import base64
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import insert, select, text
+
+from app.db.models import SymptomLog, User
+from app.services import journal_search
+from app.services.journal_crypto import (
+    ENCRYPTED_PREFIX, UserCipher, encrypt_plaintext_entries, is_encrypted, user_cipher_sync
+)
+from conftest import make_settings, sign_up, symptom_entry
+
+pytestmark = pytest.mark.anyio
+
+MASTER_KEY = base64.urlsafe_b64encode(bytes(range(32))).decode()
+
+
+@pytest.fixture
+def settings(tmp_path):
+    return make_settings(tmp_path, journal_master_key=MASTER_KEY)
+
+
+def _indexed_entries(db) -> int:
+    """Documents in the FTS5 index (the external-content table itself reads through to symptom_logs)"""
+    return db.scalar(text("SELECT count(*) FROM symptom_logs_fts_docsize"))
+
+
+async def test_entries_are_encrypted_and_not_indexed(client, db):
+    headers = await sign_up(client)
+    response = await client.post("/v1/logs/daily", headers=headers, json=symptom_entry(
+        "e1", mood="Calm", journal_entry="Heard the heartbeat today",
+    ))
+    assert response.status_code == 200, response.text
+
+    stored = db.scalar(select(SymptomLog.journal_entry))
+    assert is_encrypted(stored) and "heartbeat" not in stored
+    assert _indexed_entries(db) == 0
+    table = (await client.get("/v1/sync", headers=headers)).json()["changes"]["symptom_logs"]
+    assert [row[table["columns"].index("journal_entry")] for row in table["rows"]] == ["Heard the heartbeat today"]
+
+
+async def test_backfill_encrypts_plain_text_in_place(client, db):
+    await sign_up(client)
+    user_id = db.scalar(select(User.user_id))
+    entries = [f"Plain entry number {i}" for i in range(5)]
+    db.execute(insert(SymptomLog), [
+        {"user_id": user_id, "log_date": date.today(), "journal_entry": entry, "created_at": datetime.utcnow()}
+        for entry in entries
+    ])
+    db.commit()
+    assert _indexed_entries(db) == 5
+
+    stats = encrypt_plaintext_entries(db, batch_size=2)
+
+    assert (stats.entries, stats.users, stats.batches) == (5, 1, 3)
+    stored = db.scalars(select(SymptomLog.journal_entry).order_by(SymptomLog.log_id)).all()
+    assert all(is_encrypted(value) for value in stored)
+    assert user_cipher_sync(db, user_id).decrypt_all(stored) == entries
+    # The update trigger drops the plain text from the index
+    assert _indexed_entries(db) == 0
+    # Running again finds nothing left to do
+    assert encrypt_plaintext_entries(db).entries == 0
+
+
+async def _synced_journals(client, headers) -> list:
+    table = (await client.get("/v1/sync", headers=headers)).json()["changes"]["symptom_logs"]
+    return [row[table["columns"].index("journal_entry")] for row in table["rows"]]
+
+
+async def test_reserved_prefix_is_never_ambiguous(client, db):
+    headers = await sign_up(client)
+    legacy = ENCRYPTED_PREFIX + "not ciphertext, typed before the prefix was reserved"
+    response = await client.post("/v1/logs/daily", headers=headers, json=symptom_entry("e1", journal_entry=legacy))
+    assert response.status_code == 422
+
+    # Stored as plain text by an older release: still readable, with or without encryption
+    user_id = db.scalar(select(User.user_id))
+    db.execute(insert(SymptomLog), [
+        {"user_id": user_id, "log_date": date.today() - timedelta(days=days), "journal_entry": entry,
+         "created_at": datetime.utcnow()}
+        for days, entry in ((2, legacy), (1, "Plain entry"))
+    ])
+    db.commit()
+    assert UserCipher(user_id).decrypt(legacy) == legacy
+    assert await _synced_journals(client, headers) == [legacy, "Plain entry"]
+    params = {"q": "ciphertext"}
+    page = (await client.get("/v1/logs/journal/search", params=params, headers=headers)).json()
+    assert [hit["log_date"] for hit in page["items"]] == [(date.today() - timedelta(days=2)).isoformat()]
+
+    # The backfill encrypts it while the user has no key yet, then the rest
+    stats = encrypt_plaintext_entries(db, batch_size=1)
+    assert (stats.entries, stats.users) == (2, 1)
+    stored = db.scalars(select(SymptomLog.journal_entry).order_by(SymptomLog.log_id)).all()
+    assert all(is_encrypted(value) for value in stored) and legacy not in stored
+    assert await _synced_journals(client, headers) == [legacy, "Plain entry"]
+
+
+async def test_search_pages_through_encrypted_entries(client, monkeypatch):
+    monkeypatch.setattr(journal_search, "DECRYPT_BATCH_SIZE", 3)
+    headers = await sign_up(client)
+    day = date.today() - timedelta(days=20)
+    for i in range(8):
+        journal = f"Nausea again, day {i}" if i % 2 == 0 else f"Felt fine, day {i}"
+        response = await client.post("/v1/logs/daily", headers=headers, json=symptom_entry(
+            f"e{i}", day + timedelta(days=i), journal_entry=journal,
+        ))
+        assert response.status_code == 200, response.text
+
+    pages, cursor = [], None
+    while True:
+        params = {"q": "nause", "limit": 3, **({"cursor": cursor} if cursor else {})}
+        page = (await client.get("/v1/logs/journal/search", params=params, headers=headers)).json()
+        pages.append([hit["log_date"] for hit in page["items"]])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    expected = [(day + timedelta(days=i)).isoformat() for i in (6, 4, 2, 0)]
+    assert pages == [expected[:3], expected[3:]]
+    hit = page["items"][0]
+    assert hit["snippet"].startswith("<mark>Nausea</mark> again")
+
+
+async def test_search_scan_is_capped_per_request(client, monkeypatch):
+    monkeypatch.setattr(journal_search, "DECRYPT_BATCH_SIZE", 2)
+    monkeypatch.setattr(journal_search, "DECRYPT_MAX_ROWS", 3)
+    headers = await sign_up(client)
+    day = date.today() - timedelta(days=20)
+    for i in range(8):
+        journal = "Backache all day" if i in (0, 1) else f"Felt fine, day {i}"
+        response = await client.post("/v1/logs/daily", headers=headers, json=symptom_entry(
+            f"e{i}", day + timedelta(days=i), journal_entry=journal,
+        ))
+        assert response.status_code == 200, response.text
+
+    pages, cursor = [], None
+    while True:
+        params = {"q": "backache", "limit": 5, **({"cursor": cursor} if cursor else {})}
+        page = (await client.get("/v1/logs/journal/search", params=params, headers=headers)).json()
+        pages.append([hit["log_date"] for hit in page["items"]])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    # Three entries per request: two empty pages before the matches, newest first
+    assert pages == [[], [], [(day + timedelta(days=i)).isoformat() for i in (1, 0)]]
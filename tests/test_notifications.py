@@ -0,0 +1,102 @@
+"""
+Push Notification Tests
+FCM HTTP v1 transport against a mocked provider, and the scheduler's transport check
+"""
+
+import json
+from urllib.parse import parse_qs
+
+import httpx
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwt
+
+from app.services.notification_service import (
+    FcmPushTransport, PushMessage, TransientPushError, check_scheduler_transport
+)
+from conftest import make_settings
+
+pytestmark = pytest.mark.anyio
+
+TOKEN_URI = "https://oauth2.example.invalid/token"
+
+
+@pytest.fixture(scope="module")
+def private_key():
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+class FakeFcm:
+    """Token endpoint plus messages:send, answering by device token"""
+
+    def __init__(self, private_key):
+        self.public_key = private_key.public_key().public_bytes(
+            serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+        )
+        self.statuses = {"good": 200, "gone": 404, "busy": 503}
+        self.issued, self.sent = [], []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if str(request.url) == TOKEN_URI:
+            assertion = parse_qs(request.content.decode())["assertion"][0]
+            claims = jwt.decode(assertion, self.public_key, algorithms=["RS256"], audience=TOKEN_URI)
+            assert claims["iss"] == "reminders@demo.iam.example.invalid"
+            self.issued.append(f"access-{len(self.issued)}")
+            return httpx.Response(200, json={"access_token": self.issued[-1], "expires_in": 3600})
+
+        assert request.url.path == "/v1/projects/demo/messages:send"
+        message = json.loads(request.content)["message"]
+        if request.headers["Authorization"] != f"Bearer {self.issued[-1]}":
+            return httpx.Response(401, json={"error": {"status": "UNAUTHENTICATED"}})
+        status = self.statuses[message["token"]]
+        self.sent.append((message["token"], status))
+        body = {"error": {"status": "NOT_FOUND", "details": [{"errorCode": "UNREGISTERED"}]}} if status == 404 else {}
+        return httpx.Response(status, json=body)
+
+
+def _transport(private_key, fcm: FakeFcm) -> FcmPushTransport:
+    pem = private_key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    ).decode()
+    credentials = {"project_id": "demo", "client_email": "reminders@demo.iam.example.invalid",
+                   "private_key": pem, "private_key_id": "k1", "token_uri": TOKEN_URI}
+    return FcmPushTransport(credentials, http=httpx.AsyncClient(transport=httpx.MockTransport(fcm)))
+
+
+async def test_fcm_reports_each_message(private_key):
+    fcm = FakeFcm(private_key)
+    transport = _transport(private_key, fcm)
+    messages = [PushMessage(1, "good"), PushMessage(2, "gone"), PushMessage(3, "busy")]
+
+    results = await transport.send_batch(messages)
+    await transport.send_batch(messages[:1])
+    await transport.close()
+
+    assert [(result.user_id, result.ok, result.invalid_token) for result in results] == [
+        (1, True, False), (2, False, True), (3, False, False),
+    ]
+    # One access token for both batches
+    assert fcm.issued == ["access-0"]
+    assert [token for token, status in fcm.sent if status == 200] == ["good", "good"]
+
+
+async def test_fcm_retries_undelivered_batches(private_key):
+    fcm = FakeFcm(private_key)
+    transport = _transport(private_key, fcm)
+    with pytest.raises(TransientPushError):
+        await transport.send_batch([PushMessage(1, "busy"), PushMessage(2, "busy")])
+
+    # A revoked access token fails the batch as transient and is replaced for the retry
+    fcm.issued.append("revoked-elsewhere")
+    with pytest.raises(TransientPushError):
+        await transport.send_batch([PushMessage(1, "good")])
+    assert [result.ok for result in await transport.send_batch([PushMessage(1, "good")])] == [True]
+    await transport.close()
+
+
+def test_scheduler_needs_a_delivering_transport(tmp_path):
+    with pytest.raises(RuntimeError, match="PUSH_TRANSPORT=log"):
+        check_scheduler_transport(settings=make_settings(tmp_path))
+    assert check_scheduler_transport("fake", make_settings(tmp_path, debug=True)) == "fake"
+    assert check_scheduler_transport(settings=make_settings(tmp_path, push_transport="fcm")) == "fcm"
@@ -0,0 +1,83 @@
+"""
+Read Replica Tests
+Read-your-writes routing against a local primary plus a lagging replica
+
+The replica is a second SQLite file, copied from the primary once and never
+updated, so a read served by it can't see later writes.
+"""
+
+import sqlite3
+from datetime import date
+
+import pytest
+
+from app.db.replicas import recent_writers
+from conftest import make_settings, sign_up
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def settings(tmp_path):
+    return make_settings(tmp_path, replica_database_urls=f"sqlite:///{tmp_path}/replica.db")
+
+
+def snapshot_replica(tmp_path):
+    """Copy the primary into the replica file (SQLite backup API, safe with open connections)"""
+    with sqlite3.connect(tmp_path / "primary.db") as primary, sqlite3.connect(tmp_path / "replica.db") as replica:
+        primary.backup(replica)
+
+
+def routed_since(router, before: dict) -> dict:
+    return {name: count - before[name] for name, count in router.routed.items()}
+
+
+async def _weights(client, headers):
+    response = await client.get("/v1/logs/weight", headers=headers)
+    assert response.status_code == 200, response.text
+    return [item["weight_kg"] for item in response.json()["items"]]
+
+
+async def test_reads_follow_the_users_own_writes(app, client, tmp_path):
+    headers = await sign_up(client)
+    other = await sign_up(client, "other@example.com")
+    snapshot_replica(tmp_path)
+    recent_writers.clear()
+    router = app.state.database.replica_router
+    before = dict(router.routed)
+
+    # Before writing, reads go to the (up to date) replica
+    assert await _weights(client, headers) == []
+    assert routed_since(router, before) == {"primary": 0, "replica1": 1}
+
+    response = await client.post("/v1/logs/daily", headers=headers, json={
+        "kind": "weight", "client_entry_id": "w1", "log_date": date.today().isoformat(), "weight_kg": 61.5,
+    })
+    assert response.status_code == 200, response.text
+
+    # The writer reads its check-in from the primary; other users stay on the replica
+    assert await _weights(client, headers) == [61.5]
+    assert await _weights(client, other) == []
+    assert routed_since(router, before) == {"primary": 1, "replica1": 2}
+
+    # Once the read-your-writes window ends, the lagging replica serves the writer again
+    recent_writers.clear()
+    assert await _weights(client, headers) == []
+    assert routed_since(router, before) == {"primary": 1, "replica1": 3}
+
+
+async def test_falls_back_to_primary_without_healthy_replica(app, client, tmp_path):
+    headers = await sign_up(client)
+    snapshot_replica(tmp_path)
+    router = app.state.database.replica_router
+    before = dict(router.routed)
+
+    router.replicas[0].mark_down("test")
+    assert await _weights(client, headers) == []
+    assert routed_since(router, before) == {"primary": 1, "replica1": 0}
+
+    # A passing health check puts it back in the rotation
+    await router.check_all()
+    assert router.replicas[0].healthy
+    await _weights(client, headers)
+    assert routed_since(router, before) == {"primary": 1, "replica1": 1}
@@ -0,0 +1,78 @@
+"""
+Rollup Tests
+Incrementally maintained trend and NPS rollups agree with a full rebuild
+"""
+
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import insert, select
+
+from app.db.models import DailyLogRollup, NpsDailyRollup, NpsWeeklyRollup, PregnancyProfile, User, WeeklyLogRollup
+from app.services.nps_service import NpsService
+from app.services.rollup_service import RollupService
+from conftest import sign_up, symptom_entry
+
+pytestmark = pytest.mark.anyio
+
+START = date.today() - timedelta(days=10)
+
+
+def snapshot(db, *models) -> dict:
+    """Every row of the rollup tables, without timestamps, floats rounded"""
+    tables = {}
+    for model in models:
+        columns = [column for column in model.__table__.c if column.name != "updated_at"]
+        rows = [
+            {name: round(value, 6) if isinstance(value, float) else value for name, value in row._mapping.items()}
+            for row in db.execute(select(*columns))
+        ]
+        tables[model.__tablename__] = sorted(rows, key=repr)
+    return tables
+
+
+async def _with_profile(client, db, email: str) -> dict:
+    headers = await sign_up(client, email)
+    user_id = db.scalar(select(User.user_id).where(User.email == email))
+    db.execute(insert(PregnancyProfile).values(user_id=user_id, edd=START + timedelta(days=200), initial_weight_kg=60))
+    db.commit()
+    return headers
+
+
+async def test_log_rollups_match_rebuild(client, db):
+    users = [await _with_profile(client, db, f"user{i}@example.com") for i in range(2)]
+    for upload in range(3):
+        for number, headers in enumerate(users):
+            entries = []
+            for offset in range(upload, 10, 2):
+                log_date = START + timedelta(days=offset)
+                key = f"{upload}-{offset}"
+                entries.append({"kind": "weight", "client_entry_id": key, "log_date": log_date.isoformat(),
+                                "weight_kg": 60 + offset * 0.3 + upload * 0.1 + number})
+                entries.append(symptom_entry(key, log_date, mood=["Calm", "Tired", "Happy"][(offset + upload) % 3]))
+            response = await client.post("/v1/logs/daily/batch", json={"entries": entries}, headers=headers)
+            assert response.json()["created"] == len(entries)
+    incremental = snapshot(db, DailyLogRollup, WeeklyLogRollup)
+    assert incremental["weekly_log_rollups"]
+
+    stats = RollupService.rebuild(db, user_batch_size=1)
+
+    assert stats.users == 2
+    assert snapshot(db, DailyLogRollup, WeeklyLogRollup) == incremental
+
+
+async def test_nps_rollups_match_rebuild(client, db):
+    scores = {"a@example.com": [10, 9, 3], "b@example.com": [7, 0], "c@example.com": [8]}
+    for index, (email, user_scores) in enumerate(scores.items()):
+        # One user without a profile: their feedback has no pregnancy week
+        headers = await (_with_profile(client, db, email) if index else sign_up(client, email))
+        for score in user_scores:
+            response = await client.post("/v1/feedback", json={"nps_score": score}, headers=headers)
+            assert response.status_code == 201, response.text
+    incremental = snapshot(db, NpsDailyRollup, NpsWeeklyRollup)
+    day = incremental["nps_daily_rollups"]
+    assert [(row["promoters"], row["passives"], row["detractors"]) for row in day] == [(2, 2, 2)]
+
+    NpsService.rebuild(db, batch_size=2)
+
+    assert snapshot(db, NpsDailyRollup, NpsWeeklyRollup) == incremental
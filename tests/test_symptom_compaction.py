@@ -0,0 +1,91 @@
+"""
+Symptom Sets Tests
+Packing of symptom sets and compaction of pre-migration (legacy) symptom rows
+"""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import insert, select, update
+
+from app.db.models import MoodType, SymptomLog, SymptomType, SyncTombstone, User, pack_symptoms, unpack_symptoms
+from app.services.symptom_compaction import SymptomCompactionService
+from conftest import sign_up, symptom_entry
+
+pytestmark = pytest.mark.anyio
+
+DAY = date.today() - timedelta(days=40)
+OLD = datetime.utcnow() - timedelta(days=30)
+
+
+def test_pack_round_trip():
+    ratings = [(SymptomType.NAUSEA, 3), (SymptomType.SPOTTING, None), (SymptomType.MOOD_SWINGS, 5)]
+    mask, severities = pack_symptoms(ratings)
+    assert unpack_symptoms(mask, severities) == ratings
+    assert unpack_symptoms(0, 0) == []
+    # A symptom rated twice keeps the later rating
+    assert unpack_symptoms(*pack_symptoms([(SymptomType.FATIGUE, 4), (SymptomType.FATIGUE, 1)])) == [
+        (SymptomType.FATIGUE, 1),
+    ]
+
+
+def _legacy_row(user_id: int, symptom: SymptomType, severity: int, **fields) -> dict:
+    mask, severities = pack_symptoms([(symptom, severity)])
+    return {"user_id": user_id, "log_date": DAY, "symptom_mask": mask, "symptom_severities": severities,
+            "legacy_symptom_row": 1, "created_at": OLD, **fields}
+
+
+async def test_merges_legacy_rows_of_one_check_in(client, db):
+    await sign_up(client)
+    user_id = db.scalar(select(User.user_id))
+    db.execute(insert(SymptomLog), [
+        _legacy_row(user_id, SymptomType.NAUSEA, 2, mood=MoodType.TIRED, pregnancy_week=8),
+        _legacy_row(user_id, SymptomType.FATIGUE, 4, mood=MoodType.TIRED, pregnancy_week=8),
+        _legacy_row(user_id, SymptomType.HEADACHE, 1, pregnancy_week=8),
+        # A different mood is a separate check-in
+        _legacy_row(user_id, SymptomType.CRAMPING, 3, mood=MoodType.ANXIOUS, pregnancy_week=8),
+    ])
+    db.commit()
+    old_ids = db.scalars(select(SymptomLog.log_id)).all()
+
+    stats = SymptomCompactionService.compact(db)
+
+    assert (stats.rows_merged, stats.rows_written) == (3, 1)
+    rows = db.execute(select(SymptomLog).order_by(SymptomLog.log_id)).scalars().all()
+    assert len(rows) == 2
+    kept, merged = rows
+    assert unpack_symptoms(kept.symptom_mask, kept.symptom_severities) == [(SymptomType.CRAMPING, 3)]
+    assert unpack_symptoms(merged.symptom_mask, merged.symptom_severities) == [
+        (SymptomType.NAUSEA, 2), (SymptomType.FATIGUE, 4), (SymptomType.HEADACHE, 1),
+    ]
+    assert merged.mood == MoodType.TIRED and merged.log_id not in old_ids
+    assert sorted(db.scalars(select(SyncTombstone.entity_key)).all()) == sorted(set(old_ids) - {kept.log_id})
+
+
+async def test_leaves_new_check_ins_alone(client, db):
+    headers = await sign_up(client)
+    entries = [
+        symptom_entry("morning", DAY, mood="Tired", journal_entry="Queasy after breakfast",
+                      symptoms=[{"symptom_type": "Nausea", "severity_rating": 2},
+                                {"symptom_type": "Fatigue", "severity_rating": 3}]),
+        symptom_entry("evening", DAY, symptoms=[{"symptom_type": "Headache", "severity_rating": 1}]),
+    ]
+    for entry in entries:
+        response = await client.post("/v1/logs/daily", json=entry, headers=headers)
+        assert response.status_code == 200, response.text
+    # Old enough to pass min_age_days, but written by a current client
+    db.execute(update(SymptomLog).values(created_at=OLD))
+    db.commit()
+
+    stats = SymptomCompactionService.compact(db)
+
+    assert (stats.rows_merged, stats.rows_written) == (0, 0)
+    rows = db.execute(select(SymptomLog.client_entry_id, SymptomLog.symptom_mask).order_by(SymptomLog.log_id)).all()
+    assert [row.client_entry_id for row in rows] == ["morning", "evening"]
+    assert [row.symptom_mask for row in rows] == [
+        pack_symptoms([(SymptomType.NAUSEA, None), (SymptomType.FATIGUE, None)])[0],
+        pack_symptoms([(SymptomType.HEADACHE, None)])[0],
+    ]
+    # Retrying an upload is still recognised as a duplicate
+    response = await client.post("/v1/logs/daily", json=entries[1], headers=headers)
+    assert response.json()["status"] == "duplicate"
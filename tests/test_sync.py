@@ -0,0 +1,95 @@
+"""
+Delta Sync Tests
+Cursor paging and tombstones of GET /v1/sync
+"""
+
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import select
+
+from app.db.models import User
+from app.services.sync_service import tombstone_insert
+from conftest import sign_up, symptom_entry
+
+pytestmark = pytest.mark.anyio
+
+
+async def _sync(client, headers, cursor=None, limit=500) -> dict:
+    params = {"limit": limit, **({"cursor": cursor} if cursor else {})}
+    response = await client.get("/v1/sync", params=params, headers=headers)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def _ids(page: dict, table: str) -> list:
+    changes = page["changes"].get(table)
+    return [row[0] for row in changes["rows"]] if changes else []
+
+
+async def _check_in(client, headers, key: str, days_ago: int = 0) -> int:
+    entry = symptom_entry(key, date.today() - timedelta(days=days_ago), mood="Calm")
+    response = await client.post("/v1/logs/daily", json=entry, headers=headers)
+    return response.json()["log_id"]
+
+
+async def test_cursor_returns_only_new_rows(client):
+    headers = await sign_up(client)
+    other = await sign_up(client, "other@example.com")
+    first = await _check_in(client, headers, "a", days_ago=3)
+    await _check_in(client, other, "a")
+
+    full = await _sync(client, headers)
+    assert full["reset"] and not full["has_more"]
+    assert _ids(full, "symptom_logs") == [first]
+
+    assert _ids(await _sync(client, headers, full["cursor"]), "symptom_logs") == []
+    # A backdated check-in is still new to the client
+    second = await _check_in(client, headers, "b", days_ago=10)
+    delta = await _sync(client, headers, full["cursor"])
+    assert not delta["reset"] and _ids(delta, "symptom_logs") == [second]
+
+
+async def test_pages_cover_every_row_once(client):
+    headers = await sign_up(client)
+    created = [await _check_in(client, headers, f"e{i}", days_ago=i) for i in range(5)]
+
+    pages, cursor = [], None
+    while True:
+        page = await _sync(client, headers, cursor, limit=2)
+        pages.append(_ids(page, "symptom_logs"))
+        cursor = page["cursor"]
+        if not page["has_more"]:
+            break
+
+    assert pages == [created[:2], created[2:4], created[4:]]
+    assert _ids(await _sync(client, headers, cursor), "symptom_logs") == []
+
+
+async def test_tombstones_after_cursor(client, db):
+    headers = await sign_up(client)
+    other = await sign_up(client, "other@example.com")
+    user_id, other_id = db.scalars(select(User.user_id).order_by(User.user_id)).all()
+    log_id = await _check_in(client, headers, "a")
+    cursor = (await _sync(client, headers))["cursor"]
+    other_cursor = (await _sync(client, other))["cursor"]
+
+    db.execute(tombstone_insert("symptom_logs", [log_id], user_id))
+    db.execute(tombstone_insert("symptom_logs", [999], other_id))
+    db.commit()
+
+    page = await _sync(client, headers, cursor)
+    assert page["deleted"] == {"symptom_logs": [log_id]}
+    assert (await _sync(client, other, other_cursor))["deleted"] == {"symptom_logs": [999]}
+    # Seen once, then behind the cursor
+    assert (await _sync(client, headers, page["cursor"]))["deleted"] == {}
+
+
+async def test_rejects_unusable_cursors(client):
+    headers = await sign_up(client)
+    other = await sign_up(client, "other@example.com")
+    response = await client.get("/v1/sync", params={"cursor": "not-a-cursor"}, headers=headers)
+    assert response.status_code == 400
+    cursor = (await _sync(client, other))["cursor"]
+    response = await client.get("/v1/sync", params={"cursor": cursor}, headers=headers)
+    assert response.status_code == 400